@@ -0,0 +1 @@
+"""Offline benchmark suite for prg (``python -m benchmarks``); see benchmarks/README.md."""
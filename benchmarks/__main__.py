@@ -0,0 +1,73 @@
+"""Command-line entry point: ``python -m benchmarks``.
+
+Examples::
+
+    python -m benchmarks --size 1k
+    python -m benchmarks --size 10k --repeat 5 --only extract_full_context --only analyze_full
+    python -m benchmarks --size 1k --compare benchmarks/results/0.3.0-1k.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.suite import available_benchmarks, compare, default_output_path, echo, run_suite
+from benchmarks.synthetic import SIZES
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the prg benchmark suite.")
+    parser.add_argument("--size", choices=list(SIZES), default="1k", help="Synthetic project size (default: 1k)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (default: 3)")
+    parser.add_argument(
+        "--only", action="append", choices=available_benchmarks(), help="Run only this benchmark (repeatable)"
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "prg-benchmarks",
+        help="Where synthetic projects are generated; reused across runs of the same size",
+    )
+    parser.add_argument("--learned-skills", type=int, help="Override the size's learned-skill count")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/<version>-<size>.json)")
+    parser.add_argument("--compare", type=Path, help="Baseline result file to compare medians against")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="Slowdown ratio reported as a regression (default: 1.25)"
+    )
+    args = parser.parse_args(argv)
+
+    echo(f"Preparing {args.size} project in {args.workdir / args.size} ...")
+    document = run_suite(
+        args.size,
+        args.workdir,
+        repeat=args.repeat,
+        only=args.only,
+        progress=echo,
+        learned_skills=args.learned_skills,
+    )
+
+    output = args.output or default_output_path(RESULTS_DIR, document)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    echo(f"Results written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        rows = compare(document, baseline, threshold=args.threshold)
+        for row in rows:
+            flag = "  REGRESSION" if row["regressed"] else ""
+            echo(f"{row['name']:<30} {row['baseline_s']:.4f}s -> {row['current_s']:.4f}s ({row['ratio']:.2f}x){flag}")
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+"""Benchmarks for prg's key entry points.
+
+Each benchmark is a setup function registered with ``@benchmark(name)``. It
+receives the ``BenchContext`` and returns the zero-argument callable that is
+timed, so per-run setup (fresh objects, cleared output) stays out of the
+measurement. ``run_suite`` runs every benchmark ``repeat`` times against one
+synthetic project and returns a JSON-serialisable result document.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import shutil
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from unittest import mock
+
+from benchmarks.synthetic import SIZES, SyntheticSpec, generate_learned_skills, generate_project
+from generator.ai.ai_client import AIClient
+
+RESULT_SCHEMA = 1
+
+Setup = Callable[["BenchContext"], Callable[[], Any]]
+_REGISTRY: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register ``fn`` as the setup function for benchmark ``name``."""
+
+    def register(fn: Setup) -> Setup:
+        _REGISTRY[name] = fn
+        return fn
+
+    return register
+
+
+def available_benchmarks() -> List[str]:
+    return list(_REGISTRY)
+
+
+@dataclass
+class BenchContext:
+    """Paths and shared state for one suite run."""
+
+    workdir: Path
+    size: str
+    spec: SyntheticSpec
+    project: Path = field(init=False)
+    global_dir: Path = field(init=False)
+    scratch: Path = field(init=False)
+    shared: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        base = self.workdir / self.size
+        self.project = base / "project"
+        self.global_dir = base / "prg-global"
+        self.scratch = base / "scratch"
+
+    def prepare(self) -> None:
+        """Generate (or reuse) the synthetic project and the global skill layers."""
+        generate_project(self.project, self.spec)
+        self.shared["skill_files"] = generate_learned_skills(
+            self.global_dir / "learned", self.spec.learned_skills, seed=self.spec.seed
+        )
+        (self.global_dir / "builtin").mkdir(parents=True, exist_ok=True)
+        # Output of an earlier analyze_full run would change what later runs walk.
+        shutil.rmtree(self.project / ".clinerules", ignore_errors=True)
+        shutil.rmtree(self.scratch, ignore_errors=True)
+        self.scratch.mkdir(parents=True)
+
+    def full_context(self) -> Dict[str, Any]:
+        """Enhanced context for the project, computed once per suite run."""
+        if "context" not in self.shared:
+            from generator.parsers.enhanced_parser import EnhancedProjectParser
+
+            self.shared["context"] = EnhancedProjectParser(self.project).extract_full_context()
+        return self.shared["context"]
+
+
+# ----------------------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------------------
+
+
+@benchmark("file_index_build")
+def _file_index_build(ctx: BenchContext) -> Callable[[], Any]:
+    from generator.utils.file_index import ProjectFileIndex
+
+    return lambda: ProjectFileIndex.build(ctx.project)
+
+
+@benchmark("extract_full_context")
+def _extract_full_context(ctx: BenchContext) -> Callable[[], Any]:
+    from generator.parsers.enhanced_parser import EnhancedProjectParser
+
+    parser = EnhancedProjectParser(ctx.project)
+    return parser.extract_full_context
+
+
+@benchmark("detect_project_type")
+def _detect_project_type(ctx: BenchContext) -> Callable[[], Any]:
+    from generator.analyzers.structure_analyzer import StructureAnalyzer
+
+    analyzer = StructureAnalyzer(ctx.project)
+    return analyzer.detect_project_type
+
+
+@benchmark("incremental_detect_changes")
+def _incremental_detect_changes(ctx: BenchContext) -> Callable[[], Any]:
+    # The common watch/CI case: a manifest exists and nothing changed.
+    from generator.analyzers.incremental_analyzer import IncrementalAnalyzer
+
+    output_dir = ctx.scratch / "incremental"
+    if not output_dir.exists():
+        baseline = IncrementalAnalyzer(ctx.project, output_dir)
+        baseline.save_hash(baseline.compute_project_hash())
+    analyzer = IncrementalAnalyzer(ctx.project, output_dir)
+    return analyzer.detect_changes
+
+
+@benchmark("skill_discovery_build_cache")
+def _skill_discovery_build_cache(ctx: BenchContext) -> Callable[[], Any]:
+    from generator.skills.skill_discovery import SkillDiscovery
+
+    discovery = SkillDiscovery(project_path=ctx.project)
+    return discovery._build_cache
+
+
+@benchmark("skill_layer_resolution")
+def _skill_layer_resolution(ctx: BenchContext) -> Callable[[], Any]:
+    # Resolving the learned layer from an already-built cache: the cost paid by
+    # `prg skills list`, generate_perfect_index and resolve_skill.
+    from generator.skills.skill_discovery import SkillDiscovery
+
+    discovery = SkillDiscovery(project_path=ctx.project)
+    discovery._build_cache()
+    return lambda: discovery._get_layer_skills("learned")
+
+
+@benchmark("skill_triggers")
+def _skill_triggers(ctx: BenchContext) -> Callable[[], Any]:
+    # Trigger extraction over every layer, as auto-triggers.json and
+    # `prg skills` do; served from the skill catalog once it is warm.
+    from generator.skills.manager import SkillsManager
+
+    return lambda: SkillsManager(project_path=ctx.project).extract_all_triggers()
+
+
+@benchmark("match_skills")
+def _match_skills(ctx: BenchContext) -> Callable[[], Any]:
+    from generator.skills.enhanced_skill_matcher import EnhancedSkillMatcher
+
+    context = ctx.full_context()
+    tech = context.get("metadata", {}).get("tech_stack", [])
+    matcher = EnhancedSkillMatcher()
+    return lambda: matcher.match_skills(tech, context)
+
+
+@benchmark("extract_tech_stack")
+def _extract_tech_stack(ctx: BenchContext) -> Callable[[], Any]:
+    from generator.analyzers.readme_parser import extract_tech_stack
+
+    readme = (ctx.project / "README.md").read_text(encoding="utf-8")
+    return lambda: extract_tech_stack(readme, ctx.project)
+
+
+@benchmark("validate_quality")
+def _validate_quality(ctx: BenchContext) -> Callable[[], Any]:
+    from generator.utils.quality_checker import validate_quality
+
+    documents = [p.read_text(encoding="utf-8") for p in ctx.shared["skill_files"][:200]]
+    return lambda: [validate_quality(doc) for doc in documents]
+
+
+class StubAIClient(AIClient):
+    """Offline stand-in for a provider: returns a complete, valid skill instantly."""
+
+    DEFAULT_MODEL = "stub"
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        return _STUB_SKILL
+
+
+_STUB_SKILL = """---
+name: stub-skill
+description: |-
+  When working on the synthetic service.
+tools:
+  - read
+---
+
+# Skill: Stub Skill
+
+## Purpose
+Keeps benchmark runs offline while exercising the full AI skill path.
+
+## Auto-Trigger
+- User says: "work on the service"
+
+## Process
+
+### Step 1: Inspect
+```bash
+pytest tests/ -q
+```
+
+## Output
+A verified change.
+"""
+
+
+@benchmark("analyze_full")
+def _analyze_full(ctx: BenchContext) -> Callable[[], Any]:
+    from click.testing import CliRunner
+
+    from cli.cli import cli
+
+    shutil.rmtree(ctx.project / ".clinerules", ignore_errors=True)
+    args = ["analyze", str(ctx.project), "--no-commit", "--ai", "--auto-generate-skills", "--provider", "groq"]
+
+    def run() -> None:
+        with _stub_ai():
+            result = CliRunner().invoke(cli, args, catch_exceptions=False)
+        if result.exit_code != 0:
+            raise RuntimeError(f"prg analyze exited {result.exit_code}:\n{result.output}")
+
+    return run
+
+
+@contextmanager
+def _stub_ai() -> Iterator[None]:
+    def factory(provider: str = "groq", cache: bool = True, **kwargs: Any) -> AIClient:
+        return StubAIClient(kwargs.get("api_key"))
+
+    targets = (
+        "generator.ai.factory.create_ai_client",
+        "generator.ai.ai_strategy_router.create_ai_client",
+        "generator.skills.llm_skill_generator.create_ai_client",
+    )
+    with mock.patch.dict(os.environ, {"GROQ_API_KEY": "stub", "PRG_NO_LLM_CACHE": "1"}):
+        patches = [mock.patch(target, factory) for target in targets]
+        for patch in patches:
+            patch.start()
+        try:
+            yield
+        finally:
+            for patch in reversed(patches):
+                patch.stop()
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+
+
+@contextmanager
+def _isolated_global_dir(global_dir: Path) -> Iterator[None]:
+    """Point SkillPathManager at the suite's global dir instead of ~/.project-rules-generator."""
+    from generator.storage.skill_paths import SkillPathManager
+
+    saved = (SkillPathManager.GLOBAL_DIR, SkillPathManager.GLOBAL_BUILTIN, SkillPathManager.GLOBAL_LEARNED)
+    SkillPathManager.GLOBAL_DIR = global_dir
+    SkillPathManager.GLOBAL_BUILTIN = global_dir / "builtin"
+    SkillPathManager.GLOBAL_LEARNED = global_dir / "learned"
+    try:
+        yield
+    finally:
+        SkillPathManager.GLOBAL_DIR, SkillPathManager.GLOBAL_BUILTIN, SkillPathManager.GLOBAL_LEARNED = saved
+
+
+def _summarise(runs: List[float]) -> Dict[str, Any]:
+    return {
+        "min_s": min(runs),
+        "median_s": statistics.median(runs),
+        "mean_s": statistics.fmean(runs),
+        "max_s": max(runs),
+        "runs": runs,
+    }
+
+
+def run_suite(
+    size: str,
+    workdir: Path,
+    repeat: int = 3,
+    only: Optional[Sequence[str]] = None,
+    progress: Optional[Callable[[str], None]] = None,
+    learned_skills: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run the selected benchmarks (all by default) and return the result document.
+
+    ``learned_skills`` overrides the size's learned-skill count, e.g. to time
+    skill discovery against a 10k-skill store on an otherwise small project.
+    """
+    if size not in SIZES:
+        raise ValueError(f"Unknown size {size!r}; choose from {', '.join(SIZES)}")
+    names = list(only) if only else available_benchmarks()
+    unknown = [n for n in names if n not in _REGISTRY]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    spec = SIZES[size] if learned_skills is None else replace(SIZES[size], learned_skills=learned_skills)
+    ctx = BenchContext(workdir=Path(workdir), size=size, spec=spec)
+    started = time.perf_counter()
+    ctx.prepare()
+    fixture_s = time.perf_counter() - started
+
+    results: Dict[str, Any] = {}
+    with _isolated_global_dir(ctx.global_dir):
+        for name in names:
+            runs = []
+            for _ in range(repeat):
+                fn = _REGISTRY[name](ctx)
+                t0 = time.perf_counter()
+                fn()
+                runs.append(time.perf_counter() - t0)
+            results[name] = _summarise(runs)
+            if progress:
+                progress(f"{name:<30} median {results[name]['median_s']:.4f}s")
+
+    from cli._version import __version__
+
+    return {
+        "schema": RESULT_SCHEMA,
+        "prg_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "size": size,
+        "spec": ctx.spec.to_dict(),
+        "repeat": repeat,
+        "fixture_s": fixture_s,
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 1.25) -> List[Dict[str, Any]]:
+    """Compare median times against ``baseline``; ``regressed`` marks ratios above ``threshold``."""
+    rows = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or not before.get("median_s"):
+            continue
+        ratio = result["median_s"] / before["median_s"]
+        rows.append(
+            {
+                "name": name,
+                "baseline_s": before["median_s"],
+                "current_s": result["median_s"],
+                "ratio": ratio,
+                "regressed": ratio > threshold,
+            }
+        )
+    return rows
+
+
+def default_output_path(results_dir: Path, document: Dict[str, Any]) -> Path:
+    """``<results_dir>/<prg_version>-<size>.json``."""
+    return Path(results_dir) / f"{document['prg_version']}-{document['size']}.json"
+
+
+def echo(message: str) -> None:
+    sys.stdout.write(message + "\n")
+    sys.stdout.flush()
@@ -0,0 +1,271 @@
+"""Deterministic synthetic projects for the benchmark suite.
+
+``generate_project`` writes a Python/JS project of a configurable size: a
+deep package tree of source modules, a ``tests/`` tree, docs and config
+files, a large README, and ``node_modules``/``.venv`` decoy trees that every
+walker is expected to prune. ``generate_learned_skills`` fills a global
+``learned/`` skill layer with many skill files.
+
+The same ``SyntheticSpec`` always produces byte-identical output, so timings
+from different runs (and releases) measure the code, not the fixture.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List
+
+SPEC_FILENAME = ".prg-bench-spec.json"
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Shape of one synthetic project."""
+
+    files: int  # project files outside the decoy trees
+    depth: int  # directory levels below the package root
+    decoy_files: int  # files under node_modules/ and .venv/
+    readme_kb: int
+    learned_skills: int
+    seed: int = 1234
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+SIZES: Dict[str, SyntheticSpec] = {
+    "tiny": SyntheticSpec(files=60, depth=3, decoy_files=40, readme_kb=4, learned_skills=10),
+    "1k": SyntheticSpec(files=1_000, depth=6, decoy_files=2_000, readme_kb=64, learned_skills=200),
+    "10k": SyntheticSpec(files=10_000, depth=10, decoy_files=20_000, readme_kb=256, learned_skills=1_000),
+    "100k": SyntheticSpec(files=100_000, depth=14, decoy_files=100_000, readme_kb=1_024, learned_skills=5_000),
+}
+
+_FILES_PER_DIR = 20
+_FANOUT = 8
+
+# (import line, tech keyword) pairs rotated through the source modules.
+_IMPORTS = [
+    ("from fastapi import APIRouter", "fastapi"),
+    ("from sqlalchemy.orm import Session", "sqlalchemy"),
+    ("from pydantic import BaseModel", "pydantic"),
+    ("import click", "click"),
+    ("import requests", "requests"),
+    ("import redis", "redis"),
+    ("from celery import shared_task", "celery"),
+    ("import numpy as np", "numpy"),
+]
+
+_README_TECH = [
+    "FastAPI",
+    "PostgreSQL",
+    "SQLAlchemy",
+    "Pydantic",
+    "Redis",
+    "Celery",
+    "Docker",
+    "pytest",
+    "React",
+    "TypeScript",
+    "GitHub Actions",
+    "Kubernetes",
+]
+
+
+def generate_project(root: Path, spec: SyntheticSpec) -> Path:
+    """Write the project described by ``spec`` into ``root`` and return it.
+
+    An existing tree generated from the same spec is reused as-is; a tree
+    from a different spec is deleted and regenerated.
+    """
+    root = Path(root)
+    marker = root / SPEC_FILENAME
+    if marker.exists():
+        try:
+            if json.loads(marker.read_text(encoding="utf-8")) == spec.to_dict():
+                return root
+        except ValueError:
+            pass
+    if root.exists():
+        shutil.rmtree(root)
+    root.mkdir(parents=True)
+
+    rng = random.Random(spec.seed)
+    _write_top_level(root, spec, rng)
+
+    n_tests = spec.files // 7
+    n_docs = spec.files // 10
+    n_config = spec.files // 20
+    n_source = max(1, spec.files - n_tests - n_docs - n_config)
+
+    for i in range(n_source):
+        _write(root / "src" / "app" / _nested_dir(i, spec.depth) / f"module_{i}.py", _source_module(i, rng))
+    for i in range(n_tests):
+        _write(root / "tests" / _nested_dir(i, max(1, spec.depth // 2)) / f"test_module_{i}.py", _test_module(i))
+    for i in range(n_docs):
+        _write(root / "docs" / _nested_dir(i, 2) / f"guide_{i}.md", f"# Guide {i}\n\n{_paragraph(rng)}\n")
+    for i in range(n_config):
+        _write(root / "config" / f"settings_{i}.json", json.dumps({"name": f"service-{i}", "replicas": i % 5}))
+
+    half = spec.decoy_files // 2
+    for i in range(half):
+        _write(root / "node_modules" / f"pkg{i % 200}" / "lib" / f"index_{i}.js", "module.exports = {};\n")
+    for i in range(spec.decoy_files - half):
+        _write(
+            root / ".venv" / "lib" / "python3.11" / "site-packages" / f"dist{i % 200}" / f"mod_{i}.py",
+            "import os\n",
+        )
+
+    marker.write_text(json.dumps(spec.to_dict()), encoding="utf-8")
+    return root
+
+
+def generate_learned_skills(learned_dir: Path, count: int, seed: int = 1234) -> List[Path]:
+    """Write ``count`` learned skills into ``learned_dir`` and return the skill files.
+
+    Half are flat ``<tech>/<name>.md`` files; the other half are
+    ``<tech>/<name>/SKILL.md`` directories with a ``references/`` subfolder,
+    the layout that ``SkillDiscovery`` must not mistake for extra skills.
+    A tree generated with the same arguments is reused as-is.
+    """
+    learned_dir = Path(learned_dir)
+    marker = learned_dir / SPEC_FILENAME
+    wanted = {"count": count, "seed": seed}
+    reuse = marker.exists() and json.loads(marker.read_text(encoding="utf-8")) == wanted
+    if not reuse and learned_dir.exists():
+        shutil.rmtree(learned_dir)
+
+    rng = random.Random(seed)
+    paths: List[Path] = []
+    techs = [tech for _, tech in _IMPORTS]
+    for i in range(count):
+        tech = techs[i % len(techs)]
+        name = f"{tech}-pattern-{i}"
+        if i % 2:
+            path = learned_dir / tech / name / "SKILL.md"
+            if not reuse:
+                _write(path.parent / "references" / f"{name}-notes.md", f"# Notes\n\n{_paragraph(rng, 20)}\n")
+        else:
+            path = learned_dir / tech / f"{name}.md"
+        if not reuse:
+            _write(path, _skill_document(name, tech, rng))
+        paths.append(path)
+    if not reuse:
+        marker.write_text(json.dumps(wanted), encoding="utf-8")
+    return paths
+
+
+# ----------------------------------------------------------------------
+# Content
+# ----------------------------------------------------------------------
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _nested_dir(i: int, depth: int) -> Path:
+    """Directory for the i-th file: ``_FILES_PER_DIR`` files per leaf, ``depth`` levels deep."""
+    bucket = i // _FILES_PER_DIR
+    parts = []
+    for _ in range(depth):
+        parts.append(f"d{bucket % _FANOUT}")
+        bucket //= _FANOUT
+    return Path(*reversed(parts))
+
+
+_WORDS = (
+    "service request handler cache queue worker schema model endpoint client config "
+    "database session token user account payment order report metrics event stream"
+).split()
+
+
+def _paragraph(rng: random.Random, words: int = 60) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _source_module(i: int, rng: random.Random) -> str:
+    imports = "\n".join(line for line, _ in (_IMPORTS[i % len(_IMPORTS)], _IMPORTS[(i * 3 + 1) % len(_IMPORTS)]))
+    return (
+        f'"""Module {i}: {_paragraph(rng, 12)}"""\n\n'
+        f"{imports}\n\n\n"
+        f"class Handler{i}:\n"
+        f'    """{_paragraph(rng, 10)}"""\n\n'
+        f"    def __init__(self, name: str = 'handler-{i}'):\n"
+        f"        self.name = name\n\n"
+        f"    def handle(self, payload: dict) -> dict:\n"
+        f"        return {{'handler': self.name, **payload}}\n\n\n"
+        f"def build_{i}(value: int) -> int:\n"
+        f"    return value * {i % 97 + 1}\n"
+    )
+
+
+def _test_module(i: int) -> str:
+    body = "".join(f"\n\ndef test_case_{i}_{n}():\n    assert build_{i}({n}) == {n} * {i % 97 + 1}\n" for n in range(4))
+    return f"import pytest\n\nfrom app import build_{i}\n{body}"
+
+
+def _write_top_level(root: Path, spec: SyntheticSpec, rng: random.Random) -> None:
+    sections = [
+        "# Synthetic Service\n",
+        "A FastAPI backend with a React dashboard, used to benchmark project-rules-generator.\n",
+        "## Tech Stack\n\n" + "\n".join(f"- {tech}" for tech in _README_TECH) + "\n",
+        "## Installation\n\n```bash\npip install -r requirements.txt\nnpm install\n```\n",
+        "## Usage\n\n```bash\nuvicorn app.main:app --reload\n```\n",
+        "## Testing\n\n```bash\npytest tests/\n```\n",
+    ]
+    readme = "\n".join(sections)
+    target = spec.readme_kb * 1024
+    n = 0
+    while len(readme) < target:
+        n += 1
+        readme += f"\n## Section {n}\n\n{_paragraph(rng, 120)}\n"
+    _write(root / "README.md", readme)
+
+    _write(
+        root / "requirements.txt",
+        "fastapi==0.110.0\nuvicorn==0.29.0\nsqlalchemy==2.0.29\npydantic==2.7.0\nredis==5.0.3\n"
+        "celery==5.3.6\nrequests==2.31.0\nnumpy==1.26.4\npytest==8.1.1\n",
+    )
+    _write(
+        root / "package.json",
+        json.dumps(
+            {
+                "name": "synthetic-dashboard",
+                "dependencies": {"react": "^18.2.0", "react-dom": "^18.2.0"},
+                "devDependencies": {"typescript": "^5.4.0", "jest": "^29.7.0"},
+            },
+            indent=2,
+        ),
+    )
+    _write(root / "Dockerfile", "FROM python:3.11-slim\nCOPY . /app\nRUN pip install -r /app/requirements.txt\n")
+    _write(root / "src" / "app" / "__init__.py", "")
+    _write(root / "src" / "app" / "main.py", "from fastapi import FastAPI\n\napp = FastAPI()\n")
+
+
+def _skill_document(name: str, tech: str, rng: random.Random) -> str:
+    return (
+        "---\n"
+        f"name: {name}\n"
+        "description: |-\n"
+        f"  When working on {tech} code in this service.\n"
+        f"  When the user asks to add or refactor {tech} integration.\n"
+        "tools:\n  - read\n  - edit\n"
+        "---\n\n"
+        f"# Skill: {name}\n\n"
+        f"## Purpose\n\nWithout a consistent {tech} pattern, {_paragraph(rng, 30)}\n\n"
+        "## Auto-Trigger\n\n"
+        f'- User says: "add {tech} endpoint", "refactor {tech}"\n'
+        f"- When editing files that import {tech}\n\n"
+        "## Process\n\n"
+        f'### Step 1: Inspect existing {tech} usage\n\n```bash\ngrep -rn "{tech}" src/\n```\n\n'
+        f"### Step 2: Apply the pattern\n\n{_paragraph(rng, 40)}\n\n"
+        "### Step 3: Verify\n\n```bash\npytest tests/ -q\n```\n\n"
+        "## Output\n\nA change that follows the project's conventions, with tests.\n\n"
+        "## Anti-Patterns\n\n"
+        f"❌ Calling {tech} directly from request handlers\n✅ Going through the service layer\n"
+    )
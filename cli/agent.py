@@ -42,11 +42,11 @@ def start(task_description, project_path, provider, api_key, verbose):
     # Track skill usage for the matched skill (if any) before the full workflow runs
     try:
         from generator.planning.agent_executor import AgentExecutor
-        from generator.skills.skill_tracker import SkillTracker
+        from generator.skills.skill_tracker import get_skill_tracker
 
         matched = AgentExecutor(Path(project_path).resolve()).match_skill(task_description)
         if matched:
-            SkillTracker().record_match(matched)
+            get_skill_tracker().record_match(matched)
     except Exception:  # noqa: BLE001 — skill tracking is best-effort; never block the user workflow
         pass
 
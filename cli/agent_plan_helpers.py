@@ -111,16 +111,15 @@ def _heuristic_files_for_task(title: str, project_path: Optional[Path]) -> List[
     """
     if not project_path or not project_path.is_dir():
         return []
+    from generator.utils.file_index import get_file_index
+
     keywords = {w.lower() for w in title.split() if len(w) > 3}
     candidates: List[str] = []
-    for src in project_path.rglob("*.py"):
-        if "__pycache__" in src.parts or src.name.startswith("test_"):
+    for entry in get_file_index(project_path).by_suffix(".py"):
+        if entry.name.startswith("test_"):
             continue
-        if any(kw in src.stem.lower() for kw in keywords):
-            try:
-                candidates.append(str(src.relative_to(project_path)))
-            except ValueError:
-                candidates.append(src.name)
+        if any(kw in entry.name[:-3].lower() for kw in keywords):
+            candidates.append(str(Path(entry.rel)))
         if len(candidates) >= 3:
             break
     return candidates
@@ -3,6 +3,7 @@
 import sys
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
 
 import click
 import yaml
@@ -19,22 +20,34 @@ from cli.analyze_helpers import (  # noqa: E402
 )
 from cli.analyze_pipeline import run_generation_pipeline
 from cli.analyze_readme import resolve_readme
+from cli.watch_engine import resident_daemon
 from generator.skills.manager import SkillsManager
 from generator.sources.pack_manager import load_external_packs
+from generator.utils.file_index import ProjectFileIndex
+from generator.utils.ignore import IgnoreMatcher
+from generator.utils.profiler import PhaseProfiler
 from prg_utils.config_schema import validate_config
 from prg_utils.exceptions import InvalidREADMEError, ProjectRulesGeneratorError, READMENotFoundError
 
+CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
+
 
 def load_config():
     """Load configuration from config.yaml."""
-    config_path = Path(__file__).parent.parent / "config.yaml"
     raw_config = {}
-    if config_path.exists():
-        raw_config = yaml.safe_load(config_path.read_text()) or {}
+    if CONFIG_PATH.exists():
+        raw_config = yaml.safe_load(CONFIG_PATH.read_text()) or {}
     config_model = validate_config(raw_config)
     return config_model.model_dump()
 
 
+def load_project_ignore(project_path: Path, config: Optional[dict] = None) -> IgnoreMatcher:
+    """Ignore matcher for ``project_path``: defaults, .gitignore/.prgignore, then ``analysis.ignore``."""
+    if config is None:
+        config = load_config()
+    return IgnoreMatcher.for_project(project_path, extra=config.get("analysis", {}).get("ignore", ()))
+
+
 def cleanup_awesome_skills():
     """Remove deprecated awesome-skills directory."""
     try:
@@ -174,6 +187,7 @@ def _run_analysis_body(
     output_dir: Path,
     skills_manager,
     inc_analyzer,
+    file_index,
     commit: bool,
     interactive: bool,
     verbose: bool,
@@ -190,6 +204,9 @@ def _run_analysis_body(
     ide: str,
     provider: str,
     strategy: str,
+    analysis_cache=None,
+    ai_concurrency: int = 1,
+    profiler=None,
 ) -> None:
     """Body of the ``analyze`` command, extracted so the click entrypoint
     stays small and the radon grade for ``analyze`` drops out of the
@@ -218,6 +235,7 @@ def _run_analysis_body(
         output_dir=output_dir,
         verbose=verbose,
         ai=ai,
+        ai_concurrency=ai_concurrency,
         auto_generate_skills=auto_generate_skills,
         constitution=constitution,
         with_skills=with_skills,
@@ -227,6 +245,9 @@ def _run_analysis_body(
         export_yaml=export_yaml,
         inc_analyzer=inc_analyzer,
         strategy=strategy,
+        file_index=file_index,
+        analysis_cache=analysis_cache,
+        profiler=profiler,
     )
 
     if ide:
@@ -283,6 +304,13 @@ def _register_ide_rules(ide: str, project_path: Path, project_name: str, output_
     help="Directory containing external packs",
 )
 @click.option("--ai", is_flag=True, help="Use AI to generate skill content (requires an API key)")
+@click.option(
+    "--ai-concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Generate up to N AI skills in parallel (with --ai)",
+)
 @click.option(
     "--output",
     type=click.Path(file_okay=False),
@@ -301,6 +329,21 @@ def _register_ide_rules(ide: str, project_path: Path, project_name: str, output_
     help="Explicit mode (manual=no AI, ai=auto-generate+AI, constitution=adds constitution.md)",
 )
 @click.option("--incremental", is_flag=True, help="Only regenerate changed sections (skip if nothing changed)")
+@click.option(
+    "--git-changes",
+    is_flag=True,
+    help="With --incremental in a git repo, take changed files from git diff/status instead of rehashing the tree",
+)
+@click.option(
+    "--profile",
+    "profile",
+    is_flag=True,
+    help="Record per-phase timings and I/O counts to <output>/.prg-profile.json (also: PRG_PROFILE=1)",
+)
+@click.option("--profile-pstats", is_flag=True, help="With --profile, also dump cProfile data (.prg-profile.pstats)")
+@click.option(
+    "--profile-trace", is_flag=True, help="With --profile, also write a Chrome trace (.prg-profile.trace.json)"
+)
 @click.option(
     "--ide",
     type=click.Choice(["antigravity", "none"]),
@@ -358,6 +401,7 @@ def analyze(
     include_pack,
     external_packs_dir,
     ai,
+    ai_concurrency,
     output,
     with_skills,
     auto_generate_skills,
@@ -366,6 +410,10 @@ def analyze(
     merge,
     mode,
     incremental,
+    git_changes,
+    profile,
+    profile_pstats,
+    profile_trace,
     ide,
     provider,
     skills_dir,
@@ -392,7 +440,13 @@ def analyze(
     project_path = Path(project_path).resolve()
     cleanup_awesome_skills()
 
-    skills_manager = SkillsManager(project_path=project_path, skills_dir=skills_dir)
+    # Under `prg watch` the resident daemon supplies long-lived state (file
+    # index, skill discovery cache, analysis cache) instead of rebuilding it.
+    daemon = resident_daemon(project_path)
+    if daemon is not None:
+        skills_manager = daemon.skills_manager(project_path, skills_dir)
+    else:
+        skills_manager = SkillsManager(project_path=project_path, skills_dir=skills_dir)
 
     # Resolve mode shortcuts and provider-implied flags
     auto_generate_skills, ai, constitution = normalize_analyze_options(
@@ -432,39 +486,76 @@ def analyze(
         if verbose:
             click.echo(f"⚠️  Skills structure setup warning: {e}")
 
+    # One pruned walk of the project tree, shared by change detection and every
+    # analyzer in the generation pipeline. With --git-changes the walk waits
+    # until git has said whether anything changed at all.
+    ignore = load_project_ignore(project_path) if daemon is None else None
+    if daemon is not None:
+        file_index = daemon.file_index
+    elif incremental and git_changes:
+        file_index = None
+    else:
+        file_index = ProjectFileIndex.build(project_path, ignore=ignore)
+    analysis_cache = daemon.analysis_cache(output_dir) if daemon is not None else None
+
     # Incremental mode: check for changes before heavy work (exits if nothing changed)
-    inc_analyzer = setup_incremental(incremental, project_path, output_dir)
+    inc_analyzer = setup_incremental(
+        incremental, project_path, output_dir, file_index=file_index, git_changes=git_changes, ignore=ignore
+    )
+    if file_index is None:
+        file_index = (inc_analyzer and inc_analyzer.walked_index) or ProjectFileIndex.build(project_path, ignore=ignore)
     if inc_analyzer and verbose:
         # detect_changes() is cached — no re-read cost
-        click.echo(f"Incremental: changed sections: {', '.join(sorted(inc_analyzer.detect_changes()))}")
+        click.echo(
+            f"Incremental ({inc_analyzer.change_source}): changed sections: "
+            f"{', '.join(sorted(inc_analyzer.detect_changes()))}"
+        )
+        for section, files in sorted(inc_analyzer.changed_files.items()):
+            if files:
+                more = f" (+{len(files) - 5} more)" if len(files) > 5 else ""
+                click.echo(f"   {section}: {', '.join(files[:5])}{more}")
 
     if verbose:
         click.echo(f"Target: {project_path}")
     provider = setup_logging_and_provider(verbose, provider, api_key, __version__)
 
-    with _analyze_error_boundary(verbose):
-        _run_analysis_body(
-            project_path=project_path,
-            output_dir=output_dir,
-            skills_manager=skills_manager,
-            inc_analyzer=inc_analyzer,
-            commit=commit,
-            interactive=interactive,
-            verbose=verbose,
-            export_json=export_json,
-            export_yaml=export_yaml,
-            save_learned=save_learned,
-            include_pack=include_pack,
-            external_packs_dir=external_packs_dir,
-            ai=ai,
-            with_skills=with_skills,
-            auto_generate_skills=auto_generate_skills,
-            constitution=constitution,
-            merge=merge,
-            ide=ide,
-            provider=provider,
-            strategy=strategy,
-        )
+    profiler = PhaseProfiler.from_env(profile or profile_pstats or profile_trace)
+    if profiler is not None:
+        profiler.pstats_dump = profiler.pstats_dump or profile_pstats
+        profiler.chrome_trace = profiler.chrome_trace or profile_trace
+
+    try:
+        with _analyze_error_boundary(verbose):
+            _run_analysis_body(
+                project_path=project_path,
+                output_dir=output_dir,
+                skills_manager=skills_manager,
+                inc_analyzer=inc_analyzer,
+                file_index=file_index,
+                analysis_cache=analysis_cache,
+                commit=commit,
+                interactive=interactive,
+                verbose=verbose,
+                export_json=export_json,
+                export_yaml=export_yaml,
+                save_learned=save_learned,
+                include_pack=include_pack,
+                external_packs_dir=external_packs_dir,
+                ai=ai,
+                ai_concurrency=ai_concurrency,
+                with_skills=with_skills,
+                auto_generate_skills=auto_generate_skills,
+                constitution=constitution,
+                merge=merge,
+                ide=ide,
+                provider=provider,
+                strategy=strategy,
+                profiler=profiler,
+            )
+    finally:
+        if profiler is not None:
+            written = profiler.write(output_dir, metadata={"prg_version": __version__, "project": str(project_path)})
+            click.echo(f"Profile written to {written[0]}", err=True)
 
 
 if __name__ == "__main__":
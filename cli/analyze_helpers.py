@@ -227,20 +227,33 @@ def setup_logging_and_provider(verbose: bool, provider: Optional[str], api_key:
     return resolved
 
 
-def setup_incremental(incremental: bool, project_path: Path, output_dir: Path) -> Any:
+def setup_incremental(
+    incremental: bool,
+    project_path: Path,
+    output_dir: Path,
+    file_index: Any = None,
+    git_changes: bool = False,
+    ignore: Any = None,
+) -> Any:
     """Create IncrementalAnalyzer and perform early-exit if nothing changed.
 
     Returns the analyzer instance (or None when --incremental is not set).
-    Calls sys.exit(0) when no changes are detected.
+    Calls sys.exit(0) when no changes are detected. ``file_index`` is the
+    shared ProjectFileIndex so change detection reuses the pipeline's walk;
+    with ``git_changes`` it may be None and is only walked if git cannot
+    supply the change list.
     """
     from generator.analyzers.incremental_analyzer import IncrementalAnalyzer
 
     if not incremental:
         return None
 
-    inc_analyzer = IncrementalAnalyzer(project_path, output_dir)
+    inc_analyzer = IncrementalAnalyzer(
+        project_path, output_dir, file_index=file_index, git_changes=git_changes, ignore=ignore
+    )
     changed_sections = inc_analyzer.detect_changes()
     if not changed_sections:
+        inc_analyzer.save_git_state()
         click.echo("No changes detected. Skipping regeneration. (use without --incremental to force)")
         sys.exit(0)
     return inc_analyzer
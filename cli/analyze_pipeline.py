@@ -5,22 +5,47 @@ rules, skills auto-generation, export, and skill copying.
 Extracted from analyze_cmd.py to keep each module focused.
 """
 
+import logging
 import shutil
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Set
 
 import click
 
-from generator.analyzers.incremental_analyzer import IncrementalAnalyzer
+from generator.analyzers.analysis_cache import AnalysisCache
 from generator.outputs.clinerules_generator import generate_clinerules
 from generator.parsers.enhanced_parser import EnhancedProjectParser
 from generator.rules.constitution_generator import generate_constitution
 from generator.rules_generator import generate_rules, rules_to_json
 from generator.skills.enhanced_skill_matcher import EnhancedSkillMatcher
 from generator.storage.skill_paths import SkillPathManager
+from generator.utils.file_index import ProjectFileIndex, use_file_index
+from generator.utils.fragment_cache import FragmentCache
+from generator.utils.profiler import PhaseProfiler
+from generator.utils.stage_graph import StageGraph, format_timings
 from prg_utils.file_ops import save_markdown
 
+logger = logging.getLogger(__name__)
+
+
+def _profiled(profiler: Optional[PhaseProfiler], name: str) -> ContextManager[Any]:
+    """``profiler.phase(name)``, or a no-op when the run is not being profiled."""
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+
+def _profiled_stage(profiler: Optional[PhaseProfiler], name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a StageGraph stage function so it runs inside ``_profiled(profiler, name)``."""
+    if profiler is None:
+        return fn
+
+    def stage(**deps: Any) -> Any:
+        with profiler.phase(name):
+            return fn(**deps)
+
+    return stage
+
 
 @dataclass
 class PipelineConfig:
@@ -39,6 +64,7 @@ class PipelineConfig:
     export_json: bool = False
     export_yaml: bool = False
     strategy: str = "auto"
+    ai_concurrency: int = 1
 
 
 try:
@@ -87,12 +113,30 @@ def run_generation_pipeline(
     export_json: bool = False,
     export_yaml: bool = False,
     strategy: str = "auto",
+    ai_concurrency: int = 1,
+    file_index: Optional[ProjectFileIndex] = None,
+    analysis_cache: Optional[AnalysisCache] = None,
+    profiler: Optional[PhaseProfiler] = None,
+    fragment_cache: Optional[FragmentCache] = None,
 ) -> List[Path]:
     """Run the full artifact generation pipeline.
 
     Accepts either a PipelineConfig object (preferred) or the individual boolean/string
     kwargs (kept for backward-compat). When both are supplied, pipeline_cfg wins.
 
+    ``file_index`` is the single project walk shared by every analyzer; it is
+    built here when the caller did not supply one, and activated for the whole
+    run so deeper helpers that only receive ``project_path`` reuse it too.
+    ``analysis_cache`` holds per-file facts (import matches, test counts, AST
+    symbols) persisted under ``<output_dir>/.prg-cache/``; it is loaded here
+    when not supplied and saved once the run finishes. ``fragment_cache``
+    does the same for the rendered sections of rules.md, constitution.md and
+    clinerules.yaml, so only sections whose inputs changed are re-rendered.
+
+    ``profiler`` (``prg analyze --profile``) records each phase; stages and
+    AI skill generations (``ai_concurrency``) then run serially so file, regex
+    and LLM counters land in the right phase.
+
     Returns:
         List of generated file paths.
     """
@@ -106,11 +150,21 @@ def run_generation_pipeline(
         export_json = pipeline_cfg.export_json
         export_yaml = pipeline_cfg.export_yaml
         strategy = pipeline_cfg.strategy
+        ai_concurrency = pipeline_cfg.ai_concurrency
+    if profiler is not None:
+        # Phases are tracked per thread; work on pool threads would be dropped.
+        ai_concurrency = 1
 
     if verbose:
         click.echo("\nGenerating files...")
 
     generated_files: List[Path] = []
+    if file_index is None:
+        file_index = ProjectFileIndex.build(project_path)
+    if analysis_cache is None:
+        analysis_cache = AnalysisCache.load(output_dir)
+    if fragment_cache is None:
+        fragment_cache = FragmentCache.load(output_dir)
 
     # Resolve which phases need to run (all True when not incremental)
     _run_enhanced = _run_rules = _run_constitution = _run_skills_gen = True
@@ -130,100 +184,153 @@ def run_generation_pipeline(
             if skipped:
                 click.echo(f"   Incremental: skipping unchanged phases: {', '.join(skipped)}")
 
-    with tqdm(total=4, disable=not verbose, desc="Build") as pbar:
+    with use_file_index(file_index), tqdm(total=4, disable=not verbose, desc="Build") as pbar:
+        # Constitution, rules and skill matching each consume only the
+        # enhanced context, so they run concurrently once it is available.
+        # Output is replayed in this (serial) order; see StageGraph.
         pbar.set_description("Analyzing Project")
-        enhanced_context = _phase_enhanced_parse(project_path, _run_enhanced, verbose)
-        pbar.update(1)
 
-        # Sync project_data tech_stack with the enhanced parser result.
-        # resolve_readme() uses a README-only detector that can include noisy tokens
-        # (e.g. "gpt" from prose, "jest" from Python test files).  The enhanced
-        # parser runs a richer, filtered pipeline and is the authoritative source;
-        # overwriting here ensures rules.md and clinerules.yaml stay consistent.
-        if enhanced_context:
-            _meta_tech = enhanced_context.get("metadata", {}).get("tech_stack", [])
-            if _meta_tech:
-                project_data["tech_stack"] = _meta_tech
-
-        _phase_constitution(
-            project_name,
-            enhanced_context,
-            output_dir,
-            project_path,
-            verbose,
-            constitution,
-            _run_constitution,
-            generated_files,
-        )
-
-        pbar.set_description("Generating Rules")
-        rules_content = _phase_rules(
-            project_data,
-            config,
-            enhanced_context,
-            output_dir,
-            verbose,
-            _run_rules,
+        def enhanced_parse_stage() -> Optional[Dict[str, Any]]:
+            with _profiled(profiler, "enhanced_parse"):
+                context = _phase_enhanced_parse(
+                    project_path,
+                    _run_enhanced,
+                    verbose,
+                    file_index=file_index,
+                    analysis_cache=analysis_cache,
+                    max_workers=1 if profiler is not None else None,
+                )
+            # Sync project_data tech_stack with the enhanced parser result.
+            # resolve_readme() uses a README-only detector that can include noisy tokens
+            # (e.g. "gpt" from prose, "jest" from Python test files).  The enhanced
+            # parser runs a richer, filtered pipeline and is the authoritative source;
+            # overwriting here ensures rules.md and clinerules.yaml stay consistent.
+            if context:
+                _meta_tech = context.get("metadata", {}).get("tech_stack", [])
+                if _meta_tech:
+                    project_data["tech_stack"] = _meta_tech
+            return context
+
+        stages = StageGraph()
+        stages.add("enhanced_parse", enhanced_parse_stage)
+        stages.add(
+            "constitution",
+            _profiled_stage(
+                profiler,
+                "constitution",
+                lambda enhanced_parse: _phase_constitution(
+                    project_name,
+                    enhanced_parse,
+                    output_dir,
+                    project_path,
+                    verbose,
+                    constitution,
+                    _run_constitution,
+                    generated_files,
+                    fragment_cache=fragment_cache,
+                ),
+            ),
+            deps=("enhanced_parse",),
         )
-        pbar.update(1)
-
-        pbar.set_description("Processing Skills")
-        enhanced_selected_skills = _phase_skills(
-            project_path,
-            project_name,
-            enhanced_context,
-            provider,
-            ai,
-            verbose,
-            skills_manager,
-            strategy,
-            auto_generate_skills,
-            _run_skills_gen,
-            output_dir,
-            readme_path=readme_path,
+        stages.add(
+            "rules",
+            _profiled_stage(
+                profiler,
+                "rules",
+                lambda enhanced_parse: _phase_rules(
+                    project_data,
+                    config,
+                    enhanced_parse,
+                    output_dir,
+                    verbose,
+                    _run_rules,
+                    fragment_cache=fragment_cache,
+                ),
+            ),
+            deps=("enhanced_parse",),
         )
-        pbar.update(1)
-
-        pbar.set_description("Unified Export (.clinerules/)")
-        unified_content = _build_unified_content(
-            rules_content=rules_content,
-            triggers_dict=(
-                skills_manager.extract_project_triggers(include_only=enhanced_selected_skills) if with_skills else {}
+        stages.add(
+            "skills",
+            _profiled_stage(
+                profiler,
+                "skills",
+                lambda enhanced_parse: _phase_skills(
+                    project_path,
+                    project_name,
+                    enhanced_parse,
+                    provider,
+                    ai,
+                    verbose,
+                    skills_manager,
+                    strategy,
+                    auto_generate_skills,
+                    _run_skills_gen,
+                    output_dir,
+                    readme_path=readme_path,
+                    file_index=file_index,
+                    analysis_cache=analysis_cache,
+                    ai_concurrency=ai_concurrency,
+                ),
             ),
-            skills_manager=skills_manager,
-            enhanced_selected_skills=enhanced_selected_skills,
-            project_name=project_name,
-            readme_path=readme_path,
-            output_dir=output_dir,
-            merge=merge,
-            verbose=verbose,
-            generated_files=generated_files,
-            enhanced_context=enhanced_context,
+            deps=("enhanced_parse",),
         )
+        try:
+            results = stages.run(max_workers=1 if profiler is not None else None)
+        finally:
+            logger.debug("analyze stages: %s", stages.format_timings())
+        enhanced_context = results["enhanced_parse"]
+        rules_content = results["rules"]
+        enhanced_selected_skills = results["skills"]
+        pbar.update(3)
+        if verbose:
+            click.echo(f"   Stage timings: {stages.format_timings()}")
 
-        _phase_write_rules(
-            unified_content,
-            output_dir,
-            inc_analyzer,
-            verbose,
-            generated_files,
-            skills_manager,
-            include_only=enhanced_selected_skills if with_skills else None,
-        )
+        pbar.set_description("Unified Export (.clinerules/)")
+        with _profiled(profiler, "unified_content"):
+            unified_content = _build_unified_content(
+                rules_content=rules_content,
+                triggers_dict=(
+                    skills_manager.extract_project_triggers(include_only=enhanced_selected_skills)
+                    if with_skills
+                    else {}
+                ),
+                skills_manager=skills_manager,
+                enhanced_selected_skills=enhanced_selected_skills,
+                project_name=project_name,
+                readme_path=readme_path,
+                output_dir=output_dir,
+                merge=merge,
+                verbose=verbose,
+                generated_files=generated_files,
+                enhanced_context=enhanced_context,
+                fragment_cache=fragment_cache,
+            )
+
+        with _profiled(profiler, "write_rules"):
+            _phase_write_rules(
+                unified_content,
+                output_dir,
+                inc_analyzer,
+                verbose,
+                generated_files,
+                skills_manager,
+                include_only=enhanced_selected_skills if with_skills else None,
+            )
         pbar.update(1)
 
         pbar.set_description("Saving Skill Artifacts")
-        _run_skill_orchestration(
-            config=config,
-            project_data=project_data,
-            project_name=project_name,
-            project_path=project_path,
-            save_learned=save_learned,
-            export_json=export_json,
-            export_yaml=export_yaml,
-            output_dir=output_dir,
-            generated_files=generated_files,
-        )
+        with _profiled(profiler, "skill_orchestration"):
+            _run_skill_orchestration(
+                config=config,
+                project_data=project_data,
+                project_name=project_name,
+                project_path=project_path,
+                save_learned=save_learned,
+                export_json=export_json,
+                export_yaml=export_yaml,
+                output_dir=output_dir,
+                generated_files=generated_files,
+            )
 
         # Phase 4e: skills/index.md is now written exactly once, here.
         # _run_skill_orchestration above no longer writes the markdown
@@ -232,10 +339,11 @@ def run_generation_pipeline(
         # matches clinerules.yaml (the original "H4 fix" guarantee, but
         # without the double-write).
         project_type_label = (enhanced_context or {}).get("metadata", {}).get("project_type", "")
-        index_path = skills_manager.generate_perfect_index(
-            project_type=project_type_label,
-            include_only=enhanced_selected_skills if with_skills else None,
-        )
+        with _profiled(profiler, "skills_index"):
+            index_path = skills_manager.generate_perfect_index(
+                project_type=project_type_label,
+                include_only=enhanced_selected_skills if with_skills else None,
+            )
         if index_path and index_path not in generated_files:
             generated_files.append(index_path)
 
@@ -248,13 +356,22 @@ def run_generation_pipeline(
         # Plans/prg-systemic-bug-refactor.md and cli/profile_shadow.py.
         from cli.profile_shadow import shadow_validate
 
-        shadow_validate(
-            enhanced_context=enhanced_context,
-            project_path=project_path,
-            selected_skill_refs=enhanced_selected_skills,
-            output_dir=output_dir,
-            verbose=verbose,
-        )
+        with _profiled(profiler, "shadow_validate"):
+            shadow_validate(
+                enhanced_context=enhanced_context,
+                project_path=project_path,
+                selected_skill_refs=enhanced_selected_skills,
+                output_dir=output_dir,
+                verbose=verbose,
+            )
+
+    analysis_cache.save(file_index)
+    fragment_cache.save()
+    if verbose:
+        stats = analysis_cache.stats()
+        click.echo(f"   Analysis cache: {stats['hits']} hits, {stats['misses']} misses")
+        fragment_stats = fragment_cache.stats()
+        click.echo(f"   Fragments: {fragment_stats['rendered']} rendered, {fragment_stats['reused']} reused")
 
     return generated_files
 
@@ -268,7 +385,7 @@ def _ensure_clinerules_gitignore(output_dir: Path) -> None:
     (or extends) a minimal .gitignore so users never have to think about it.
     """
     gitignore_path = output_dir / ".gitignore"
-    required_lines = {"*.bak", "*.tmp", ".prg-invariants.json"}
+    required_lines = {"*.bak", "*.tmp", ".prg-invariants.json", ".prg-cache/", ".prg-profile*"}
 
     existing: set[str] = set()
     header_present = False
@@ -306,6 +423,9 @@ def _phase_enhanced_parse(
     project_path: Path,
     run_enhanced: bool,
     verbose: bool,
+    file_index: Optional[ProjectFileIndex] = None,
+    analysis_cache: Optional[AnalysisCache] = None,
+    max_workers: Optional[int] = None,
 ) -> Optional[Dict[str, Any]]:
     """Phase 1: parse the project with EnhancedProjectParser.
 
@@ -317,11 +437,15 @@ def _phase_enhanced_parse(
         if verbose:
             click.echo("   Incremental: skipped enhanced parse (source/structure unchanged)")
         return None
+    parser = EnhancedProjectParser(project_path, file_index=file_index, analysis_cache=analysis_cache)
     try:
-        return EnhancedProjectParser(project_path).extract_full_context()
+        context = parser.extract_full_context(max_workers=max_workers)
     except (OSError, ValueError, RuntimeError) as e:
         click.echo(f"⚠️  Enhanced analysis failed (generation will continue with reduced context): {e}", err=True)
         return None
+    if verbose:
+        click.echo(f"   Parse stages: {format_timings(parser.timings)}")
+    return context
 
 
 def _phase_constitution(
@@ -333,6 +457,7 @@ def _phase_constitution(
     constitution: bool,
     run_constitution: bool,
     generated_files: List[Path],
+    fragment_cache: Optional[FragmentCache] = None,
 ) -> None:
     """Phase 2: optionally generate constitution.md.
 
@@ -348,7 +473,9 @@ def _phase_constitution(
         if verbose:
             click.echo("   Skipping constitution (enhanced analysis unavailable)")
         return
-    content = generate_constitution(project_name, enhanced_context, project_path=project_path)
+    content = generate_constitution(
+        project_name, enhanced_context, project_path=project_path, fragment_cache=fragment_cache
+    )
     path = output_dir / "constitution.md"
     path.write_text(content, encoding="utf-8")
     generated_files.append(path)
@@ -363,19 +490,20 @@ def _phase_rules(
     output_dir: Path,
     verbose: bool,
     run_rules: bool,
+    fragment_cache: Optional[FragmentCache] = None,
 ) -> str:
     """Phase 3: produce rules content string.
 
     When skipped, returns cached rules.md content (or regenerates if no cache exists).
     """
     if run_rules:
-        return generate_rules(project_data, config, enhanced_context=enhanced_context)
+        return generate_rules(project_data, config, enhanced_context=enhanced_context, fragment_cache=fragment_cache)
     existing = output_dir / "rules.md"
     if existing.exists():
         if verbose:
             click.echo("   Incremental: skipped rules regen (README/deps unchanged) — using cached rules.md")
         return existing.read_text(encoding="utf-8")
-    return generate_rules(project_data, config, enhanced_context=enhanced_context)
+    return generate_rules(project_data, config, enhanced_context=enhanced_context, fragment_cache=fragment_cache)
 
 
 def _phase_skills(
@@ -391,6 +519,9 @@ def _phase_skills(
     run_skills_gen: bool,
     output_dir: Optional[Path] = None,
     readme_path: Optional[Path] = None,
+    file_index: Optional[ProjectFileIndex] = None,
+    analysis_cache: Optional[AnalysisCache] = None,
+    ai_concurrency: int = 1,
 ) -> Set[str]:
     """Phase 4: optionally auto-generate skills.
 
@@ -414,6 +545,9 @@ def _phase_skills(
         strategy=strategy,
         output_dir=output_dir,
         readme_path=readme_path,
+        file_index=file_index,
+        analysis_cache=analysis_cache,
+        ai_concurrency=ai_concurrency,
     )
 
 
@@ -426,21 +560,20 @@ def _phase_write_rules(
     skills_manager: Any,
     include_only: Optional[Set[str]] = None,
 ) -> None:
-    """Phase 6: write rules.md and rules.json; merge incrementally when appropriate.
+    """Phase 6: write rules.md and rules.json.
 
-    Appends both files to generated_files.
+    ``unified_content`` is always the complete file — the rules part is
+    assembled from cached fragments, so nothing is spliced into the previous
+    rules.md. Appends both files to generated_files.
 
     Args:
         include_only: Forwarded to save_triggers_json — limits auto-triggers.json to
                       the project's selected skill refs, preventing global-cache leakage.
     """
     rules_path = output_dir / "rules.md"
-    if inc_analyzer and rules_path.exists():
+    if inc_analyzer and verbose:
         changed_sections = inc_analyzer.detect_changes()  # cached — no re-read
-        existing_rules = rules_path.read_text(encoding="utf-8")
-        unified_content = IncrementalAnalyzer.merge_rules(existing_rules, unified_content, changed_sections)
-        if verbose:
-            click.echo(f"   Incremental: merged changes from {', '.join(sorted(changed_sections))}")
+        click.echo(f"   Incremental: regenerated sections affected by {', '.join(sorted(changed_sections))}")
     save_markdown(rules_path, unified_content, backup=True)
     generated_files.append(rules_path)
 
@@ -468,6 +601,7 @@ def _build_unified_content(
     verbose: bool,
     generated_files: List[Path],
     enhanced_context: Optional[Dict[str, Any]] = None,
+    fragment_cache: Optional[FragmentCache] = None,
 ) -> str:
     """Assemble the unified rules + skills content string.
 
@@ -498,6 +632,7 @@ def _build_unified_content(
             enhanced_selected_skills,
             enhanced_context,
             output_dir=output_dir,
+            fragment_cache=fragment_cache,
         )
 
         # Bug 2 fix: add a visible skill listing so agents can read active skills
@@ -0,0 +1,44 @@
+"""prg cache — inspect and clear the persistent LLM response cache.
+
+Commands::
+
+    prg cache stats    # Location, entry count, size and limits
+    prg cache clear    # Delete every cached response
+"""
+
+from __future__ import annotations
+
+import click
+
+from generator.ai.response_cache import get_response_cache
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@click.group(name="cache")
+def cache_group() -> None:
+    """Manage the LLM response cache (~/.prg/llm-cache)."""
+
+
+@cache_group.command(name="stats")
+def cache_stats() -> None:
+    """Show where the cache lives, how big it is, and its limits."""
+    stats = get_response_cache().stats()
+    ttl_days = stats["ttl_seconds"] / 86400
+    click.echo(f"Path:    {stats['path']}")
+    click.echo(f"Entries: {stats['entries']} (max {stats['max_entries']})")
+    click.echo(f"Size:    {_format_bytes(stats['bytes'])} (max {_format_bytes(stats['max_bytes'])})")
+    click.echo(f"TTL:     {ttl_days:g} days")
+
+
+@cache_group.command(name="clear")
+def cache_clear() -> None:
+    """Delete every cached LLM response."""
+    removed = get_response_cache().clear()
+    click.echo(f"Removed {removed} cached response(s).")
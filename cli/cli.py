@@ -1,5 +1,6 @@
 """CLI orchestrator for project rules and skills generator."""
 
+import importlib
 from pathlib import Path
 
 from prg_utils.logger import ensure_utf8_streams
@@ -14,9 +15,55 @@ from dotenv import load_dotenv  # noqa: E402
 
 from cli._version import __version__  # noqa: E402
 
-# Import commands from modules
-# note: imports are delayed to avoid circular dependency issues during setup if any
-# but specific command imports are usually fine.
+# Sub-commands are imported on first use, not here: the command modules pull
+# in pydantic, yaml, rich and the generator packages, and `prg --version`,
+# shell completion and git-hook calls should not pay for that.
+# Name → "module:attribute" of the click command.
+_LAZY_COMMANDS = {
+    "agent": "cli.agent:agent_command",
+    "analyze": "cli.analyze_cmd:analyze",
+    "cache": "cli.cache_cmd:cache_group",
+    "create-rules": "cli.create_rules_cmd:create_rules",
+    "design": "cli.cmd_design:design",
+    "exec": "cli.jobs:exec_task",
+    "feature": "cli.feature_cmd:feature",
+    "gaps": "cli.gaps_cmd:gaps",
+    "init": "cli.init_cmd:init",
+    "leaderboard": "cli.jobs:leaderboard",
+    "manager": "cli.manager_cmd:manager",
+    "next": "cli.jobs:next_task",
+    "plan": "cli.cmd_plan:plan",
+    "providers": "cli.providers_cmd:providers_group",
+    "quality": "cli.quality_cmd:quality_cmd",
+    "query": "cli.jobs:query_tasks",
+    "ralph": "cli.ralph_cmd:ralph_group",
+    "review": "cli.cmd_review:review",
+    "setup": "cli.agent:setup",
+    "skills": "cli.skills_cmd:skills_group",
+    "spec": "cli.gaps_cmd:spec_cmd",
+    "start": "cli.agent:start",
+    "status": "cli.jobs:status",
+    "tasks": "cli.tasks_cmd:tasks_cmd",
+    "verify": "cli.verify_cmd:verify",
+    "watch": "cli.watch_cmd:watch",
+}
+
+# ── CLI surface curation (CR §4.5) ────────────────────────────────────────────
+# `prg --help` previously listed all 25 commands with no hierarchy, which buries
+# the "start here" path for new users. We keep a small, stable core visible and
+# mark everything else hidden=True — the hidden commands stay fully invocable
+# (e.g. `prg ralph ...` still works), they're just not advertised until they
+# stabilise. Promote a command by adding its name to _STABLE_COMMANDS.
+_STABLE_COMMANDS = {
+    "init",
+    "analyze",
+    "create-rules",
+    "quality",
+    "skills",
+    "plan",
+    "providers",
+    "status",
+}
 
 
 def _looks_like_default_target(arg: str) -> bool:
@@ -44,7 +91,51 @@ def _looks_like_default_target(arg: str) -> bool:
     return False
 
 
-class DefaultGroup(click.Group):
+# Flags accepted by the root group itself (before the sub-command name).
+_GROUP_FLAGS = ("--no-llm-cache",)
+
+
+class LazyGroup(click.Group):
+    """Click group that imports each sub-command the first time it is needed.
+
+    ``lazy_commands`` maps a command name to ``"module:attribute"``. When
+    ``visible_commands`` is given, every other lazy command is marked hidden
+    and left out of ``list_commands`` — hidden commands never appear in help
+    or completion, so listing them would only import them for nothing. They
+    stay invocable by name.
+    """
+
+    def __init__(self, *args, lazy_commands=None, visible_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+        self.visible_commands = set(visible_commands) if visible_commands is not None else None
+
+    def _is_visible(self, cmd_name):
+        return self.visible_commands is None or cmd_name in self.visible_commands
+
+    def has_command(self, cmd_name):
+        return cmd_name in self.commands or cmd_name in self.lazy_commands
+
+    def list_commands(self, ctx):
+        lazy = {name for name in self.lazy_commands if self._is_visible(name)}
+        return sorted(lazy | set(self.commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self._load(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name):
+        module_name, _, attr = self.lazy_commands[cmd_name].partition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{self.lazy_commands[cmd_name]} is not a click command")
+        if not self._is_visible(cmd_name):
+            command.hidden = True
+        return command
+
+
+class DefaultGroup(LazyGroup):
     """Click group that delegates to a default command when none is given."""
 
     def __init__(self, *args, default_cmd="analyze", **kwargs):
@@ -52,28 +143,40 @@ class DefaultGroup(click.Group):
         self.default_cmd = default_cmd
 
     def parse_args(self, ctx, args):
+        # Group-level flags come first; route on whatever follows them.
+        leading = []
+        while args and args[0] in _GROUP_FLAGS:
+            leading.append(args[0])
+            args = args[1:]
         if not args:
             args = [self.default_cmd]
         # Let group-level flags (--help, --version) pass through, and only route
         # to the default command when the first arg looks like a path/option —
         # a bare unknown word falls through to Click's "No such command" error.
         elif (
-            args[0] not in self.commands
+            not self.has_command(args[0])
             and args[0] not in ("--help", "--version", "-h")
             and _looks_like_default_target(args[0])
         ):
             args = [self.default_cmd] + list(args)
-        return super().parse_args(ctx, args)
+        return super().parse_args(ctx, leading + list(args))
 
 
 @click.group(
     cls=DefaultGroup,
     default_cmd="analyze",
+    lazy_commands=_LAZY_COMMANDS,
+    visible_commands=_STABLE_COMMANDS,
     help="Project Rules Generator - Generate rules.md and skills.md from README.md",
     epilog="Use 'analyze --help' to see options for the default analyze command.",
 )
 @click.version_option(version=__version__)
-def cli():
+@click.option(
+    "--no-llm-cache",
+    is_flag=True,
+    help="Always call the AI provider; bypass the response cache in ~/.prg/llm-cache",
+)
+def cli(no_llm_cache):
     """Project Rules Generator - Generate rules.md and skills.md from README.md
 
     Common analyze options:
@@ -84,73 +187,10 @@ def cli():
       --output PATH            Output directory (default: .clinerules)
       --incremental            Only regenerate changed sections
     """
-    pass
-
-
-from cli.agent import agent_command, design, plan, review, setup, start
-
-# Import and register commands at module level
-from cli.analyze_cmd import analyze
-from cli.create_rules_cmd import create_rules
-from cli.feature_cmd import feature
-from cli.gaps_cmd import gaps, spec_cmd
-from cli.init_cmd import init
-from cli.jobs import exec_task, leaderboard, next_task, query_tasks, status
-from cli.manager_cmd import manager
-from cli.providers_cmd import providers_group
-from cli.quality_cmd import quality_cmd
-from cli.ralph_cmd import ralph_group
-from cli.skills_cmd import skills_group
-from cli.tasks_cmd import tasks_cmd
-from cli.verify_cmd import verify
-from cli.watch_cmd import watch
-
-cli.add_command(analyze)
-cli.add_command(init)
-cli.add_command(create_rules)
-cli.add_command(design)
-cli.add_command(plan)
-cli.add_command(review)
-cli.add_command(start)
-cli.add_command(setup)
-cli.add_command(exec_task)
-cli.add_command(status)
-cli.add_command(next_task, name="next")
-cli.add_command(query_tasks, name="query")
-cli.add_command(manager)
-cli.add_command(verify)
-cli.add_command(gaps)
-cli.add_command(tasks_cmd)
-cli.add_command(spec_cmd, name="spec")
-cli.add_command(agent_command)
-cli.add_command(leaderboard)
-cli.add_command(providers_group, name="providers")
-cli.add_command(quality_cmd, name="quality")
-cli.add_command(skills_group, name="skills")
-cli.add_command(watch)
-cli.add_command(feature)
-cli.add_command(ralph_group, name="ralph")
-
+    if no_llm_cache:
+        from generator.ai.response_cache import set_llm_cache_enabled
 
-# ── CLI surface curation (CR §4.5) ────────────────────────────────────────────
-# `prg --help` previously listed all 25 commands with no hierarchy, which buries
-# the "start here" path for new users. We keep a small, stable core visible and
-# mark everything else hidden=True — the hidden commands stay fully invocable
-# (e.g. `prg ralph ...` still works), they're just not advertised until they
-# stabilise. Promote a command by adding its name to _STABLE_COMMANDS.
-_STABLE_COMMANDS = {
-    "init",
-    "analyze",
-    "create-rules",
-    "quality",
-    "skills",
-    "plan",
-    "providers",
-    "status",
-}
-for _name, _command in cli.commands.items():
-    if _name not in _STABLE_COMMANDS:
-        _command.hidden = True
+        set_llm_cache_enabled(False)
 
 
 def _sanitize_env_from_dotenv() -> None:
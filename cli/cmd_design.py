@@ -8,6 +8,7 @@ from cli._version import __version__
 from cli.utils import detect_provider as _detect_provider
 from cli.utils import has_api_key as _has_api_key
 from cli.utils import set_api_key_env as _set_api_key
+from cli.utils import stream_progress as _stream_progress
 
 
 @click.command(name="design")
@@ -68,7 +69,8 @@ def design(description, project_path, output, api_key, provider, verbose):
 
     from generator.outputs.design_generator import DesignGenerator
 
-    generator = DesignGenerator(provider=provider or "groq")
+    progress = _stream_progress("Generating design") if verbose else None
+    generator = DesignGenerator(provider=provider or "groq", on_progress=progress)
 
     if verbose:
         click.echo("Generating design...")
@@ -15,6 +15,7 @@ from cli.agent_plan_helpers import (
 from cli.utils import detect_provider as _detect_provider
 from cli.utils import has_api_key as _has_api_key
 from cli.utils import set_api_key_env as _set_api_key
+from cli.utils import stream_progress as _stream_progress
 
 
 @click.command(name="plan")
@@ -161,7 +162,8 @@ def plan(
 
     from generator.tasks import TaskDecomposer
 
-    decomposer = TaskDecomposer(provider=provider, api_key=api_key)
+    progress = _stream_progress("Decomposing task") if verbose else None
+    decomposer = TaskDecomposer(provider=provider, api_key=api_key, on_progress=progress)
     if verbose:
         click.echo("Decomposing task...")
 
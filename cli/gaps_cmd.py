@@ -121,7 +121,7 @@ def spec_cmd(project_path, generate, provider, api_key):
 
 def _generate_spec_with_llm(project_path: Path, provider: str, api_key) -> None:
     """Generate a full structured spec.md using an LLM."""
-    from generator.ai.factory import create_ai_client
+    from generator.ai.sessions import ai_session
     from generator.prompts.spec_generation import SPEC_GENERATION_PROMPT, SPEC_SYSTEM_MESSAGE
     from generator.utils.readme_bridge import build_project_tree
 
@@ -140,7 +140,7 @@ def _generate_spec_with_llm(project_path: Path, provider: str, api_key) -> None:
 
     click.echo("Generating spec.md via LLM...")
     try:
-        client = create_ai_client(provider=provider or "groq", api_key=api_key)
+        client = ai_session(provider or "groq", api_key=api_key)
         spec_content = client.generate(prompt, system_message=SPEC_SYSTEM_MESSAGE)
     except Exception as exc:  # noqa: BLE001 — CLI boundary: LLM call can fail in many ways
         click.echo(f"LLM generation failed: {exc}", err=True)
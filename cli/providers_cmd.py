@@ -118,7 +118,7 @@ def providers_test(provider: str | None) -> None:
             from generator.ai.factory import create_ai_client
 
             t0 = time.perf_counter()
-            client = create_ai_client(p)
+            client = create_ai_client(p, cache=False)
             result = client.generate(test_prompt, max_tokens=20)
             latency = time.perf_counter() - t0
             click.echo(f"✅ {p:<12} — {latency:.2f}s → {result.strip()[:60]}")
@@ -156,7 +156,7 @@ def providers_benchmark(prompts: int) -> None:
         try:
             from generator.ai.factory import create_ai_client
 
-            client = create_ai_client(provider)
+            client = create_ai_client(provider, cache=False)
             latencies: list[float] = []  # list[float] requires Python 3.10+
             for prompt in test_prompts:
                 t0 = time.perf_counter()
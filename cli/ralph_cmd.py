@@ -85,6 +85,7 @@ def ralph_group():
       go        Create feature + run loop immediately (default)
       discover  Scan project and queue multiple features
       run       Start loop for an existing FEATURE-XXX
+      run-all   Run pending features in parallel worktrees
       status    Show loop progress
       resume    Continue an interrupted loop
       stop      Emergency stop
@@ -359,6 +360,154 @@ def ralph_run(feature_id, project_path, max_iterations, provider, api_key, verbo
     _exit_on_loop_failure(engine)
 
 
+# ---------------------------------------------------------------------------
+# run-all
+# ---------------------------------------------------------------------------
+
+_SUMMARY_COLUMNS = ("Feature", "Phase", "Status", "Iteration", "Tasks", "Review", "Exit")
+
+
+def _summary_row(state: dict) -> list:
+    """One line of the run-all status view, from a feature's STATE.json (plus runner phase)."""
+    return [
+        str(state.get("feature_id", "?")),
+        str(state.get("phase", "—")),
+        str(state.get("status", "—")),
+        f"{state.get('iteration', 0)}/{state.get('max_iterations', '?')}",
+        f"{state.get('tasks_complete', 0)}/{state.get('tasks_total', 0)}",
+        str(state.get("last_review_score") if state.get("last_review_score") is not None else "—"),
+        str(state.get("error") or state.get("exit_condition") or "—"),
+    ]
+
+
+def _summary_table(rows: list):
+    from rich.table import Table
+
+    table = Table(title="Ralph — parallel run", show_header=True)
+    for column in _SUMMARY_COLUMNS:
+        table.add_column(column)
+    for row in rows:
+        table.add_row(*_summary_row(row))
+    return table
+
+
+@ralph_group.command(name="run-all")
+@click.argument("feature_ids", nargs=-1)
+@click.option(
+    "--project",
+    "-p",
+    "project_path",
+    type=click.Path(exists=True, file_okay=False),
+    default=".",
+    help="Project root directory",
+)
+@click.option("--parallel", "-j", default=2, show_default=True, type=click.IntRange(min=1), help="Loops run at once")
+@click.option("--max-iterations", default=None, type=int, help="Override max iterations from each STATE.json")
+@click.option(
+    "--provider",
+    type=click.Choice(["gemini", "groq", "anthropic", "openai"]),
+    default=None,
+)
+@click.option("--api-key", default=None)
+@click.option(
+    "--requests-per-minute",
+    "rpm",
+    default=0.0,
+    type=click.FloatRange(min=0),
+    help="Provider request budget shared by all loops (0 = unpaced; 429 back-off is always shared)",
+)
+@click.option("--keep-worktrees", is_flag=True, default=False, help="Keep each feature's worktree after its loop ends")
+@click.option("--verbose/--quiet", default=False)
+def ralph_run_all(feature_ids, project_path, parallel, max_iterations, provider, api_key, rpm, keep_worktrees, verbose):
+    """Run the loops of several features concurrently, one git worktree each.
+
+    Runs FEATURE_IDS, or every feature under features/ that has not started
+    yet. Each loop's output goes to features/<id>/RALPH.log.
+
+    \b
+    Example:
+      prg ralph run-all --parallel 3
+      prg ralph run-all FEATURE-004 FEATURE-007 -j 2 --requests-per-minute 30
+    """
+    project_path = Path(project_path).resolve()
+
+    from prg_utils import git_ops
+
+    if not git_ops.is_git_repo(project_path):
+        raise click.ClickException(
+            f"{project_path} is not a git repository.\n" "Ralph requires git for branch isolation and PR creation."
+        )
+
+    provider = _detect_provider(provider, api_key)
+    if not provider:
+        raise click.ClickException(
+            "No AI provider detected. Set an API key env var "
+            "(ANTHROPIC_API_KEY, OPENAI_API_KEY, GROQ_API_KEY, GEMINI_API_KEY) "
+            "or pass --provider."
+        )
+    _set_api_key(provider, api_key)
+
+    from generator.ai.rate_limit import SharedRateLimiter
+    from generator.ralph.parallel import ParallelRunner, pending_features
+
+    feature_ids = list(feature_ids) or pending_features(project_path / "features")
+    if not feature_ids:
+        click.echo("[ralph] No pending features — create some with `prg feature` or `prg ralph discover`.")
+        return
+    for feature_id in feature_ids:
+        _load_state_dict(_feature_dir(project_path, feature_id))
+
+    runner = ParallelRunner(
+        project_path,
+        feature_ids,
+        provider=provider,
+        api_key=api_key,
+        parallel=parallel,
+        max_iterations=max_iterations,
+        limiter=SharedRateLimiter(requests_per_minute=rpm),
+        verbose=verbose,
+        keep_worktrees=keep_worktrees,
+    )
+    # A branch checked out in the main tree cannot get a second worktree.
+    current = git_ops.get_current_branch(project_path)
+    busy = [run.feature_id for run in runner.runs if run.branch == current]
+    if busy:
+        raise click.ClickException(
+            f"{busy[0]}'s branch '{current}' is checked out here. "
+            f"Switch to another branch first (e.g. `git checkout {git_ops.default_branch(project_path)}`)."
+        )
+
+    click.echo(f"[ralph] Running {len(feature_ids)} feature(s), {min(parallel, len(feature_ids))} at a time")
+    try:
+        from rich.console import Console
+        from rich.live import Live
+
+        console = Console()
+        live = console.is_terminal
+    except ImportError:
+        live = False
+
+    if live:
+        with Live(_summary_table(runner.rows()), console=console, refresh_per_second=2) as view:
+            runs = runner.run(on_update=lambda rows: view.update(_summary_table(rows)))
+    else:
+        seen = {}
+
+        def report(rows: list) -> None:
+            for row in rows:
+                line = "  ".join(_summary_row(row))
+                if seen.get(row["feature_id"]) != line:
+                    seen[row["feature_id"]] = line
+                    click.echo(f"[ralph] {line}")
+
+        runs = runner.run(on_update=report)
+
+    failed = [run.feature_id for run in runs if run.phase != "done"]
+    if failed:
+        click.echo(f"[ralph] {len(failed)} feature(s) did not succeed: {', '.join(failed)} — exiting 1", err=True)
+        sys.exit(1)
+
+
 # ---------------------------------------------------------------------------
 # status
 # ---------------------------------------------------------------------------
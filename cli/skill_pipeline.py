@@ -6,11 +6,14 @@ stub creation, and orchestration of the skill layer.
 """
 
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import click
 
+from generator.analyzers.analysis_cache import AnalysisCache
 from generator.analyzers.project_type_detector import detect_project_type_from_data
 from generator.extractors.code_extractor import CodeExampleExtractor
 from generator.parsers.enhanced_parser import EnhancedProjectParser
@@ -21,6 +24,7 @@ from generator.skills.skill_generator import SkillGenerator
 from generator.sources.learned import LearnedSkillsSource
 from generator.storage.skill_paths import SkillPathManager
 from generator.types import SkillFile
+from generator.utils.file_index import ProjectFileIndex, get_file_index
 
 # ---------------------------------------------------------------------------
 # Phase helpers for _auto_generate_skills
@@ -31,13 +35,17 @@ def _phase_detect_and_log(
     project_path: Path,
     enhanced_context: Optional[Dict[str, Any]],
     verbose: bool,
+    file_index: Optional[ProjectFileIndex] = None,
+    analysis_cache: Optional[AnalysisCache] = None,
 ) -> Tuple[Dict[str, Any], List[str], str]:
     """Phase 1: Ensure context exists and log verbose diagnostics.
 
     Returns (enhanced_context, detected_tech, project_type).
     """
     if enhanced_context is None:
-        enhanced_context = EnhancedProjectParser(project_path).extract_full_context()
+        enhanced_context = EnhancedProjectParser(
+            project_path, file_index=file_index, analysis_cache=analysis_cache
+        ).extract_full_context()
 
     detected_tech: List[str] = enhanced_context.get("metadata", {}).get("tech_stack", [])
     project_type: str = enhanced_context.get("metadata", {}).get("project_type", "unknown")
@@ -131,6 +139,7 @@ def _phase_include_agent_skills(
     selected_refs: Set[str],
     project_path: Path,
     project_type: str,
+    file_index: Optional[ProjectFileIndex] = None,
 ) -> Set[str]:
     """Phase 4: For agent-skills projects, rglob all SKILL.md files as project skills.
 
@@ -140,10 +149,9 @@ def _phase_include_agent_skills(
         return selected_refs
 
     result = set(selected_refs)
-    _infra_dirs = {".clinerules", ".venv", "__pycache__", "node_modules", ".git"}
-    for p in project_path.rglob("SKILL.md"):
-        if not any(part in _infra_dirs for part in p.parts):
-            result.add(f"project/{p.parent.name}")
+    # The index already skips ignored trees; .clinerules holds our own output.
+    for entry in get_file_index(project_path, file_index).by_name("SKILL.md", exclude={".clinerules"}):
+        result.add(f"project/{entry.path.parent.name}")
 
     return result
 
@@ -322,11 +330,16 @@ def _auto_generate_skills(
     strategy: str,
     output_dir: Optional[Path] = None,
     readme_path: Optional[Path] = None,
+    file_index: Optional[ProjectFileIndex] = None,
+    analysis_cache: Optional[AnalysisCache] = None,
+    ai_concurrency: int = 1,
 ) -> Set[str]:
     """Auto-detect and optionally LLM-generate matched skills. Returns selected skill refs."""
     try:
         # Phase 1: resolve context and log diagnostics
-        enhanced_context, detected_tech, project_type = _phase_detect_and_log(project_path, enhanced_context, verbose)
+        enhanced_context, detected_tech, project_type = _phase_detect_and_log(
+            project_path, enhanced_context, verbose, file_index=file_index, analysis_cache=analysis_cache
+        )
 
         # Initial skill matching
         selected_skills: Set[str] = EnhancedSkillMatcher().match_skills(
@@ -341,7 +354,9 @@ def _auto_generate_skills(
         selected_skills = _phase_include_project_skills(selected_skills, skills_manager, project_type)
 
         # Phase 4: agent-skills project rglob
-        selected_skills = _phase_include_agent_skills(selected_skills, project_path, project_type)
+        selected_skills = _phase_include_agent_skills(
+            selected_skills, project_path, project_type, file_index=file_index
+        )
 
         if verbose:
             click.echo(f"   Matched Skills: {len(selected_skills)}")
@@ -362,6 +377,9 @@ def _auto_generate_skills(
                 verbose=verbose,
                 skills_manager=skills_manager,
                 output_dir=output_dir,
+                file_index=file_index,
+                analysis_cache=analysis_cache,
+                ai_concurrency=ai_concurrency,
             )
 
         # Phase 5: README-driven project-skill generation
@@ -393,6 +411,14 @@ def _auto_generate_skills(
         return set()
 
 
+_AUTH_FAILURE_MARKERS = ("invalid_api_key", "401", "authentication")
+
+
+def _is_auth_failure(exc: Exception) -> bool:
+    err = str(exc).lower()
+    return any(marker in err for marker in _AUTH_FAILURE_MARKERS)
+
+
 def _llm_generate_skills(
     project_path: Path,
     project_name: str,
@@ -403,6 +429,9 @@ def _llm_generate_skills(
     verbose: bool,
     skills_manager: Any,
     output_dir: Optional[Path] = None,
+    file_index: Optional[ProjectFileIndex] = None,
+    analysis_cache: Optional[AnalysisCache] = None,
+    ai_concurrency: int = 1,
 ) -> None:
     """Call the LLM to generate content for each matched learned skill.
 
@@ -413,29 +442,24 @@ def _llm_generate_skills(
     dir, causing those skills to leak into unrelated projects as ghost
     triggers. Global writes are now reserved for explicit
     ``prg skills save`` / ``prg skills create --scope learned`` commands.
+
+    Prompts are built up front, then up to ``ai_concurrency`` generations run
+    on a thread pool sharing one client and one per-provider 429 back-off.
+    An auth failure stops every generation that has not started yet. Results
+    are written (and reported) in skill-name order once all calls finish, and
+    the skill discovery cache is invalidated once at the end.
     """
-    extractor = CodeExampleExtractor()
-    llm_auth_failed = False
+    extractor = CodeExampleExtractor(file_index=file_index, analysis_cache=analysis_cache)
 
     # Default output_dir to <project>/.clinerules when the caller hasn't
     # threaded it through (keeps backward-compat for older callers).
     if output_dir is None:
         output_dir = project_path / ".clinerules"
 
-    # Bug F fix: instantiate the LLM client ONCE and reuse it across every
-    # skill generation. Previously we created a new LLMSkillGenerator inside
-    # the loop, which re-ran `genai.Client()` — and the google-genai SDK
-    # prints "Both GOOGLE_API_KEY and GEMINI_API_KEY are set. Using
-    # GOOGLE_API_KEY." on every client construction when both env vars are
-    # present. Hoisting the instantiation makes that warning fire at most
-    # once per run (at true provider-init time), matching what users expect.
-    llm_gen = None  # lazy: stays None until the first skill that needs it
-
+    jobs: List[Tuple[str, str, Path, str]] = []
     for skill_ref in sorted(enhanced_selected_skills):
         if not skill_ref.startswith("learned/"):
             continue
-        if llm_auth_failed:
-            continue
 
         skill_topic = skill_ref.split("/")[-1]
 
@@ -458,29 +482,77 @@ def _llm_generate_skills(
             detected_patterns=enhanced_context.get("structure", {}).get("patterns", []),
             project_path=project_path,
         )
+        jobs.append((skill_ref, skill_topic, project_skill_path, prompt))
 
-        try:
-            if llm_gen is None:
-                # Lazy init on the first skill that needs generation. Keeps
-                # runs that skip every learned skill (all cached) zero-cost
-                # and emits the provider warning at most once.
-                from generator.skills.llm_skill_generator import LLMSkillGenerator
+    if not jobs:
+        # Every learned skill is cached — never construct an LLM client.
+        return
 
-                llm_gen = LLMSkillGenerator(provider=provider)
-            skill_content = llm_gen.generate_content(prompt, max_tokens=4000)
+    # Bug F fix: instantiate the LLM client ONCE and reuse it across every
+    # skill generation. Previously we created a new LLMSkillGenerator inside
+    # the loop, which re-ran `genai.Client()` — and the google-genai SDK
+    # prints "Both GOOGLE_API_KEY and GEMINI_API_KEY are set. Using
+    # GOOGLE_API_KEY." on every client construction when both env vars are
+    # present. Hoisting the instantiation makes that warning fire at most
+    # once per run (at true provider-init time), matching what users expect.
+    try:
+        from generator.ai.rate_limit import ProviderBackoff
+        from generator.ai.response_cache import cache_only_valid
+        from generator.skills.llm_skill_generator import LLMSkillGenerator, is_complete_skill
+
+        llm_gen = LLMSkillGenerator(provider=provider)
+    except Exception as e:  # noqa: BLE001 — client init failure is reported like a per-skill failure
+        click.echo(f"   ⚠️  Failed to generate {jobs[0][0]}: {e}")
+        return
+
+    backoff = ProviderBackoff()
+    auth_failed = threading.Event()
+
+    def _generate(prompt: str) -> Tuple[Optional[str], Optional[Exception]]:
+        if auth_failed.is_set():
+            return None, None
+        try:
+            # Truncated or placeholder-only skills are written but never cached.
+            with cache_only_valid(is_complete_skill):
+                return backoff.call(lambda: llm_gen.generate_content(prompt, max_tokens=4000)), None
+        except Exception as e:  # noqa: BLE001 — one item failure must not abort the batch
+            if _is_auth_failure(e):
+                auth_failed.set()
+            return None, e
 
+    workers = max(1, min(ai_concurrency, len(jobs)))
+    if workers == 1:
+        outcomes = [_generate(prompt) for _, _, _, prompt in jobs]
+    else:
+        if verbose:
+            click.echo(f"   Generating {len(jobs)} skills with {workers} concurrent requests")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_generate, [prompt for _, _, _, prompt in jobs]))
+
+    generated = False
+    auth_reported = False
+    for (skill_ref, skill_topic, project_skill_path, _), (skill_content, error) in zip(jobs, outcomes):
+        if error is not None:
+            click.echo(f"   ⚠️  Failed to generate {skill_ref}: {error}")
+            if _is_auth_failure(error) and not auth_reported:
+                click.echo("   ❌ API key invalid — skipping remaining LLM generations")
+                auth_reported = True
+            continue
+        if skill_content is None:
+            continue  # skipped after an auth failure
+        try:
             # Write directly to the project-local learned dir — never pollute
             # the user's global ~/.project-rules-generator/learned/.
             project_skill_path.parent.mkdir(parents=True, exist_ok=True)
             project_skill_path.write_text(skill_content, encoding="utf-8")
-            skills_manager.discovery.invalidate_cache()
-            click.echo(f"   💾 Generated: skills/learned/{skill_topic} (project-local)")
-        except Exception as e:  # noqa: BLE001 — one item failure must not abort the batch
-            err_str = str(e)
+        except OSError as e:
             click.echo(f"   ⚠️  Failed to generate {skill_ref}: {e}")
-            if "invalid_api_key" in err_str or "401" in err_str or "authentication" in err_str.lower():
-                click.echo("   ❌ API key invalid — skipping remaining LLM generations")
-                llm_auth_failed = True
+            continue
+        generated = True
+        click.echo(f"   💾 Generated: skills/learned/{skill_topic} (project-local)")
+
+    if generated:
+        skills_manager.discovery.invalidate_cache()
 
 
 def _copy_skill_files(
@@ -1,7 +1,10 @@
 """Shared CLI utilities."""
 
 import os
-from typing import Optional
+import sys
+from typing import Callable, Optional
+
+import click
 
 
 def detect_provider(provider: Optional[str], api_key: Optional[str]) -> Optional[str]:
@@ -65,3 +68,18 @@ def set_api_key_env(provider: str, api_key: Optional[str]) -> None:
     env_var = env_map.get(provider)
     if env_var:
         os.environ[env_var] = api_key
+
+
+def stream_progress(label: str) -> Optional[Callable[[int], None]]:
+    """Return an ``on_progress`` callback that redraws ``label`` and a character count on stderr.
+
+    Returns None when stderr is not a terminal, so the response is not streamed
+    just to report progress nobody sees.
+    """
+    if not sys.stderr.isatty():
+        return None
+
+    def report(received: int) -> None:
+        click.echo(f"\r{label}... {received:,} chars received\x1b[K", nl=False, err=True)
+
+    return report
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import subprocess
-import sys
 import threading
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import click
-import pathspec
+
+from generator.utils.ignore import IGNORE_FILENAMES, IgnoreMatcher
 
 # Files that trigger a re-analyze when modified or created
 WATCH_FILES = {
@@ -34,6 +33,7 @@ WATCH_FILES = {
     "requirements-llm.txt",
     ".env",
     ".gitignore",
+    ".prgignore",
     "docker-compose.yml",
     "docker-compose.yaml",
     "Dockerfile",
@@ -44,38 +44,18 @@ WATCH_FILES = {
 # Directory name prefixes that trigger on any new file inside them
 WATCH_DIRS = {"tests", "test", "spec"}
 
-# Paths to always ignore (gitignore-like noise filter)
-_IGNORE_DIRS = {
-    ".git",
-    ".mypy_cache",
-    ".pytest_cache",
-    ".ruff_cache",
-    "__pycache__",
-    ".venv",
-    "venv",
-    "node_modules",
-    "dist",
-    "build",
-    ".clinerules",
-    ".claude",
-}
-
+# Generated output: analyze writes here, so changes must never re-trigger it.
+_OUTPUT_DIRS = {".clinerules", ".claude"}
 
-def _load_gitignore_spec(project_path: Path):
-    """Load .gitignore patterns using pathspec (returns None if unavailable)."""
-    try:
-        import pathspec
+_DEFAULT_IGNORE = IgnoreMatcher()
 
-        gitignore = project_path / ".gitignore"
-        if gitignore.exists():
-            return pathspec.PathSpec.from_lines("gitignore", gitignore.read_text(encoding="utf-8").splitlines())
-    except Exception:  # noqa: BLE001 — gitignore parsing is best-effort; missing spec just disables filtering
-        pass
-    return None
 
+def _should_trigger(path: str, project_path: Path, ignore: Optional[IgnoreMatcher] = None) -> bool:
+    """Return True if the changed file should trigger a re-analyze.
 
-def _should_trigger(path: str, project_path: Path, gitignore_spec=None) -> bool:
-    """Return True if the changed file should trigger a re-analyze."""
+    ``ignore`` is the project's matcher (defaults plus .gitignore/.prgignore);
+    without one only the default noise directories are filtered.
+    """
     try:
         rel = Path(path).relative_to(project_path)
     except ValueError:
@@ -84,12 +64,9 @@ def _should_trigger(path: str, project_path: Path, gitignore_spec=None) -> bool:
     parts = rel.parts
     name = rel.name
 
-    # Always ignore known noise directories
-    if parts and parts[0] in _IGNORE_DIRS:
+    if parts and parts[0] in _OUTPUT_DIRS:
         return False
-
-    # Filter via .gitignore patterns
-    if gitignore_spec and gitignore_spec.match_file(str(rel)):
+    if (ignore or _DEFAULT_IGNORE).ignores_path(rel.as_posix()):
         return False
 
     # Top-level watched files
@@ -115,9 +92,16 @@ class _PRGHandler:
     - Issue #1 (race condition): replaced _running bool with dirty-bit system.
       If a change arrives while an analysis is running, _needs_rerun is set so
       one final run executes after the current one completes — no drops.
-    - Issue #2 (gitignore): gitignore_spec is loaded once and passed to _should_trigger.
+    - Issue #2 (gitignore): the project's ignore matcher is passed to _should_trigger. It is read
+      from the daemon's file index on every event, since the daemon rebuilds the index (and its
+      matcher) after a .gitignore/.prgignore edit.
     - Issue #3 (lock files): handled in WATCH_FILES constant above.
     - Issue #4 (moved/deleted): on_change() is called for all event types.
+
+    Analysis runs in-process on a resident ``AnalysisDaemon`` (created on the
+    first run unless one is injected). Every changed path — triggering or not —
+    is queued so the daemon's file index stays in step with the tree; the
+    queued batch is applied as a delta before each run.
     """
 
     def __init__(
@@ -126,27 +110,47 @@ class _PRGHandler:
         delay: float,
         extra_args: List[str],
         verbose: bool,
-        gitignore_spec=None,
+        ignore: Optional[IgnoreMatcher] = None,
+        engine=None,
     ):
         self._project_path = project_path
         self._delay = delay
         self._extra_args = extra_args
         self._verbose = verbose
-        self._gitignore_spec = gitignore_spec
+        self._ignore = ignore or _DEFAULT_IGNORE
+        self._engine = engine
         self._timer: Optional[threading.Timer] = None
         self._running = False
         self._needs_rerun = False
+        self._pending: Set[str] = set()
         self._lock = threading.Lock()
 
+    def _get_engine(self):
+        if self._engine is None:
+            from cli.watch_engine import AnalysisDaemon
+
+            self._engine = AnalysisDaemon(self._project_path, self._extra_args, self._verbose)
+        return self._engine
+
+    def _current_ignore(self) -> IgnoreMatcher:
+        """The resident daemon's matcher, else the one passed in (or the defaults)."""
+        file_index = getattr(self._engine, "file_index", None)
+        matcher = getattr(file_index, "ignore", None)
+        return matcher if isinstance(matcher, IgnoreMatcher) else self._ignore
+
     def on_change(self, path: str) -> None:
         """Called by the observer thread when a file change is detected."""
-        if not _should_trigger(path, self._project_path, self._gitignore_spec):
+        try:
+            rel = Path(path).relative_to(self._project_path).as_posix()
+        except ValueError:
+            return
+        ignore = self._current_ignore()
+        if not ignore.ignores_path(rel):
+            with self._lock:
+                self._pending.add(path)
+        if not _should_trigger(path, self._project_path, ignore):
             return
         if self._verbose:
-            try:
-                rel = Path(path).relative_to(self._project_path)
-            except ValueError:
-                rel = path  # type: ignore[assignment]
             click.echo(f"[watch] Changed: {rel}")
         with self._lock:
             if self._running:
@@ -164,16 +168,16 @@ class _PRGHandler:
             with self._lock:
                 self._running = True
                 self._needs_rerun = False
+                batch, self._pending = self._pending, set()
 
             try:
                 click.echo("[watch] Running incremental analysis...")
-                cmd = [sys.executable, "-m", "cli.cli", "analyze", str(self._project_path), "--incremental"]
-                cmd.extend(self._extra_args)
-                result = subprocess.run(cmd, capture_output=False, timeout=300)
-                if result.returncode != 0 and self._verbose:
-                    click.echo(f"[watch] analyze exited with code {result.returncode}", err=True)
+                started = time.perf_counter()
+                returncode = self._get_engine().run(sorted(batch))
+                if returncode != 0 and self._verbose:
+                    click.echo(f"[watch] analyze exited with code {returncode}", err=True)
                 else:
-                    click.echo("[watch] Done.")
+                    click.echo(f"[watch] Done in {time.perf_counter() - started:.2f}s.")
             except Exception as e:  # noqa: BLE001 — CLI boundary: watch loop must not crash on analysis error
                 click.echo(f"[watch] Error during analysis: {e}", err=True)
             finally:
@@ -206,7 +210,9 @@ def watch(project_path: str, delay: float, ide: Optional[str], quiet: bool) -> N
     """Watch project files and auto-run 'prg analyze --incremental' on changes.
 
     Monitors README, pyproject.toml, lock files, requirements, Dockerfile,
-    and test directories. Respects .gitignore to skip noise. Press Ctrl+C to stop.
+    and test directories. Respects .gitignore and .prgignore to skip noise. Analysis runs
+    in-process against resident caches, so warm re-runs skip start-up and
+    cache rebuilds. Press Ctrl+C to stop.
     """
     try:
         from watchdog.events import FileSystemEvent, FileSystemEventHandler
@@ -218,13 +224,16 @@ def watch(project_path: str, delay: float, ide: Optional[str], quiet: bool) -> N
 
     path = Path(project_path).resolve()
     verbose = not quiet
-    gitignore_spec = _load_gitignore_spec(path)
 
     extra_args: List[str] = []
     if ide:
         extra_args += ["--ide", ide]
 
-    handler_obj = _PRGHandler(path, delay, extra_args, verbose, gitignore_spec)
+    from cli.watch_engine import AnalysisDaemon
+
+    # Build the resident state up front so the first change is already warm.
+    engine = AnalysisDaemon(path, extra_args, verbose)
+    handler_obj = _PRGHandler(path, delay, extra_args, verbose, engine=engine)
 
     class _EventBridge(FileSystemEventHandler):
         def on_modified(self, event: FileSystemEvent) -> None:
@@ -249,8 +258,9 @@ def watch(project_path: str, delay: float, ide: Optional[str], quiet: bool) -> N
     observer.schedule(_EventBridge(), str(path), recursive=True)
     observer.start()
 
-    gitignore_note = " (respecting .gitignore)" if gitignore_spec else ""
-    click.echo(f"[watch] Watching {path}{gitignore_note}  (delay={delay}s, Ctrl+C to stop)")
+    ignore_files = [name for name in IGNORE_FILENAMES if (path / name).is_file()]
+    ignore_note = f" (respecting {', '.join(ignore_files)})" if ignore_files else ""
+    click.echo(f"[watch] Watching {path}{ignore_note}  (delay={delay}s, Ctrl+C to stop)")
 
     try:
         while True:
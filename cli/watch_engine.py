@@ -0,0 +1,158 @@
+"""Resident analysis engine for ``prg watch``.
+
+Watch mode used to spawn ``python -m cli.cli analyze --incremental`` for every
+debounced change, paying interpreter start-up, the click/pydantic/yaml/rich
+imports and a cold rebuild of every cache each time. ``AnalysisDaemon`` keeps
+that state alive in the watch process instead:
+
+* the ``ProjectFileIndex`` — updated from each event batch via
+  ``ProjectFileIndex.with_changes`` rather than re-walked (an edit to
+  ``.gitignore``, ``.prgignore`` or the ``analysis.ignore`` list in
+  ``config.yaml`` rebuilds it);
+* the per-file ``AnalysisCache`` for each output directory;
+* one ``SkillsManager`` (and so its ``SkillDiscovery`` cache) per skills dir;
+* parsed dependency manifests (``DependencyParser``'s stat-keyed memo) and the
+  tech-detection tables, which simply stay imported.
+
+Each run invokes the ``analyze`` command in-process with ``--incremental``;
+``analyze`` finds the daemon on its click context and reuses the resident
+state, and ``IncrementalAnalyzer`` decides which phases the delta affects.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import click
+
+from generator.analyzers.analysis_cache import AnalysisCache
+from generator.utils.file_index import ProjectFileIndex
+from generator.utils.ignore import IGNORE_FILENAMES
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisDaemon:
+    """Long-lived analysis state shared by successive ``analyze`` runs."""
+
+    def __init__(self, project_path: Path, extra_args: Sequence[str] = (), verbose: bool = False):
+        self.project_path = Path(project_path).resolve()
+        self.extra_args = list(extra_args)
+        self.verbose = verbose
+        self._config_stamp: Optional[Tuple[int, int]] = None
+        self.file_index = self._build_index()
+        self.runs = 0
+        self.last_duration: Optional[float] = None
+        self._analysis_caches: Dict[Path, AnalysisCache] = {}
+        self._skills_managers: Dict[Tuple[Path, Optional[Path]], object] = {}
+
+    # ------------------------------------------------------------------
+    # Resident state handed to ``analyze``
+    # ------------------------------------------------------------------
+
+    def _build_index(self) -> ProjectFileIndex:
+        from cli.analyze_cmd import load_project_ignore
+
+        self._config_stamp = _config_stamp()
+        return ProjectFileIndex.build(self.project_path, ignore=load_project_ignore(self.project_path))
+
+    def serves(self, project_path: Path) -> bool:
+        return Path(project_path).resolve() == self.project_path
+
+    def analysis_cache(self, output_dir: Path) -> AnalysisCache:
+        key = Path(output_dir).resolve()
+        cache = self._analysis_caches.get(key)
+        if cache is None:
+            cache = self._analysis_caches[key] = AnalysisCache.load(key)
+        return cache
+
+    def skills_manager(self, project_path: Path, skills_dir: Optional[Path] = None):
+        from generator.skills.manager import SkillsManager
+
+        key = (Path(project_path).resolve(), Path(skills_dir).resolve() if skills_dir else None)
+        manager = self._skills_managers.get(key)
+        if manager is None:
+            manager = self._skills_managers[key] = SkillsManager(project_path=project_path, skills_dir=skills_dir)
+        return manager
+
+    # ------------------------------------------------------------------
+    # Deltas and runs
+    # ------------------------------------------------------------------
+
+    def apply_delta(self, changed_paths: Iterable[str]) -> List[str]:
+        """Fold a batch of changed absolute paths into the resident state.
+
+        Returns the project-relative paths that were applied.
+        """
+        rels: List[str] = []
+        for raw in changed_paths:
+            try:
+                rels.append(Path(raw).resolve().relative_to(self.project_path).as_posix())
+            except (ValueError, OSError):
+                continue
+        if any(rel in IGNORE_FILENAMES for rel in rels) or _config_stamp() != self._config_stamp:
+            # The ignore policy itself changed: a delta cannot say what it now
+            # hides or reveals, so walk again. config.yaml lives with prg, not
+            # in the watched tree, so its edits are noticed by stat.
+            self.file_index = self._build_index()
+        elif rels:
+            self.file_index = self.file_index.with_changes(rels)
+
+        # Both caches key on paths/README text, not file contents, so a delta
+        # can leave them stale (a new ``api/`` dir, an edited SKILL.md).
+        from generator.analyzers.project_type_detector import _detect_project_type_cached
+        from generator.skills.tag_resolver import clear_tag_cache
+
+        _detect_project_type_cached.cache_clear()
+        clear_tag_cache()
+        return rels
+
+    def run(self, changed_paths: Iterable[str] = ()) -> int:
+        """Apply ``changed_paths`` and run ``analyze --incremental`` in-process.
+
+        Returns the command's exit code (0 when nothing needed regenerating).
+        """
+        from cli.analyze_cmd import analyze
+
+        self.apply_delta(changed_paths)
+        args = [str(self.project_path), "--incremental", *self.extra_args]
+        started = time.perf_counter()
+        try:
+            rv = analyze.main(args, prog_name="prg analyze", standalone_mode=False, obj=self)
+            code = rv if isinstance(rv, int) else 0
+        except click.exceptions.Exit as e:
+            code = e.exit_code
+        except click.ClickException as e:
+            e.show()
+            code = e.exit_code
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        finally:
+            self.runs += 1
+            self.last_duration = time.perf_counter() - started
+        logger.debug("watch run %d finished in %.3fs (exit %s)", self.runs, self.last_duration, code)
+        return code
+
+
+def resident_daemon(project_path: Path) -> Optional[AnalysisDaemon]:
+    """Return the ``AnalysisDaemon`` driving the current click invocation, if any."""
+    ctx = click.get_current_context(silent=True)
+    daemon = ctx.find_object(AnalysisDaemon) if ctx is not None else None
+    if daemon is not None and daemon.serves(project_path):
+        return daemon
+    return None
+
+
+def _config_stamp() -> Optional[Tuple[int, int]]:
+    """``(mtime_ns, size)`` of prg's config.yaml, whose ``analysis.ignore`` feeds the matcher."""
+    from cli.analyze_cmd import CONFIG_PATH
+
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
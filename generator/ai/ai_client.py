@@ -1,15 +1,90 @@
-"""AI Client Abstraction."""
+"""AI Client Abstraction.
 
+``generate`` is the one method every provider implements. ``stream`` yields
+the response in pieces as the provider produces them, and ``agenerate`` /
+``astream`` are their coroutine counterparts. The base-class versions fall
+back to ``generate`` (``agenerate`` runs it in a worker thread); providers
+override them with native SDK calls on pooled clients
+(``generator.ai.client_pool``).
+"""
+
+import asyncio
+import os
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+from ..utils.encoding import normalize_mojibake
+
+# Every sequence ``normalize_mojibake`` rewrites is three characters long, so
+# holding back two characters is enough to never split one across pieces.
+_MOJIBAKE_HOLDBACK = 2
+
+
+def normalized_stream(pieces: Iterable[str]) -> Iterator[str]:
+    """Yield ``pieces`` with mojibake cleaned, as ``normalize_mojibake`` would clean their concatenation."""
+    pending = ""
+    for piece in pieces:
+        if not piece:
+            continue
+        pending = normalize_mojibake(pending + piece)
+        if len(pending) > _MOJIBAKE_HOLDBACK:
+            yield pending[:-_MOJIBAKE_HOLDBACK]
+            pending = pending[-_MOJIBAKE_HOLDBACK:]
+    if pending:
+        yield pending
+
+
+async def anormalized_stream(pieces: AsyncIterable[str]) -> AsyncIterator[str]:
+    """Async counterpart of ``normalized_stream``."""
+    pending = ""
+    async for piece in pieces:
+        if not piece:
+            continue
+        pending = normalize_mojibake(pending + piece)
+        if len(pending) > _MOJIBAKE_HOLDBACK:
+            yield pending[:-_MOJIBAKE_HOLDBACK]
+            pending = pending[-_MOJIBAKE_HOLDBACK:]
+    if pending:
+        yield pending
 
 
 class AIClient(ABC):
     """Abstract base class for AI providers."""
 
+    DEFAULT_MODEL: str = ""
+    # Environment variable that overrides DEFAULT_MODEL, if the provider has one.
+    MODEL_ENV: Optional[str] = None
+
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
 
+    def resolve_model(self, model: Optional[str] = None) -> str:
+        """Return the model a ``generate`` call with ``model`` would actually use."""
+        if model:
+            return model
+        if self.MODEL_ENV:
+            return os.getenv(self.MODEL_ENV) or self.DEFAULT_MODEL
+        return self.DEFAULT_MODEL
+
+    @staticmethod
+    def _record_usage(usage: Any, input_attr: str, output_attr: str) -> None:
+        """Report one round-trip and its token counts to ``prg analyze --profile``.
+
+        ``usage`` is the provider SDK's usage object; counts that are missing
+        or not integers are reported as zero. The tokens are also added to the
+        ``AISession`` making the request, if any.
+        """
+        from generator.utils.profiler import record_llm_call
+
+        from .sessions import record_session_tokens
+
+        def _count(attr: str) -> int:
+            value = getattr(usage, attr, 0)
+            return value if isinstance(value, int) else 0
+
+        record_llm_call(_count(input_attr), _count(output_attr))
+        record_session_tokens(_count(input_attr), _count(output_attr))
+
     @abstractmethod
     def generate(
         self,
@@ -21,3 +96,54 @@ class AIClient(ABC):
     ) -> str:
         """Generate content from prompt."""
         pass
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield the response in pieces; their concatenation equals ``generate``'s result.
+
+        The default yields the whole ``generate`` result at once.
+        """
+        text = self.generate(
+            prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+        )
+        if text:
+            yield text
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        """Coroutine form of ``generate``. The default runs ``generate`` in a worker thread."""
+        return await asyncio.to_thread(
+            self.generate,
+            prompt,
+            max_tokens=max_tokens,
+            model=model,
+            temperature=temperature,
+            system_message=system_message,
+        )
+
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Async form of ``stream``. The default yields the whole ``agenerate`` result."""
+        text = await self.agenerate(
+            prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+        )
+        if text:
+            yield text
@@ -22,6 +22,7 @@ from typing import Dict, List, Optional, Tuple
 import yaml
 
 from generator.ai.factory import create_ai_client
+from generator.ai.response_cache import last_response_cached
 
 # ---------------------------------------------------------------------------
 # Config
@@ -192,7 +193,9 @@ class AIStrategyRouter:
                 t0 = time.perf_counter()
                 client = create_ai_client(provider)
                 result = client.generate(prompt, max_tokens=max_tokens)
-                self._latency_cache[provider] = time.perf_counter() - t0
+                # A cache hit says nothing about the provider's latency.
+                if not last_response_cached():
+                    self._latency_cache[provider] = time.perf_counter() - t0
                 self._usage_counts[provider] = self._usage_counts.get(provider, 0) + 1
                 return result, provider
             except Exception as exc:  # noqa: BLE001 — AI provider call; try next provider on any failure
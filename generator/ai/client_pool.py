@@ -0,0 +1,60 @@
+"""Process-wide pool of provider SDK clients.
+
+Every ``GroqClient``/``AnthropicClient``/``OpenAIClient``/``GeminiClient``
+used to construct its own SDK client, and with it a fresh HTTP connection
+pool. ``create_ai_client`` runs per request in several places (the strategy
+router, ``TaskDecomposer``), so a batch of calls paid a new TCP and TLS
+handshake each time. The SDK clients are thread-safe and keep their
+connections alive, so one per ``(provider, constructor, api_key, timeout)``
+is shared by the whole process.
+
+Async SDK clients own an ``httpx.AsyncClient`` bound to the event loop that
+first used it, so they are pooled per running loop and released together
+with the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, MutableMapping
+
+_sync_clients: Dict[Hashable, Any] = {}
+_async_clients: "MutableMapping[asyncio.AbstractEventLoop, Dict[Hashable, Any]]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def pooled_client(key: Hashable, build: Callable[[], Any]) -> Any:
+    """Return the SDK client stored under ``key``, calling ``build`` once to create it."""
+    with _lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            client = build()
+            _sync_clients[key] = client
+        return client
+
+
+def pooled_async_client(key: Hashable, build: Callable[[], Any]) -> Any:
+    """Return the async SDK client for ``key`` on the running event loop.
+
+    Must be called from a coroutine; each event loop gets its own client.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.get(loop)
+        if clients is None:
+            clients = {}
+            _async_clients[loop] = clients
+        client = clients.get(key)
+        if client is None:
+            client = build()
+            clients[key] = client
+        return client
+
+
+def clear_client_pool() -> None:
+    """Forget every pooled client (tests, or after credentials change)."""
+    with _lock:
+        _sync_clients.clear()
+        _async_clients.clear()
@@ -7,31 +7,45 @@ from .ai_client import AIClient
 SUPPORTED_PROVIDERS = ("groq", "gemini", "anthropic", "openai")
 
 
-def create_ai_client(provider: str = "groq", **kwargs: Any) -> AIClient:
+def create_ai_client(provider: str = "groq", cache: bool = True, **kwargs: Any) -> AIClient:
     """Factory to create AI client instance.
 
     Args:
         provider: One of "groq", "gemini", "anthropic", "openai"
+        cache: Serve repeated requests from the persistent LLM response cache
+            (see ``generator.ai.response_cache``). Pass False for calls that
+            must reach the provider, such as connectivity tests.
         **kwargs: Passed to the client constructor (e.g. api_key=...)
 
     Raises:
         ValueError: If provider is not recognised.
     """
+    client: AIClient
     if provider == "groq":
         from .providers.groq_client import GroqClient
 
-        return GroqClient(**kwargs)
+        client = GroqClient(**kwargs)
     elif provider == "gemini":
         from .providers.gemini_client import GeminiClient
 
-        return GeminiClient(**kwargs)
+        client = GeminiClient(**kwargs)
     elif provider == "anthropic":
         from .providers.anthropic_client import AnthropicClient
 
-        return AnthropicClient(**kwargs)
+        client = AnthropicClient(**kwargs)
     elif provider == "openai":
         from .providers.openai_client import OpenAIClient
 
-        return OpenAIClient(**kwargs)
+        client = OpenAIClient(**kwargs)
     else:
         raise ValueError(f"Unknown AI provider: {provider!r}. " f"Supported: {', '.join(SUPPORTED_PROVIDERS)}")
+
+    # Rate limiting sits inside the cache so cache hits never wait for a slot.
+    from .rate_limit import with_rate_limit
+
+    client = with_rate_limit(client)
+    if not cache:
+        return client
+    from .response_cache import with_response_cache
+
+    return with_response_cache(client, provider)
@@ -17,6 +17,11 @@ Problems this module solves:
    top-level source directories; ``ground_paths()`` rewrites paths that
    reference non-existent top-level dirs.
 
+4. **Silent long generations** — a 4-8k token design or plan took tens of
+   seconds with no feedback. With ``on_progress``, ``generate_with_validator()``
+   streams the response, reports the characters received after each piece,
+   and checks truncation the moment the stream closes.
+
 Nothing in this module knows about Design or SubTask specifically — it is a
 thin utility layer usable from any generator.
 """
@@ -26,7 +31,9 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
-from typing import Callable, List, Optional, Protocol, Sequence
+from typing import Any, Callable, List, Optional, Protocol, Sequence
+
+from generator.ai.response_cache import cache_only_valid
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +112,10 @@ class _SupportsGenerate(Protocol):
     ) -> str: ...
 
 
+ProgressCallback = Callable[[int], None]
+"""Called with the number of characters received so far while a response streams."""
+
+
 Validator = Callable[[str], bool]
 """A validator returns True when the LLM output is acceptable."""
 
@@ -120,6 +131,7 @@ def generate_with_validator(
     system_message: Optional[str] = None,
     max_retries: int = 1,
     detect_truncation: bool = True,
+    on_progress: Optional[ProgressCallback] = None,
 ) -> str:
     """Call ``client.generate`` with retry on validation/truncation failure.
 
@@ -130,7 +142,19 @@ def generate_with_validator(
     ``validator`` is optional; when ``None`` only the truncation heuristic (if
     enabled) drives retries.  Errors from the client are caught and treated as
     an invalid empty response, exhausting retries before returning ``""``.
+
+    With ``on_progress`` the response is read through ``client.stream`` and
+    the callback receives the running character count after every piece.
+
+    Calls run inside ``cache_only_valid``, so a response that fails the
+    truncation check or the validator is never written to the response cache.
     """
+
+    def accept(text: str) -> bool:
+        if detect_truncation and looks_truncated(text):
+            return False
+        return validator is None or validator(text)
+
     last_result = ""
     for attempt in range(max_retries + 1):
         current_temp = temperature if attempt == 0 else max(0.1, temperature - 0.3)
@@ -142,13 +166,25 @@ def generate_with_validator(
                 "format requested. Do not apologise; do not repeat instructions."
             )
         try:
-            result = client.generate(
-                attempt_prompt,
-                max_tokens=max_tokens,
-                model=model,
-                temperature=current_temp,
-                system_message=system_message,
-            )
+            with cache_only_valid(accept):
+                if on_progress is not None:
+                    result = _read_stream(
+                        client,
+                        attempt_prompt,
+                        on_progress,
+                        max_tokens=max_tokens,
+                        model=model,
+                        temperature=current_temp,
+                        system_message=system_message,
+                    )
+                else:
+                    result = client.generate(
+                        attempt_prompt,
+                        max_tokens=max_tokens,
+                        model=model,
+                        temperature=current_temp,
+                        system_message=system_message,
+                    )
         except Exception as exc:  # noqa: BLE001 — treat any SDK error as retryable
             logger.warning("LLM call failed on attempt %d: %s", attempt + 1, exc)
             result = ""
@@ -171,38 +207,24 @@ def generate_with_validator(
     return last_result
 
 
+def _read_stream(client: Any, prompt: str, on_progress: ProgressCallback, **kwargs: Any) -> str:
+    pieces: List[str] = []
+    received = 0
+    for piece in client.stream(prompt, **kwargs):
+        pieces.append(piece)
+        received += len(piece)
+        on_progress(received)
+    return "".join(pieces)
+
+
 # ---------------------------------------------------------------------------
 # Repo-tree grounding
 # ---------------------------------------------------------------------------
 
-# Directories we never treat as candidate source dirs, even when they contain code.
-_SOURCE_DIR_BLOCKLIST = frozenset(
-    {
-        ".git",
-        ".github",
-        ".venv",
-        "venv",
-        "env",
-        "__pycache__",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".ruff_cache",
-        "node_modules",
-        "dist",
-        "build",
-        "htmlcov",
-        ".tox",
-        ".idea",
-        ".vscode",
-        "tests",
-        "test",
-        "docs",
-        "doc",
-        "examples",
-        "example",
-        ".web",  # Reflex framework generated Next.js output
-    }
-)
+# Directories we never treat as candidate source dirs, even when they contain
+# code. Ignored trees (venvs, node_modules, build output, .gitignore entries)
+# never reach the check: candidates come from the shared project file index.
+_SOURCE_DIR_BLOCKLIST = frozenset({"env", "tests", "test", "docs", "doc", "examples", "example"})
 
 # Common source-layout conventions; presence of any of these (in the order given)
 # wins over heuristic discovery.
@@ -216,8 +238,9 @@ def discover_source_dirs(project_path: Path) -> List[str]:
 
     * ``src/``, ``lib/``, ``app/`` win when they exist.
     * Otherwise any non-blocklisted directory that contains at least one
-      ``*.py`` / ``*.ts`` / ``*.js`` / ``*.go`` / ``*.rs`` file is included.
-    * Hidden directories (``.foo``) are always skipped.
+      ``*.py`` / ``*.ts`` / ``*.go`` file is included.
+    * Hidden and ignored directories (``.foo``, ``.gitignore`` entries,
+      venvs, ``node_modules`` …) are always skipped.
 
     The returned list is sorted alphabetically for deterministic prompts.
     Returns an empty list when ``project_path`` is not a directory.
@@ -229,19 +252,14 @@ def discover_source_dirs(project_path: Path) -> List[str]:
     if conventional:
         return conventional
 
-    found: List[str] = []
-    for child in sorted(project_path.iterdir()):
-        if not child.is_dir():
-            continue
-        name = child.name
-        if name.startswith(".") or name in _SOURCE_DIR_BLOCKLIST:
-            continue
-        try:
-            if any(child.rglob("*.py")) or any(child.rglob("*.ts")) or any(child.rglob("*.go")):
-                found.append(name)
-        except (OSError, PermissionError):
-            continue
-    return found
+    from generator.utils.file_index import get_file_index
+
+    found = {
+        entry.rel.split("/", 1)[0]
+        for entry in get_file_index(project_path).by_suffix(".py", ".ts", ".go")
+        if "/" in entry.rel
+    }
+    return sorted(name for name in found if not name.startswith(".") and name not in _SOURCE_DIR_BLOCKLIST)
 
 
 def _path_top_segment(path: str) -> str:
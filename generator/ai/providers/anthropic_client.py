@@ -1,10 +1,11 @@
 """Anthropic/Claude AI Provider."""
 
 import os
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 from ...utils.encoding import normalize_mojibake
-from ..ai_client import AIClient
+from ..ai_client import AIClient, anormalized_stream, normalized_stream
+from ..client_pool import pooled_async_client, pooled_client
 
 try:
     import anthropic as _anthropic
@@ -19,6 +20,7 @@ class AnthropicClient(AIClient):
     """Anthropic Claude API client."""
 
     DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
+    MODEL_ENV = "ANTHROPIC_MODEL"
     DEFAULT_TIMEOUT = 60.0  # seconds
 
     def __init__(self, api_key: Optional[str] = None):
@@ -29,7 +31,34 @@ class AnthropicClient(AIClient):
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found.")
 
-        self.client = _anthropic.Anthropic(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT)
+        sdk = _anthropic
+        self.client = pooled_client(
+            ("anthropic", sdk.Anthropic, self.api_key, self.DEFAULT_TIMEOUT),
+            lambda: sdk.Anthropic(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT),
+        )
+
+    def _async_client(self) -> Any:
+        sdk = _anthropic
+        return pooled_async_client(
+            ("anthropic", sdk.AsyncAnthropic, self.api_key, self.DEFAULT_TIMEOUT),
+            lambda: sdk.AsyncAnthropic(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT),
+        )
+
+    def _request(
+        self, prompt: str, max_tokens: int, model: Optional[str], temperature: float, system_message: Optional[str]
+    ) -> Dict[str, Any]:
+        return {
+            "model": self.resolve_model(model),
+            "max_tokens": max_tokens,
+            "system": system_message or "You are an expert AI skill generator for developer tools.",
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+
+    def _text(self, msg: Any) -> str:
+        self._record_usage(getattr(msg, "usage", None), "input_tokens", "output_tokens")
+        raw = next((b.text for b in msg.content if hasattr(b, "text")), "") if msg.content else ""
+        return normalize_mojibake(raw)
 
     def generate(
         self,
@@ -41,14 +70,63 @@ class AnthropicClient(AIClient):
     ) -> str:
         """Generate content using Anthropic Claude."""
         try:
-            msg = self.client.messages.create(
-                model=model or os.getenv("ANTHROPIC_MODEL", self.DEFAULT_MODEL),
-                max_tokens=max_tokens,
-                system=system_message or "You are an expert AI skill generator for developer tools.",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=temperature,
+            msg = self.client.messages.create(**self._request(prompt, max_tokens, model, temperature, system_message))
+            return self._text(msg)
+        except Exception as e:  # noqa: BLE001 — Anthropic SDK raises diverse provider errors
+            raise RuntimeError(f"Anthropic generation failed: {e}") from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        """Generate content using Anthropic's async client."""
+        try:
+            msg = await self._async_client().messages.create(
+                **self._request(prompt, max_tokens, model, temperature, system_message)
             )
-            raw = next((b.text for b in msg.content if hasattr(b, "text")), "") if msg.content else ""
-            return normalize_mojibake(raw)
+            return self._text(msg)
+        except Exception as e:  # noqa: BLE001 — Anthropic SDK raises diverse provider errors
+            raise RuntimeError(f"Anthropic generation failed: {e}") from e
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream content from Anthropic Claude as it is generated."""
+        try:
+            with self.client.messages.stream(
+                **self._request(prompt, max_tokens, model, temperature, system_message)
+            ) as stream:
+                yield from normalized_stream(stream.text_stream)
+                usage = getattr(stream.get_final_message(), "usage", None)
+            self._record_usage(usage, "input_tokens", "output_tokens")
+        except Exception as e:  # noqa: BLE001 — Anthropic SDK raises diverse provider errors
+            raise RuntimeError(f"Anthropic generation failed: {e}") from e
+
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Stream content from Anthropic's async client as it is generated."""
+        try:
+            async with self._async_client().messages.stream(
+                **self._request(prompt, max_tokens, model, temperature, system_message)
+            ) as stream:
+                async for piece in anormalized_stream(stream.text_stream):
+                    yield piece
+                usage = getattr(await stream.get_final_message(), "usage", None)
+            self._record_usage(usage, "input_tokens", "output_tokens")
         except Exception as e:  # noqa: BLE001 — Anthropic SDK raises diverse provider errors
             raise RuntimeError(f"Anthropic generation failed: {e}") from e
@@ -1,10 +1,11 @@
 """Gemini AI Provider."""
 
 import os
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 from ...utils.encoding import normalize_mojibake
-from ..ai_client import AIClient
+from ..ai_client import AIClient, anormalized_stream, normalized_stream
+from ..client_pool import pooled_async_client, pooled_client
 
 try:
     from google import genai
@@ -26,6 +27,7 @@ class GeminiClient(AIClient):
     """Google Gemini API client."""
 
     DEFAULT_MODEL = "gemini-2.5-flash"
+    MODEL_ENV = "GEMINI_MODEL"
     DEFAULT_TIMEOUT_MS = 60_000  # 60 seconds — HttpOptions.timeout is in milliseconds
 
     def __init__(self, api_key: Optional[str] = None):
@@ -36,11 +38,38 @@ class GeminiClient(AIClient):
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY not found.")
 
-        self.client = genai.Client(
+        self.client = pooled_client(
+            ("gemini", genai.Client, self.api_key, self.DEFAULT_TIMEOUT_MS), lambda: self._new_client()
+        )
+
+    def _new_client(self) -> Any:
+        return genai.Client(
             api_key=self.api_key,
             http_options=types.HttpOptions(timeout=self.DEFAULT_TIMEOUT_MS),
         )
 
+    def _async_client(self) -> Any:
+        # ``Client.aio`` shares the client's async HTTP session, which is bound
+        # to one event loop, so each loop gets its own client.
+        return pooled_async_client(
+            ("gemini", genai.Client, self.api_key, self.DEFAULT_TIMEOUT_MS), lambda: self._new_client().aio
+        )
+
+    def _request(
+        self, prompt: str, max_tokens: int, model: Optional[str], temperature: float, system_message: Optional[str]
+    ) -> Dict[str, Any]:
+        return {
+            "model": self.resolve_model(model),
+            "contents": f"{system_message}\n\n{prompt}" if system_message else prompt,
+            "config": types.GenerateContentConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens,
+            ),
+        }
+
+    def _record_response_usage(self, response: Any) -> None:
+        self._record_usage(getattr(response, "usage_metadata", None), "prompt_token_count", "candidates_token_count")
+
     def generate(
         self,
         prompt: str,
@@ -51,16 +80,79 @@ class GeminiClient(AIClient):
     ) -> str:
         """Generate content using Gemini."""
         try:
-            full_prompt = f"{system_message}\n\n{prompt}" if system_message else prompt
             response = self.client.models.generate_content(
-                model=model or os.getenv("GEMINI_MODEL", self.DEFAULT_MODEL) or self.DEFAULT_MODEL,
-                contents=full_prompt,
-                config=types.GenerateContentConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                ),
+                **self._request(prompt, max_tokens, model, temperature, system_message)
             )
+            self._record_response_usage(response)
             # Clean encoding artifacts per AMIT_CODING_PREFERENCES.md
             return normalize_mojibake(response.text or "")
         except Exception as e:  # noqa: BLE001 — google-genai SDK raises diverse provider errors
             raise RuntimeError(f"Gemini generation failed: {e}") from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        """Generate content using Gemini's async client."""
+        try:
+            response = await self._async_client().models.generate_content(
+                **self._request(prompt, max_tokens, model, temperature, system_message)
+            )
+            self._record_response_usage(response)
+            return normalize_mojibake(response.text or "")
+        except Exception as e:  # noqa: BLE001 — google-genai SDK raises diverse provider errors
+            raise RuntimeError(f"Gemini generation failed: {e}") from e
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream content from Gemini as it is generated."""
+        try:
+            chunks = self.client.models.generate_content_stream(
+                **self._request(prompt, max_tokens, model, temperature, system_message)
+            )
+            yield from normalized_stream(self._texts(chunks))
+        except Exception as e:  # noqa: BLE001 — google-genai SDK raises diverse provider errors
+            raise RuntimeError(f"Gemini generation failed: {e}") from e
+
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Stream content from Gemini's async client as it is generated."""
+        try:
+            chunks = await self._async_client().models.generate_content_stream(
+                **self._request(prompt, max_tokens, model, temperature, system_message)
+            )
+            async for piece in anormalized_stream(self._atexts(chunks)):
+                yield piece
+        except Exception as e:  # noqa: BLE001 — google-genai SDK raises diverse provider errors
+            raise RuntimeError(f"Gemini generation failed: {e}") from e
+
+    def _texts(self, chunks: Any) -> Iterator[str]:
+        # Every chunk carries cumulative usage; the last one is the total.
+        last = None
+        for chunk in chunks:
+            last = chunk
+            yield chunk.text or ""
+        self._record_response_usage(last)
+
+    async def _atexts(self, chunks: Any) -> AsyncIterator[str]:
+        last = None
+        async for chunk in chunks:
+            last = chunk
+            yield chunk.text or ""
+        self._record_response_usage(last)
@@ -1,13 +1,14 @@
 """Groq AI Provider."""
 
 import os
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 from ...utils.encoding import normalize_mojibake
-from ..ai_client import AIClient
+from ..ai_client import AIClient, anormalized_stream, normalized_stream
+from ..client_pool import pooled_async_client, pooled_client
 
 try:
-    from groq import Groq
+    from groq import AsyncGroq, Groq
 
     GROQ_AVAILABLE = True
 except ImportError:
@@ -28,7 +29,35 @@ class GroqClient(AIClient):
         if not self.api_key:
             raise ValueError("GROQ_API_KEY not found.")
 
-        self.client = Groq(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT)
+        self.client = pooled_client(
+            ("groq", Groq, self.api_key, self.DEFAULT_TIMEOUT),
+            lambda: Groq(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT),
+        )
+
+    def _async_client(self) -> Any:
+        return pooled_async_client(
+            ("groq", AsyncGroq, self.api_key, self.DEFAULT_TIMEOUT),
+            lambda: AsyncGroq(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT),
+        )
+
+    def _request(
+        self, prompt: str, max_tokens: int, model: Optional[str], temperature: float, system_message: Optional[str]
+    ) -> Dict[str, Any]:
+        messages: list = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+        return {
+            "model": self.resolve_model(model),
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
+    def _text(self, completion: Any) -> str:
+        self._record_usage(getattr(completion, "usage", None), "prompt_tokens", "completion_tokens")
+        # Clean encoding artifacts per AMIT_CODING_PREFERENCES.md
+        return normalize_mojibake(completion.choices[0].message.content or "")
 
     def generate(
         self,
@@ -40,17 +69,78 @@ class GroqClient(AIClient):
     ) -> str:
         """Generate content using Groq."""
         try:
-            messages: list = []
-            if system_message:
-                messages.append({"role": "system", "content": system_message})
-            messages.append({"role": "user", "content": prompt})
             completion = self.client.chat.completions.create(
-                model=model or self.DEFAULT_MODEL,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
+                **self._request(prompt, max_tokens, model, temperature, system_message)
+            )
+            return self._text(completion)
+        except Exception as e:  # noqa: BLE001 — Groq SDK raises diverse provider errors
+            raise RuntimeError(f"Groq generation failed: {e}") from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        """Generate content using Groq's async client."""
+        try:
+            completion = await self._async_client().chat.completions.create(
+                **self._request(prompt, max_tokens, model, temperature, system_message)
             )
-            # Clean encoding artifacts per AMIT_CODING_PREFERENCES.md
-            return normalize_mojibake(completion.choices[0].message.content or "")
+            return self._text(completion)
         except Exception as e:  # noqa: BLE001 — Groq SDK raises diverse provider errors
             raise RuntimeError(f"Groq generation failed: {e}") from e
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream content from Groq as it is generated."""
+        try:
+            chunks = self.client.chat.completions.create(
+                **self._request(prompt, max_tokens, model, temperature, system_message), stream=True
+            )
+            yield from normalized_stream(self._deltas(chunks))
+        except Exception as e:  # noqa: BLE001 — Groq SDK raises diverse provider errors
+            raise RuntimeError(f"Groq generation failed: {e}") from e
+
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Stream content from Groq's async client as it is generated."""
+        try:
+            chunks = await self._async_client().chat.completions.create(
+                **self._request(prompt, max_tokens, model, temperature, system_message), stream=True
+            )
+            async for piece in anormalized_stream(self._adeltas(chunks)):
+                yield piece
+        except Exception as e:  # noqa: BLE001 — Groq SDK raises diverse provider errors
+            raise RuntimeError(f"Groq generation failed: {e}") from e
+
+    def _deltas(self, chunks: Any) -> Iterator[str]:
+        # Groq reports usage on the final chunk under ``x_groq``.
+        usage = None
+        for chunk in chunks:
+            usage = getattr(getattr(chunk, "x_groq", None), "usage", None) or usage
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+        self._record_usage(usage, "prompt_tokens", "completion_tokens")
+
+    async def _adeltas(self, chunks: Any) -> AsyncIterator[str]:
+        usage = None
+        async for chunk in chunks:
+            usage = getattr(getattr(chunk, "x_groq", None), "usage", None) or usage
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+        self._record_usage(usage, "prompt_tokens", "completion_tokens")
@@ -1,17 +1,20 @@
 """OpenAI API Provider."""
 
 import os
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 from ...utils.encoding import normalize_mojibake
-from ..ai_client import AIClient
+from ..ai_client import AIClient, anormalized_stream, normalized_stream
+from ..client_pool import pooled_async_client, pooled_client
 
 try:
+    from openai import AsyncOpenAI as _AsyncOpenAI
     from openai import OpenAI as _OpenAI
 
     OPENAI_AVAILABLE = True
 except ImportError:
     _OpenAI = None
+    _AsyncOpenAI = None
     OPENAI_AVAILABLE = False
 
 
@@ -19,6 +22,7 @@ class OpenAIClient(AIClient):
     """OpenAI API client (GPT-4o / GPT-4o-mini)."""
 
     DEFAULT_MODEL = "gpt-4o-mini"
+    MODEL_ENV = "OPENAI_MODEL"
     DEFAULT_TIMEOUT = 60.0  # seconds
 
     def __init__(self, api_key: Optional[str] = None):
@@ -29,7 +33,35 @@ class OpenAIClient(AIClient):
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not found.")
 
-        self.client = _OpenAI(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT)
+        self.client = pooled_client(
+            ("openai", _OpenAI, self.api_key, self.DEFAULT_TIMEOUT),
+            lambda: _OpenAI(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT),
+        )
+
+    def _async_client(self) -> Any:
+        return pooled_async_client(
+            ("openai", _AsyncOpenAI, self.api_key, self.DEFAULT_TIMEOUT),
+            lambda: _AsyncOpenAI(api_key=self.api_key, timeout=self.DEFAULT_TIMEOUT),
+        )
+
+    def _request(
+        self, prompt: str, max_tokens: int, model: Optional[str], temperature: float, system_message: Optional[str]
+    ) -> Dict[str, Any]:
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+        return {
+            "model": self.resolve_model(model),
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+    def _text(self, resp: Any) -> str:
+        self._record_usage(getattr(resp, "usage", None), "prompt_tokens", "completion_tokens")
+        raw = resp.choices[0].message.content or ""
+        return normalize_mojibake(raw)
 
     def generate(
         self,
@@ -41,18 +73,82 @@ class OpenAIClient(AIClient):
     ) -> str:
         """Generate content using OpenAI."""
         try:
-            messages = []
-            if system_message:
-                messages.append({"role": "system", "content": system_message})
-            messages.append({"role": "user", "content": prompt})
-
             resp = self.client.chat.completions.create(
-                model=model or os.getenv("OPENAI_MODEL", self.DEFAULT_MODEL),
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
+                **self._request(prompt, max_tokens, model, temperature, system_message)
+            )
+            return self._text(resp)
+        except Exception as e:  # noqa: BLE001 — OpenAI SDK raises diverse provider errors
+            raise RuntimeError(f"OpenAI generation failed: {e}") from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        """Generate content using OpenAI's async client."""
+        try:
+            resp = await self._async_client().chat.completions.create(
+                **self._request(prompt, max_tokens, model, temperature, system_message)
+            )
+            return self._text(resp)
+        except Exception as e:  # noqa: BLE001 — OpenAI SDK raises diverse provider errors
+            raise RuntimeError(f"OpenAI generation failed: {e}") from e
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream content from OpenAI as it is generated."""
+        try:
+            chunks = self.client.chat.completions.create(
+                **self._request(prompt, max_tokens, model, temperature, system_message),
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            yield from normalized_stream(self._deltas(chunks))
+        except Exception as e:  # noqa: BLE001 — OpenAI SDK raises diverse provider errors
+            raise RuntimeError(f"OpenAI generation failed: {e}") from e
+
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Stream content from OpenAI's async client as it is generated."""
+        try:
+            chunks = await self._async_client().chat.completions.create(
+                **self._request(prompt, max_tokens, model, temperature, system_message),
+                stream=True,
+                stream_options={"include_usage": True},
             )
-            raw = resp.choices[0].message.content or ""
-            return normalize_mojibake(raw)
+            async for piece in anormalized_stream(self._adeltas(chunks)):
+                yield piece
         except Exception as e:  # noqa: BLE001 — OpenAI SDK raises diverse provider errors
             raise RuntimeError(f"OpenAI generation failed: {e}") from e
+
+    def _deltas(self, chunks: Any) -> Iterator[str]:
+        # With include_usage the final chunk carries the usage and no choices.
+        usage = None
+        for chunk in chunks:
+            usage = getattr(chunk, "usage", None) or usage
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+        self._record_usage(usage, "prompt_tokens", "completion_tokens")
+
+    async def _adeltas(self, chunks: Any) -> AsyncIterator[str]:
+        usage = None
+        async for chunk in chunks:
+            usage = getattr(chunk, "usage", None) or usage
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+        self._record_usage(usage, "prompt_tokens", "completion_tokens")
@@ -0,0 +1,285 @@
+"""Provider rate limiting shared across worker processes.
+
+``prg ralph run-all --parallel N`` runs N Ralph loops as separate processes
+against the same provider account. Each loop on its own stays under the
+provider's limits; N of them together do not. ``SharedRateLimiter`` keeps its
+state in ``multiprocessing`` shared memory, so every process that receives it
+(as a ``Process`` argument) paces its requests against the same schedule and
+backs off together when any of them is rate-limited.
+
+A process opts in with ``install_rate_limiter``; from then on
+``create_ai_client`` wraps every provider client in a ``RateLimitedAIClient``.
+Cached responses are served outside the wrapper and never wait for a slot.
+
+``ProviderBackoff`` is the in-process counterpart used by the threads of one
+command (``prg analyze --ai-concurrency``); both share ``is_rate_limited`` and
+the retry loops in ``call`` and ``acall``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from .ai_client import AIClient
+
+T = TypeVar("T")
+
+_RATE_LIMIT_MARKERS = ("429", "rate limit", "rate_limit", "ratelimit", "too many requests", "resource_exhausted")
+
+_installed: Optional["SharedRateLimiter"] = None
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """True when ``exc`` looks like a provider 429 / quota error."""
+    err = str(exc).lower()
+    return any(marker in err for marker in _RATE_LIMIT_MARKERS)
+
+
+class _Backoff(ABC):
+    """The 429 retry loops; subclasses keep the back-off state.
+
+    ``reserve`` returns how long to wait before a request may start,
+    ``rate_limited`` extends the shared pause after a 429 and ``succeeded``
+    resets the delay.
+    """
+
+    max_retries: int
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """Claim the next request slot and return how long to wait for it."""
+
+    @abstractmethod
+    def rate_limited(self) -> None:
+        """Pause every holder after a 429 and lengthen the next pause."""
+
+    @abstractmethod
+    def succeeded(self) -> None:
+        """Reset the back-off delay after a successful request."""
+
+    def acquire(self) -> None:
+        """Block until a request may start."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Async ``acquire``: waits without blocking the event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run ``fn``, retrying after the shared back-off when it is rate-limited."""
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            try:
+                result = fn()
+            except Exception as e:  # noqa: BLE001 — classify provider errors; non-429s propagate
+                if attempt < self.max_retries and is_rate_limited(e):
+                    self.rate_limited()
+                    continue
+                raise
+            self.succeeded()
+            return result
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def acall(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async ``call``: awaits ``fn()`` for each attempt."""
+        for attempt in range(self.max_retries + 1):
+            await self.aacquire()
+            try:
+                result = await fn()
+            except Exception as e:  # noqa: BLE001 — classify provider errors; non-429s propagate
+                if attempt < self.max_retries and is_rate_limited(e):
+                    self.rate_limited()
+                    continue
+                raise
+            self.succeeded()
+            return result
+        raise AssertionError("unreachable")  # pragma: no cover
+
+
+class ProviderBackoff(_Backoff):
+    """Shared 429 back-off for one provider across the threads of one process.
+
+    A rate-limited call pauses *every* thread using it until the back-off
+    expires, doubling the delay on consecutive 429s and resetting it after a
+    success.
+    """
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 30.0, max_retries: int = 4):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self._delay = base_delay
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            return self._resume_at - time.monotonic()
+
+    def rate_limited(self) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + self._delay)
+            self._delay = min(self._delay * 2, self.max_delay)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self._delay = self.base_delay
+
+
+class SharedRateLimiter(_Backoff):
+    """Request pacing and 429 back-off shared by every process holding it.
+
+    ``requests_per_minute`` spaces request *starts* evenly (0 disables
+    pacing). A rate-limited call pauses every holder until the back-off
+    expires, doubling the delay on consecutive 429s and resetting it after a
+    success. Times are wall-clock (``time.time``) because the schedule is
+    compared across processes.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_retries: int = 4,
+        context: Any = None,
+    ):
+        ctx = context or multiprocessing.get_context("spawn")
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self._lock = ctx.Lock()
+        self._next_slot = ctx.RawValue("d", 0.0)
+        self._resume_at = ctx.RawValue("d", 0.0)
+        self._delay = ctx.RawValue("d", base_delay)
+
+    def reserve(self) -> float:
+        """Claim the next request slot and return how long to wait for it."""
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.value, self._resume_at.value)
+            self._next_slot.value = slot + self.interval
+        return slot - now
+
+    def rate_limited(self) -> None:
+        with self._lock:
+            self._resume_at.value = max(self._resume_at.value, time.time() + self._delay.value)
+            self._delay.value = min(self._delay.value * 2, self.max_delay)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self._delay.value = self.base_delay
+
+
+def install_rate_limiter(limiter: Optional[SharedRateLimiter]) -> None:
+    """Route this process's provider clients through ``limiter`` (None uninstalls)."""
+    global _installed
+    _installed = limiter
+
+
+def installed_rate_limiter() -> Optional[SharedRateLimiter]:
+    return _installed
+
+
+class RateLimitedAIClient(AIClient):
+    """Wraps a provider client so every request waits for a shared slot.
+
+    Attribute access falls through to the wrapped client, like
+    ``CachingAIClient``. Streams take a slot before the request but are not
+    retried: pieces may already have been handed to the caller.
+    """
+
+    def __init__(self, inner: AIClient, limiter: SharedRateLimiter):
+        super().__init__(inner.api_key)
+        self.inner = inner
+        self.limiter = limiter
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__dict__["inner"], name)
+
+    def resolve_model(self, model: Optional[str] = None) -> str:
+        return self.inner.resolve_model(model)
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        return self.limiter.call(
+            lambda: self.inner.generate(
+                prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+            )
+        )
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> Iterator[str]:
+        self.limiter.acquire()
+        try:
+            yield from self.inner.stream(
+                prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+            )
+        except Exception as e:  # noqa: BLE001 — report 429s to the shared back-off, then propagate
+            if is_rate_limited(e):
+                self.limiter.rate_limited()
+            raise
+        self.limiter.succeeded()
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        return await self.limiter.acall(
+            lambda: self.inner.agenerate(
+                prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+            )
+        )
+
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        await self.limiter.aacquire()
+        try:
+            async for piece in self.inner.astream(
+                prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+            ):
+                yield piece
+        except Exception as e:  # noqa: BLE001 — report 429s to the shared back-off, then propagate
+            if is_rate_limited(e):
+                self.limiter.rate_limited()
+            raise
+        self.limiter.succeeded()
+
+
+def with_rate_limit(client: AIClient) -> AIClient:
+    """Wrap ``client`` in a ``RateLimitedAIClient`` when a limiter is installed."""
+    if _installed is None or isinstance(client, RateLimitedAIClient):
+        return client
+    return RateLimitedAIClient(client, _installed)
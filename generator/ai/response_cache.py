@@ -0,0 +1,435 @@
+"""Persistent LLM response cache.
+
+CI runs ``prg analyze --ai``, ``prg design`` and ``prg plan`` against inputs
+that rarely change between runs, yet every ``AIClient.generate`` call went to
+the network. ``LLMResponseCache`` stores each response as one JSON file under
+``~/.prg/llm-cache`` keyed by everything that shapes the answer — provider,
+resolved model, temperature, system message, a digest of the prompt and
+``max_tokens`` — so an identical request on a later run is served from disk.
+
+The cache is bounded: entries older than the TTL are treated as misses and
+deleted, and once the directory exceeds its byte or entry budget the least
+recently used files (by mtime, which every hit refreshes) are evicted. The
+cache keeps running byte/entry totals, so only a write that crosses the budget
+scans the directory.
+
+``create_ai_client`` wraps each provider client in ``CachingAIClient`` unless
+caching is disabled (``prg --no-llm-cache`` or ``PRG_NO_LLM_CACHE=1``).
+Callers that validate LLM output make their requests inside
+``cache_only_valid(validator)``: a response the validator rejects is never
+stored, and a stored entry it rejects is treated as a miss, so neither the
+retry nor the next run is served a rejected answer.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .ai_client import AIClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".prg" / "llm-cache"
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# Bumped when the key derivation or entry layout changes.
+_KEY_VERSION = 1
+
+
+class LLMResponseCache:
+    """Size-bounded, TTL-limited on-disk cache of LLM responses."""
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        self.root = Path(root) if root is not None else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # (bytes, entries) on disk, counted on the first write and kept up to
+        # date by put/discard. Other processes sharing the directory make it an
+        # estimate; every eviction pass re-counts from disk.
+        self._totals: Optional[Tuple[int, int]] = None
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: float,
+        system_message: Optional[str],
+        prompt: str,
+        max_tokens: int,
+    ) -> str:
+        """Return the cache key for one ``generate`` request."""
+        prompt_digest = hashlib.sha256(prompt.encode("utf-8", errors="surrogatepass")).hexdigest()
+        material = json.dumps(
+            [_KEY_VERSION, provider, model, float(temperature), system_message, prompt_digest, int(max_tokens)]
+        )
+        return hashlib.sha256(material.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None on a miss or expiry."""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            response = data["response"]
+            created = float(data["created"])
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if self.ttl_seconds and time.time() - created > self.ttl_seconds:
+            self.discard(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            os.utime(path)  # mark as recently used for LRU eviction
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return response
+
+    def put(self, key: str, response: str, meta: Optional[Dict[str, Any]] = None) -> None:
+        """Store ``response`` under ``key`` and evict down to the size budget."""
+        entry = {"created": time.time(), "response": response, **(meta or {})}
+        path = self._path(key)
+        data = json.dumps(entry).encode("utf-8", errors="surrogatepass")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            replaced = _file_size(path)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("Could not write LLM cache entry %s: %s", path, exc)
+            return
+        if self._add_to_totals(len(data) - (replaced or 0), 0 if replaced is not None else 1):
+            self._evict()
+
+    def discard(self, key: str) -> None:
+        path = self._path(key)
+        size = _file_size(path)
+        try:
+            path.unlink()
+        except OSError:
+            return
+        self._add_to_totals(-(size or 0), -1)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """Return ``(mtime, size, path)`` for every entry, oldest first."""
+        entries: List[Tuple[float, int, Path]] = []
+        try:
+            with os.scandir(self.root) as it:
+                for child in it:
+                    if not child.name.endswith(".json"):
+                        continue
+                    try:
+                        st = child.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, Path(child.path)))
+        except OSError:
+            return []
+        entries.sort()
+        return entries
+
+    def _add_to_totals(self, size: int, count: int) -> bool:
+        """Apply a write/delete to the running totals; True when they exceed the budget."""
+        with self._lock:
+            if self._totals is None:
+                entries = self._entries()
+                self._totals = (sum(size for _, size, _ in entries), len(entries))
+            else:
+                self._totals = (self._totals[0] + size, self._totals[1] + count)
+            total, entries_count = self._totals
+            return total > self.max_bytes or entries_count > self.max_entries
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            count = len(entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes and count <= self.max_entries:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                count -= 1
+            self._totals = (total, count)
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self._entries()
+        return {
+            "path": str(self.root),
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self) -> int:
+        """Delete every entry; return how many were removed."""
+        removed = 0
+        for _, _, path in self._entries():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        with self._lock:
+            self._totals = None
+        return removed
+
+
+def _file_size(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+# ----------------------------------------------------------------------
+# Client wrapper
+# ----------------------------------------------------------------------
+
+Validator = Callable[[str], bool]
+
+# The validator of the innermost ``cache_only_valid`` block. A ContextVar, not
+# a thread-local, so concurrent ``agenerate``/``astream`` tasks on one event
+# loop each see their own.
+_validator: "contextvars.ContextVar[Optional[Validator]]" = contextvars.ContextVar("llm_cache_validator", default=None)
+# Whether the most recent response in this context was a cache hit.
+_last_hit: "contextvars.ContextVar[bool]" = contextvars.ContextVar("llm_cache_last_hit", default=False)
+
+
+@contextmanager
+def cache_only_valid(validator: Validator) -> Iterator[None]:
+    """Cache responses produced in this block only when ``validator`` accepts them.
+
+    A cached entry the validator rejects (stored before the check existed, or
+    by a caller without one) is dropped and the request goes to the provider.
+    """
+    token = _validator.set(validator)
+    try:
+        yield
+    finally:
+        _validator.reset(token)
+
+
+def _accepted(response: str) -> bool:
+    validator = _validator.get()
+    return validator is None or validator(response)
+
+
+class CachingAIClient(AIClient):
+    """Wraps a provider client, answering repeated requests from the cache.
+
+    Attribute access falls through to the wrapped client, so callers that
+    reach for provider-specific attributes (``client.client``) keep working.
+    """
+
+    def __init__(self, inner: AIClient, provider: str, cache: LLMResponseCache):
+        super().__init__(inner.api_key)
+        self.inner = inner
+        self.provider = provider
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        # Only consulted for attributes not found on the wrapper itself.
+        return getattr(self.__dict__["inner"], name)
+
+    def resolve_model(self, model: Optional[str] = None) -> str:
+        return self.inner.resolve_model(model)
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        key, resolved, cached = self._lookup(prompt, max_tokens, model, temperature, system_message)
+        if cached is not None:
+            return cached
+
+        result = self.inner.generate(
+            prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+        )
+        self._store(key, resolved, result)
+        return result
+
+    def _lookup(
+        self, prompt: str, max_tokens: int, model: Optional[str], temperature: float, system_message: Optional[str]
+    ) -> Tuple[str, str, Optional[str]]:
+        resolved = self.inner.resolve_model(model)
+        key = self.cache.make_key(self.provider, resolved, temperature, system_message, prompt, max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None and not _accepted(cached):
+            logger.debug("Dropping cached LLM response rejected by the validator (%s/%s)", self.provider, resolved)
+            self.cache.discard(key)
+            cached = None
+        if cached is not None:
+            logger.debug("LLM cache hit (%s/%s)", self.provider, resolved)
+        _last_hit.set(cached is not None)
+        return key, resolved, cached
+
+    def _store(self, key: str, resolved: str, result: str) -> None:
+        if result and _accepted(result):
+            self.cache.put(key, result, {"provider": self.provider, "model": resolved})
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream from the wrapped client; a cache hit is yielded whole.
+
+        The response is stored once the stream has been read to the end.
+        """
+        key, resolved, cached = self._lookup(prompt, max_tokens, model, temperature, system_message)
+        if cached is not None:
+            yield cached
+            return
+        pieces: List[str] = []
+        for piece in self.inner.stream(
+            prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+        ):
+            pieces.append(piece)
+            yield piece
+        self._store(key, resolved, "".join(pieces))
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        key, resolved, cached = self._lookup(prompt, max_tokens, model, temperature, system_message)
+        if cached is not None:
+            return cached
+        result = await self.inner.agenerate(
+            prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+        )
+        self._store(key, resolved, result)
+        return result
+
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        key, resolved, cached = self._lookup(prompt, max_tokens, model, temperature, system_message)
+        if cached is not None:
+            yield cached
+            return
+        pieces: List[str] = []
+        async for piece in self.inner.astream(
+            prompt, max_tokens=max_tokens, model=model, temperature=temperature, system_message=system_message
+        ):
+            pieces.append(piece)
+            yield piece
+        self._store(key, resolved, "".join(pieces))
+
+
+def last_response_cached() -> bool:
+    """True when the most recent response in this thread / task was a cache hit."""
+    return _last_hit.get()
+
+
+# ----------------------------------------------------------------------
+# Process-wide configuration
+# ----------------------------------------------------------------------
+
+_enabled: Optional[bool] = None
+_default_cache: Optional[LLMResponseCache] = None
+
+
+def set_llm_cache_enabled(enabled: bool) -> None:
+    """Enable or disable response caching for clients created from now on."""
+    global _enabled
+    _enabled = enabled
+
+
+def llm_cache_enabled() -> bool:
+    if _enabled is not None:
+        return _enabled
+    return os.getenv("PRG_NO_LLM_CACHE", "").strip().lower() not in ("1", "true", "yes")
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if not raw:
+        return float(default)
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring non-numeric %s=%r", name, raw)
+        return float(default)
+
+
+def get_response_cache() -> LLMResponseCache:
+    """Return the process-wide cache, configured from ``PRG_LLM_CACHE_*`` env vars."""
+    global _default_cache
+    root = Path(os.environ["PRG_LLM_CACHE_DIR"]) if os.getenv("PRG_LLM_CACHE_DIR") else DEFAULT_CACHE_DIR
+    if _default_cache is None or _default_cache.root != root:
+        _default_cache = LLMResponseCache(
+            root=root,
+            max_bytes=int(_env_number("PRG_LLM_CACHE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024)) * 1024 * 1024),
+            ttl_seconds=_env_number("PRG_LLM_CACHE_TTL", DEFAULT_TTL_SECONDS),
+        )
+    return _default_cache
+
+
+def with_response_cache(client: AIClient, provider: str) -> AIClient:
+    """Wrap ``client`` in a ``CachingAIClient`` when caching is enabled."""
+    if not llm_cache_enabled() or isinstance(client, CachingAIClient):
+        return client
+    return CachingAIClient(client, provider, get_response_cache())
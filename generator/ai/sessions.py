@@ -0,0 +1,237 @@
+"""Process-wide AI client sessions with usage totals.
+
+Components that talk to a provider (``RalphEngine``'s agent and self-review,
+``ContentAnalyzer``, ``ProjectPlanner``, ``TaskDecomposer``,
+``DesignGenerator``, ``prg gaps``) each built their own client with
+``create_ai_client``, once per call or per object. ``ai_session`` returns the
+one ``AISession`` registered for ``(provider, api_key, model)`` instead, so
+the client stack (response cache, rate limiter, provider client on a pooled
+SDK connection from ``generator.ai.client_pool``) is set up once per run.
+
+An ``AISession`` is itself an ``AIClient``: it forwards every call to the
+client it wraps and adds the round trip to its ``SessionStats`` — request
+count, failures, wall-clock latency and the token counts the provider
+reported. ``sessions()`` lists them for run summaries.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from .ai_client import AIClient
+
+# The session whose request is in flight in this thread / task, so token
+# counts reported by the provider client (``AIClient._record_usage``) can be
+# attributed to it.
+_current: "contextvars.ContextVar[Optional[AISession]]" = contextvars.ContextVar("ai_session", default=None)
+
+_sessions: Dict[Tuple[str, Optional[str], Optional[str]], "AISession"] = {}
+_lock = threading.Lock()
+
+
+@dataclass
+class SessionStats:
+    """Cumulative usage of one ``AISession``."""
+
+    requests: int = 0
+    failures: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency_s: float = 0.0
+
+
+class AISession(AIClient):
+    """A shared client for one ``(provider, api_key, model)`` that meters its use.
+
+    ``model`` is the default for calls that do not pass one. Attribute access
+    falls through to the wrapped client, like ``CachingAIClient``.
+    """
+
+    def __init__(self, inner: AIClient, provider: str, model: Optional[str] = None):
+        super().__init__(getattr(inner, "api_key", None))
+        self.inner = inner
+        self.provider = provider
+        self.model = model
+        self.stats = SessionStats()
+        self._stats_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__dict__["inner"], name)
+
+    def resolve_model(self, model: Optional[str] = None) -> str:
+        return self.inner.resolve_model(model or self.model)
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"{self.provider}: {s.requests} request(s), {s.failures} failed, "
+            f"{s.input_tokens} in / {s.output_tokens} out tokens, {s.latency_s:.1f}s"
+        )
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        started = time.perf_counter()
+        token = _current.set(self)
+        try:
+            result = self.inner.generate(
+                prompt,
+                max_tokens=max_tokens,
+                model=model or self.model,
+                temperature=temperature,
+                system_message=system_message,
+            )
+        except Exception:
+            self._finish(started, failed=True)
+            raise
+        finally:
+            _current.reset(token)
+        self._finish(started)
+        return result
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> Iterator[str]:
+        started = time.perf_counter()
+        pieces = iter(
+            self.inner.stream(
+                prompt,
+                max_tokens=max_tokens,
+                model=model or self.model,
+                temperature=temperature,
+                system_message=system_message,
+            )
+        )
+        # The session is current only while the wrapped stream runs, not
+        # while the caller handles a piece (it may use other sessions).
+        while True:
+            token = _current.set(self)
+            try:
+                piece = next(pieces)
+            except StopIteration:
+                break
+            except Exception:
+                self._finish(started, failed=True)
+                raise
+            finally:
+                _current.reset(token)
+            yield piece
+        self._finish(started)
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> str:
+        started = time.perf_counter()
+        token = _current.set(self)
+        try:
+            result = await self.inner.agenerate(
+                prompt,
+                max_tokens=max_tokens,
+                model=model or self.model,
+                temperature=temperature,
+                system_message=system_message,
+            )
+        except Exception:
+            self._finish(started, failed=True)
+            raise
+        finally:
+            _current.reset(token)
+        self._finish(started)
+        return result
+
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        started = time.perf_counter()
+        pieces = self.inner.astream(
+            prompt,
+            max_tokens=max_tokens,
+            model=model or self.model,
+            temperature=temperature,
+            system_message=system_message,
+        ).__aiter__()
+        while True:
+            token = _current.set(self)
+            try:
+                piece = await pieces.__anext__()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                self._finish(started, failed=True)
+                raise
+            finally:
+                _current.reset(token)
+            yield piece
+        self._finish(started)
+
+    def _finish(self, started: float, failed: bool = False) -> None:
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self.stats.requests += 1
+            self.stats.failures += failed
+            self.stats.latency_s += elapsed
+
+    def _add_tokens(self, input_tokens: int, output_tokens: int) -> None:
+        with self._stats_lock:
+            self.stats.input_tokens += input_tokens
+            self.stats.output_tokens += output_tokens
+
+
+def ai_session(provider: str, api_key: Optional[str] = None, model: Optional[str] = None) -> AISession:
+    """Return the session for ``(provider, api_key, model)``, creating its client on first use.
+
+    Raises whatever ``create_ai_client`` raises (unknown provider, missing
+    SDK or key); nothing is registered in that case.
+    """
+    key = (provider, api_key, model)
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            from . import factory
+
+            session = AISession(factory.create_ai_client(provider, api_key=api_key), provider, model)
+            _sessions[key] = session
+        return session
+
+
+def sessions() -> List[AISession]:
+    """Every session created in this process, oldest first."""
+    with _lock:
+        return list(_sessions.values())
+
+
+def clear_sessions() -> None:
+    """Forget every session (tests, or after credentials change)."""
+    with _lock:
+        _sessions.clear()
+
+
+def record_session_tokens(input_tokens: int, output_tokens: int) -> None:
+    """Add a provider-reported token count to the session whose request is in flight, if any."""
+    session = _current.get()
+    if session is not None:
+        session._add_tokens(input_tokens, output_tokens)
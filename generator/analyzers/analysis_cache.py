@@ -0,0 +1,159 @@
+"""Persistent per-file analysis cache.
+
+``StructureAnalyzer`` and ``CodeExampleExtractor`` derive small facts from
+individual source files — which import regexes match, how many test cases a
+test module declares, which functions/classes/imports the AST contains. Those
+facts depend only on the file's bytes, so they are cached on disk under
+``.clinerules/.prg-cache/`` (beside ``.prg-cache.json``) and reused across
+``prg analyze`` runs.
+
+Lookup is keyed by relative path and validated against ``(size, mtime_ns)``
+from the shared ``ProjectFileIndex``. When that key is ambiguous — same size
+but a different mtime (``git checkout``, ``touch``), or an mtime so close to
+when the record was written that a same-second edit could hide behind it —
+the file's blake2b digest decides instead. A warm rerun therefore reads only
+files that actually changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from generator.utils.file_index import RACY_WINDOW_NS, FileEntry, ProjectFileIndex
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = ".prg-cache"
+CACHE_FILENAME = "analysis.json"
+_CACHE_VERSION = 1
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class AnalysisCache:
+    """Per-file derived facts keyed by (path, size, mtime_ns) with digest fallback.
+
+    ``cache_dir=None`` gives an in-memory cache with the same semantics, which
+    is what analyzers use when the caller does not supply a persistent one.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        # Analyzers may run concurrently (see EnhancedProjectParser); the lock
+        # guards record bookkeeping, never the (possibly slow) compute call.
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, output_dir: Path) -> "AnalysisCache":
+        """Open the cache stored under ``<output_dir>/.prg-cache/``."""
+        cache = cls(Path(output_dir) / CACHE_DIRNAME)
+        path = cache.cache_path
+        if path is None or not path.exists():
+            return cache
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Ignoring unreadable analysis cache %s: %s", path, exc)
+            return cache
+        if data.get("version") == _CACHE_VERSION and isinstance(data.get("files"), dict):
+            cache._records = data["files"]
+        return cache
+
+    @property
+    def cache_path(self) -> Optional[Path]:
+        return self.cache_dir / CACHE_FILENAME if self.cache_dir is not None else None
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, entry: FileEntry, kind: str, compute: Callable[[str], Any], max_chars: Optional[int] = None) -> Any:
+        """Return the cached ``kind`` fact for ``entry``, computing it on a miss.
+
+        ``compute`` receives the file's text (decoded as UTF-8 with
+        replacement, truncated to ``max_chars`` when given). Its return value
+        must be JSON-serialisable. Unreadable files compute on ``""`` and are
+        not cached.
+        """
+        with self._lock:
+            record = self._records.get(entry.rel)
+            if record is not None and kind in record["facts"] and self._stat_matches(record, entry):
+                self.hits += 1
+                return record["facts"][kind]
+
+        try:
+            data = entry.path.read_bytes()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return compute("")
+        digest = file_digest(data)
+
+        with self._lock:
+            record = self._records.get(entry.rel)
+            if record is None or record.get("digest") != digest:
+                record = {"facts": {}}
+                self._records[entry.rel] = record
+            record.update(size=entry.size, mtime_ns=entry.mtime_ns, digest=digest, recorded_ns=time.time_ns())
+            self._dirty = True
+
+            if kind in record["facts"]:
+                # Stat changed but content did not (checkout/touch) — still a hit.
+                self.hits += 1
+                return record["facts"][kind]
+            self.misses += 1
+
+        text = data.decode("utf-8", errors="replace")
+        value = compute(text[:max_chars] if max_chars is not None else text)
+        with self._lock:
+            record["facts"][kind] = value
+        return value
+
+    @staticmethod
+    def _stat_matches(record: Dict[str, Any], entry: FileEntry) -> bool:
+        if record.get("size") != entry.size or record.get("mtime_ns") != entry.mtime_ns:
+            return False
+        return entry.mtime_ns < record.get("recorded_ns", 0) - RACY_WINDOW_NS
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._records)}
+
+    def save(self, file_index: Optional[ProjectFileIndex] = None) -> None:
+        """Write the cache to disk (no-op for in-memory caches or when nothing changed).
+
+        When ``file_index`` is given, records for files that no longer exist
+        are dropped so the cache does not grow without bound.
+        """
+        if file_index is not None:
+            live = {e.rel for e in file_index}
+            stale = [rel for rel in self._records if rel not in live]
+            for rel in stale:
+                del self._records[rel]
+            self._dirty = self._dirty or bool(stale)
+        path = self.cache_path
+        if path is None or not self._dirty:
+            return
+        from prg_utils.file_ops import atomic_write_text
+
+        payload = {"version": _CACHE_VERSION, "files": self._records, "last_run": self.stats()}
+        try:
+            atomic_write_text(path, json.dumps(payload, separators=(",", ":")))
+            self._dirty = False
+        except OSError as exc:
+            logger.warning("Failed to write analysis cache %s: %s", path, exc)
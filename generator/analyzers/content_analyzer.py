@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from generator.ai.factory import create_ai_client
+from generator.ai.sessions import ai_session
 from generator.config import AnalyzerConfig
 from generator.exceptions import FileOperationError, ValidationError
 from generator.integrations.opik_client import OpikEvaluator
@@ -135,7 +135,7 @@ class ContentAnalyzer:
         allowed_base_path: Optional[Path] = None,
         client=None,
     ):
-        self.client = client or create_ai_client(provider=provider, api_key=api_key)
+        self.client = client or ai_session(provider, api_key=api_key)
         self.config = config or AnalyzerConfig()
         self.allowed_base_path = allowed_base_path.resolve() if allowed_base_path else Path.cwd().resolve()
         self.opik = OpikEvaluator() if getattr(self.config, "enable_opik", False) else None
@@ -3,9 +3,16 @@
 import hashlib
 import json
 import logging
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from generator.utils.file_index import RACY_WINDOW_NS, FileEntry, ProjectFileIndex
+from generator.utils.ignore import IgnoreMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,21 @@ _HASH_PATTERNS = [
     ".env.example",
 ]
 
+_DEP_FILES = [
+    "requirements.txt",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "package.json",
+    "Pipfile",
+    "poetry.lock",
+]
+
+_SOURCE_SUFFIXES = (".py", ".js", ".ts", ".go", ".rs", ".java")
+
+# Below this many stat-changed files, a thread pool costs more than it saves.
+_PARALLEL_HASH_THRESHOLD = 16
+
 _SOURCE_GLOBS = [
     "*.py",
     "*.js",
@@ -49,15 +71,55 @@ CACHE_FILENAME = ".prg-cache.json"
 
 
 class IncrementalAnalyzer:
-    """Detect project changes and skip unnecessary regeneration."""
-
-    def __init__(self, project_path: Path, output_dir: Path):
+    """Detect project changes and skip unnecessary regeneration.
+
+    With ``git_changes=True`` in a git work tree, the source and test sections
+    are rebuilt from the previous manifest plus only the paths git reports as
+    changed: ``git diff`` since the commit recorded by the last run, and the
+    paths dirty now or at the last run. Files git does not mention are neither
+    walked nor stat'ed. Without a usable previous git record (first run, a
+    plain hash run before it, an unknown commit, a changed ignore policy) or
+    outside git, the tree is hashed as usual. Both paths produce identical
+    section hashes. Files that git itself ignores but the project's ignore
+    policy does not (``.git/info/exclude``, a global excludes file) are not
+    re-checked in this mode.
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        output_dir: Path,
+        file_index: Optional[ProjectFileIndex] = None,
+        git_changes: bool = False,
+        ignore: Optional[IgnoreMatcher] = None,
+    ):
         self.project_path = Path(project_path)
         self.output_dir = Path(output_dir)
+        # Injected by the analyze pipeline so change detection shares its single
+        # tree walk. When absent, compute_project_hash() walks afresh per call.
+        self._file_index = file_index
+        self.git_changes = git_changes
+        self._ignore = ignore if ignore is not None else (file_index.ignore if file_index is not None else None)
+        #: The index compute_project_hash() walked itself, if any (reusable by the caller).
+        self.walked_index: Optional[ProjectFileIndex] = None
+        #: ``"git"`` when the last hash came from git's change list, else ``"hash"``.
+        self.change_source = "hash"
+        self._git_state: Optional[Dict[str, Any]] = None
+        self._output_rel: Optional[str] = None
         self.cache_path = self.output_dir / CACHE_FILENAME
         self._cached_changed: Optional[Set[str]] = None
         # Current hash computed during detect_changes() — reused by save_hash()
         self._current_hash: Optional[Dict[str, str]] = None
+        # Per-file manifest (rel -> size, mtime_ns, digest, sections) behind the
+        # last computed hash, and when its digests were taken.
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+        self._manifest_ns = 0
+        self._top_level: Optional[List[str]] = None
+        self._cache_data: Optional[Dict[str, Any]] = None
+        #: Section -> paths that changed since the last run (set by detect_changes()).
+        self.changed_files: Dict[str, List[str]] = {}
+        #: Number of files read (not reused from the manifest) by the last hash.
+        self.rehashed_files = 0
 
     # ------------------------------------------------------------------
     # Hashing
@@ -71,90 +133,275 @@ class IncrementalAnalyzer:
             {
                 'deps': '<sha256>',      # dependency files
                 'readme': '<sha256>',     # README content
-                'source': '<sha256>',     # source code (shallow)
+                'source': '<sha256>',     # source code
                 'tests': '<sha256>',      # test files
                 'structure': '<sha256>',  # directory layout
             }
 
-        This method is intentionally NOT cached — it re-reads files on each call
+        Every section hash is built from per-file blake2b digests, so an edit
+        that keeps a file's size is still detected. Digests are reused from
+        the previous manifest (``.prg-cache.json``) for files whose
+        ``(size, mtime_ns)`` is unchanged; only stat-changed files are read,
+        in a thread pool.
+
+        This method is intentionally NOT cached — it re-stats files on each call
         so it always reflects the current on-disk state. Use detect_changes() for
         the cached "what changed vs last run" result.
         """
-        return {
-            "deps": self._hash_deps(),
-            "readme": self._hash_readme(),
-            "source": self._hash_source(),
-            "tests": self._hash_tests(),
-            "structure": self._hash_structure(),
-        }
+        started_ns = time.time_ns()
+        known: Dict[str, str] = {}
+        manifest: Dict[str, Dict[str, Any]] = {}
+        hashes: Dict[str, str] = {}
+        sections = {"deps": self._dep_entries(), "readme": self._readme_entries()}
+        from_git = self._git_source_entries() if self.git_changes else None
+        if from_git is not None:
+            source, known = from_git
+            self.change_source = "git"
+            if source is None:
+                # Git reports no source file changed: carry both sections over.
+                previous_files, _ = self._load_manifest()
+                for rel, record in (previous_files or {}).items():
+                    kept = [sec for sec in record.get("sections", ()) if sec in ("source", "tests")]
+                    if kept:
+                        manifest[rel] = {**record, "sections": kept}
+                previous_hashes = self.load_previous_hash() or {}
+                hashes.update(source=previous_hashes["source"], tests=previous_hashes["tests"])
+        else:
+            index = self._file_index or ProjectFileIndex.build(self.project_path, ignore=self._ignore)
+            if self._file_index is None:
+                self.walked_index = index
+            source = index.by_suffix(*_SOURCE_SUFFIXES)
+            self.change_source = "hash"
+        if source is not None:
+            sections.update(source=self._order_source(source), tests=self._order_tests(source))
+
+        unique: Dict[str, FileEntry] = {}
+        for entries in sections.values():
+            for entry in entries:
+                unique.setdefault(entry.rel, entry)
+        digests = self._digest_entries([e for rel, e in unique.items() if rel not in known])
+        digests.update(known)
+
+        for section, entries in sections.items():
+            h = hashlib.sha256()
+            for entry in entries:
+                digest = digests.get(entry.rel)
+                if digest is None:  # vanished or unreadable since the walk
+                    continue
+                h.update(f"{entry.rel}:{digest}\n".encode())
+                record = manifest.setdefault(
+                    entry.rel,
+                    {"size": entry.size, "mtime_ns": entry.mtime_ns, "digest": digest, "sections": []},
+                )
+                record["sections"].append(section)
+            hashes[section] = h.hexdigest()
+        hashes = {section: hashes[section] for section in ("deps", "readme", "source", "tests")}
+
+        top_level = self._top_level_items()
+        hashes["structure"] = self._hash_structure(top_level)
+
+        self._manifest = manifest
+        self._manifest_ns = started_ns
+        self._top_level = top_level
+        return hashes
+
+    def _stat_entry(self, rel: str) -> Optional[FileEntry]:
+        path = self.project_path / rel
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return FileEntry(self.project_path, rel, path.name, path.suffix, st.st_size, st.st_mtime_ns)
 
-    def _hash_deps(self) -> str:
-        h = hashlib.sha256()
-        dep_files = sorted(
-            [
-                "requirements.txt",
-                "pyproject.toml",
-                "setup.py",
-                "setup.cfg",
-                "package.json",
-                "Pipfile",
-                "poetry.lock",
-            ]
-        )
-        for name in dep_files:
-            p = self.project_path / name
-            if p.exists():
-                h.update(p.read_bytes())
-        return h.hexdigest()
+    def _dep_entries(self) -> List[FileEntry]:
+        # Root-level manifests are stat'ed directly so they are always current,
+        # even when the injected file index is an older snapshot.
+        entries = (self._stat_entry(name) for name in sorted(_DEP_FILES))
+        return [e for e in entries if e is not None]
 
-    def _hash_readme(self) -> str:
-        h = hashlib.sha256()
+    def _readme_entries(self) -> List[FileEntry]:
         from generator.utils.readme_bridge import find_readme
 
         p = find_readme(self.project_path)
-        if p:
-            h.update(p.read_bytes())
-        return h.hexdigest()
+        if not p:
+            return []
+        try:
+            rel = p.resolve().relative_to(self.project_path.resolve()).as_posix()
+        except ValueError:
+            return []
+        entry = self._stat_entry(rel)
+        return [entry] if entry is not None else []
 
-    def _hash_source(self) -> str:
-        """Shallow hash of source files (name + size, not full content for speed)."""
-        h = hashlib.sha256()
-        files = []
-        for ext in ("*.py", "*.js", "*.ts", "*.go", "*.rs", "*.java"):
-            files.extend(sorted(self.project_path.rglob(ext)))
-        for f in files:
-            # Skip venvs, node_modules, __pycache__
-            parts = f.relative_to(self.project_path).parts
-            if any(p in (".venv", "venv", "node_modules", "__pycache__", ".git") for p in parts):
+    @staticmethod
+    def _order_source(entries: List[FileEntry]) -> List[FileEntry]:
+        """Source files of the hashed languages, in hash order.
+
+        Ignored trees (venvs, node_modules, .gitignore entries …) never reach
+        here: the index walk and the git path both apply the ignore policy.
+        """
+        return sorted(entries, key=lambda e: e.parts)
+
+    @staticmethod
+    def _order_tests(entries: List[FileEntry]) -> List[FileEntry]:
+        tests: List[FileEntry] = []
+        for test_dir in ("tests", "test"):
+            prefix = f"{test_dir}/"
+            matching = [e for e in entries if e.suffix == ".py" and e.rel.startswith(prefix)]
+            tests.extend(sorted(matching, key=lambda e: e.parts))
+        return tests
+
+    # ------------------------------------------------------------------
+    # Git-backed change list
+    # ------------------------------------------------------------------
+
+    def _capture_git_state(self) -> Optional[Dict[str, Any]]:
+        """HEAD, the dirty paths and the ignore policy, recorded before hashing.
+
+        The dirty paths are kept as a list rather than a status digest: a
+        second edit to an already-modified file leaves ``git status``
+        unchanged, so every path dirty at either run is re-checked.
+        """
+        from prg_utils import git_ops
+
+        head = git_ops.head_commit(self.project_path)
+        dirty = git_ops.dirty_paths(self.project_path) if head else None
+        if head is None or dirty is None:
+            return None
+        ignore = self._ignore_matcher()
+        policy = hashlib.sha256("\n".join(ignore.patterns).encode()).hexdigest()
+        return {"head": head, "dirty": sorted(rel for rel in dirty if not self._in_output_dir(rel)), "ignore": policy}
+
+    def _git_source_entries(self) -> Optional[Tuple[Optional[List[FileEntry]], Dict[str, str]]]:
+        """Source entries and their known digests from git's change list.
+
+        Returns None to hash the tree instead, and ``(None, {})`` when no
+        source file is among the changed paths, so the previous source and
+        tests sections still hold.
+        """
+        from prg_utils import git_ops
+
+        state = self._git_state = self._capture_git_state()
+        previous = (self._read_cache() or {}).get("git")
+        previous_files, _ = self._load_manifest()
+        previous_hashes = self.load_previous_hash() or {}
+        if state is None or not isinstance(previous, dict) or previous_files is None:
+            return None
+        if previous.get("ignore") != state["ignore"] or not previous.get("head"):
+            return None
+        if "source" not in previous_hashes or "tests" not in previous_hashes:
+            return None
+
+        committed = (
+            [] if previous["head"] == state["head"] else git_ops.changed_since(previous["head"], self.project_path)
+        )
+        if committed is None:
+            return None
+        ignore = self._ignore_matcher()
+        candidates = {
+            rel
+            for rel in (*committed, *state["dirty"], *previous.get("dirty", ()))
+            if not self._in_output_dir(rel) and not ignore.ignores_path(rel)
+        }
+        if not any(os.path.splitext(rel)[1] in _SOURCE_SUFFIXES for rel in candidates):
+            return None, {}
+
+        entries: List[FileEntry] = []
+        known: Dict[str, str] = {}
+        for rel, record in previous_files.items():
+            if rel in candidates or "source" not in record.get("sections", ()):
                 continue
+            name = rel.rsplit("/", 1)[-1]
+            entries.append(
+                FileEntry(self.project_path, rel, name, os.path.splitext(name)[1], record["size"], record["mtime_ns"])
+            )
+            known[rel] = record["digest"]
+        for rel in sorted(candidates):
+            if os.path.splitext(rel)[1] in _SOURCE_SUFFIXES:
+                entry = self._stat_entry(rel)
+                if entry is not None:
+                    entries.append(entry)
+        return entries, known
+
+    def _ignore_matcher(self) -> IgnoreMatcher:
+        if self._ignore is None:
+            self._ignore = IgnoreMatcher.for_project(self.project_path)
+        return self._ignore
+
+    def _in_output_dir(self, rel: str) -> bool:
+        """True for paths inside the output directory, which every run rewrites."""
+        if self._output_rel is None:
             try:
-                h.update(f"{f.relative_to(self.project_path)}:{f.stat().st_size}".encode())
-            except OSError:
-                pass
-        return h.hexdigest()
+                self._output_rel = self.output_dir.resolve().relative_to(self.project_path.resolve()).as_posix()
+            except (ValueError, OSError):
+                self._output_rel = ""
+        out = self._output_rel
+        return out not in ("", ".") and (rel == out or rel.startswith(f"{out}/"))
+
+    def _digest_entries(self, entries: List[FileEntry]) -> Dict[str, str]:
+        """Return ``rel -> digest``, reading only files whose stat changed."""
+        digests: Dict[str, str] = {}
+        stale: List[FileEntry] = []
+        for entry in entries:
+            known = self._reusable_digest(entry)
+            if known is not None:
+                digests[entry.rel] = known
+            else:
+                stale.append(entry)
+
+        if len(stale) > _PARALLEL_HASH_THRESHOLD:
+            with ThreadPoolExecutor() as pool:
+                results = list(pool.map(self._digest_file, stale))
+        else:
+            results = [self._digest_file(e) for e in stale]
 
-    def _hash_tests(self) -> str:
-        h = hashlib.sha256()
-        test_dirs = [self.project_path / "tests", self.project_path / "test"]
-        for td in test_dirs:
-            if td.is_dir():
-                for f in sorted(td.rglob("*.py")):
-                    try:
-                        h.update(f"{f.relative_to(self.project_path)}:{f.stat().st_size}".encode())
-                    except OSError:
-                        pass
+        for entry, digest in zip(stale, results):
+            if digest is not None:
+                digests[entry.rel] = digest
+        self.rehashed_files = len(stale)
+        return digests
+
+    def _reusable_digest(self, entry: FileEntry) -> Optional[str]:
+        """Digest from the last known manifest when ``entry``'s stat is unchanged.
+
+        The in-memory manifest from an earlier call wins over the one on disk.
+        An mtime too close to when the digest was taken cannot rule out a
+        same-tick edit, so such files are always rehashed.
+        """
+        for manifest, taken_ns in ((self._manifest, self._manifest_ns), self._load_manifest()):
+            record = (manifest or {}).get(entry.rel)
+            if (
+                record is not None
+                and record.get("size") == entry.size
+                and record.get("mtime_ns") == entry.mtime_ns
+                and entry.mtime_ns < taken_ns - RACY_WINDOW_NS
+            ):
+                return record.get("digest")
+        return None
+
+    @staticmethod
+    def _digest_file(entry: FileEntry) -> Optional[str]:
+        h = hashlib.blake2b(digest_size=16)
+        try:
+            with open(entry.path, "rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    h.update(chunk)
+        except OSError:
+            return None
         return h.hexdigest()
 
-    def _hash_structure(self) -> str:
+    def _top_level_items(self) -> List[str]:
+        return sorted(
+            p.name
+            for p in self.project_path.iterdir()
+            if not p.name.startswith(".") and p.name not in ("__pycache__", "node_modules", ".venv", "venv")
+        )
+
+    @staticmethod
+    def _hash_structure(top_items: List[str]) -> str:
         """Hash the top-level directory names and key config files presence."""
         h = hashlib.sha256()
-        top_items = sorted(
-            [
-                p.name
-                for p in self.project_path.iterdir()
-                if not p.name.startswith(".") and p.name not in ("__pycache__", "node_modules", ".venv", "venv")
-            ]
-        )
         h.update(",".join(top_items).encode())
         return h.hexdigest()
 
@@ -162,26 +409,57 @@ class IncrementalAnalyzer:
     # Cache I/O
     # ------------------------------------------------------------------
 
+    def _read_cache(self) -> Optional[Dict[str, Any]]:
+        if self._cache_data is None:
+            self._cache_data = {}
+            if self.cache_path.exists():
+                try:
+                    self._cache_data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError) as exc:
+                    logger.warning("Failed to read cache: %s", exc)
+                    return None
+        return self._cache_data
+
+    def _load_manifest(self) -> Tuple[Optional[Dict[str, Dict[str, Any]]], int]:
+        data = self._read_cache() or {}
+        files = data.get("files")
+        return (files if isinstance(files, dict) else None), int(data.get("hashed_ns", 0))
+
     def load_previous_hash(self) -> Optional[Dict[str, str]]:
         """Read the previously cached hash from .clinerules/.prg-cache.json."""
-        if not self.cache_path.exists():
-            return None
-        try:
-            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
-            return data.get("hashes")
-        except (json.JSONDecodeError, KeyError, OSError) as exc:
-            logger.warning("Failed to read cache: %s", exc)
+        data = self._read_cache()
+        if not data:
             return None
+        return data.get("hashes")
 
     def save_hash(self, hashes: Dict[str, str]) -> None:
-        """Persist current hashes to disk."""
+        """Persist current hashes (and the per-file manifest behind them) to disk."""
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        data = {
+        data: Dict[str, Any] = {
             "version": 1,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "hashes": hashes,
         }
+        if self._manifest is not None:
+            data["hashed_ns"] = self._manifest_ns
+            data["files"] = self._manifest
+            data["top_level"] = self._top_level
+            if self._git_state is not None:
+                data["git"] = self._git_state
         self.cache_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        self._cache_data = data
+
+    def save_git_state(self) -> None:
+        """Persist a moved HEAD or changed dirty set after a run that found nothing to regenerate.
+
+        Without this a clean first ``--git-changes`` run would exit before any
+        git record was written, and later runs would keep diffing from an
+        ever older commit.
+        """
+        if self._git_state is None or self._current_hash is None:
+            return
+        if (self._read_cache() or {}).get("git") != self._git_state:
+            self.save_hash(self._current_hash)
 
     # ------------------------------------------------------------------
     # Change detection
@@ -191,16 +469,19 @@ class IncrementalAnalyzer:
         """Compare current hashes with cached ones.
 
         Returns a set of changed section keys (e.g. ``{'deps', 'readme'}``).
-        If no cache exists, returns *all* sections (full regen).
+        If no cache exists, returns *all* sections (full regen). The files
+        behind each changed section are recorded in :attr:`changed_files`.
         Result is cached on the instance — safe to call multiple times with
         no performance penalty (hash is computed only once per analyzer lifetime).
         """
         if self._cached_changed is not None:
             return self._cached_changed
 
+        previous = self.load_previous_hash()
+        previous_files, _ = self._load_manifest()
+        previous_top = (self._read_cache() or {}).get("top_level")
         current = self.compute_project_hash()
         self._current_hash = current  # store for save_hash() to reuse
-        previous = self.load_previous_hash()
 
         if previous is None:
             self._cached_changed = set(current.keys())
@@ -211,8 +492,37 @@ class IncrementalAnalyzer:
                     changed.add(key)
             self._cached_changed = changed
 
+        self.changed_files = {
+            section: self._diff_section(section, previous_files, previous_top) for section in self._cached_changed
+        }
         return self._cached_changed
 
+    def _diff_section(
+        self,
+        section: str,
+        previous_files: Optional[Dict[str, Dict[str, Any]]],
+        previous_top: Optional[List[str]],
+    ) -> List[str]:
+        """Paths that were added, removed or modified in ``section`` since the last run.
+
+        For ``structure`` these are top-level entry names. Without a previous
+        manifest every current file of the section is reported.
+        """
+        if section == "structure":
+            current_top = set(self._top_level or [])
+            return sorted(current_top ^ set(previous_top or []))
+
+        def _digests(manifest: Optional[Dict[str, Dict[str, Any]]]) -> Dict[str, str]:
+            return {
+                rel: record.get("digest", "")
+                for rel, record in (manifest or {}).items()
+                if section in record.get("sections", ())
+            }
+
+        now = _digests(self._manifest)
+        before = _digests(previous_files)
+        return sorted(rel for rel in now.keys() | before.keys() if now.get(rel) != before.get(rel))
+
     def phases_to_run(self) -> Tuple[bool, bool, bool, bool]:
         """Return which pipeline phases need to run based on changed sections.
 
@@ -220,17 +530,20 @@ class IncrementalAnalyzer:
             (run_enhanced_parse, run_rules, run_constitution, run_skills_gen)
 
         Mapping logic:
-        - ``readme`` or ``deps`` changed  → rules + constitution need regeneration
-        - ``source`` or ``structure`` changed → enhanced parse + skills need regeneration
-        - Nothing changed          → all False (should have exited earlier)
+        - Any section changed → every phase runs. rules.md, constitution.md
+          and clinerules.yaml are assembled from cached fragments
+          (``generator.utils.fragment_cache``), so only the fragments whose
+          inputs changed are re-rendered; skipping the whole phase would leave
+          e.g. the TESTING section stale after a test-only change.
+        - Nothing changed → all False (should have exited earlier)
         """
         changed = self.detect_changes()
         readme_or_deps = bool(changed & {"readme", "deps"})
         source_or_structure = bool(changed & {"source", "structure", "tests"})
 
         run_enhanced_parse = readme_or_deps or source_or_structure
-        run_rules = readme_or_deps
-        run_constitution = bool(changed & {"readme"})
+        run_rules = run_enhanced_parse
+        run_constitution = run_enhanced_parse
         run_skills_gen = readme_or_deps or source_or_structure
 
         return run_enhanced_parse, run_rules, run_constitution, run_skills_gen
@@ -243,6 +556,11 @@ class IncrementalAnalyzer:
     def merge_rules(existing_content: str, new_content: str, changed_sections: Set[str]) -> str:
         """Merge new sections into existing rules.md.
 
+        The analyze pipeline no longer calls this: rules.md is re-assembled
+        from cached fragments, which gives the full-render result without
+        string splicing. Kept for callers that merge externally produced
+        content.
+
         Strategy:
         - If 'readme' or 'deps' changed, replace the entire header/rules block.
         - If only 'source' or 'tests' changed, replace from ``# Agent Skills`` onward.
@@ -4,6 +4,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
+from generator.utils.file_index import ProjectFileIndex, get_file_index
+
 
 @lru_cache(maxsize=128)
 def _detect_project_type_cached(
@@ -16,16 +18,17 @@ def _detect_project_type_cached(
     Internal cached detection logic.
     """
     scores = _initialize_scores()
+    index = get_file_index(Path(project_path))
 
     # Run detection algorithms
-    _detect_agent_skills_signals(scores, tech_stack, project_path)
+    _detect_agent_skills_signals(scores, tech_stack, project_path, index)
     _detect_agent_signals(scores, tech_stack, readme_content)
     _detect_ml_pipeline_signals(scores, tech_stack, readme_content)
-    _detect_web_app_signals(scores, tech_stack, project_path, readme_content)
-    _detect_python_api_signals(scores, tech_stack, project_path, readme_content)
-    _detect_cli_tool_signals(scores, tech_stack, readme_content, project_path)
+    _detect_web_app_signals(scores, tech_stack, project_path, readme_content, index)
+    _detect_python_api_signals(scores, tech_stack, project_path, readme_content, index)
+    _detect_cli_tool_signals(scores, tech_stack, readme_content, project_path, index)
     _detect_library_signals(scores, project_path, readme_content)
-    _detect_generator_signals(scores, project_name, readme_content, project_path)
+    _detect_generator_signals(scores, project_name, readme_content, project_path, index)
 
     # Apply penalties for hybrid projects
     _apply_hybrid_penalties(scores)
@@ -50,6 +53,12 @@ def detect_project_type(project_data: Dict[str, Any], project_path: str) -> Dict
 detect_project_type_from_data = detect_project_type
 
 
+def _has_dir_named(index: ProjectFileIndex, *names: str) -> bool:
+    """True if any directory in the project is named one of ``names`` (``**/<name>/**``)."""
+    wanted = set(names)
+    return any(rel.rsplit("/", 1)[-1] in wanted for rel in index.dirs)
+
+
 def _initialize_scores() -> Dict[str, float]:
     """Initialize score dictionary."""
     return {
@@ -64,7 +73,12 @@ def _initialize_scores() -> Dict[str, float]:
     }
 
 
-def _detect_agent_skills_signals(scores: Dict[str, float], tech_stack: Tuple[str, ...], project_path: str) -> None:
+def _detect_agent_skills_signals(
+    scores: Dict[str, float],
+    tech_stack: Tuple[str, ...],
+    project_path: str,
+    index: ProjectFileIndex,
+) -> None:
     """Detect agent-skills collection projects (SKILL.md files, no Python/JS source).
 
     Only counts SKILL.md files outside of .clinerules/, .venv/ and other
@@ -75,8 +89,8 @@ def _detect_agent_skills_signals(scores: Dict[str, float], tech_stack: Tuple[str
     _infra_dirs = {".clinerules", ".venv", "__pycache__", "node_modules", ".git"}
 
     # Only count SKILL.md files that live outside infrastructure directories
-    skill_md_files = [p for p in path.glob("**/SKILL.md") if not any(part in _infra_dirs for part in p.parts)]
-    py_sources = [p for p in path.glob("**/*.py") if ".venv" not in p.parts and "__pycache__" not in p.parts]
+    skill_md_files = index.by_name("SKILL.md", exclude=_infra_dirs)
+    py_sources = index.has_suffix(".py")
     package_json = (path / "package.json").exists()
 
     if not skill_md_files:
@@ -159,6 +173,7 @@ def _detect_web_app_signals(
     tech_stack: Tuple[str, ...],
     project_path: str,
     readme: str,
+    index: ProjectFileIndex,
 ) -> None:
     """Detect web application signals."""
     web_frameworks = {
@@ -179,7 +194,7 @@ def _detect_web_app_signals(
         scores["web_app"] += 0.5
 
     # API directory structure
-    if any(Path(project_path).glob("**/api/**")) or any(Path(project_path).glob("**/routers/**")):
+    if _has_dir_named(index, "api", "routers"):
         scores["web_app"] += 0.3
 
     readme_lower = readme.lower()
@@ -192,6 +207,7 @@ def _detect_python_api_signals(
     tech_stack: Tuple[str, ...],
     project_path: str,
     readme: str,
+    index: ProjectFileIndex,
 ) -> None:
     """Detect Python API server signals (FastAPI, Flask REST, Django REST)."""
     api_frameworks = {"fastapi", "flask", "django"}
@@ -205,8 +221,7 @@ def _detect_python_api_signals(
         scores["python_api"] += 0.6
 
     # routers/ or api/ directory structure
-    path = Path(project_path)
-    if any(path.glob("**/routers/**")) or any(path.glob("**/routes/**")):
+    if _has_dir_named(index, "routers", "routes"):
         scores["python_api"] += 0.3
 
     readme_lower = readme.lower()
@@ -219,6 +234,7 @@ def _detect_cli_tool_signals(
     tech_stack: Tuple[str, ...],
     readme: str,
     project_path: str,
+    index: ProjectFileIndex,
 ) -> None:
     """Detect CLI tool signals."""
     cli_libs = {"click", "argparse", "typer", "fire"}
@@ -230,7 +246,7 @@ def _detect_cli_tool_signals(
 
     # main.py without API structure
     has_main = Path(project_path, "main.py").exists()
-    has_api = any(Path(project_path).glob("**/api/**"))
+    has_api = _has_dir_named(index, "api")
     if has_main and not has_api:
         scores["cli_tool"] += 0.3
 
@@ -254,7 +270,13 @@ def _detect_library_signals(scores: Dict[str, float], project_path: str, readme:
         scores["library"] += 0.3
 
 
-def _detect_generator_signals(scores: Dict[str, float], project_name: str, readme: str, project_path: str) -> None:
+def _detect_generator_signals(
+    scores: Dict[str, float],
+    project_name: str,
+    readme: str,
+    project_path: str,
+    index: ProjectFileIndex,
+) -> None:
     """Detect generator/scaffolding tool signals."""
     generator_keywords = {"generate", "template", "scaffold", "boilerplate", "create-"}
 
@@ -263,7 +285,7 @@ def _detect_generator_signals(scores: Dict[str, float], project_name: str, readm
         scores["generator"] += 0.3
 
     # Templates directory
-    if any(Path(project_path).glob("**/templates/**")):
+    if _has_dir_named(index, "templates"):
         scores["generator"] += 0.3
 
     # Generator keywords
@@ -1,6 +1,7 @@
 """README parsing and metadata extraction"""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -168,7 +169,8 @@ def extract_tech_stack(content: str, project_path: Optional[Path] = None) -> Lis
     content_cleaned = BADGE_LINKED_RE.sub("", content_cleaned)
 
     content_lower = content_cleaned.lower()
-    found = [tech for tech in TECH_KEYWORDS if _tech_has_non_negated_mention(tech, content_lower)]
+    mentioned = _tech_keyword_matcher().matches(content_lower)
+    found = [tech for tech in TECH_KEYWORDS if tech in mentioned]
 
     # Cross-reference with actual dependencies if project_path is provided
     if project_path:
@@ -193,6 +195,14 @@ def extract_tech_stack(content: str, project_path: Optional[Path] = None) -> Lis
     return list(dict.fromkeys(found))
 
 
+@lru_cache(maxsize=1)
+def _tech_keyword_matcher():
+    """Single-pass matcher over ``TECH_KEYWORDS``, compiled on first use."""
+    from generator.utils.negation import KeywordMatcher
+
+    return KeywordMatcher(TECH_KEYWORDS)
+
+
 def _tech_has_non_negated_mention(tech: str, content_lower: str) -> bool:
     """Thin wrapper over the shared negation helper. Kept as a module-level
     name so tests can import ``_tech_has_non_negated_mention`` from
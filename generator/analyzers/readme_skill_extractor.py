@@ -9,6 +9,8 @@ import re
 from pathlib import Path
 from typing import List, Optional
 
+from generator.utils.file_index import ProjectFileIndex, get_file_index
+
 
 def extract_purpose(readme: str) -> str:
     """Extract a single-line purpose from the first real paragraph after the title.
@@ -226,7 +228,12 @@ def extract_process_steps(readme: str) -> List[str]:
     return steps[:10]
 
 
-def extract_anti_patterns(readme: str, tech: List[str], project_path: Optional[Path] = None) -> List[str]:
+def extract_anti_patterns(
+    readme: str,
+    tech: List[str],
+    project_path: Optional[Path] = None,
+    file_index: Optional[ProjectFileIndex] = None,
+) -> List[str]:
     """Extract anti-patterns from both README text and project structure.
 
     Priority 1: explicit ❌ markers the author wrote in the README.
@@ -253,7 +260,7 @@ def extract_anti_patterns(readme: str, tech: List[str], project_path: Optional[P
 
     project_path = Path(project_path)
 
-    anti_patterns.extend(_structural_anti_patterns(tech, project_path))
+    anti_patterns.extend(_structural_anti_patterns(tech, project_path, file_index))
 
     return anti_patterns
 
@@ -310,15 +317,18 @@ def _extract_negative_imperatives(readme: str, existing_texts: set) -> List[str]
     return found
 
 
-def _structural_anti_patterns(tech: List[str], project_path: Path) -> List[str]:
+def _structural_anti_patterns(
+    tech: List[str],
+    project_path: Path,
+    file_index: Optional[ProjectFileIndex] = None,
+) -> List[str]:
     """Priority 3: structural checks against the actual project on disk."""
     found: List[str] = []
     project_path = Path(project_path)
 
     if "ffmpeg" in tech:
-        for py_file in project_path.rglob("*.py"):
-            if any(skip in py_file.parts for skip in (".venv", "venv", "__pycache__", ".git", "node_modules")):
-                continue
+        for entry in get_file_index(project_path, file_index).by_suffix(".py"):
+            py_file = entry.path
             try:
                 py_content = py_file.read_text(encoding="utf-8", errors="replace")
                 if "ffmpeg" in py_content and "shutil.which" not in py_content:
@@ -1,33 +1,16 @@
 """Detect architecture patterns from file/folder structure."""
 
+import functools
+import hashlib
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
-logger = logging.getLogger(__name__)
+from generator.analyzers.analysis_cache import AnalysisCache
+from generator.utils.file_index import FileEntry, ProjectFileIndex, get_file_index
 
-# Directories to skip during analysis
-SKIP_DIRS = {
-    ".git",
-    "node_modules",
-    "venv",
-    ".venv",
-    "env",
-    "__pycache__",
-    ".pytest_cache",
-    "dist",
-    "build",
-    ".idea",
-    ".vscode",
-    ".tox",
-    ".mypy_cache",
-    ".eggs",
-    "*.egg-info",
-    "htmlcov",
-    ".coverage",
-    ".web",  # Reflex framework generated Next.js output — not user-authored code
-}
+logger = logging.getLogger(__name__)
 
 
 class StructureAnalyzer:
@@ -154,11 +137,35 @@ class StructureAnalyzer:
         },
     }
 
-    def __init__(self, project_path: Path):
+    # Files are only regex-scanned up to this many characters.
+    _SCAN_CHARS = 5000
+
+    _PY_TEST_RE = re.compile(r"^\s*(?:async\s+)?def\s+(test_\w+)\s*\(", re.MULTILINE)
+    _JS_TEST_RE = re.compile(r"^\s*(?:it|test)\s*\(", re.MULTILINE)
+
+    def __init__(
+        self,
+        project_path: Path,
+        file_index: Optional[ProjectFileIndex] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
+    ):
         self.project_path = Path(project_path)
-        self._file_cache: Optional[List[Path]] = None
+        self._file_index = file_index
+        # Persistent per-file facts (matched import regexes, test-case counts).
+        # Falls back to an in-memory cache so lookups behave identically.
+        self._analysis_cache = analysis_cache if analysis_cache is not None else AnalysisCache()
+        self._source_entries: Optional[List[FileEntry]] = None
+        self._test_entries: Optional[List[FileEntry]] = None
+        self._imports_memo: Dict[str, FrozenSet[str]] = {}
         self._content_cache: Dict[str, str] = {}
 
+    @property
+    def file_index(self) -> ProjectFileIndex:
+        """The shared project file index (built on first use when not injected)."""
+        if self._file_index is None:
+            self._file_index = get_file_index(self.project_path)
+        return self._file_index
+
     def detect_patterns(self) -> List[str]:
         """
         Return list of detected patterns, e.g.:
@@ -241,9 +248,8 @@ class StructureAnalyzer:
 
     def _has_js_or_ts_files(self) -> bool:
         """Return True if the project contains any .js or .ts source files."""
-        for ext in ("*.js", "*.ts", "*.jsx", "*.tsx"):
-            if any(self.project_path.rglob(ext)):
-                return True
+        if self.file_index.has_suffix(".js", ".ts", ".jsx", ".tsx"):
+            return True
         return (self.project_path / "package.json").exists()
 
     def detect_test_framework(self) -> Optional[str]:
@@ -263,12 +269,10 @@ class StructureAnalyzer:
                     return framework
 
             # Check imports in test files
-            test_files = self._get_test_files()
-            for tf in test_files[:10]:  # Limit scan
-                content = self._read_file_cached(tf)
-                for pattern in definition.get("imports", []):
-                    if re.search(pattern, content):
-                        return framework
+            for entry in self._get_test_entries()[:10]:  # Limit scan
+                matched = self._matched_imports(entry)
+                if any(pattern in matched for pattern in definition.get("imports", [])):
+                    return framework
 
             # Check pyproject.toml for config keys and dep name patterns
             pyproject = self.project_path / "pyproject.toml"
@@ -297,7 +301,8 @@ class StructureAnalyzer:
             }
         """
         framework = self.detect_test_framework()
-        test_files = self._get_test_files()
+        test_entries = self._get_test_entries()
+        test_files = [self.project_path / e.rel for e in test_entries]
         test_dirs = self._get_test_dirs()
 
         patterns = []
@@ -322,7 +327,7 @@ class StructureAnalyzer:
         has_conftest = (self.project_path / "tests" / "conftest.py").exists()
 
         # Count actual test functions/methods
-        test_cases = self._count_test_cases(test_files)
+        test_cases = self._count_test_cases(test_entries)
 
         return {
             "framework": framework,
@@ -333,29 +338,58 @@ class StructureAnalyzer:
             "has_conftest": has_conftest,
         }
 
-    def _count_test_cases(self, test_files: List[Path]) -> int:
+    def _count_test_cases(self, test_entries: List[FileEntry]) -> int:
         """Count test functions and methods across test files.
 
         Counts top-level ``def test_*`` functions and ``def test_*`` methods
         inside classes.  For JS/TS files it counts ``it(`` and ``test(`` calls.
+        Per-file counts come from the analysis cache when the file is unchanged.
         """
         count = 0
-        py_pattern = re.compile(r"^\s*(?:async\s+)?def\s+(test_\w+)\s*\(", re.MULTILINE)
-        js_pattern = re.compile(r"^\s*(?:it|test)\s*\(", re.MULTILINE)
-
-        for tf in test_files:
-            try:
-                if tf.stat().st_size > 1024 * 1024:  # skip files > 1 MB
-                    continue
-                content = tf.read_text(encoding="utf-8", errors="replace")
-            except OSError:
+        for entry in test_entries:
+            if entry.size > 1024 * 1024:  # skip files > 1 MB
+                continue
+            if entry.suffix == ".py":
+                pattern = self._PY_TEST_RE
+            elif entry.suffix in (".js", ".ts", ".jsx", ".tsx"):
+                pattern = self._JS_TEST_RE
+            else:
                 continue
-            if tf.suffix == ".py":
-                count += len(py_pattern.findall(content))
-            elif tf.suffix in (".js", ".ts", ".jsx", ".tsx"):
-                count += len(js_pattern.findall(content))
+            count += self._analysis_cache.get(entry, "test_cases", functools.partial(_count_matches, pattern))
         return count
 
+    @classmethod
+    def _all_import_patterns(cls) -> List[str]:
+        """Every import regex in PATTERNS and TEST_PATTERNS, in declaration order."""
+        seen: Dict[str, None] = {}
+        for table in (cls.PATTERNS, cls.TEST_PATTERNS):
+            for definition in table.values():
+                for pattern in definition.get("imports", []):
+                    seen.setdefault(pattern, None)
+        return list(seen)
+
+    def _matched_imports(self, entry: FileEntry) -> FrozenSet[str]:
+        """Return the import regexes that match the head of ``entry``.
+
+        All patterns are evaluated in one pass per file and cached; the cache
+        kind embeds a fingerprint of the pattern table so edits to PATTERNS
+        invalidate stale facts automatically.
+        """
+        memo = self._imports_memo.get(entry.rel)
+        if memo is not None:
+            return memo
+        patterns = self._all_import_patterns()
+        kind = "imports:" + hashlib.blake2b("\n".join(patterns).encode(), digest_size=6).hexdigest()
+        matched = self._analysis_cache.get(
+            entry,
+            kind,
+            lambda text: [p for p in patterns if re.search(p, text)],
+            max_chars=self._SCAN_CHARS,
+        )
+        result = frozenset(matched)
+        self._imports_memo[entry.rel] = result
+        return result
+
     def _score_pattern(self, pattern_def: Dict) -> int:
         """Score how well a pattern matches the project."""
         score = 0
@@ -367,18 +401,16 @@ class StructureAnalyzer:
 
         # Check specific files
         for fname in pattern_def.get("files", []):
-            matches = list(self.project_path.rglob(fname))
-            if matches:
+            if self.file_index.by_name(fname):
                 score += 1
 
         # Check imports in source files
-        source_files = self._get_source_files()
-        for sf in source_files[:30]:  # Limit to avoid perf issues
-            content = self._read_file_cached(sf)
-            for pattern in pattern_def.get("imports", []):
-                if re.search(pattern, content):
-                    score += 2
-                    break  # One match per file is enough
+        imports = pattern_def.get("imports", [])
+        if imports:
+            for entry in self._get_source_entries()[:30]:  # Limit to avoid perf issues
+                matched = self._matched_imports(entry)
+                if any(pattern in matched for pattern in imports):
+                    score += 2  # One match per file is enough
 
         return score
 
@@ -418,55 +450,39 @@ class StructureAnalyzer:
                 found.append(str(m.relative_to(self.project_path)))
         return found
 
+    def _get_source_entries(self) -> List[FileEntry]:
+        """Index entries for Python and JS/TS source files."""
+        if self._source_entries is None:
+            entries = self.file_index.by_suffix(".py", ".js", ".ts", ".jsx", ".tsx")
+            self._source_entries = entries[:100]  # Safety limit
+        return self._source_entries
+
     def _get_source_files(self) -> List[Path]:
         """Get Python and JS/TS source files."""
-        if self._file_cache is not None:
-            return self._file_cache
-
-        files = []
-        extensions = {".py", ".js", ".ts", ".jsx", ".tsx"}
-        for f in self.project_path.rglob("*"):
-            if f.suffix in extensions and not self._should_skip(f):
-                files.append(f)
-                if len(files) >= 100:  # Safety limit
-                    break
-
-        self._file_cache = files
-        return files
+        return [self.project_path / e.rel for e in self._get_source_entries()]
+
+    def _get_test_entries(self) -> List[FileEntry]:
+        """Index entries for test files."""
+        if self._test_entries is None:
+            entries: List[FileEntry] = []
+            # Python tests first, then JS tests — same order the per-pattern rglobs produced.
+            for pattern in ["test_*.py", "*_test.py", "*.test.js", "*.test.ts", "*.spec.js", "*.spec.ts"]:
+                entries.extend(self.file_index.glob(pattern))
+            self._test_entries = entries
+        return self._test_entries
 
     def _get_test_files(self) -> List[Path]:
         """Find test files."""
-        test_files = []
-        for f in self.project_path.rglob("test_*.py"):
-            if not self._should_skip(f):
-                test_files.append(f)
-        for f in self.project_path.rglob("*_test.py"):
-            if not self._should_skip(f):
-                test_files.append(f)
-        # JS tests
-        for pattern in ["*.test.js", "*.test.ts", "*.spec.js", "*.spec.ts"]:
-            for f in self.project_path.rglob(pattern):
-                if not self._should_skip(f):
-                    test_files.append(f)
-        return test_files
+        return [self.project_path / e.rel for e in self._get_test_entries()]
 
     def _get_test_dirs(self) -> List[Path]:
         """Find test-related directories."""
         test_dirs = []
-        for d in self.project_path.rglob("*"):
-            if d.is_dir() and not self._should_skip(d):
-                if d.name in ("tests", "test", "__tests__", "fixtures", "test_data"):
-                    test_dirs.append(d)
+        for rel in self.file_index.dirs:
+            if rel.rsplit("/", 1)[-1] in ("tests", "test", "__tests__", "fixtures", "test_data"):
+                test_dirs.append(self.project_path / rel)
         return test_dirs
 
-    def _should_skip(self, path: Path) -> bool:
-        """Check if path should be skipped."""
-        parts = path.parts
-        for skip in SKIP_DIRS:
-            if skip in parts:
-                return True
-        return False
-
     def _read_file_cached(self, path: Path) -> str:
         """Read file with caching."""
         key = str(path)
@@ -476,3 +492,7 @@ class StructureAnalyzer:
             except OSError:
                 self._content_cache[key] = ""
         return self._content_cache[key]
+
+
+def _count_matches(pattern: "re.Pattern[str]", text: str) -> int:
+    return len(pattern.findall(text))
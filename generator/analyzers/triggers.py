@@ -1,10 +1,10 @@
 import fnmatch
-import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 from generator.types import Skill
+from generator.utils.file_index import ProjectFileIndex, get_file_index
 
 
 class SkillTriggerDetector:
@@ -13,23 +13,24 @@ class SkillTriggerDetector:
     and skill auto-trigger definitions.
     """
 
-    def __init__(self, project_path: Path, project_context: Dict[str, Any]):
+    def __init__(
+        self,
+        project_path: Path,
+        project_context: Dict[str, Any],
+        file_index: Optional[ProjectFileIndex] = None,
+    ):
         self.project_path = project_path
         self.context = project_context
         self._cache_file_list: List[str] = []
-        self._load_file_list()
-
-    def _load_file_list(self):
-        """Cache list of files for pattern matching."""
-        _SKIP_DIRS = {".git", "node_modules", "venv", "__pycache__", ".venv"}
-        try:
-            for root, dirs, files in os.walk(self.project_path):
-                dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
-                rel_root = Path(root).relative_to(self.project_path)
-                for file in files:
-                    self._cache_file_list.append(str(rel_root / file).replace("\\", "/"))
-        except OSError:
-            pass
+        self._load_file_list(file_index)
+
+    def _load_file_list(self, file_index: Optional[ProjectFileIndex] = None):
+        """Cache list of files for pattern matching.
+
+        The shared index already prunes .git, node_modules, venvs and __pycache__.
+        """
+        index = get_file_index(self.project_path, file_index)
+        self._cache_file_list = [entry.rel for entry in index]
 
     def _get_tech_stack_set(self) -> Set[str]:
         """Extract tech stack as a flat set of lowercase strings."""
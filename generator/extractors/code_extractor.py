@@ -3,29 +3,12 @@
 import ast
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-logger = logging.getLogger(__name__)
+from generator.analyzers.analysis_cache import AnalysisCache
+from generator.utils.file_index import FileEntry, ProjectFileIndex, get_file_index
 
-# Directories to skip
-SKIP_DIRS = {
-    ".git",
-    "node_modules",
-    "venv",
-    ".venv",
-    "env",
-    "__pycache__",
-    ".pytest_cache",
-    "dist",
-    "build",
-    ".idea",
-    ".vscode",
-    ".tox",
-    ".mypy_cache",
-    ".eggs",
-    "htmlcov",
-    ".web",  # Reflex framework generated Next.js output
-}
+logger = logging.getLogger(__name__)
 
 
 class CodeExampleExtractor:
@@ -85,6 +68,14 @@ class CodeExampleExtractor:
         },
     }
 
+    def __init__(
+        self,
+        file_index: Optional[ProjectFileIndex] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
+    ):
+        self._file_index = file_index
+        self._analysis_cache = analysis_cache if analysis_cache is not None else AnalysisCache()
+
     def extract_examples_for_skill(
         self,
         project_path: Path,
@@ -113,14 +104,14 @@ class CodeExampleExtractor:
         search_patterns = self._get_search_patterns(skill_topic, tech_stack)
 
         # Find relevant source files
-        source_files = self._get_source_files(project_path)
+        source_entries = self._get_source_entries(project_path, self._file_index)
 
-        for source_file in source_files:
+        for entry in source_entries:
             try:
-                file_examples = self._extract_from_file(source_file, project_path, search_patterns)
+                file_examples = self._extract_from_file(entry, search_patterns)
                 examples.extend(file_examples)
             except OSError as e:
-                logger.debug(f"Failed to extract from {source_file}: {e}")
+                logger.debug(f"Failed to extract from {entry.rel}: {e}")
 
             # Limit total examples
             if len(examples) >= 10:
@@ -175,29 +166,44 @@ class CodeExampleExtractor:
 
     def _extract_from_file(
         self,
-        file_path: Path,
-        project_path: Path,
+        entry: FileEntry,
         search_patterns: Dict[str, List[str]],
     ) -> List[Dict[str, Any]]:
-        """Extract examples from a single Python file using AST."""
+        """Extract examples from a single source file.
+
+        Python symbols come from the analysis cache, so the file itself is only
+        read when a symbol matched (to cut its snippet) or keyword scanning is
+        requested.
+        """
         examples: List[Dict[str, Any]] = []
+        if entry.size > 1024 * 1024:  # skip files > 1 MB
+            return examples
+
+        matches: List[Tuple[Dict[str, Any], int]] = []
+        if entry.suffix == ".py":
+            symbols = self._analysis_cache.get(entry, "ast_symbols", self._ast_symbols)
+            matches = self._match_symbols(symbols, entry.rel, search_patterns)
+
+        if not matches and not search_patterns.get("keywords"):
+            return examples
 
         try:
-            if file_path.stat().st_size > 1024 * 1024:  # skip files > 1 MB
-                return examples
-            content = file_path.read_text(encoding="utf-8", errors="replace")
+            content = entry.path.read_text(encoding="utf-8", errors="replace")
         except OSError:
             return examples
-
-        relative_path = str(file_path.relative_to(project_path))
         lines = content.splitlines()
 
-        # Try AST parsing for Python files
-        if file_path.suffix == ".py":
-            examples.extend(self._extract_with_ast(content, lines, relative_path, search_patterns))
+        # Fill in snippets for AST matches (0 lines = the single import line)
+        for example, max_lines in matches:
+            lineno = example["line"]
+            if max_lines:
+                example["code"] = self._extract_snippet(lines, lineno - 1, max_lines)
+            else:
+                example["code"] = lines[lineno - 1].strip() if lineno <= len(lines) else ""
+            examples.append(example)
 
         # Fallback: regex-based extraction for all file types
-        examples.extend(self._extract_with_regex(content, lines, relative_path, search_patterns))
+        examples.extend(self._extract_with_regex(content, lines, entry.rel, search_patterns))
 
         # Deduplicate by line number
         seen_lines = set()
@@ -209,113 +215,150 @@ class CodeExampleExtractor:
 
         return unique_examples
 
-    def _extract_with_ast(
-        self,
-        content: str,
-        lines: List[str],
-        relative_path: str,
-        search_patterns: Dict[str, List[str]],
-    ) -> List[Dict[str, Any]]:
-        """Extract examples using Python AST parsing."""
-        examples: List[Dict[str, Any]] = []
+    @classmethod
+    def _ast_symbols(cls, content: str) -> Optional[List[Dict[str, Any]]]:
+        """Summarise the functions, classes and imports of a module in ``ast.walk`` order.
 
+        The result is plain JSON so it can live in the analysis cache; ``None``
+        marks a file that does not parse.
+        """
         try:
             tree = ast.parse(content)
-        except SyntaxError:
-            return examples
+        except (SyntaxError, ValueError):
+            return None
 
+        symbols: List[Dict[str, Any]] = []
         for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                symbols.append(
+                    {
+                        "kind": "function",
+                        "name": node.name,
+                        "line": node.lineno,
+                        "is_async": isinstance(node, ast.AsyncFunctionDef),
+                        "decorators": [cls._decorator_to_string(d) for d in node.decorator_list],
+                    }
+                )
+            elif isinstance(node, ast.ClassDef):
+                symbols.append(
+                    {
+                        "kind": "class",
+                        "name": node.name,
+                        "line": node.lineno,
+                        "bases": [cls._name_to_string(b) for b in node.bases],
+                    }
+                )
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                module = ""
+                if isinstance(node, ast.ImportFrom) and node.module:
+                    module = node.module
+                elif isinstance(node, ast.Import):
+                    module = ", ".join(alias.name for alias in node.names)
+                symbols.append({"kind": "import", "name": module, "line": node.lineno})
+        return symbols
+
+    @staticmethod
+    def _match_symbols(
+        symbols: Optional[List[Dict[str, Any]]],
+        relative_path: str,
+        search_patterns: Dict[str, List[str]],
+    ) -> List[Tuple[Dict[str, Any], int]]:
+        """Match cached AST symbols against the search patterns.
+
+        Returns ``(example, snippet_lines)`` pairs; the ``code`` field is filled
+        in by the caller once the file's lines are available.
+        """
+        matches: List[Tuple[Dict[str, Any], int]] = []
+        for sym in symbols or []:
+            name = sym["name"]
+            lineno = sym["line"]
+
             # Function definitions
-            if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                func_name = node.name
-                is_async = isinstance(node, ast.AsyncFunctionDef)
+            if sym["kind"] == "function":
+                is_async = sym["is_async"]
 
                 # Check if function matches any pattern
                 for pattern in search_patterns.get("functions", []):
-                    if pattern.lower() in func_name.lower():
-                        code_snippet = self._extract_snippet(lines, node.lineno - 1, 10)
-                        examples.append(
-                            {
-                                "file": relative_path,
-                                "line": node.lineno,
-                                "code": code_snippet,
-                                "type": "async_function" if is_async else "function",
-                                "name": func_name,
-                                "is_good_example": True,
-                                "reason": f"{'Async f' if is_async else 'F'}unction matching '{pattern}'",
-                                "relevance": 5,
-                            }
+                    if pattern.lower() in name.lower():
+                        matches.append(
+                            (
+                                {
+                                    "file": relative_path,
+                                    "line": lineno,
+                                    "type": "async_function" if is_async else "function",
+                                    "name": name,
+                                    "is_good_example": True,
+                                    "reason": f"{'Async f' if is_async else 'F'}unction matching '{pattern}'",
+                                    "relevance": 5,
+                                },
+                                10,
+                            )
                         )
                         break
 
                 # Check decorators
-                for decorator in node.decorator_list:
-                    dec_str = self._decorator_to_string(decorator)
+                for dec_str in sym["decorators"]:
                     for pattern in search_patterns.get("decorators", []):
                         if pattern.lower() in dec_str.lower():
-                            code_snippet = self._extract_snippet(lines, node.lineno - 1, 10)
-                            examples.append(
-                                {
-                                    "file": relative_path,
-                                    "line": node.lineno,
-                                    "code": code_snippet,
-                                    "type": "decorated_function",
-                                    "name": func_name,
-                                    "is_good_example": True,
-                                    "reason": f"Uses @{dec_str}",
-                                    "relevance": 7,
-                                }
+                            matches.append(
+                                (
+                                    {
+                                        "file": relative_path,
+                                        "line": lineno,
+                                        "type": "decorated_function",
+                                        "name": name,
+                                        "is_good_example": True,
+                                        "reason": f"Uses @{dec_str}",
+                                        "relevance": 7,
+                                    },
+                                    10,
+                                )
                             )
                             break
 
             # Class definitions
-            elif isinstance(node, ast.ClassDef):
-                class_name = node.name
+            elif sym["kind"] == "class":
+                base_names = sym["bases"]
                 for pattern in search_patterns.get("classes", []):
                     # Check class name or base classes
-                    base_names = [self._name_to_string(b) for b in node.bases]
-                    if pattern.lower() in class_name.lower() or any(pattern.lower() in b.lower() for b in base_names):
-                        code_snippet = self._extract_snippet(lines, node.lineno - 1, 12)
-                        examples.append(
-                            {
-                                "file": relative_path,
-                                "line": node.lineno,
-                                "code": code_snippet,
-                                "type": "class",
-                                "name": class_name,
-                                "is_good_example": True,
-                                "reason": f"Class {'inheriting ' + pattern if base_names else 'matching ' + pattern}",
-                                "relevance": 6,
-                            }
+                    if pattern.lower() in name.lower() or any(pattern.lower() in b.lower() for b in base_names):
+                        matches.append(
+                            (
+                                {
+                                    "file": relative_path,
+                                    "line": lineno,
+                                    "type": "class",
+                                    "name": name,
+                                    "is_good_example": True,
+                                    "reason": f"Class {'inheriting ' + pattern if base_names else 'matching ' + pattern}",
+                                    "relevance": 6,
+                                },
+                                12,
+                            )
                         )
                         break
 
             # Import statements
-            elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                module = ""
-                if isinstance(node, ast.ImportFrom) and node.module:
-                    module = node.module
-                elif isinstance(node, ast.Import):
-                    module = ", ".join(alias.name for alias in node.names)
-
+            elif sym["kind"] == "import":
                 for pattern in search_patterns.get("imports", []):
-                    if pattern.lower() in module.lower():
-                        code_snippet = lines[node.lineno - 1].strip() if node.lineno <= len(lines) else ""
-                        examples.append(
-                            {
-                                "file": relative_path,
-                                "line": node.lineno,
-                                "code": code_snippet,
-                                "type": "import",
-                                "name": module,
-                                "is_good_example": True,
-                                "reason": f"Imports {module}",
-                                "relevance": 2,
-                            }
+                    if pattern.lower() in name.lower():
+                        matches.append(
+                            (
+                                {
+                                    "file": relative_path,
+                                    "line": lineno,
+                                    "type": "import",
+                                    "name": name,
+                                    "is_good_example": True,
+                                    "reason": f"Imports {name}",
+                                    "relevance": 2,
+                                },
+                                0,
+                            )
                         )
                         break
 
-        return examples
+        return matches
 
     def _extract_with_regex(
         self,
@@ -390,28 +433,23 @@ class CodeExampleExtractor:
         return ""
 
     @staticmethod
-    def _get_source_files(project_path: Path) -> List[Path]:
-        """Get source files to analyze, sorted by likely relevance."""
-        files = []
-        extensions = {".py", ".js", ".ts", ".jsx", ".tsx"}
-
-        for f in project_path.rglob("*"):
-            if f.suffix not in extensions:
-                continue
-            # Skip irrelevant directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            files.append(f)
-            if len(files) >= 100:
-                break
+    def _get_source_entries(project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> List[FileEntry]:
+        """Get source file entries to analyze, sorted by likely relevance."""
+        index = get_file_index(project_path, file_index)
+        entries = index.by_suffix(".py", ".js", ".ts", ".jsx", ".tsx")[:100]
 
         # Sort: prefer non-test files, prefer shorter paths (more central)
-        files.sort(
-            key=lambda f: (
-                "test" in f.name.lower(),
-                len(f.parts),
-                f.name,
+        entries.sort(
+            key=lambda e: (
+                "test" in e.name.lower(),
+                len(e.parts),
+                e.name,
             )
         )
 
-        return files
+        return entries
+
+    @staticmethod
+    def _get_source_files(project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> List[Path]:
+        """Get source files to analyze, sorted by likely relevance."""
+        return [project_path / e.rel for e in CodeExampleExtractor._get_source_entries(project_path, file_index)]
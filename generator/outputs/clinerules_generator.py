@@ -2,12 +2,13 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 import yaml
 
 from generator.prompts.skill_generation import detect_project_tools
 from generator.storage.skill_paths import SkillPathManager
+from generator.utils.fragment_cache import Fragment, FragmentCache, assemble
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,7 @@ def generate_clinerules(
     selected_skills: Set[str],
     project_context: Optional[Dict[str, Any]] = None,
     output_dir: "Path | None" = None,
+    fragment_cache: Optional[FragmentCache] = None,
 ) -> str:
     """
     Generate lightweight .clinerules YAML that links to skills.
@@ -30,6 +32,8 @@ def generate_clinerules(
         selected_skills: Set of skill refs like {'builtin/code-review', 'learned/fastapi/async-patterns'}
         project_context: Optional context for additional metadata
         output_dir: Optional output directory for relative path generation
+        fragment_cache: Optional cache; only top-level blocks whose inputs
+            changed are re-rendered
 
     Returns:
         YAML string content for .clinerules file
@@ -119,29 +123,13 @@ def generate_clinerules(
                 }
             )
 
-    # Build the clinerules structure
-    clinerules: Dict[str, Any] = {
-        "project": project_name,
-        "version": "2.0",
-        "generated_by": "project-rules-generator",
-    }
-
-    # Add tech stack summary if available
-    if project_context:
-        metadata = project_context.get("metadata", {})
-        if metadata.get("tech_stack"):
-            clinerules["tech_stack"] = metadata["tech_stack"]
-        if metadata.get("project_type"):
-            clinerules["project_type"] = metadata["project_type"]
-
     # Tools section: runnable commands for the project
+    tools: Dict[str, str] = {}
+    metadata = project_context.get("metadata", {}) if project_context else {}
     if project_context:
-        metadata = project_context.get("metadata", {})
         project_path_str = project_context.get("readme", {}).get("readme_path", "")
         project_path = Path(project_path_str).parent if project_path_str else None
         tools = detect_project_tools(project_path, metadata.get("tech_stack", []))
-        if tools:
-            clinerules["tools"] = tools
 
     # Skills section
     skills_section: Dict[str, Any] = {}
@@ -155,20 +143,56 @@ def generate_clinerules(
     if learned_skills:
         skills_section["learned"] = [s["path"] for s in learned_skills]
 
-    clinerules["skills"] = skills_section
-
-    # Summary counts
-    clinerules["skills_count"] = {
-        "project": len(project_skills),
-        "builtin": len(builtin_skills),
-        "learned": len(learned_skills),
-        "total": len(project_skills) + len(builtin_skills) + len(learned_skills),
+    inputs = {
+        "readme": project_name,
+        "structure": {
+            "metadata": metadata,
+            "structure": project_context.get("structure", {}) if project_context else {},
+            "has_context": bool(project_context),
+        },
+        "tools": tools,
+        "skills": skills_section,
     }
 
-    # Context configuration
-    clinerules["context"] = _build_context_config(project_context)
+    # Each fragment is one run of top-level keys; block-style YAML dumps of
+    # consecutive keys concatenate to the dump of the whole mapping.
+    def header() -> Dict[str, Any]:
+        return {"project": project_name, "version": "2.0", "generated_by": "project-rules-generator"}
+
+    def tech_summary() -> Dict[str, Any]:
+        # Add tech stack summary if available
+        block: Dict[str, Any] = {}
+        if metadata.get("tech_stack"):
+            block["tech_stack"] = metadata["tech_stack"]
+        if metadata.get("project_type"):
+            block["project_type"] = metadata["project_type"]
+        return block
+
+    def skills() -> Dict[str, Any]:
+        # Summary counts
+        counts = {kind: len(skills_section.get(kind, [])) for kind in ("project", "builtin", "learned")}
+        counts["total"] = sum(counts.values())
+        return {"skills": skills_section, "skills_count": counts}
+
+    fragments = [
+        _yaml_fragment("header", ("readme",), header),
+        _yaml_fragment("tech_stack", ("structure",), tech_summary),
+        _yaml_fragment("tools", ("tools",), lambda: {"tools": tools} if tools else {}),
+        _yaml_fragment("skills", ("skills",), skills),
+        # Context configuration
+        _yaml_fragment("context", ("structure",), lambda: {"context": _build_context_config(project_context)}),
+    ]
+    return assemble("clinerules.yaml", fragments, inputs, fragment_cache)
+
+
+def _yaml_fragment(name: str, inputs: Tuple[str, ...], block: Callable[[], Dict[str, Any]]) -> Fragment:
+    """A fragment rendering the top-level keys returned by ``block`` (nothing when empty)."""
+
+    def render() -> str:
+        data = block()
+        return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True) if data else ""
 
-    return yaml.dump(clinerules, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    return Fragment(name, inputs, render)
 
 
 def _build_context_config(project_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -4,7 +4,7 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -181,6 +181,7 @@ class DesignGenerator:
         api_key: Optional[str] = None,
         model_name: Optional[str] = None,
         provider: Optional[str] = "groq",
+        on_progress: Optional[Callable[[int], None]] = None,
     ):
         """Initialize design generator with AI client.
 
@@ -192,6 +193,8 @@ class DesignGenerator:
                 ``"openai"``. Defaults to ``"groq"``. When ``None`` or ``"groq"``
                 and ``GROQ_API_KEY`` is unset, auto-detects the first configured
                 provider in preference order groq → gemini → anthropic → openai.
+            on_progress: Optional callback; when set the design is streamed and
+                it receives the number of characters received so far.
         """
         # Env-var resolution for every supported provider. Gemini accepts two
         # historical key names; the others are straightforward.
@@ -226,10 +229,10 @@ class DesignGenerator:
         # Only initialize AI client if an API key is available; otherwise fallback deterministically
         self.client: Optional[Any] = None
         try:
-            from generator.ai.factory import create_ai_client
+            from generator.ai.sessions import ai_session
 
             if self.api_key:
-                self.client = create_ai_client(self.provider, api_key=self.api_key)
+                self.client = ai_session(self.provider, api_key=self.api_key)
                 logger.debug("Design generator using: %s", self.provider)
             else:
                 self.client = None
@@ -238,6 +241,7 @@ class DesignGenerator:
             logger.warning("Design AI client init failed: %s", e)
 
         self.model_name = model_name
+        self.on_progress = on_progress
 
     def generate_design(
         self,
@@ -474,6 +478,7 @@ NOW generate the complete design following this structure. Be specific, detailed
             model=self.model_name,
             temperature=0.7,
             max_retries=1,
+            on_progress=self.on_progress,
         )
         if not result or len(result.strip()) < 100:
             logger.warning("LLM returned short/empty response (%d chars)", len(result or ""))
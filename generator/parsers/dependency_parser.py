@@ -1,11 +1,20 @@
 """Parse dependency files from multiple ecosystems."""
 
+import copy
+import functools
+import heapq
+import itertools
 import json
 import logging
+import os
 import re
+import time
 import types
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from generator.utils.file_index import RACY_WINDOW_NS, ProjectFileIndex
+from generator.utils.ignore import IgnoreMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +33,136 @@ except ModuleNotFoundError:
         _tomllib = None
 tomllib = _tomllib
 
+# (parser name, path) -> (size, mtime_ns, parsed result). Process-wide, so a
+# resident ``prg watch`` daemon only re-parses manifests that actually changed.
+_PARSE_MEMO: Dict[Tuple[str, str], Tuple[int, int, Any]] = {}
+
+
+def _memoize_by_stat(func: Callable[[Path], Any]) -> Callable[[Path], Any]:
+    """Reuse ``func(path)`` while the file's ``(size, mtime_ns)`` is unchanged.
+
+    Results are deep-copied in and out because callers extend the returned
+    lists. Files modified within the racy window are always re-parsed.
+    """
+
+    @functools.wraps(func)
+    def wrapper(file_path: Path) -> Any:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return func(file_path)
+        key = (func.__name__, str(file_path))
+        cached = _PARSE_MEMO.get(key)
+        if (
+            cached is not None
+            and cached[:2] == (st.st_size, st.st_mtime_ns)
+            and st.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS
+        ):
+            return copy.deepcopy(cached[2])
+        result = func(file_path)
+        _PARSE_MEMO[key] = (st.st_size, st.st_mtime_ns, copy.deepcopy(result))
+        return result
+
+    return wrapper
+
+
+# System dependency -> marker regexes, searched case-insensitively.
+_SYSTEM_MARKERS: Dict[str, List[str]] = {
+    "ffmpeg": [r"\bffmpeg\b", r"subprocess.*ffmpeg", r"import ffmpeg"],
+    "imagemagick": [r"\bconvert\b.*image", r"imagemagick"],
+    "graphviz": [r"\bgraphviz\b", r"import graphviz"],
+    "tesseract": [r"\btesseract\b", r"pytesseract"],
+    "redis-server": [r"redis://", r"redis\.Redis"],
+    "postgresql": [r"postgresql://", r"psycopg"],
+    "mysql": [r"mysql://", r"pymysql"],
+}
+_SYSTEM_MARKER_GROUPS = {f"m{i}": dep for i, dep in enumerate(_SYSTEM_MARKERS)}
+_SYSTEM_SCAN_MAX_FILES = 50
+_SYSTEM_SCAN_CHARS = 2000
+# Pruned on top of the project's IgnoreMatcher: hidden trees and a venv named ``env``.
+_SYSTEM_SCAN_SKIP_DIRS = frozenset({"env"})
+# Scanned only after first-party source.
+_SYSTEM_SCAN_LATE_DIRS = frozenset({"tests", "test", "docs", "examples", "scripts"})
+
+
+@functools.lru_cache(maxsize=None)
+def _system_marker_regex(deps: FrozenSet[str]) -> "re.Pattern[str]":
+    """One alternation over the markers of ``deps``, each dependency a named group."""
+    groups = [
+        f"(?P<{group}>{'|'.join(_SYSTEM_MARKERS[dep])})" for group, dep in _SYSTEM_MARKER_GROUPS.items() if dep in deps
+    ]
+    return re.compile("|".join(groups), re.IGNORECASE)
+
+
+def _system_scan_skipped(name: str) -> bool:
+    return name in _SYSTEM_SCAN_SKIP_DIRS or name.startswith(".")
+
+
+def _system_scan_key(parts: Tuple[str, ...]) -> Tuple[int, int, Tuple[str, ...]]:
+    """Scan order: root READMEs, then (first-party, late) x depth x path."""
+    if len(parts) == 1 and parts[0].startswith("README"):
+        return (0, 0, parts)
+    tier = 2 if any(part in _SYSTEM_SCAN_LATE_DIRS for part in parts[:-1]) else 1
+    return (tier, len(parts), parts)
+
+
+def _system_scan_candidates(project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> Iterator[Path]:
+    """Yield the root README* files and ``*.py`` files in ``_system_scan_key`` order.
+
+    Without an index the tree is expanded lazily through a heap — a
+    directory is only listed when it is the smallest pending key — so a
+    caller that stops early never walks the rest of the tree. Either way the
+    project's ``IgnoreMatcher`` decides what is skipped.
+    """
+    root = Path(project_path)
+    if file_index is not None:
+        keys = [
+            tuple(entry.rel.split("/"))
+            for entry in file_index
+            if (entry.suffix == ".py" or ("/" not in entry.rel and entry.name.startswith("README")))
+            and not any(_system_scan_skipped(part) for part in entry.rel.split("/")[:-1])
+        ]
+        for parts in sorted(keys, key=_system_scan_key):
+            yield root.joinpath(*parts)
+        return
+
+    # Heap items: (key, is_dir, parts). Children always sort after their
+    # directory, so popping in key order yields files in global key order.
+    ignore = IgnoreMatcher.for_project(root)
+    heap: List[Tuple[Tuple[int, int, Tuple[str, ...]], bool, Tuple[str, ...]]] = [((1, 0, ()), True, ())]
+    while heap:
+        _, is_dir, parts = heapq.heappop(heap)
+        if not is_dir:
+            yield root.joinpath(*parts)
+            continue
+        try:
+            with os.scandir(root.joinpath(*parts)) as entries:
+                for entry in entries:
+                    child = parts + (entry.name,)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _system_scan_skipped(entry.name) and not ignore.ignores(
+                                "/".join(child), is_dir=True
+                            ):
+                                key = _system_scan_key(child + ("",))
+                                heapq.heappush(heap, ((key[0], key[1] - 1, child), True, child))
+                        elif (
+                            entry.is_file()
+                            and (entry.name.endswith(".py") or (not parts and entry.name.startswith("README")))
+                            and not ignore.ignores("/".join(child))
+                        ):
+                            heapq.heappush(heap, (_system_scan_key(child), False, child))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
 
 class DependencyParser:
     """Parse dependency files: requirements.txt, pyproject.toml, package.json."""
 
     @staticmethod
+    @_memoize_by_stat
     def parse_requirements_txt(file_path: Path) -> List[Dict[str, str]]:
         """
         Parse requirements.txt into structured dependency list.
@@ -109,6 +243,7 @@ class DependencyParser:
         return deps
 
     @staticmethod
+    @_memoize_by_stat
     def parse_pyproject_toml(file_path: Path) -> Dict:
         """
         Parse pyproject.toml for dependencies and project metadata.
@@ -226,6 +361,7 @@ class DependencyParser:
         return result
 
     @staticmethod
+    @_memoize_by_stat
     def parse_package_json(file_path: Path) -> Dict:
         """
         Parse package.json for Node.js dependencies.
@@ -330,6 +466,7 @@ class DependencyParser:
             return None
 
     @staticmethod
+    @_memoize_by_stat
     def parse_readme_pip_install(readme_path: Path) -> List[Dict[str, str]]:
         """Extract dependencies from `pip install ...` commands in README.
 
@@ -394,47 +531,34 @@ class DependencyParser:
         return deps
 
     @staticmethod
-    def detect_system_dependencies(project_path: Path) -> List[str]:
-        """Detect system-level dependencies from code and docs."""
-        system_deps = []
-        system_markers = {
-            "ffmpeg": [r"\bffmpeg\b", r"subprocess.*ffmpeg", r"import ffmpeg"],
-            "imagemagick": [r"\bconvert\b.*image", r"imagemagick"],
-            "graphviz": [r"\bgraphviz\b", r"import graphviz"],
-            "tesseract": [r"\btesseract\b", r"pytesseract"],
-            "redis-server": [r"redis://", r"redis\.Redis"],
-            "postgresql": [r"postgresql://", r"psycopg"],
-            "mysql": [r"mysql://", r"pymysql"],
-        }
-
-        # Scan Python files and README
-        scan_files: set = set()
-        scan_files.update(project_path.glob("*.py"))
-        scan_files.update(project_path.glob("README*"))
-
-        # Add recursive scan, but the set will handle duplicates if logic changes
-        # Previously: glob("*.py") AND glob("**/*.py") caused root files to be double counted
-        # The glob("**/*.py") includes root files !!
-        # So we just need the recursive glob.
-        scan_files = set(project_path.glob("**/*.py"))
-        scan_files.update(project_path.glob("README*"))
-
-        # Limit scanning to avoid performance issues
-        # Sort to ensure deterministic behavior for tests/limiting
-        scan_files_list = sorted(list(scan_files))[:50]
-
-        combined_content = ""
-        for f in scan_files_list:
+    def detect_system_dependencies(project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> List[str]:
+        """Detect system-level dependencies from code and docs.
+
+        Scans the root README and up to ``_SYSTEM_SCAN_MAX_FILES`` Python files,
+        first-party source before tests/docs/examples and shallow before deep
+        (see ``_system_scan_candidates``), and stops as soon as every marker
+        has been seen. With ``file_index`` the candidates come from the index
+        instead of a walk.
+        """
+        remaining = frozenset(_SYSTEM_MARKERS)
+        found: List[str] = []
+        for path in itertools.islice(_system_scan_candidates(project_path, file_index), _SYSTEM_SCAN_MAX_FILES):
             try:
-                combined_content += f.read_text(encoding="utf-8", errors="replace")[:2000]
+                with open(path, encoding="utf-8", errors="replace") as fh:
+                    text = fh.read(_SYSTEM_SCAN_CHARS)
             except OSError:
                 continue
-
-        content_lower = combined_content.lower()
-        for dep_name, patterns in system_markers.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower, re.IGNORECASE):
-                    system_deps.append(dep_name)
+            pos = 0
+            while remaining:
+                match = _system_marker_regex(remaining).search(text, pos)
+                if match is None or match.lastgroup is None:  # every alternative is a named group
                     break
-
-        return list(set(system_deps))
+                dep = _SYSTEM_MARKER_GROUPS[match.lastgroup]
+                found.append(dep)
+                remaining -= {dep}
+                # Resume just past the match start: a greedy marker such as
+                # ``convert.*image`` must not hide another marker on its line.
+                pos = match.start() + 1
+            if not remaining:
+                break
+        return found
@@ -2,9 +2,12 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
+from generator.analyzers.analysis_cache import AnalysisCache
 from generator.analyzers.structure_analyzer import StructureAnalyzer
+from generator.utils.file_index import ProjectFileIndex
+from generator.utils.stage_graph import StageGraph, StageTiming
 
 from .dependency_parser import DependencyParser
 
@@ -14,16 +17,30 @@ logger = logging.getLogger(__name__)
 class EnhancedProjectParser:
     """Extract context from README + dependencies + structure + tests."""
 
-    def __init__(self, project_path: Path):
+    def __init__(
+        self,
+        project_path: Path,
+        file_index: Optional[ProjectFileIndex] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
+    ):
         self.path = Path(project_path)
         self.context: Dict[str, Any] = {}
+        self.timings: List[StageTiming] = []
         self._dep_parser = DependencyParser()
-        self._structure_analyzer = StructureAnalyzer(self.path)
+        # The structure analyzer owns the (possibly lazily built) file index;
+        # tech detection below reuses it so the tree is walked at most once.
+        self._structure_analyzer = StructureAnalyzer(self.path, file_index=file_index, analysis_cache=analysis_cache)
 
-    def extract_full_context(self) -> Dict[str, Any]:
+    def extract_full_context(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Main entry point - gather all context from multiple sources.
 
+        README parsing, dependency parsing, structure analysis and test
+        analysis are independent, so they run concurrently on a
+        ``StageGraph`` (``max_workers=1`` runs them serially); metadata is
+        built once all four are done. Per-stage timings are left in
+        ``self.timings``.
+
         Returns:
             {
                 'readme': {...},
@@ -33,13 +50,19 @@ class EnhancedProjectParser:
                 'metadata': {'tech_stack': [...], 'project_name': ..., ...},
             }
         """
-        self.context = {
-            "readme": self._parse_readme(),
-            "dependencies": self._parse_dependencies(),
-            "structure": self._analyze_structure(),
-            "test_patterns": self._analyze_tests(),
-            "metadata": {},
-        }
+        # Resolve the shared file index before fanning out so the stages
+        # don't race to walk the tree.
+        _ = self._structure_analyzer.file_index
+
+        graph = StageGraph()
+        graph.add("readme", self._parse_readme)
+        graph.add("dependencies", self._parse_dependencies)
+        graph.add("structure", self._analyze_structure)
+        graph.add("test_patterns", self._analyze_tests)
+        try:
+            self.context = {**graph.run(max_workers=max_workers), "metadata": {}}
+        finally:
+            self.timings = graph.timings
 
         # Build metadata from all sources
         self.context["metadata"] = self._extract_metadata()
@@ -157,7 +180,9 @@ class EnhancedProjectParser:
                     logger.info(f"Extracted {len(readme_deps)} deps from {readme_path.name} pip install commands")
 
         # System dependencies
-        result["system"] = self._dep_parser.detect_system_dependencies(self.path)
+        result["system"] = self._dep_parser.detect_system_dependencies(
+            self.path, file_index=self._structure_analyzer.file_index
+        )
 
         return result
 
@@ -315,7 +340,9 @@ class EnhancedProjectParser:
             # which is exactly what ops-heavy / agent-skills projects need.
             from generator.utils.tech_detector import detect_tech_stack as _detect_tech_full
 
-            for tech in _detect_tech_full(self.path, readme_content=raw_readme):
+            for tech in _detect_tech_full(
+                self.path, readme_content=raw_readme, file_index=self._structure_analyzer.file_index
+            ):
                 tech_stack.add(tech)
 
         # Detect docker
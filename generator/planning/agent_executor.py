@@ -203,9 +203,9 @@ class AgentExecutor:
                 self.rules_dir,
             )
         try:
-            from generator.skills.skill_tracker import SkillTracker
+            from generator.skills.skill_tracker import get_skill_tracker
 
-            SkillTracker().record_match(skill)
+            get_skill_tracker().record_match(skill)
         except (
             Exception
         ) as _te:  # noqa: BLE001 — tracking is non-critical; ImportError or any runtime error must not break routing
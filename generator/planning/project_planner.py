@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
-from generator.ai.factory import create_ai_client
+from generator.ai.sessions import ai_session
 
 logger = logging.getLogger(__name__)
 
@@ -153,7 +153,7 @@ class ProjectPlanner:
             self.client = client
         else:
             try:
-                self.client = create_ai_client(provider=provider, api_key=api_key)
+                self.client = ai_session(provider, api_key=api_key)
             except (ImportError, ValueError, RuntimeError):
                 # Fallback to a stub with a minimal generate() to keep planner functional
                 class _Stub:
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
-from generator.ai.factory import create_ai_client
+from generator.ai.sessions import ai_session
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +65,7 @@ class SelfReviewer:
     """Critique generated artifacts for quality and hallucinations."""
 
     def __init__(self, provider: str = "groq", api_key: Optional[str] = None, client=None):
-        self.client = client or create_ai_client(provider=provider, api_key=api_key)
+        self.client = client or ai_session(provider, api_key=api_key)
 
     def review(self, filepath: Path, project_path: Optional[Path] = None) -> ReviewReport:
         """Critique a generated artifact.
@@ -5,7 +5,7 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from generator.ai.factory import create_ai_client
+from generator.ai.sessions import ai_session
 from generator.exceptions import SecurityError
 from generator.tasks import SubTask
 
@@ -36,7 +36,7 @@ class TaskImplementationAgent:
     """Agent that generates code changes for a subtask."""
 
     def __init__(self, provider: str = "groq", api_key: Optional[str] = None, client=None):
-        self.client = client or create_ai_client(provider=provider, api_key=api_key)
+        self.client = client or ai_session(provider, api_key=api_key)
 
     def implement(self, subtask: SubTask, project_context: Optional[Dict] = None) -> Dict[str, str]:
         """Generate file changes for a subtask.
@@ -5,11 +5,12 @@ Re-exports all public names for convenient imports.
 
 from generator.ralph.engine import RalphEngine
 from generator.ralph.state import FeatureState
-from generator.ralph.tasks import _load_tasks, _pending_tasks, _save_tasks, next_feature_id, slugify
+from generator.ralph.tasks import TaskStore, _load_tasks, _pending_tasks, _save_tasks, next_feature_id, slugify
 
 __all__ = [
     "RalphEngine",
     "FeatureState",
+    "TaskStore",
     "next_feature_id",
     "slugify",
     "_load_tasks",
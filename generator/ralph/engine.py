@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import logging
+import os
+import signal
 import subprocess
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Collection, Dict, List, Optional, Tuple, TypeVar
 
+from generator.ai.sessions import AISession, ai_session, sessions
 from generator.exceptions import SecurityError
+from generator.ralph.impact import IMPACT_FILENAME, ImpactMap, jest_related_args
 from generator.ralph.state import FeatureState
-from generator.ralph.tasks import _load_tasks, _pending_tasks, _save_tasks
+from generator.ralph.tasks import TaskStore
 from prg_utils import git_ops  # noqa: F401 — kept for downstream consumers
 from prg_utils.logger import ensure_utf8_streams
 
@@ -20,6 +26,8 @@ ensure_utf8_streams()
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # ---------------------------------------------------------------------------
 # Thresholds and timeouts
 # ---------------------------------------------------------------------------
@@ -60,21 +68,36 @@ class RalphEngine:
         provider: str = "groq",
         api_key: Optional[str] = None,
         verbose: bool = True,
+        feature_dir: Optional[Path] = None,
     ):
+        """``feature_dir`` defaults to ``<project_path>/features/<feature_id>``.
+
+        ``prg ralph run-all`` points ``project_path`` at a per-feature git
+        worktree and keeps ``feature_dir`` in the main tree, so STATE.json and
+        the task list stay where ``prg ralph status`` reads them.
+        """
         self.feature_id = feature_id
         self.project_path = Path(project_path).resolve()
         self.provider = provider
         self.api_key = api_key
         self.verbose = verbose
 
-        self.feature_dir = self.project_path / "features" / feature_id
+        self.feature_dir = Path(feature_dir) if feature_dir else self.project_path / "features" / feature_id
         self.state_path = self.feature_dir / "STATE.json"
         self.tasks_yaml = self.feature_dir / "TASKS.yaml"
         self.plan_md = self.feature_dir / "PLAN.md"
         self.critiques_dir = self.feature_dir / "CRITIQUES"
+        self.impact_path = self.feature_dir / IMPACT_FILENAME
+        self.task_store = TaskStore(self.tasks_yaml)
 
         self.state = self.load_state()
         self._last_tests_passed: Optional[bool] = None  # cached by execute_iteration()
+        self._last_tests_full = False  # whether the last _run_tests() ran the whole suite
+        self._impact: Optional[ImpactMap] = None
+        # The running test subprocess, so a review emergency stop can kill it.
+        self._tests_lock = threading.Lock()
+        self._test_proc: Optional[subprocess.Popen] = None
+        self._tests_cancelled = False
 
     # ------------------------------------------------------------------
     # Public API
@@ -145,7 +168,7 @@ class RalphEngine:
             self._print_summary()
 
     def execute_iteration(self) -> None:
-        """Orchestrate one Ralph iteration: context -> skill -> agent -> commit -> review -> tests."""
+        """Orchestrate one Ralph iteration: context -> skill -> agent -> commit -> review + tests."""
         result = self._step_context()
         if result is None:
             return
@@ -160,13 +183,10 @@ class RalphEngine:
         if not self._step_commit(changes, next_task_title):
             return
 
-        review_score = self._step_review()
-        if review_score is None:
-            return
-
-        tests_passed = self._step_tests(next_task_title, review_score)
-        if tests_passed is None:
+        outcome = self._step_review_and_tests(next_task_title, changes)
+        if outcome is None:
             return
+        review_score, tests_passed = outcome
 
         if self.verbose:
             logger.info(
@@ -256,7 +276,10 @@ class RalphEngine:
 
         Returns the review score, or None when the loop should stop (score < 60).
         """
-        review_score = self._run_self_review()
+        return self._apply_review(self._run_self_review())
+
+    def _apply_review(self, review_score: int) -> Optional[int]:
+        """Record ``review_score`` and enforce the review thresholds (see ``_step_review``)."""
         self.state.last_review_score = review_score
         self.save_state()
 
@@ -277,12 +300,18 @@ class RalphEngine:
             logger.info("Review score %d — fixing issues before next iteration.", review_score)
         return review_score
 
-    def _step_tests(self, next_task_title: str, review_score: int) -> Optional[bool]:
+    def _step_tests(self, next_task_title: str, review_score: int, changes: Optional[dict] = None) -> Optional[bool]:
         """Step 6: run tests, cache result, track failures, mark task complete.
 
-        Returns the tests_passed bool, or None when the loop should stop (test_fail_3x).
+        Only the tests affected by ``changes`` run; with no changes the whole
+        suite does. Returns the tests_passed bool, or None when the loop
+        should stop (test_fail_3x).
         """
-        tests_passed, _ = self._run_tests()
+        tests_passed, _ = self._run_tests(changed=list(changes) if changes else None)
+        return self._apply_tests(next_task_title, review_score, tests_passed)
+
+    def _apply_tests(self, next_task_title: str, review_score: int, tests_passed: bool) -> Optional[bool]:
+        """Record a test result and act on it (see ``_step_tests``)."""
         self.state.test_pass_rate = 1.0 if tests_passed else 0.0
         self._last_tests_passed = tests_passed
 
@@ -303,13 +332,52 @@ class RalphEngine:
 
         if tests_passed and review_score >= REVIEW_SCORE_TASK_COMPLETE:
             self._mark_task_complete(next_task_title)
-            self.state.tasks_complete = max(
-                0, self.state.tasks_total - len(_pending_tasks(_load_tasks(self.tasks_yaml)))
-            )
+            self.state.tasks_complete = max(0, self.state.tasks_total - len(self.task_store.pending()))
             self.save_state()
 
         return tests_passed
 
+    def _step_review_and_tests(self, next_task_title: str, changes: Optional[dict]) -> Optional[Tuple[int, bool]]:
+        """Steps 5 and 6 overlapped: the self-review round trip and the test run start together.
+
+        Results are applied in step order — review thresholds first, then the
+        test result — so the outcome matches running them one after the
+        other, with two exceptions that end the iteration early:
+
+        * a review below ``REVIEW_SCORE_EMERGENCY_STOP`` kills the test
+          subprocess and discards its result;
+        * tests that finish first and reach ``CONSECUTIVE_FAILURE_LIMIT``
+          stop the loop without waiting for the review, which is abandoned.
+
+        Returns ``(review_score, tests_passed)``, or None when the loop stops.
+        """
+        with self._tests_lock:
+            self._tests_cancelled = False
+        changed = list(changes) if changes else None
+        review: "Future[int]" = _in_thread(self._run_self_review, "ralph-review")
+        tests: "Future[Tuple[bool, str]]" = _in_thread(lambda: self._run_tests(changed=changed), "ralph-tests")
+
+        both: "List[Future]" = [review, tests]
+        done, _ = wait(both, return_when=FIRST_COMPLETED)
+        if review not in done:
+            tests_passed = tests.result()[0]
+            if not tests_passed and self.state.consecutive_test_failures + 1 >= CONSECUTIVE_FAILURE_LIMIT:
+                if self.verbose:
+                    logger.info("Tests reached the failure limit — not waiting for self-review.")
+                self._apply_tests(next_task_title, REVIEW_SCORE_NEUTRAL, False)
+                return None
+
+        review_score = self._apply_review(review.result())
+        if review_score is None:
+            self._cancel_tests()
+            wait([tests])
+            return None
+
+        applied = self._apply_tests(next_task_title, review_score, tests.result()[0])
+        if applied is None:  # the failure limit stopped the loop
+            return None
+        return review_score, applied
+
     def build_context(self) -> str:
         """Assemble loop context from project rules, feature plan, and git history."""
         rules_path = self.project_path / ".clinerules" / "rules.md"
@@ -336,25 +404,25 @@ class RalphEngine:
             return True
         if self.state.iteration >= self.state.max_iterations:
             return True
-        tasks = _load_tasks(self.tasks_yaml)
-        if tasks and len(_pending_tasks(tasks)) == 0:
+        if self.task_store.tasks() and not self.task_store.pending():
             return True
         return False
 
     def verify_success(self) -> bool:
         """Return True when the feature is genuinely complete.
 
-        Reuses the test result cached by execute_iteration() to avoid running
-        the test suite twice per successful iteration.
+        Reuses the test result cached by execute_iteration() when that run
+        covered the whole suite (or failed — a failing subset fails the suite
+        too); otherwise runs the full suite.
         """
         if (self.state.last_review_score or 0) < REVIEW_SCORE_SUCCESS_GATE:
             return False
-        tasks = _load_tasks(self.tasks_yaml)
-        if tasks and len(_pending_tasks(tasks)) > 0:
+        if self.task_store.pending():
             return False
-        # Use cached result from execute_iteration() if available; otherwise run tests.
-        if self._last_tests_passed is not None:
+        if self._last_tests_passed is False or (self._last_tests_passed and self._last_tests_full):
             return self._last_tests_passed
+        with self._tests_lock:
+            self._tests_cancelled = False
         tests_passed, _ = self._run_tests()
         return tests_passed
 
@@ -410,7 +478,7 @@ class RalphEngine:
             from generator.planning.task_agent import TaskImplementationAgent
             from generator.tasks import SubTask
 
-            agent = TaskImplementationAgent(provider=self.provider, api_key=self.api_key)
+            agent = TaskImplementationAgent(provider=self.provider, api_key=self.api_key, client=self._ai_session())
             subtask = SubTask(
                 id=self.state.iteration,
                 title=task_title,
@@ -442,6 +510,10 @@ class RalphEngine:
             logger.warning("Agent execution failed (iteration %d): %s", self.state.iteration, exc)
             return {}
 
+    def _ai_session(self) -> AISession:
+        """The process-wide client session for this loop's provider, shared by every iteration."""
+        return ai_session(self.provider, api_key=self.api_key)
+
     def _git_commit(self, message: str, files: Optional[List[str]] = None) -> None:
         try:
             if files:
@@ -480,7 +552,7 @@ class RalphEngine:
         try:
             from generator.planning.self_reviewer import SelfReviewer
 
-            reviewer = SelfReviewer(provider=self.provider, api_key=self.api_key)
+            reviewer = SelfReviewer(provider=self.provider, api_key=self.api_key, client=self._ai_session())
             report = reviewer.review(self.plan_md, project_path=self.project_path)
 
             score = self.review_score_from_verdict(report.verdict)
@@ -496,22 +568,36 @@ class RalphEngine:
             logger.warning("Self-review failed: %s — using neutral score.", exc)
             return REVIEW_SCORE_NEUTRAL
 
-    def _run_tests(self) -> Tuple[bool, str]:
-        """Run project tests; returns (passed, output)."""
+    def _run_tests(self, changed: Optional[Collection[str]] = None) -> Tuple[bool, str]:
+        """Run project tests; returns (passed, output).
+
+        With ``changed`` (project-relative paths) only the tests affected by
+        those files run — see ``generator.ralph.impact``. ``None`` runs the
+        whole suite.
+        """
         runner, args = self._detect_test_runner()
+        self._last_tests_full = True
         if not runner:
             return True, "No test runner detected."
 
+        selected = self._select_tests(runner, changed) if changed else None
+        if selected is not None and not selected:
+            self._last_tests_full = False
+            if self.verbose:
+                logger.info("[OK] No tests affected by this iteration's changes")
+            return True, "No tests affected by this iteration's changes."
+        self._last_tests_full = selected is None
+        if selected is not None and self.verbose:
+            logger.info("[TEST] Running %d affected test target(s)", len(selected))
+
         try:
-            result = subprocess.run(
-                [runner] + args,
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                timeout=TIMEOUT_TESTS,
-            )
-            passed = result.returncode == 0
-            output = (result.stdout + result.stderr).strip()
+            returncode, output = self._run_test_command([runner] + args + (selected or []))
+            if self._tests_cancelled:
+                return False, "Tests cancelled."
+            passed = returncode == 0
+            output = output.strip()
+            if runner == "pytest":
+                self._record_impact(selected, passed)
             if self.verbose:
                 icon = "[OK]" if passed else "[FAIL]"
                 logger.info("%s Tests %s", icon, "passed" if passed else "FAILED")
@@ -523,6 +609,74 @@ class RalphEngine:
         except (OSError, subprocess.SubprocessError) as exc:
             return False, f"Test execution error: {exc}"
 
+    def _run_test_command(self, cmd: List[str]) -> Tuple[int, str]:
+        """Run ``cmd`` in the project and return ``(returncode, stdout + stderr)``.
+
+        The process runs in its own process group (POSIX) so ``_cancel_tests``
+        can kill it together with any workers it spawned. Raises
+        ``subprocess.TimeoutExpired`` after ``TIMEOUT_TESTS``.
+        """
+        with self._tests_lock:
+            if self._tests_cancelled:
+                return -1, "Tests cancelled."
+            proc = subprocess.Popen(
+                cmd,
+                cwd=self.project_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                start_new_session=os.name == "posix",
+            )
+            self._test_proc = proc
+        try:
+            stdout, stderr = proc.communicate(timeout=TIMEOUT_TESTS)
+        except subprocess.TimeoutExpired:
+            _kill_process_tree(proc)
+            proc.communicate()
+            raise
+        finally:
+            with self._tests_lock:
+                self._test_proc = None
+        return proc.returncode, (stdout or "") + (stderr or "")
+
+    def _cancel_tests(self) -> None:
+        """Kill the running test subprocess, if any; a run not yet started is skipped."""
+        with self._tests_lock:
+            self._tests_cancelled = True
+            proc = self._test_proc
+        if proc is not None:
+            _kill_process_tree(proc)
+            if self.verbose:
+                logger.info("[STOP] Test run cancelled.")
+
+    def _select_tests(self, runner: str, changed: Collection[str]) -> Optional[List[str]]:
+        """Return the extra runner arguments selecting tests affected by ``changed``.
+
+        None means run the whole suite; ``[]`` means no test is affected.
+        """
+        if runner != "pytest":
+            return jest_related_args(changed)
+        try:
+            impact = self._impact_map()
+            selected = impact.affected_tests(changed)
+            impact.save()
+            return selected
+        except Exception as exc:  # noqa: BLE001 — selection is an optimisation; fall back to the full suite
+            logger.warning("Test-impact selection failed: %s — running the full suite.", exc)
+            return None
+
+    def _impact_map(self) -> ImpactMap:
+        if self._impact is None:
+            self._impact = ImpactMap.load(self.project_path, self.impact_path)
+        return self._impact
+
+    def _record_impact(self, selected: Optional[List[str]], passed: bool) -> None:
+        if self._impact is None and not self.impact_path.exists():
+            return
+        impact = self._impact_map()
+        impact.record_result(selected, passed)
+        impact.save()
+
     def _detect_test_runner(self) -> Tuple[Optional[str], list]:
         # Strong indicators: presence of these files always means pytest
         strong_indicators = ["pytest.ini", "setup.cfg", "conftest.py"]
@@ -544,19 +698,13 @@ class RalphEngine:
         return None, []
 
     def _next_task_title(self) -> Optional[str]:
-        tasks = _load_tasks(self.tasks_yaml)
-        pending = _pending_tasks(tasks)
-        if not pending:
+        task = self.task_store.next_pending()
+        if task is None:
             return None
-        return pending[0].get("title") or pending[0].get("description") or "(unnamed task)"
+        return task.get("title") or task.get("description") or "(unnamed task)"
 
     def _mark_task_complete(self, title: str) -> None:
-        tasks = _load_tasks(self.tasks_yaml)
-        for t in tasks:
-            if (t.get("title") or t.get("description")) == title and t.get("status") != "done":
-                t["status"] = "done"
-                break
-        _save_tasks(self.tasks_yaml, tasks)
+        self.task_store.mark_done(title)
 
     def _git_log_oneline(self, n: int = 5) -> str:
         try:
@@ -617,4 +765,36 @@ class RalphEngine:
         logger.info("   Tasks     : %d/%d complete", s.tasks_complete, s.tasks_total)
         logger.info("   Review    : %s", s.last_review_score)
         logger.info("   Exit      : %s", s.exit_condition or "—")
+        for session in sessions():
+            logger.info("   AI        : %s", session.summary())
         logger.info("%s", "=" * 60)
+
+
+def _in_thread(fn: Callable[[], T], name: str) -> "Future[T]":
+    """Run ``fn`` in a daemon thread and return a future for its result.
+
+    Daemon threads, not an executor: an abandoned self-review must not keep
+    the process alive until its LLM request times out.
+    """
+    future: "Future[T]" = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as exc:  # noqa: BLE001 — re-raised by future.result() in the caller
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
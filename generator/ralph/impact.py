@@ -0,0 +1,365 @@
+"""Test-impact selection for Ralph's per-iteration test runs.
+
+``RalphEngine`` used to run the whole suite (``pytest -x -q`` or ``npx jest
+--bail``) after every iteration, which makes the loop unusable on a project
+whose suite takes minutes. ``ImpactMap`` maps each Python file to the test
+modules that import it, directly or through other project modules, so an
+iteration runs only the tests affected by the files in the agent's
+``changes``.
+
+The map comes from the import graph of the project's ``.py`` files (parsed
+with ``ast``, no coverage run needed) and is stored beside ``STATE.json`` in
+``TEST_IMPACT.json``. A file's imports are re-parsed only when its
+``(size, mtime_ns)`` changes. A change reaching a ``conftest.py`` selects
+every test below that ``conftest.py``. Only modules the full run would
+collect are selected (pytest's ``testpaths`` and ``norecursedirs``). Changes
+the graph cannot reason about — configuration, data files, files outside the
+index, modules no project file is seen importing — fall back to the full
+suite, as does the final ``verify_success`` check. Test modules from a
+failing selective run are carried into later selections until they pass.
+
+Jest projects pass the changed files to ``jest --findRelatedTests``, which
+walks the JS module graph the same way.
+"""
+
+from __future__ import annotations
+
+import ast
+import configparser
+import fnmatch
+import json
+import logging
+import os
+import posixpath
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from generator.utils.file_index import RACY_WINDOW_NS, ProjectFileIndex
+
+logger = logging.getLogger(__name__)
+
+IMPACT_FILENAME = "TEST_IMPACT.json"
+_IMPACT_VERSION = 1
+
+# Changed files with these suffixes never affect a test run.
+DOC_SUFFIXES = frozenset({".md", ".rst"})
+
+# pytest's default ``norecursedirs``; a configured value replaces it.
+_DEFAULT_NORECURSE = ("*.egg", ".*", "_darcs", "build", "CVS", "dist", "node_modules", "venv", "{arch}")
+
+# Changes to these make jest's related-test walk unreliable.
+_JEST_CONFIG_PREFIXES = ("package.json", "jest.config", "babel.config", ".babelrc", "tsconfig")
+
+
+def is_test_file(rel: str) -> bool:
+    """True for the module names pytest collects by default (``test_*.py`` / ``*_test.py``)."""
+    name = posixpath.basename(rel)
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def jest_related_args(changed: Iterable[str]) -> Optional[List[str]]:
+    """Return ``--findRelatedTests`` arguments for ``changed``, or None to run the full jest suite."""
+    files = [_normalize(rel) for rel in changed]
+    code = [rel for rel in files if posixpath.splitext(rel)[1] not in DOC_SUFFIXES]
+    if any(posixpath.basename(rel).startswith(_JEST_CONFIG_PREFIXES) for rel in code):
+        return None
+    return ["--findRelatedTests", *code] if code else []
+
+
+def pytest_scope(project_path: Path) -> Tuple[List[str], List[str]]:
+    """Return ``(testpaths, norecursedirs)`` from the project's pytest configuration.
+
+    Reads the same files pytest does, first match wins: ``pytest.ini``,
+    ``pyproject.toml``, ``tox.ini``, ``setup.cfg``.
+    """
+    for name, section in (
+        ("pytest.ini", "pytest"),
+        ("pyproject.toml", None),
+        ("tox.ini", "pytest"),
+        ("setup.cfg", "tool:pytest"),
+    ):
+        path = Path(project_path) / name
+        if not path.is_file():
+            continue
+        options = _read_pytest_options(path, section)
+        if options is None:
+            continue
+        testpaths = _as_list(options.get("testpaths"))
+        norecurse = _as_list(options.get("norecursedirs")) or list(_DEFAULT_NORECURSE)
+        return [p.strip("/") for p in testpaths], norecurse
+    return [], list(_DEFAULT_NORECURSE)
+
+
+def _read_pytest_options(path: Path, section: Optional[str]) -> Optional[Dict[str, Any]]:
+    try:
+        if section is None:
+            from generator.parsers.dependency_parser import tomllib
+
+            if tomllib is None:
+                return None
+            data = tomllib.loads(path.read_text(encoding="utf-8"))
+            options = data.get("tool", {}).get("pytest", {}).get("ini_options")
+            return options if isinstance(options, dict) else None
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read(path, encoding="utf-8")
+        return dict(parser[section]) if parser.has_section(section) else None
+    except (OSError, ValueError, configparser.Error):
+        return None
+
+
+def _as_list(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return value.split()
+    return [str(item) for item in value or []]
+
+
+def _collectable(rel: str, testpaths: List[str], norecurse: List[str]) -> bool:
+    if testpaths and not any(rel.startswith(f"{base}/") for base in testpaths):
+        return False
+    directory = posixpath.dirname(rel)
+    parts = directory.split("/") if directory else []
+    for i, part in enumerate(parts):
+        prefix = "/".join(parts[: i + 1])
+        for pattern in norecurse:
+            if fnmatch.fnmatchcase(prefix if "/" in pattern else part, pattern.rstrip("/")):
+                return False
+    return True
+
+
+def _normalize(rel: str) -> str:
+    rel = str(rel).replace("\\", "/")
+    return rel[2:] if rel.startswith("./") else rel
+
+
+class ImpactMap:
+    """Import graph of a project's Python files, persisted per feature.
+
+    ``path=None`` gives an in-memory map with the same semantics.
+    """
+
+    def __init__(self, project_path: Path, path: Optional[Path] = None):
+        self.project_path = Path(project_path)
+        self.path = Path(path) if path is not None else None
+        # rel -> {"size", "mtime_ns", "recorded_ns", "imports": [[module, level, [names]]]}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # Test modules selected by a run that failed, carried until a run including them passes.
+        self.failing: Set[str] = set()
+        self._graph: Dict[str, Set[str]] = {}
+        self._dirty = False
+        self.parsed = 0
+
+    @classmethod
+    def load(cls, project_path: Path, path: Path) -> "ImpactMap":
+        impact = cls(project_path, path)
+        if not path.exists():
+            return impact
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Ignoring unreadable test-impact map %s: %s", path, exc)
+            return impact
+        if data.get("version") == _IMPACT_VERSION:
+            if isinstance(data.get("files"), dict):
+                impact._files = data["files"]
+            impact.failing = set(data.get("failing") or [])
+        return impact
+
+    # ------------------------------------------------------------------
+    # Graph
+    # ------------------------------------------------------------------
+
+    def refresh(self, index: Optional[ProjectFileIndex] = None) -> None:
+        """Re-read the project's Python files and rebuild the import graph.
+
+        Files whose ``(size, mtime_ns)`` match their record (outside the racy
+        window) keep their stored imports.
+        """
+        if index is None:
+            index = ProjectFileIndex.build(self.project_path)
+        files: Dict[str, Dict[str, Any]] = {}
+        for entry in index.by_suffix(".py"):
+            record = self._files.get(entry.rel)
+            if (
+                record is None
+                or record.get("size") != entry.size
+                or record.get("mtime_ns") != entry.mtime_ns
+                or entry.mtime_ns >= record.get("recorded_ns", 0) - RACY_WINDOW_NS
+            ):
+                record = {
+                    "size": entry.size,
+                    "mtime_ns": entry.mtime_ns,
+                    "recorded_ns": time.time_ns(),
+                    "imports": _read_imports(entry.path),
+                }
+                self.parsed += 1
+                self._dirty = True
+            files[entry.rel] = record
+        if files.keys() != self._files.keys():
+            self._dirty = True
+        self._files = files
+
+        known = set(files)
+        dirs = {posixpath.dirname(rel) for rel in known}
+        for directory in list(dirs):
+            while directory:
+                directory = posixpath.dirname(directory)
+                dirs.add(directory)
+        self._graph = {rel: _resolve(rel, record["imports"], known, dirs) for rel, record in files.items()}
+
+    def affected_tests(self, changed: Iterable[str]) -> Optional[List[str]]:
+        """Return the test modules affected by ``changed`` (project-relative paths).
+
+        Returns None when the full suite must run and ``[]`` when no test is
+        affected. A changed module nothing is seen importing (a script, or an
+        import the graph could not resolve) also runs the full suite.
+        Previously failing test modules are always included. The graph is
+        refreshed first, so files just written are part of it.
+        """
+        self.refresh()
+        graph = self._graph
+
+        pending: List[str] = []
+        for rel in map(_normalize, changed):
+            suffix = posixpath.splitext(rel)[1]
+            if suffix in DOC_SUFFIXES:
+                continue
+            if suffix != ".py" or rel not in graph:
+                return None
+            pending.append(rel)
+
+        importers: Dict[str, Set[str]] = {}
+        for rel, deps in graph.items():
+            for dep in deps:
+                importers.setdefault(dep, set()).add(rel)
+        for rel in pending:
+            if rel not in importers and not is_test_file(rel) and posixpath.basename(rel) != "conftest.py":
+                return None
+
+        reached = set(pending)
+        while pending:
+            for importer in importers.get(pending.pop(), ()):
+                if importer not in reached:
+                    reached.add(importer)
+                    pending.append(importer)
+
+        tests = {rel for rel in reached if is_test_file(rel)}
+        for rel in reached:
+            if posixpath.basename(rel) == "conftest.py":
+                scope = posixpath.dirname(rel)
+                if not scope:
+                    return None
+                tests.update(t for t in graph if is_test_file(t) and t.startswith(f"{scope}/"))
+        tests.update(rel for rel in self.failing if rel in graph)
+        testpaths, norecurse = pytest_scope(self.project_path)
+        return sorted(rel for rel in tests if _collectable(rel, testpaths, norecurse))
+
+    def record_result(self, selected: Optional[List[str]], passed: bool) -> None:
+        """Track failing test modules; ``selected=None`` means the full suite ran."""
+        before = set(self.failing)
+        if selected is None:
+            if passed:
+                self.failing.clear()
+        elif passed:
+            self.failing.difference_update(selected)
+        else:
+            self.failing.update(selected)
+        if self.failing != before:
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> None:
+        """Write the map (no-op when in-memory or unchanged)."""
+        if self.path is None or not self._dirty:
+            return
+        payload = {"version": _IMPACT_VERSION, "files": self._files, "failing": sorted(self.failing)}
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as exc:
+            logger.debug("Could not write test-impact map %s: %s", self.path, exc)
+
+
+def _read_imports(path: Path) -> List[List[Any]]:
+    """Return ``[module, level, names]`` for every import statement in ``path``."""
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return []
+    imports: List[List[Any]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend([alias.name, 0, []] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.append([node.module or "", node.level, [alias.name for alias in node.names]])
+    return imports
+
+
+def _import_base(rel: str, known: Set[str]) -> str:
+    """Directory pytest's default import mode puts on ``sys.path`` for ``rel``: the first ancestor outside a package."""
+    directory = posixpath.dirname(rel)
+    while directory and posixpath.join(directory, "__init__.py") in known:
+        directory = posixpath.dirname(directory)
+    return directory
+
+
+def _module_file(directory: str, dotted: str, known: Set[str], dirs: Set[str]) -> Optional[List[str]]:
+    """Files executed by importing ``dotted`` relative to ``directory``: package ``__init__``s and the module.
+
+    Returns None when ``dotted`` is not a project module. A directory of
+    project files without ``__init__.py`` is a namespace package (PEP 420):
+    it contributes no file but is descended into.
+    """
+    found: List[str] = []
+    current = directory
+    for part in dotted.split("."):
+        current = posixpath.join(current, part) if current else part
+        init = posixpath.join(current, "__init__.py")
+        if init in known:
+            found.append(init)
+        elif f"{current}.py" in known:
+            found.append(f"{current}.py")
+            return found
+        elif current not in dirs:
+            return None
+    return found
+
+
+def _resolve(rel: str, imports: List[List[Any]], known: Set[str], dirs: Set[str]) -> Set[str]:
+    """Project files ``rel`` imports, resolved against the project's own modules."""
+    roots = list(dict.fromkeys([_import_base(rel, known), "", "src"]))
+    deps: Set[str] = set()
+    for module, level, names in imports:
+        if level:
+            base = posixpath.dirname(rel)
+            for _ in range(level - 1):
+                base = posixpath.dirname(base)
+            bases = [base]
+        else:
+            bases = roots
+        for base in bases:
+            if not module:
+                # ``from . import x``: the package itself plus any submodule named.
+                init = posixpath.join(base, "__init__.py")
+                if init in known:
+                    deps.add(init)
+                for name in names:
+                    deps.update(_module_file(base, name, known, dirs) or ())
+                break
+            found = _module_file(base, module, known, dirs)
+            if found is None:
+                continue
+            deps.update(found)
+            if not found or found[-1].endswith("__init__.py"):
+                # A package: the imported names may be submodules.
+                for name in names:
+                    deps.update(_module_file(base, f"{module}.{name}", known, dirs) or ())
+            break
+    deps.discard(rel)
+    return deps
@@ -0,0 +1,244 @@
+"""Parallel Ralph runner — one git worktree and one process per feature.
+
+``prg ralph run FEATURE-XXX`` drives a single feature in the main working
+tree, so a backlog of features is processed one at a time. ``ParallelRunner``
+checks each feature's branch out into its own worktree under
+``<git-common-dir>/ralph-worktrees/`` and runs up to ``parallel``
+``RalphEngine`` loops at once, each in a separate process.
+
+The agent edits, commits and test runs of a feature happen in its worktree;
+STATE.json, TASKS.yaml and the rest of the feature workspace stay in the
+main tree's ``features/<id>/`` (``RalphEngine(feature_dir=...)``), so every
+feature keeps its own state file and ``prg ralph status`` keeps working while
+the loops run. Each worker's output goes to ``features/<id>/RALPH.log``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from generator.ai.rate_limit import SharedRateLimiter, install_rate_limiter
+from prg_utils import git_ops
+
+logger = logging.getLogger(__name__)
+
+RUN_LOG = "RALPH.log"
+WORKTREES_DIRNAME = "ralph-worktrees"
+PENDING_STATUSES = ("planning_complete",)
+
+
+def pending_features(features_dir: Path) -> List[str]:
+    """IDs of features under ``features_dir`` whose loop has not started yet."""
+    if not features_dir.is_dir():
+        return []
+    pending = []
+    for state_path in sorted(features_dir.glob("*/STATE.json")):
+        try:
+            status = json.loads(state_path.read_text(encoding="utf-8")).get("status")
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Skipping %s: %s", state_path, exc)
+            continue
+        if status in PENDING_STATUSES:
+            pending.append(state_path.parent.name)
+    return pending
+
+
+def worktrees_dir(project_path: Path) -> Path:
+    """Where feature worktrees live — inside the git dir, so they never show up as untracked files."""
+    common = git_ops.common_git_dir(project_path) or project_path / ".git"
+    return common / WORKTREES_DIRNAME
+
+
+def run_feature_worker(
+    feature_id: str,
+    worktree: str,
+    feature_dir: str,
+    provider: str,
+    api_key: Optional[str],
+    max_iterations: Optional[int],
+    limiter: Optional[SharedRateLimiter],
+    verbose: bool,
+) -> None:
+    """Process entry point: run one feature's Ralph loop in its worktree.
+
+    Exits 0 when the feature succeeded and 1 otherwise, like ``prg ralph run``.
+    """
+    log = open(Path(feature_dir) / RUN_LOG, "a", encoding="utf-8")  # stays open for the life of the process
+    # Redirect the file descriptors, not just sys.stdout, so test-runner and
+    # git subprocesses write to the log instead of the shared terminal.
+    os.dup2(log.fileno(), 1)
+    os.dup2(log.fileno(), 2)
+    sys.stdout = sys.stderr = log
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format="%(message)s", force=True)
+    logging.getLogger("generator.planning.agent_executor").setLevel(logging.WARNING)
+    install_rate_limiter(limiter)
+
+    from generator.ralph.engine import RalphEngine
+
+    engine = RalphEngine(
+        feature_id=feature_id,
+        project_path=Path(worktree),
+        provider=provider,
+        api_key=api_key,
+        verbose=verbose,
+        feature_dir=Path(feature_dir),
+    )
+    engine.run_loop(max_iterations=max_iterations)
+    log.flush()
+    sys.exit(0 if engine.state.status == "success" else 1)
+
+
+@dataclass
+class FeatureRun:
+    """One feature's slot in a parallel run."""
+
+    feature_id: str
+    feature_dir: Path
+    branch: str
+    worktree: Path
+    phase: str = "queued"  # queued|running|done|failed|error
+    exitcode: Optional[int] = None
+    error: Optional[str] = None
+    process: Optional[BaseProcess] = None
+
+
+class ParallelRunner:
+    """Run the Ralph loops of several features concurrently.
+
+    Usage::
+
+        runner = ParallelRunner(Path("."), ["FEATURE-001", "FEATURE-002"], provider="groq", parallel=2)
+        runs = runner.run(on_update=print_rows)
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        feature_ids: List[str],
+        provider: str,
+        api_key: Optional[str] = None,
+        parallel: int = 2,
+        max_iterations: Optional[int] = None,
+        limiter: Optional[SharedRateLimiter] = None,
+        verbose: bool = False,
+        keep_worktrees: bool = False,
+        worker: Callable[..., None] = run_feature_worker,
+    ):
+        self.project_path = Path(project_path).resolve()
+        self.provider = provider
+        self.api_key = api_key
+        self.parallel = max(1, parallel)
+        self.max_iterations = max_iterations
+        self.limiter = limiter
+        self.verbose = verbose
+        self.keep_worktrees = keep_worktrees
+        self.worker = worker
+
+        root = worktrees_dir(self.project_path)
+        self.runs: List[FeatureRun] = []
+        for feature_id in feature_ids:
+            feature_dir = self.project_path / "features" / feature_id
+            state = self._read_state(feature_dir)
+            branch = state.get("branch_name") or f"ralph/{feature_id}"
+            self.runs.append(FeatureRun(feature_id, feature_dir, branch, root / feature_id))
+
+    def run(
+        self, on_update: Optional[Callable[[List[Dict[str, Any]]], None]] = None, poll_interval: float = 1.0
+    ) -> List[FeatureRun]:
+        """Run every feature, at most ``parallel`` at a time, and return the ``FeatureRun`` list.
+
+        ``on_update`` receives ``rows()`` whenever a worker starts or exits
+        and at least every ``poll_interval`` seconds in between.
+        """
+        ctx = multiprocessing.get_context("spawn")
+        queue = list(self.runs)
+        active: List[Tuple[FeatureRun, BaseProcess]] = []
+        try:
+            while queue or active:
+                while queue and len(active) < self.parallel:
+                    run = queue.pop(0)
+                    process = self._start(ctx, run)
+                    if process is not None:
+                        active.append((run, process))
+                if on_update:
+                    on_update(self.rows())
+                if not active:
+                    continue
+                ready = wait([process.sentinel for _, process in active], timeout=poll_interval)
+                for run, process in [item for item in active if item[1].sentinel in ready]:
+                    active.remove((run, process))
+                    self._finish(run, process)
+        except KeyboardInterrupt:
+            for _, process in active:
+                process.terminate()
+            for run, process in active:
+                process.join(timeout=10)
+                run.phase, run.exitcode = "failed", process.exitcode
+            raise
+        if on_update:
+            on_update(self.rows())
+        return self.runs
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """The current STATE.json of every feature, with the runner's ``phase`` added."""
+        rows = []
+        for run in self.runs:
+            row = {"feature_id": run.feature_id, **self._read_state(run.feature_dir), "phase": run.phase}
+            if run.error:
+                row["error"] = run.error
+            rows.append(row)
+        return rows
+
+    def _start(self, ctx: Any, run: FeatureRun) -> Optional[BaseProcess]:
+        try:
+            if not (run.worktree / ".git").exists():
+                run.worktree.parent.mkdir(parents=True, exist_ok=True)
+                git_ops.add_worktree(run.worktree, run.branch, self.project_path)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            stderr = getattr(exc, "stderr", None)
+            run.phase, run.error = "error", (stderr or str(exc)).strip()
+            logger.warning("Could not create worktree for %s: %s", run.feature_id, run.error)
+            return None
+        process = ctx.Process(
+            target=self.worker,
+            args=(
+                run.feature_id,
+                str(run.worktree),
+                str(run.feature_dir),
+                self.provider,
+                self.api_key,
+                self.max_iterations,
+                self.limiter,
+                self.verbose,
+            ),
+            name=f"ralph-{run.feature_id}",
+        )
+        process.start()
+        run.process, run.phase = process, "running"
+        return process
+
+    def _finish(self, run: FeatureRun, process: BaseProcess) -> None:
+        process.join()
+        run.exitcode = process.exitcode
+        run.phase = "done" if run.exitcode == 0 else "failed"
+        if self.keep_worktrees:
+            return
+        if not git_ops.remove_worktree(run.worktree, self.project_path):
+            logger.warning("Kept worktree %s: it has uncommitted changes.", run.worktree)
+
+    @staticmethod
+    def _read_state(feature_dir: Path) -> Dict[str, Any]:
+        try:
+            return json.loads((feature_dir / "STATE.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import os
 import re
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+from generator.utils.file_index import RACY_WINDOW_NS
+
 
 def next_feature_id(features_dir: Path) -> str:
     """Return the next available FEATURE-XXX identifier."""
@@ -33,16 +36,118 @@ def _load_tasks(tasks_yaml: Path) -> List[dict]:
     """Load tasks list from TASKS.yaml.  Returns [] if file absent."""
     if not tasks_yaml.exists():
         return []
-    raw = yaml.safe_load(tasks_yaml.read_text(encoding="utf-8")) or {}
-    return raw.get("tasks", [])
+    return _parse_tasks(tasks_yaml.read_text(encoding="utf-8"))
 
 
 def _save_tasks(tasks_yaml: Path, tasks: List[dict]) -> None:
+    _write_tasks_text(tasks_yaml, _dump_tasks(tasks))
+
+
+def _parse_tasks(text: str) -> List[dict]:
+    raw = yaml.safe_load(text) or {}
+    return raw.get("tasks", [])
+
+
+def _dump_tasks(tasks: List[dict]) -> str:
+    return yaml.dump({"tasks": tasks}, default_flow_style=False)
+
+
+def _write_tasks_text(tasks_yaml: Path, text: str) -> None:
     tasks_yaml.parent.mkdir(parents=True, exist_ok=True)
     tmp = tasks_yaml.with_suffix(".tmp")
-    tmp.write_text(yaml.dump({"tasks": tasks}, default_flow_style=False), encoding="utf-8")
+    tmp.write_text(text, encoding="utf-8")
     os.replace(tmp, tasks_yaml)
 
 
 def _pending_tasks(tasks: List[dict]) -> List[dict]:
     return [t for t in tasks if t.get("status", "pending") == "pending"]
+
+
+class TaskStore:
+    """In-memory, indexed view of a feature's TASKS.yaml.
+
+    ``RalphEngine`` consults the task list several times per iteration
+    (``should_exit``, ``build_context``, ``_step_context``, the test step,
+    ``verify_success``). The file is parsed once and re-read only when its
+    mtime, size or inode changes, so a manual edit between iterations still
+    takes effect. As with the other stat-keyed caches, a file modified
+    within ``RACY_WINDOW_NS`` of the last check is re-read anyway, because a
+    second write in the same timestamp tick would not change its stat; the
+    YAML is parsed again only if the text differs. Writes happen only on
+    mutation, atomically, like ``_save_tasks``.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.parses = 0  # YAML parses so far, for tests and profiling
+        self._tasks: List[dict] = []
+        self._pending: List[dict] = []
+        self._by_title: Dict[str, List[dict]] = {}
+        self._text: Optional[str] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._checked_ns = 0
+        self._loaded = False
+
+    def tasks(self) -> List[dict]:
+        """Every task, in file order."""
+        self._refresh()
+        return self._tasks
+
+    def pending(self) -> List[dict]:
+        """Tasks still pending, in file order (what ``_pending_tasks`` returns)."""
+        self._refresh()
+        return self._pending
+
+    def next_pending(self) -> Optional[dict]:
+        pending = self.pending()
+        return pending[0] if pending else None
+
+    def mark_done(self, title: str) -> bool:
+        """Mark the first not-done task named ``title`` done and write the file.
+
+        Returns False (and writes nothing) when no such task exists.
+        """
+        self._refresh()
+        for task in self._by_title.get(title, []):
+            if task.get("status") != "done":
+                task["status"] = "done"
+                self._text = _dump_tasks(self._tasks)
+                _write_tasks_text(self.path, self._text)
+                self._stamp = self._stat()
+                self._checked_ns = time.time_ns()
+                self._index()
+                return True
+        return False
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _refresh(self) -> None:
+        stamp = self._stat()
+        if self._loaded and stamp == self._stamp and (stamp is None or stamp[0] < self._checked_ns - RACY_WINDOW_NS):
+            return
+        self._checked_ns = time.time_ns()
+        self._stamp = stamp
+        try:
+            text: Optional[str] = self.path.read_text(encoding="utf-8") if stamp is not None else None
+        except FileNotFoundError:
+            text = None
+        if self._loaded and text == self._text:
+            return
+        self._loaded = True
+        self._text = text
+        self._tasks = _parse_tasks(text) if text is not None else []
+        self.parses += 1
+        self._index()
+
+    def _index(self) -> None:
+        self._pending = _pending_tasks(self._tasks)
+        self._by_title = {}
+        for task in self._tasks:
+            title = task.get("title") or task.get("description")
+            if title:
+                self._by_title.setdefault(title, []).append(task)
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import List, Optional
 
 from generator.ai.factory import create_ai_client
+from generator.utils.file_index import get_file_index
 
 
 @dataclass
@@ -105,10 +106,8 @@ class RequirementsInferrer:
 
         # 1. Search for TODOs
         try:
-            # Using grep-like search via subprocess if path is large, or just glob
-            for p in project_path.rglob("*.py"):
-                if ".clinerules" in str(p) or "venv" in str(p):
-                    continue
+            for entry in get_file_index(project_path).by_suffix(".py", exclude={".clinerules"}):
+                p = entry.path
                 content = p.read_text(encoding="utf-8", errors="ignore")
                 todos = re.findall(r"(?:#|//)\s*TODO:\s*(.+)", content, re.IGNORECASE)
                 for t in todos:
@@ -1,15 +1,19 @@
 """Generate constitution.md — project-specific coding principles derived from analysis."""
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from generator.prompts.skill_generation import detect_project_tools
+from generator.utils.fragment_cache import Fragment, FragmentCache, assemble
+
+_DOCKER_FILES = ("Dockerfile", "docker-compose.yml", "docker-compose.yaml")
 
 
 def generate_constitution(
     project_name: str,
     enhanced_context: Dict[str, Any],
     project_path: Optional[Path] = None,
+    fragment_cache: Optional[FragmentCache] = None,
 ) -> str:
     """Generate constitution.md with sections derived from actual project analysis.
 
@@ -17,10 +21,25 @@ def generate_constitution(
         project_name: Name of the project
         enhanced_context: Full context from EnhancedProjectParser
         project_path: Optional project root for tool detection
+        fragment_cache: Optional cache; only sections whose inputs changed are re-rendered
 
     Returns:
         Markdown content for constitution.md
     """
+    inputs, fragments = constitution_fragments(project_name, enhanced_context, project_path)
+    return assemble("constitution.md", fragments, inputs, fragment_cache)
+
+
+def constitution_fragments(
+    project_name: str,
+    enhanced_context: Dict[str, Any],
+    project_path: Optional[Path] = None,
+) -> Tuple[Dict[str, Any], List[Fragment]]:
+    """Return the fragment inputs and the ordered section fragments of constitution.md.
+
+    Tool detection and the Docker file check read the project directory, so
+    their results are computed here and passed in as the ``tools`` input.
+    """
     metadata = enhanced_context.get("metadata", {})
     deps = enhanced_context.get("dependencies", {})
     structure = enhanced_context.get("structure", {})
@@ -31,51 +50,68 @@ def generate_constitution(
     tech_stack = metadata.get("tech_stack", [])
     project_type = metadata.get("project_type", "unknown")
 
-    code_quality = _build_code_quality_section(tech_stack, python_deps, node_deps, project_path)
-    testing = _build_testing_standards_section(test_info, python_deps, tech_stack)
-    architecture = _build_architecture_section(structure, project_type, python_deps, node_deps)
-    dev_guidelines = _build_dev_guidelines_section(tech_stack, python_deps, project_path, structure, project_type)
+    tools = detect_project_tools(project_path, tech_stack)
+    has_docker_files = project_path is not None and any((project_path / name).exists() for name in _DOCKER_FILES)
+
+    inputs = {
+        "name": project_name,
+        "deps": {"tech_stack": tech_stack, "dependencies": deps},
+        "structure": {"project_type": project_type, "structure": structure},
+        "tests": test_info,
+        "tools": {"tools": tools, "docker": has_docker_files},
+    }
 
-    return f"""# {project_name} — Constitution
+    def section(heading: str, names: Tuple[str, ...], body: Callable[[], str]) -> Fragment:
+        return Fragment(heading, names, lambda: f"## {heading}\n\n{body()}\n\n")
+
+    fragments = [
+        Fragment(
+            "header",
+            ("name",),
+            lambda: f"""# {project_name} — Constitution
 
 > Coding principles and standards derived from project analysis.
 > This document is auto-generated and reflects the actual tools, patterns, and conventions found in the codebase.
 
 ---
 
-## Code Quality Principles
-
-{code_quality}
-
-## Testing Standards
-
-{testing}
-
-## Architecture Decisions
-
-{architecture}
-
-## Development Guidelines
-
-{dev_guidelines}
-
----
-_Generated by project-rules-generator (constitution mode)_
-"""
+""",
+        ),
+        section(
+            "Code Quality Principles",
+            ("deps", "tools"),
+            lambda: _build_code_quality_section(tech_stack, python_deps, node_deps, tools),
+        ),
+        section(
+            "Testing Standards",
+            ("deps", "tests"),
+            lambda: _build_testing_standards_section(test_info, python_deps, tech_stack),
+        ),
+        section(
+            "Architecture Decisions",
+            ("deps", "structure"),
+            lambda: _build_architecture_section(structure, project_type, python_deps, node_deps),
+        ),
+        section(
+            "Development Guidelines",
+            ("deps", "structure", "tools"),
+            lambda: _build_dev_guidelines_section(tech_stack, tools, structure, has_docker_files),
+        ),
+        Fragment("footer", (), lambda: "---\n_Generated by project-rules-generator (constitution mode)_\n"),
+    ]
+    return inputs, fragments
 
 
 def _build_code_quality_section(
     tech_stack: List[str],
     python_deps: List[str],
     node_deps: List[str],
-    project_path: Optional[Path],
+    tools: Dict[str, str],
 ) -> str:
     """Build code quality section from detected linters and type-hint patterns."""
     lines: List[str] = []
 
-    # Detect linters / formatters
-    tools = detect_project_tools(project_path, tech_stack)
-
+    # Detected linters / formatters
     linters_found: List[str] = []
     if tools.get("check"):
         linters_found.append(tools["check"])
@@ -231,16 +267,14 @@ def _build_architecture_section(
 
 def _build_dev_guidelines_section(
     tech_stack: List[str],
-    python_deps: List[str],
-    project_path: Optional[Path],
+    tools: Dict[str, str],
     structure: Dict[str, Any],
-    project_type: str,
+    has_docker_files: bool = False,
 ) -> str:
     """Build development guidelines from detected tools and conventions."""
     lines: List[str] = []
 
     # Tools section
-    tools = detect_project_tools(project_path, tech_stack)
     if tools:
         lines.append("### Detected Tools")
         for purpose, cmd in tools.items():
@@ -256,11 +290,7 @@ def _build_dev_guidelines_section(
         lines.append("")
 
     # Docker
-    has_docker = "docker" in tech_stack
-    if project_path:
-        has_docker = has_docker or (project_path / "Dockerfile").exists()
-        has_docker = has_docker or (project_path / "docker-compose.yml").exists()
-        has_docker = has_docker or (project_path / "docker-compose.yaml").exists()
+    has_docker = "docker" in tech_stack or has_docker_files
 
     if has_docker:
         lines.append("### Containerization")
@@ -23,6 +23,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from generator.rules import append_mandatory_anti_patterns
+from generator.utils.fragment_cache import FragmentCache
 from generator.utils.readme_bridge import bridge_missing_context, is_readme_sufficient
 
 # ── Strategy Protocol ─────────────────────────────────────────────────────────
@@ -97,13 +98,14 @@ class _LegacyStrategy(_RulesStrategy):
         project_data: Optional[Dict[str, Any]] = None,
         config: Optional[Dict[str, Any]] = None,
         enhanced_context: Optional[Dict[str, Any]] = None,
+        fragment_cache: Optional[FragmentCache] = None,
         **_,
     ) -> Optional[str]:
         if project_data is None:
             return None
         cfg = config or {}
         if enhanced_context:
-            return _generate_enhanced_rules(project_data, cfg, enhanced_context)
+            return _generate_enhanced_rules(project_data, cfg, enhanced_context, fragment_cache=fragment_cache)
         return _generate_basic_rules(project_data, cfg)
 
 
@@ -188,15 +190,18 @@ class RulesGenerator:
         project_data: Dict[str, Any],
         config: Dict[str, Any],
         enhanced_context: Optional[Dict[str, Any]] = None,
+        fragment_cache: Optional[FragmentCache] = None,
     ) -> str:
         """
         Generate rules via the legacy enhanced-analysis path.
         Preserves full DO/DON'T/TESTING/WORKFLOWS/CONTEXT STRATEGY output.
+        With ``fragment_cache``, sections whose inputs are unchanged are reused.
         """
         result = self._legacy.generate(
             project_data=project_data,
             config=config,
             enhanced_context=enhanced_context,
+            fragment_cache=fragment_cache,
         )
         return result or self._stub.generate()
 
@@ -242,6 +247,7 @@ def generate_rules(
     project_data: Dict[str, Any],
     config: Dict[str, Any],
     enhanced_context: Optional[Dict[str, Any]] = None,
+    fragment_cache: Optional[FragmentCache] = None,
 ) -> str:
     """
     Backward-compatible entry point used by analyze_cmd.py.
@@ -249,7 +255,7 @@ def generate_rules(
     Delegates to RulesGenerator.generate_legacy() — zero behavior change.
     """
     generator = RulesGenerator()
-    return generator.generate_legacy(project_data, config, enhanced_context)
+    return generator.generate_legacy(project_data, config, enhanced_context, fragment_cache=fragment_cache)
 
 
 def rules_to_json(rules_md: str) -> str:
@@ -4,24 +4,43 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from generator.rules import append_mandatory_anti_patterns
 from generator.rules_sections.do_dont import _build_do_rules, _build_dont_rules
 from generator.rules_sections.structure import _build_context_strategy, _build_dep_section, _build_file_structure
 from generator.rules_sections.testing import _build_test_section
 from generator.rules_sections.workflows import _build_workflow_section
+from generator.utils.fragment_cache import Fragment, FragmentCache, assemble
 
 logger = logging.getLogger(__name__)
 
 
-def _generate_enhanced_rules(project_data: Dict[str, Any], config: Dict[str, Any], ctx: Dict[str, Any]) -> str:
-    """Generate rules grounded in actual project analysis."""
+def _generate_enhanced_rules(
+    project_data: Dict[str, Any],
+    config: Dict[str, Any],
+    ctx: Dict[str, Any],
+    fragment_cache: Optional[FragmentCache] = None,
+) -> str:
+    """Generate rules grounded in actual project analysis.
+
+    The file is assembled from ``enhanced_rules_fragments``; with a
+    ``fragment_cache`` only sections whose inputs changed are re-rendered.
+    """
+    inputs, fragments = enhanced_rules_fragments(project_data, config, ctx)
+    return assemble("rules.md", fragments, inputs, fragment_cache)
+
+
+def enhanced_rules_fragments(
+    project_data: Dict[str, Any], config: Dict[str, Any], ctx: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[Fragment]]:
+    """Return the fragment inputs and the ordered section fragments of the enhanced rules.md."""
     name = project_data["name"]
     max_desc = config.get("generation", {}).get("max_description_length", 200)
     description = project_data["description"][:max_desc]
     tech_stack = project_data["tech_stack"]
     tech_str = ", ".join(tech_stack) if tech_stack else "standard tools"
+    features = project_data.get("features", [])
 
     metadata = ctx.get("metadata", {})
     project_type = metadata.get("project_type", "unknown")
@@ -53,55 +72,16 @@ def _generate_enhanced_rules(project_data: Dict[str, Any], config: Dict[str, Any
                 break
 
     readme_data = ctx.get("readme", {})
-    installation = readme_data.get("installation", "")
-    usage = readme_data.get("usage", "")
-    troubleshooting = readme_data.get("troubleshooting", "")
-    raw_readme = readme_data.get("raw_readme", "")
-    _readme_conventions: list = []
-    if raw_readme:
-        try:
-            from generator.analyzers.readme_parser import extract_conventions
-
-            _readme_conventions = extract_conventions(raw_readme)
-        except Exception as e:  # noqa: BLE001 — optional enrichment; fallback to empty
-            logger.debug(f"Expected error: {e}")
-
-    arch_lines = []
-    if project_type != "unknown":
-        arch_lines.append(f"- **Project type**: {project_type}")
-    if entry_points:
-        arch_lines.append(f"- **Entry points**: {', '.join(entry_points)}")
-    if patterns:
-        arch_lines.append(f"- **Structural patterns**: {', '.join(patterns)}")
-    if languages:
-        arch_lines.append(f"- **Languages**: {', '.join(languages)}")
-    arch_section = "\n".join(arch_lines) if arch_lines else "- Standard project layout"
-
-    do_rules = _build_do_rules(tech_stack, python_deps, node_deps, project_type, test_framework, structure)
-    if _readme_conventions:
-        conv_md = "\n".join(f"- {c}" for c in _readme_conventions[:10])
-        do_rules += f"\n\n**README Conventions:**\n{conv_md}"
-    dont_rules = _build_dont_rules(tech_stack, python_deps, project_type, structure)
-
-    features = project_data.get("features", [])
-    # R1 fix: exclude port-number lines that the README scanner picks up from
-    # "Key Service Ports" tables (e.g. "**8642**: Hermes Gateway + API").
-    # A genuine priority step is never just a bold integer followed by a colon.
-    _port_re = re.compile(r"^\*{0,2}\d+\*{0,2}\s*:")
-    filtered_features = [f for f in features if not _port_re.match(f.strip())]
-    priorities = filtered_features[:7] if filtered_features else []
-    while len(priorities) < 3:
-        defaults = ["Code quality", "Test coverage", "Documentation clarity"]
-        priorities.append(defaults[len(priorities)])
 
-    test_section = _build_test_section(test_framework, test_files, test_info, python_deps, node_deps)
-    dep_section = _build_dep_section(python_deps, node_deps, missing_files)
-    file_structure = _build_file_structure(structure, entry_points, patterns)
-    workflow_section = _build_workflow_section(installation, usage, troubleshooting, test_framework, tech_stack)
-    context_strategy = _build_context_strategy(structure, entry_points, project_type, test_info)
-    priorities_str = "\n".join(f"{i + 1}. {p}" for i, p in enumerate(priorities))
+    inputs = {
+        "readme": {"name": name, "description": description, "features": features, "readme": readme_data},
+        "deps": {"tech_stack": tech_stack, "dependencies": deps},
+        "structure": {"metadata": metadata, "structure": structure},
+        "tests": test_info,
+    }
 
-    template = f"""---
+    def frontmatter() -> str:
+        return f"""---
 project: {name}
 purpose: Coding & contribution rules for this workspace
 version: 2.0
@@ -109,53 +89,95 @@ generated: auto
 project_type: {project_type}
 ---
 
-## CONTEXT
-
-{description}
-
-This project uses: {tech_str}
-
-## ARCHITECTURE
-
-{arch_section}
-
-## FILE STRUCTURE
-
-{file_structure}
-
-## DEPENDENCIES
-
-{dep_section}
-
-## DO (must follow)
-
-{do_rules}
-
-## DON'T
-
-{dont_rules}
-
-## TESTING
-
-{test_section}
-
-## PRIORITIES
-
-{priorities_str}
-
-## CONTEXT STRATEGY
-
-{context_strategy}
-
-## WORKFLOWS
-
-{workflow_section}
-
----
-_Generated by project-rules-generator (enhanced analysis)_
 """
-    framework_hint = "react" if tech_stack and "react" in tech_stack else ""
-    return append_mandatory_anti_patterns(template, framework_hint)
+
+    def architecture() -> str:
+        arch_lines = []
+        if project_type != "unknown":
+            arch_lines.append(f"- **Project type**: {project_type}")
+        if entry_points:
+            arch_lines.append(f"- **Entry points**: {', '.join(entry_points)}")
+        if patterns:
+            arch_lines.append(f"- **Structural patterns**: {', '.join(patterns)}")
+        if languages:
+            arch_lines.append(f"- **Languages**: {', '.join(languages)}")
+        return "\n".join(arch_lines) if arch_lines else "- Standard project layout"
+
+    def do_rules() -> str:
+        rules = _build_do_rules(tech_stack, python_deps, node_deps, project_type, test_framework, structure)
+        readme_conventions: list = []
+        raw_readme = readme_data.get("raw_readme", "")
+        if raw_readme:
+            try:
+                from generator.analyzers.readme_parser import extract_conventions
+
+                readme_conventions = extract_conventions(raw_readme)
+            except Exception as e:  # noqa: BLE001 — optional enrichment; fallback to empty
+                logger.debug(f"Expected error: {e}")
+        if readme_conventions:
+            conv_md = "\n".join(f"- {c}" for c in readme_conventions[:10])
+            rules += f"\n\n**README Conventions:**\n{conv_md}"
+        return rules
+
+    def priorities() -> str:
+        # R1 fix: exclude port-number lines that the README scanner picks up from
+        # "Key Service Ports" tables (e.g. "**8642**: Hermes Gateway + API").
+        # A genuine priority step is never just a bold integer followed by a colon.
+        _port_re = re.compile(r"^\*{0,2}\d+\*{0,2}\s*:")
+        filtered_features = [f for f in features if not _port_re.match(f.strip())]
+        items = filtered_features[:7] if filtered_features else []
+        while len(items) < 3:
+            defaults = ["Code quality", "Test coverage", "Documentation clarity"]
+            items.append(defaults[len(items)])
+        return "\n".join(f"{i + 1}. {p}" for i, p in enumerate(items))
+
+    def workflows() -> str:
+        return _build_workflow_section(
+            readme_data.get("installation", ""),
+            readme_data.get("usage", ""),
+            readme_data.get("troubleshooting", ""),
+            test_framework,
+            tech_stack,
+        )
+
+    def footer() -> str:
+        framework_hint = "react" if tech_stack and "react" in tech_stack else ""
+        return append_mandatory_anti_patterns(
+            "---\n_Generated by project-rules-generator (enhanced analysis)_\n", framework_hint
+        )
+
+    fragments = [
+        Fragment("frontmatter", ("readme", "structure"), frontmatter),
+        Fragment(
+            "context", ("readme", "deps"), lambda: f"## CONTEXT\n\n{description}\n\nThis project uses: {tech_str}\n\n"
+        ),
+        _section("ARCHITECTURE", ("structure",), architecture),
+        _section("FILE STRUCTURE", ("structure",), lambda: _build_file_structure(structure, entry_points, patterns)),
+        _section("DEPENDENCIES", ("deps",), lambda: _build_dep_section(python_deps, node_deps, missing_files)),
+        _section("DO (must follow)", ("readme", "deps", "structure", "tests"), do_rules),
+        _section(
+            "DON'T", ("deps", "structure"), lambda: _build_dont_rules(tech_stack, python_deps, project_type, structure)
+        ),
+        _section(
+            "TESTING",
+            ("deps", "tests"),
+            lambda: _build_test_section(test_framework, test_files, test_info, python_deps, node_deps),
+        ),
+        _section("PRIORITIES", ("readme",), priorities),
+        _section(
+            "CONTEXT STRATEGY",
+            ("structure", "tests"),
+            lambda: _build_context_strategy(structure, entry_points, project_type, test_info),
+        ),
+        _section("WORKFLOWS", ("readme", "deps", "tests"), workflows),
+        Fragment("footer", ("deps",), footer),
+    ]
+    return inputs, fragments
+
+
+def _section(heading: str, inputs: Tuple[str, ...], body: Callable[[], str]) -> Fragment:
+    """A ``## heading`` section fragment named after its heading."""
+    return Fragment(heading, inputs, lambda: f"## {heading}\n\n{body()}\n\n")
 
 
 def _generate_basic_rules(project_data: Dict[str, Any], config: Dict[str, Any]) -> str:
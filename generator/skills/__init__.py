@@ -12,6 +12,7 @@ when the submodule has been imported.
 from generator.skills import (  # noqa: F401 — re-exports for patch() target binding
     llm_skill_generator,
     manager,
+    skill_catalog,
     skill_content_renderer,
     skill_creator,
     skill_discovery,
@@ -20,6 +21,7 @@ from generator.skills import (  # noqa: F401 — re-exports for patch() target b
     skill_metadata_builder,
     skill_parser,
     skill_project_scanner,
+    skill_record,
     skill_templates,
     skill_tracker,
     tag_resolver,
@@ -6,6 +6,16 @@ from typing import Dict, List, Optional
 
 from generator.ai.factory import create_ai_client
 
+# Every complete SKILL.md has this section; a response without it was cut short.
+REQUIRED_SKILL_SECTION = "## Process"
+
+
+def is_complete_skill(text: str) -> bool:
+    """True when ``text`` reaches ``## Process`` and has no unfilled template placeholders."""
+    from generator.ai.hardening import contains_unfilled_placeholders
+
+    return bool(text) and REQUIRED_SKILL_SECTION in text and not contains_unfilled_placeholders(text)
+
 
 def _parse_python_deps_from_files(key_files: Dict[str, str]) -> List[str]:
     """Extract package names from requirements.txt or pyproject.toml content in key_files."""
@@ -161,8 +171,15 @@ class LLMSkillGenerator:
         # (e.g. "[One sentence: what problem does this solve]"). The repair
         # prompt tells the model explicitly not to keep bracketed guidance.
         from generator.ai.hardening import contains_unfilled_placeholders
+        from generator.ai.response_cache import cache_only_valid
+
+        def generate(text: str) -> str:
+            # Only complete skills go into the response cache, otherwise the
+            # retry (same prompt) and the next run would be served the same stub.
+            with cache_only_valid(is_complete_skill):
+                return self.generate_content(text, max_tokens=4000)
 
-        result = self.generate_content(prompt, max_tokens=4000)
+        result = generate(prompt)
 
         # Truncation detection: a valid SKILL.md must contain at least ## Process.
         # When it's absent the provider stopped early (safety filter, rate-limit,
@@ -170,10 +187,9 @@ class LLMSkillGenerator:
         # Purpose section. Retry once; if still truncated, return "" so the
         # strategy chain falls back to READMEStrategy / StubStrategy instead of
         # saving the broken file to disk.
-        _REQUIRED_SECTION = "## Process"
-        if result and _REQUIRED_SECTION not in result:
-            result = self.generate_content(prompt, max_tokens=4000)
-            if not result or _REQUIRED_SECTION not in result:
+        if result and REQUIRED_SKILL_SECTION not in result:
+            result = generate(prompt)
+            if not result or REQUIRED_SKILL_SECTION not in result:
                 return ""
 
         if contains_unfilled_placeholders(result):
@@ -185,7 +201,7 @@ class LLMSkillGenerator:
                 "content. Do NOT copy any bracketed hint from the template into the "
                 "final output."
             )
-            retried = self.generate_content(repair_prompt, max_tokens=4000)
+            retried = generate(repair_prompt)
             if retried and not contains_unfilled_placeholders(retried):
                 return retried
             # Keep the cleaner of the two — neither may be perfect, but the
@@ -1,10 +1,13 @@
 import re
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
 
+from generator.skills.skill_catalog import SkillCatalog, get_skill_catalog
 from generator.skills.skill_discovery import SkillDiscovery
 from generator.skills.skill_generator import SkillGenerator
 from generator.skills.skill_parser import SkillParser
+from generator.skills.skill_record import SkillRecord
 
 # Project types that have no JS/frontend stack.  Learned skills whose triggers
 # exclusively mention JS frameworks (jest, UI, React) are hidden for these types
@@ -24,6 +27,9 @@ _PYTHON_ONLY_PROJECT_TYPES: frozenset = frozenset(
     }
 )
 
+# Trigger precedence: later layers overwrite earlier ones on name collisions.
+_LAYERS = ("builtin", "learned", "project")
+
 # Trigger phrases that only make sense in a JS/frontend project.
 _JS_TRIGGER_RE = re.compile(
     r"\bjest\b|ui\s+change|react\s+component|angular|vue\s+component|\bdom\b|\.jsx?\b",
@@ -47,6 +53,13 @@ def _learned_skill_has_js_only_triggers(content: str) -> bool:
     )
 
 
+def _skill_fact(catalog: SkillCatalog, data: Dict[str, Any], kind: str, compute: Callable[[str], Any]) -> Any:
+    """``compute`` over a list_skills() entry: inline content if present, else the cataloged file."""
+    if data.get("content") or "path" not in data:
+        return compute(data.get("content", ""))
+    return catalog.get(data["path"], kind, compute)
+
+
 class SkillsManager:
     """
     Facade for skill management.
@@ -157,10 +170,15 @@ class SkillsManager:
         """Get full content of all skills for export (Project > Learned > Builtin)."""
         return self.discovery.get_all_skills_content()
 
+    def iter_skills(
+        self, layers: Iterable[str] = _LAYERS, include_only: Optional[Set[str]] = None
+    ) -> Iterator[SkillRecord]:
+        """Lazily yield resolved skills; see ``SkillDiscovery.iter_skills``."""
+        return self.discovery.iter_skills(layers, include_only=include_only)
+
     def extract_all_triggers(self) -> Dict[str, List[str]]:
         """Extract auto-trigger phrases from all skills."""
-        all_skills = self.discovery.get_all_skills_content()
-        return SkillParser.extract_all_triggers(all_skills)
+        return self._record_triggers(self.discovery.iter_skills(_LAYERS))
 
     def extract_project_triggers(self, include_only: Optional[Set[str]] = None) -> Dict[str, List[str]]:
         """Extract triggers from project and learned skills only.
@@ -174,26 +192,23 @@ class SkillsManager:
                           to include. If None, all learned skills are included.
                           Project-local skills are always included.
         """
-        all_skills = self.discovery.get_all_skills_content()
-
-        project_only = {}
-        # Always include project-local skills
-        if "project" in all_skills:
-            project_only["project"] = all_skills["project"]
-
-        # Filter learned skills by include_only if provided
-        if "learned" in all_skills:
-            if include_only is not None:
-                # Skill keys in all_skills['learned'] are the names, e.g. 'fastapi'
-                # include_only set contains refs, e.g. 'learned/fastapi'
-                learned_filtered = {
-                    name: data for name, data in all_skills["learned"].items() if f"learned/{name}" in include_only
-                }
-                project_only["learned"] = learned_filtered
-            else:
-                project_only["learned"] = all_skills["learned"]
-
-        return SkillParser.extract_all_triggers(project_only)
+        return self._record_triggers(self.discovery.iter_skills(("learned", "project"), include_only=include_only))
+
+    @staticmethod
+    def _record_triggers(records: Iterable[SkillRecord]) -> Dict[str, List[str]]:
+        """Triggers per skill name; records from later layers overwrite earlier ones.
+
+        Only each skill's header (frontmatter through ``## Auto-Trigger``) is
+        parsed, and only when the skill catalog has no current entry for it.
+        """
+        catalog = get_skill_catalog()
+        triggers: Dict[str, List[str]] = {}
+        for record in records:
+            conditions = catalog.get(record.path, "triggers", SkillParser.extract_triggers, header_only=True)
+            if conditions:
+                triggers[record.name] = list(conditions)
+        catalog.save()
+        return triggers
 
     def save_triggers_json(self, output_dir: Path, include_only: Optional[Set[str]] = None):
         """Save extracted triggers to .clinerules/auto-triggers.json
@@ -242,6 +257,7 @@ class SkillsManager:
 
         # 1. Get all skills
         all_skills = self.discovery.list_skills()
+        catalog = get_skill_catalog()
 
         # 2. Sort skills by type and then name for consistent output; apply exclusions
         # H4 fix: build a name-only lookup from include_only so that a skill
@@ -267,13 +283,7 @@ class SkillsManager:
             # specific (e.g. "jest", "ui change") in Python-only projects.
             # These leak from global caches populated by frontend projects.
             if _filter_js_triggers and skill_type == "learned":
-                content = data.get("content", "")
-                if not content and "path" in data:
-                    try:
-                        content = Path(data["path"]).read_text(encoding="utf-8")
-                    except OSError:
-                        content = ""
-                if _learned_skill_has_js_only_triggers(content):
+                if _skill_fact(catalog, data, "js_only", _learned_skill_has_js_only_triggers):
                     continue
             sorted_skills.append((name, data))
         sorted_skills.sort(key=lambda x: (x[1]["type"], x[0]))
@@ -307,16 +317,11 @@ class SkillsManager:
                 index_content.append("")
                 current_type = skill_type
 
-            # Parse content
-            content = data.get("content", "")
-            # If content is missing (failed load), try to read file
-            if not content and "path" in data:
-                try:
-                    content = Path(data["path"]).read_text(encoding="utf-8")
-                except OSError:
-                    continue
-
-            parsed = SkillParser.parse_skill_md(content, name)
+            # Parsed fields are cached per skill file (and per name, which
+            # feeds the default command) in the skill catalog.
+            parsed = _skill_fact(catalog, data, f"parsed:{name}", partial(SkillParser.parse_skill_md, filename=name))
+            if parsed is None:
+                continue
 
             # Format using Mandatory Template
             skill_block = [
@@ -339,5 +344,6 @@ class SkillsManager:
         output_path = self.discovery.project_skills_root / "index.md"
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text("\n".join(index_content), encoding="utf-8")
+        catalog.save()
 
         return output_path
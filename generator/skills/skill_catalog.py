@@ -0,0 +1,273 @@
+"""Persistent catalog of skill-layer listings and per-skill parsed facts.
+
+Every process used to rglob the builtin, learned and project skill roots, and
+``extract_project_triggers``, ``generate_perfect_index`` and the tag resolver
+each re-read and re-parsed the same skill files. ``SkillCatalog`` keeps both
+the directory listings and the facts derived from each skill file (triggers,
+parsed index fields, frontmatter tags) in ``~/.project-rules-generator/
+catalog.json`` so a warm run re-lists only directories whose mtime changed and
+re-reads only files whose ``(size, mtime_ns)`` changed.
+
+Staleness follows ``AnalysisCache``: a record is trusted on a stat match only
+when the mtime is older than the moment it was recorded by more than
+``RACY_WINDOW_NS``; otherwise the directory is re-listed, or the file's digest
+decides whether its facts are still valid. ``PRG_NO_SKILL_CATALOG=1`` keeps
+the catalog in memory for the process instead of persisting it.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from generator.skills.skill_record import read_skill_header
+from generator.utils.file_index import RACY_WINDOW_NS
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "catalog.json"
+SKILL_SUFFIXES = (".md", ".yaml", ".yml")
+_CATALOG_VERSION = 2
+
+
+class SkillCatalog:
+    """Cached skill-root listings plus per-file facts keyed by (size, mtime_ns).
+
+    ``path=None`` gives an in-memory catalog with the same semantics.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else None
+        # root -> {rel_dir: [mtime_ns, files, subdirs, recorded_ns]}
+        self._roots: Dict[str, Dict[str, List[Any]]] = {}
+        # absolute file path -> {"full"|"header": {size, mtime_ns, digest, recorded_ns, facts}}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.dirs_listed = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "SkillCatalog":
+        catalog = cls(path)
+        if not catalog.path or not catalog.path.exists():
+            return catalog
+        try:
+            data = json.loads(catalog.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Ignoring unreadable skill catalog %s: %s", path, exc)
+            return catalog
+        if data.get("version") == _CATALOG_VERSION:
+            if isinstance(data.get("roots"), dict):
+                catalog._roots = data["roots"]
+            if isinstance(data.get("files"), dict):
+                catalog._files = data["files"]
+        return catalog
+
+    # ------------------------------------------------------------------
+    # Directory listings
+    # ------------------------------------------------------------------
+
+    def scan(self, root: Path) -> List[str]:
+        """Return the skill files under ``root`` as forward-slash relative paths.
+
+        Matches ``root.rglob("*")`` filtered to ``SKILL_SUFFIXES``: directories
+        are visited pre-order in directory-listing order and symlinked
+        directories are not descended. Unchanged directories are served from
+        the catalog without being listed.
+        """
+        root_key = str(root)
+        with self._lock:
+            if not os.path.isdir(root_key):
+                if self._roots.pop(root_key, None) is not None:
+                    self._dirty = True
+                return []
+
+            known = self._roots.get(root_key, {})
+            dirs: Dict[str, List[Any]] = {}
+            found: List[str] = []
+            stack = [""]
+            while stack:
+                rel_dir = stack.pop()
+                abs_dir = os.path.join(root_key, rel_dir) if rel_dir else root_key
+                try:
+                    mtime_ns = os.stat(abs_dir).st_mtime_ns
+                except OSError:
+                    continue
+                record = known.get(rel_dir)
+                if record is None or record[0] != mtime_ns or mtime_ns >= record[3] - RACY_WINDOW_NS:
+                    files, subdirs = self._list_dir(abs_dir)
+                    record = [mtime_ns, files, subdirs, time.time_ns()]
+                    self.dirs_listed += 1
+                    self._dirty = True
+                dirs[rel_dir] = record
+                prefix = f"{rel_dir}/" if rel_dir else ""
+                found.extend(prefix + name for name in record[1])
+                stack.extend(prefix + name for name in reversed(record[2]))
+
+            if dirs.keys() != known.keys():
+                self._dirty = True
+            self._roots[root_key] = dirs
+            return found
+
+    @staticmethod
+    def _list_dir(abs_dir: str) -> Tuple[List[str], List[str]]:
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.name)
+                        elif os.path.splitext(entry.name)[1] in SKILL_SUFFIXES and entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return files, subdirs
+
+    # ------------------------------------------------------------------
+    # Per-file facts
+    # ------------------------------------------------------------------
+
+    def get(self, path: Path, kind: str, compute: Callable[[str], Any], header_only: bool = False) -> Optional[Any]:
+        """Return the cached ``kind`` fact for the skill file at ``path``.
+
+        ``compute`` receives the file's text (UTF-8, errors replaced) and must
+        return a JSON-serialisable value. With ``header_only`` it receives
+        only ``read_skill_header()`` — frontmatter through the trigger section
+        — and the fact is validated against that part alone. Returns ``None``
+        for a missing or unreadable file.
+        """
+        key = str(path)
+        view = "header" if header_only else "full"
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+
+        with self._lock:
+            record = self._files.get(key, {}).get(view)
+            if (
+                record is not None
+                and kind in record["facts"]
+                and record.get("size") == st.st_size
+                and record.get("mtime_ns") == st.st_mtime_ns
+                and st.st_mtime_ns < record.get("recorded_ns", 0) - RACY_WINDOW_NS
+            ):
+                self.hits += 1
+                return record["facts"][kind]
+
+        try:
+            text = (
+                read_skill_header(Path(key)) if header_only else Path(key).read_text(encoding="utf-8", errors="replace")
+            )
+        except OSError:
+            return None
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+        with self._lock:
+            views = self._files.setdefault(key, {})
+            record = views.get(view)
+            if record is None or record.get("digest") != digest:
+                record = {"facts": {}}
+                views[view] = record
+            record.update(size=st.st_size, mtime_ns=st.st_mtime_ns, digest=digest, recorded_ns=time.time_ns())
+            self._dirty = True
+            if kind in record["facts"]:
+                self.hits += 1
+                return record["facts"][kind]
+            self.misses += 1
+
+        value = compute(text)
+        with self._lock:
+            record["facts"][kind] = value
+        return value
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "dirs_listed": self.dirs_listed,
+            "files": len(self._files),
+        }
+
+    def save(self) -> None:
+        """Write the catalog (no-op when in-memory or unchanged).
+
+        Roots that no longer exist are dropped, and so are file records that
+        are neither listed under a known root nor still on disk.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            self._roots = {root: dirs for root, dirs in self._roots.items() if os.path.isdir(root)}
+            listed: Set[str] = set()
+            for root, dirs in self._roots.items():
+                for rel_dir, record in dirs.items():
+                    base = os.path.join(root, rel_dir) if rel_dir else root
+                    listed.update(os.path.join(base, name) for name in record[1])
+            self._files = {key: record for key, record in self._files.items() if key in listed or os.path.exists(key)}
+            payload = json.dumps({"version": _CATALOG_VERSION, "roots": self._roots, "files": self._files})
+            self._dirty = False
+
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            logger.debug("Could not write skill catalog %s: %s", self.path, exc)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+# ----------------------------------------------------------------------
+# Process-wide catalog
+# ----------------------------------------------------------------------
+
+_catalogs: Dict[str, SkillCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def skill_catalog_enabled() -> bool:
+    return os.getenv("PRG_NO_SKILL_CATALOG", "").strip().lower() not in ("1", "true", "yes")
+
+
+def get_skill_catalog() -> SkillCatalog:
+    """Return the catalog for the current ``SkillPathManager.GLOBAL_DIR``.
+
+    Loaded once per process and saved again at exit if anything changed.
+    """
+    from generator.storage.skill_paths import SkillPathManager
+
+    global_dir = SkillPathManager.GLOBAL_DIR
+    with _catalogs_lock:
+        catalog = _catalogs.get(str(global_dir))
+        if catalog is None:
+            if skill_catalog_enabled():
+                catalog = SkillCatalog.load(global_dir / CATALOG_FILENAME)
+                atexit.register(catalog.save)
+            else:
+                catalog = SkillCatalog()
+            _catalogs[str(global_dir)] = catalog
+        return catalog
@@ -3,8 +3,10 @@ import os
 import re
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 
+from generator.skills.skill_catalog import get_skill_catalog
+from generator.skills.skill_record import SkillRecord
 from generator.storage.skill_paths import SkillPathManager
 
 logger = logging.getLogger(__name__)
@@ -93,25 +95,23 @@ class SkillDiscovery:
         if hasattr(self, "_layer_skills_cache"):
             del self._layer_skills_cache
 
-        def _scan(root: Path):
-            if not root or not root.exists():
-                return {"by_rel": {}, "by_name": {}}
+        catalog = get_skill_catalog()
 
+        def _scan(root: Path):
             idx: Dict[str, Dict[str, Path]] = {
                 "by_rel": {},  # "math/add.md" -> Path (always forward slashes)
                 "by_name": {},  # "add.md" -> Path (first found)
             }
-            try:
-                # Use a single pass over the directory tree
-                for p in root.rglob("*"):
-                    if p.is_file() and p.suffix in [".md", ".yaml", ".yml"]:
-                        # Normalize to forward slashes for cross-platform consistency
-                        rel = p.relative_to(root).as_posix()
-                        idx["by_rel"][rel] = p
-                        if p.name not in idx["by_name"]:
-                            idx["by_name"][p.name] = p
-            except (PermissionError, OSError):
-                pass
+            if not root:
+                return idx
+            # Listings come from the skill catalog, which re-lists only
+            # directories whose mtime changed since the last run.
+            for rel in catalog.scan(root):
+                p = root / rel
+                idx["by_rel"][rel] = p
+                name = rel.rsplit("/", 1)[-1]
+                if name not in idx["by_name"]:
+                    idx["by_name"][name] = p
             return idx
 
         def _merge_scans(*roots: Optional[Path]):
@@ -130,6 +130,7 @@ class SkillDiscovery:
         self._skills_cache["learned"] = _merge_scans(self.project_learned_link, self.global_learned)
         if self.project_local_dir:
             self._skills_cache["project"] = _scan(self.project_local_dir)
+        catalog.save()
 
     def invalidate_cache(self) -> None:
         """Reset the skills cache so the next lookup rebuilds it from disk.
@@ -259,26 +260,17 @@ class SkillDiscovery:
         # Priority matching _resolve_path: .md > .yaml > .yml > SKILL.md
         priority = {".md": 4, ".yaml": 3, ".yml": 2, "SKILL.md": 1}
 
-        # Replicate _scan_directory's stop-at-SKILL.md recursive logic
+        # Replicate _scan_directory's stop-at-SKILL.md recursive logic: a
+        # directory holding SKILL.md is one skill, so nothing else beneath it
+        # (references/, nested SKILL.md) is. A SKILL.md at the layer root
+        # hides nothing.
         rel_paths = sorted(idx["by_rel"].keys())
-        skill_dirs = set()
-        for rel in rel_paths:
-            if rel == "SKILL.md" or rel.endswith("/SKILL.md"):
-                sd = "" if rel == "SKILL.md" else rel[:-9]
-                skill_dirs.add(sd)
+        skill_dirs = {rel[:-9] for rel in rel_paths if rel.endswith("/SKILL.md")}
 
         for rel in rel_paths:
             path = idx["by_rel"][rel]
 
-            # Check if this path is inside a skill directory (and not the SKILL.md itself)
-            is_inside_skill_dir = False
-            for sd in skill_dirs:
-                if sd == "":
-                    continue  # SKILL.md in root doesn't hide anything
-                if rel.startswith(f"{sd}/") and rel != f"{sd}/SKILL.md":
-                    is_inside_skill_dir = True
-                    break
-            if is_inside_skill_dir:
+            if skill_dirs and self._inside_skill_dir(rel, skill_dirs):
                 continue
 
             # Skill name logic matches split("/")[-1] from list_skills
@@ -301,6 +293,23 @@ class SkillDiscovery:
         self._layer_skills_cache[layer] = skills
         return skills
 
+    @staticmethod
+    def _inside_skill_dir(rel: str, skill_dirs: Set[str]) -> bool:
+        """True when an ancestor directory of ``rel`` is a skill directory.
+
+        Looks up each ancestor prefix in the ``skill_dirs`` set, so the cost is
+        the path depth rather than the number of skill directories. The
+        SKILL.md that defines a skill directory is not inside it.
+        """
+        own_dir = rel[:-9] if rel.endswith("/SKILL.md") else None
+        pos = rel.find("/")
+        while pos != -1:
+            ancestor = rel[:pos]
+            if ancestor != own_dir and ancestor in skill_dirs:
+                return True
+            pos = rel.find("/", pos + 1)
+        return False
+
     def resolve_skill(self, skill_name: str) -> Optional[Path]:
         """Find the active skill file based on priority."""
         if self._skills_cache is None:
@@ -397,23 +406,40 @@ class SkillDiscovery:
                     return True
         return False
 
+    def iter_skills(
+        self,
+        layers: Iterable[str] = ("builtin", "learned", "project"),
+        include_only: Optional[Set[str]] = None,
+    ) -> Iterator[SkillRecord]:
+        """Yield a ``SkillRecord`` per resolved skill in ``layers``, in that order.
+
+        No skill file is opened; records read their content on demand.
+        ``include_only`` is a set of refs such as ``{"learned/fastapi"}``: it
+        filters the builtin and learned layers before anything is read, while
+        project-local skills are always yielded.
+        """
+        for layer in layers:
+            for name, path in self._get_layer_skills(layer).items():
+                record = SkillRecord(name, layer, path)
+                if include_only is not None and layer != "project" and record.ref not in include_only:
+                    continue
+                yield record
+
     def get_all_skills_content(self) -> Dict[str, Dict]:
-        """Get full content of all skills for export (Project > Learned > Builtin)."""
-        if self._skills_cache is None:
-            self._build_cache()
+        """Get full content of all skills for export (Project > Learned > Builtin).
 
+        Holds every skill's text at once; callers that only need some skills,
+        or only their triggers, should use ``iter_skills`` instead.
+        """
         skills_content: Dict[str, Dict[str, Any]] = {"project": {}, "learned": {}, "builtin": {}}
-
-        for category in ["builtin", "learned", "project"]:
-            layer_skills = self._get_layer_skills(category)
-            for name, path in layer_skills.items():
-                try:
-                    content = path.read_text(encoding="utf-8", errors="replace")
-                    skills_content[category][name] = {
-                        "path": str(path),
-                        "content": content,
-                    }
-                except OSError:
-                    continue
+        for record in self.iter_skills():
+            try:
+                content = record.read()
+            except OSError:
+                continue
+            skills_content[record.layer][record.name] = {
+                "path": str(record.path),
+                "content": content,
+            }
 
         return skills_content
@@ -11,6 +11,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from generator.utils.file_index import get_file_index
+
 
 class SkillDocLoader:
     """Discovers and loads project docs for LLM context."""
@@ -95,8 +97,6 @@ class SkillDocLoader:
         candidates.sort(key=lambda p: (-self._score_doc(p, ""), p.name))
         return candidates
 
-    _USAGE_SKIP_DIRS = {".venv", "venv", "site-packages", "__pycache__", ".git", "node_modules"}
-
     def load_key_files(self, skill_name: str) -> Dict[str, str]:
         """Load actual key project files to ground the LLM in real project content.
 
@@ -159,10 +159,10 @@ class SkillDocLoader:
 
         scored: List[Tuple[float, Path]] = []
         try:
-            for py_file in self.project_path.rglob("*.py"):
+            # The shared index never enters venvs, node_modules or ignored trees.
+            for entry in get_file_index(self.project_path).by_suffix(".py"):
+                py_file = entry.path
                 rel = str(py_file.relative_to(self.project_path))
-                if any(skip in rel for skip in self._USAGE_SKIP_DIRS):
-                    continue
                 if rel in key_files:
                     continue
                 try:
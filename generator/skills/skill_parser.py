@@ -107,6 +107,39 @@ class SkillParser:
 
         return "\n".join(guidelines[:8])
 
+    @staticmethod
+    def extract_triggers(content: str) -> List[str]:
+        """Extract the auto-trigger phrases from one skill's ``## Auto-Trigger`` section."""
+        match = re.search(r"## Auto-Trigger\n(.*?)(?:\n## |\Z)", content, re.DOTALL)
+        if not match:
+            return []
+        conditions: List[str] = []
+        for line in match.group(1).split("\n"):
+            line = line.strip()
+            if not line.startswith("-"):
+                continue
+
+            # Clean line
+            clean_line = line.strip("- ").strip().lower()
+
+            # improved parsing: extract phrases in quotes
+            quoted_phrases = re.findall(r'"([^"]*)"', clean_line)
+            if quoted_phrases:
+                conditions.extend(quoted_phrases)
+            else:
+                # If no quotes, use the whole line but remove common prefixes
+                for prefix in [
+                    "user says:",
+                    "user reports:",
+                    "when ",
+                    "before ",
+                    "after ",
+                ]:
+                    if clean_line.startswith(prefix):
+                        clean_line = clean_line[len(prefix) :].strip()
+                conditions.append(clean_line)
+        return conditions
+
     @staticmethod
     def extract_all_triggers(
         all_skills_content: Dict[str, Dict],
@@ -123,40 +156,9 @@ class SkillParser:
                 continue
 
             for skill_name, skill_data in all_skills_content[category].items():
-                content = skill_data["content"]
-
-                # Match "## Auto-Trigger" section
-                match = re.search(r"## Auto-Trigger\n(.*?)(?:\n## |\Z)", content, re.DOTALL)
-                if match:
-                    trigger_text = match.group(1)
-                    conditions = []
-                    for line in trigger_text.split("\n"):
-                        line = line.strip()
-                        if not line.startswith("-"):
-                            continue
-
-                        # Clean line
-                        clean_line = line.strip("- ").strip().lower()
-
-                        # improved parsing: extract phrases in quotes
-                        quoted_phrases = re.findall(r'"([^"]*)"', clean_line)
-                        if quoted_phrases:
-                            conditions.extend(quoted_phrases)
-                        else:
-                            # If no quotes, use the whole line but remove common prefixes
-                            for prefix in [
-                                "user says:",
-                                "user reports:",
-                                "when ",
-                                "before ",
-                                "after ",
-                            ]:
-                                if clean_line.startswith(prefix):
-                                    clean_line = clean_line[len(prefix) :].strip()
-                            conditions.append(clean_line)
-
-                    if conditions:
-                        triggers[skill_name] = conditions
+                conditions = SkillParser.extract_triggers(skill_data["content"])
+                if conditions:
+                    triggers[skill_name] = conditions
 
         return triggers
 
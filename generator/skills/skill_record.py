@@ -0,0 +1,57 @@
+"""Lazy handles on resolved skills.
+
+``SkillDiscovery.iter_skills`` yields one ``SkillRecord`` per resolved skill
+without touching the file; callers read the full text with ``read()`` or
+just the part trigger and tag extraction need with ``read_header()``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+_TRIGGER_HEADING = "## Auto-Trigger\n"
+
+
+def read_skill_header(path: Path) -> str:
+    """Read a skill file up to the end of its ``## Auto-Trigger`` section.
+
+    The result holds the frontmatter, the preamble and the trigger section,
+    which is everything ``SkillParser.extract_triggers`` and the tag resolver
+    look at. Reading stops at the first ``## `` heading after the trigger
+    section; a file without one is read to the end.
+    """
+    lines = []
+    in_triggers = False
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            if in_triggers and line.startswith("## "):
+                break
+            lines.append(line)
+            if line.endswith(_TRIGGER_HEADING):
+                in_triggers = True
+    return "".join(lines)
+
+
+class SkillRecord:
+    """One resolved skill: its name, layer and file, with content read on demand."""
+
+    __slots__ = ("name", "layer", "path")
+
+    def __init__(self, name: str, layer: str, path: Path):
+        self.name = name
+        self.layer = layer
+        self.path = path
+
+    @property
+    def ref(self) -> str:
+        """``<layer>/<name>``, the form used by ``include_only`` sets."""
+        return f"{self.layer}/{self.name}"
+
+    def read(self) -> str:
+        return self.path.read_text(encoding="utf-8", errors="replace")
+
+    def read_header(self) -> str:
+        return read_skill_header(self.path)
+
+    def __repr__(self) -> str:
+        return f"SkillRecord({self.ref!r}, {str(self.path)!r})"
@@ -1,7 +1,8 @@
-"""Skill usage tracker — persists match counts and feedback scores to JSON."""
+"""Skill usage tracker — persists match counts and feedback scores as an event log plus a JSON snapshot."""
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
@@ -11,15 +12,22 @@ import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Minimum feedback events before a skill can be flagged as low-scoring.
 MIN_FEEDBACK_FOR_FLAG = 3
 
+# Buffered matches per append for the process-wide tracker.
+FLUSH_EVERY = 20
+# Event-log size that triggers folding it into the JSON snapshot.
+COMPACT_BYTES = 256 * 1024
+
 _DATA_DIR = Path.home() / ".project-rules-generator"
 _DEFAULT_PATH = _DATA_DIR / "skill-usage.json"
+# Snapshot key recording [st_dev, st_ino, offset] of the log prefix it folded.
+_FOLDED_KEY = "__folded_log__"
 
 
 # ---------------------------------------------------------------------------
@@ -108,16 +116,26 @@ def _file_lock(lock_path: Path, *, timeout: float = 5.0) -> Iterator[None]:
 class SkillTracker:
     """Thread-safe, multi-process-safe skill usage tracker.
 
-    Data is stored in ~/.project-rules-generator/skill-usage.json so it
-    accumulates across projects and survives skill regeneration.
+    Data lives beside ~/.project-rules-generator/skill-usage.json so it
+    accumulates across projects and survives skill regeneration. Each match or
+    vote is an event appended to ``skill-usage.events.jsonl``; the JSON file
+    is a compacted snapshot that the log is folded into once it grows past
+    ``COMPACT_BYTES``. Current stats are the snapshot plus the log.
 
     Concurrency guarantees:
 
     * Within a single process: a ``threading.Lock`` serialises mutations.
-    * Across processes: a sidecar ``.lock`` file is held exclusively for the
-      duration of each read-modify-write sequence, and writes go to a temp
-      file renamed into place atomically. Two concurrent ``prg agent``
-      invocations cannot clobber each other or produce a torn JSON file.
+    * Across processes: a sidecar ``.lock`` file is held while events are
+      appended and while the log is compacted. Appends are O(events), not
+      O(tracked skills), and compaction writes the snapshot to a temp file
+      renamed into place before swapping in a fresh log, so readers never see
+      a torn file. The snapshot records which log prefix it folded, so a
+      compaction interrupted before the swap never counts an event twice.
+
+    Matches are buffered and appended every ``flush_every`` events (and by
+    ``flush()``); ``get_skill_tracker()`` returns a process-wide buffered
+    instance that is flushed at exit. Feedback votes are appended at once so
+    the returned score includes other processes' votes.
 
     Schema per entry:
         {
@@ -129,11 +147,17 @@ class SkillTracker:
         }
     """
 
-    def __init__(self, data_path: Optional[Path] = None):
+    def __init__(self, data_path: Optional[Path] = None, flush_every: int = 1):
         self._path = Path(data_path) if data_path else _DEFAULT_PATH
         self._lock_path = self._path.with_suffix(self._path.suffix + ".lock")
+        self._log_path = self._path.with_name(self._path.stem + ".events.jsonl")
+        self._flush_every = max(1, flush_every)
         self._lock = threading.Lock()
         self._data: Dict[str, dict] = {}
+        self._pending: List[dict] = []
+        # (st_dev, st_ino) of the log and how far into it _data has applied.
+        self._log_id: Optional[Tuple[int, int]] = None
+        self._log_offset = 0
         self._load()
 
     # ------------------------------------------------------------------
@@ -142,25 +166,30 @@ class SkillTracker:
 
     def record_match(self, skill_name: str) -> None:
         """Increment the match counter for *skill_name* and update last_used."""
-        with self._lock, _file_lock(self._lock_path):
-            self._reload_from_disk()
-            entry = self._entry(skill_name)
-            entry["match_count"] += 1
-            entry["last_used"] = datetime.now(timezone.utc).isoformat()
-            self._save()
+        with self._lock:
+            self._record(skill_name, "match")
+            if len(self._pending) >= self._flush_every:
+                self._flush_locked()
 
     def record_feedback(self, skill_name: str, useful: bool) -> float:
         """Record a useful / not-useful vote and return the updated score."""
-        with self._lock, _file_lock(self._lock_path):
-            self._reload_from_disk()
-            entry = self._entry(skill_name)
-            if useful:
-                entry["useful_count"] += 1
-            else:
-                entry["not_useful_count"] += 1
-            entry["score"] = self._calc_score(entry)
-            self._save()
-            return entry["score"]
+        with self._lock:
+            self._record(skill_name, "useful" if useful else "not_useful")
+            self._flush_locked()
+            return self._data[skill_name]["score"]
+
+    def flush(self) -> None:
+        """Append buffered events to the log."""
+        with self._lock:
+            self._flush_locked()
+
+    def compact(self) -> None:
+        """Flush, then fold the event log into the JSON snapshot."""
+        with self._lock:
+            self._flush_locked()
+            with _file_lock(self._lock_path):
+                self._refresh()
+                self._compact_locked()
 
     def get_score(self, skill_name: str) -> float:
         """Return the current score for *skill_name* (default 0.5 when unknown)."""
@@ -213,33 +242,143 @@ class SkillTracker:
             return 0.5
         return entry.get("useful_count", 0) / total
 
-    def _load(self) -> None:
-        """Initial load — no file lock (constructor path)."""
-        self._data = self._read_from_disk()
+    def _record(self, skill_name: str, kind: str) -> None:
+        event = {"skill": skill_name, "event": kind, "ts": datetime.now(timezone.utc).isoformat()}
+        self._apply(event)
+        self._pending.append(event)
+
+    def _apply(self, event: dict) -> None:
+        skill, kind = event.get("skill"), event.get("event")
+        if not isinstance(skill, str):
+            return
+        entry = self._entry(skill)
+        if kind == "match":
+            entry["match_count"] += 1
+            ts = event.get("ts")
+            if entry["last_used"] is None or (ts and ts > entry["last_used"]):
+                entry["last_used"] = ts
+        elif kind in ("useful", "not_useful"):
+            entry[f"{kind}_count"] += 1
+            entry["score"] = self._calc_score(entry)
 
-    def _reload_from_disk(self) -> None:
-        """Re-read the JSON file inside a held lock so concurrent writers
-        from other processes don't get clobbered by our pending mutation."""
-        self._data = self._read_from_disk()
+    def _load(self) -> None:
+        """Initial load. Takes the file lock only if there is anything to read,
+        so constructing a tracker never creates files."""
+        if not self._path.exists() and not self._log_path.exists():
+            return
+        with _file_lock(self._lock_path):
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """Apply events other processes appended since the last refresh.
+
+        Must run under the file lock. A replaced log (compaction) or a log
+        shorter than what was already applied means a full reload of the
+        snapshot plus the log, with this tracker's unflushed events
+        re-applied on top.
+        """
+        try:
+            st = os.stat(self._log_path)
+            log_id: Optional[Tuple[int, int]] = (st.st_dev, st.st_ino)
+            size = st.st_size
+        except OSError:
+            log_id, size = None, 0
+
+        if log_id is None or log_id != self._log_id or size < self._log_offset:
+            self._data, folded = self._read_from_disk()
+            self._log_id, self._log_offset = log_id, 0
+            # The snapshot already holds this log's prefix if the compaction
+            # that wrote it died before swapping in a fresh log.
+            if folded is not None and folded[:2] == log_id and folded[2] <= size:
+                self._log_offset = folded[2]
+            self._read_log()
+            for event in self._pending:
+                self._apply(event)
+        elif size > self._log_offset:
+            self._read_log()
+
+    def _read_log(self) -> None:
+        """Apply complete log lines past ``_log_offset`` and advance it."""
+        if self._log_id is None:
+            return
+        try:
+            with open(self._log_path, "rb") as fh:
+                fh.seek(self._log_offset)
+                chunk = fh.read()
+        except OSError as exc:
+            logger.warning("Could not read skill usage log %s: %s", self._log_path, exc)
+            return
+        # A writer that died mid-line leaves a partial tail; leave it unread.
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict):
+                self._apply(event)
+        self._log_offset += end
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        payload = "".join(json.dumps(event) + "\n" for event in self._pending).encode("utf-8")
+        with _file_lock(self._lock_path):
+            self._refresh()
+            try:
+                with open(self._log_path, "ab") as fh:
+                    fh.write(payload)
+                st = os.stat(self._log_path)
+            except OSError as exc:
+                logger.warning("Could not save skill usage data to %s: %s", self._log_path, exc)
+                return
+            # Our own events are already in _data; skip past them.
+            self._log_id, self._log_offset = (st.st_dev, st.st_ino), st.st_size
+            self._pending.clear()
+            if self._log_offset >= COMPACT_BYTES:
+                self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Write the snapshot, then swap in an empty log (file lock held, nothing pending)."""
+        if self._log_id is None or not self._save():
+            return
+        tmp_path = self._log_path.with_suffix(self._log_path.suffix + f".tmp.{os.getpid()}")
+        try:
+            tmp_path.write_bytes(b"")
+            os.replace(tmp_path, self._log_path)
+            st = os.stat(self._log_path)
+        except OSError as exc:
+            logger.warning("Could not compact skill usage log %s: %s", self._log_path, exc)
+            return
+        self._log_id, self._log_offset = (st.st_dev, st.st_ino), 0
 
-    def _read_from_disk(self) -> Dict[str, dict]:
+    def _read_from_disk(self) -> Tuple[Dict[str, dict], Optional[Tuple[int, int, int]]]:
+        """Return the snapshot's stats and the (st_dev, st_ino, offset) of the log it folded."""
         if not self._path.exists():
-            return {}
+            return {}, None
         try:
             raw = self._path.read_text(encoding="utf-8")
             if not raw.strip():
-                return {}
+                return {}, None
             parsed = json.loads(raw)
-            return parsed if isinstance(parsed, dict) else {}
         except (OSError, ValueError) as exc:
             logger.warning("Could not load skill usage data from %s: %s", self._path, exc)
-            return {}
-
-    def _save(self) -> None:
-        """Atomic write via same-directory temp file + os.replace."""
+            return {}, None
+        if not isinstance(parsed, dict):
+            return {}, None
+        marker = parsed.pop(_FOLDED_KEY, None)
+        if isinstance(marker, list) and len(marker) == 3 and all(isinstance(n, int) for n in marker):
+            return parsed, (marker[0], marker[1], marker[2])
+        return parsed, None
+
+    def _save(self) -> bool:
+        """Atomic snapshot write via same-directory temp file + os.replace."""
         try:
             self._path.parent.mkdir(parents=True, exist_ok=True)
-            payload = json.dumps(self._data, indent=2)
+            snapshot: Dict[str, object] = dict(self._data)
+            if self._log_id is not None:
+                snapshot[_FOLDED_KEY] = [*self._log_id, self._log_offset]
+            payload = json.dumps(snapshot, indent=2)
             tmp_path = self._path.with_suffix(self._path.suffix + f".tmp.{os.getpid()}")
             try:
                 tmp_path.write_text(payload, encoding="utf-8")
@@ -252,3 +391,29 @@ class SkillTracker:
                 raise
         except OSError as exc:
             logger.warning("Could not save skill usage data to %s: %s", self._path, exc)
+            return False
+        return True
+
+
+# ---------------------------------------------------------------------------
+# Process-wide tracker
+# ---------------------------------------------------------------------------
+
+_trackers: Dict[Path, SkillTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_skill_tracker() -> SkillTracker:
+    """Return the buffered process-wide tracker for the default data path.
+
+    Matches are appended every ``FLUSH_EVERY`` events and at interpreter exit,
+    so hot paths (``prg agent``, Ralph iterations) no longer pay a locked file
+    write per match.
+    """
+    with _trackers_lock:
+        tracker = _trackers.get(_DEFAULT_PATH)
+        if tracker is None:
+            tracker = SkillTracker(_DEFAULT_PATH, flush_every=FLUSH_EVERY)
+            atexit.register(tracker.flush)
+            _trackers[_DEFAULT_PATH] = tracker
+        return tracker
@@ -19,7 +19,9 @@ Caching
 File reads are cached per-process via ``functools.lru_cache`` on the
 inner reader. Repeated resolves of the same ref during one ``prg
 analyze`` run hit the cache, so the filter adds negligible overhead
-even when iterating over 50+ skill refs.
+even when iterating over 50+ skill refs. Across runs the parsed tags
+live in the skill catalog (``generator.skills.skill_catalog``), so a
+file is only re-read once its size or mtime changes.
 """
 
 from __future__ import annotations
@@ -28,7 +30,7 @@ import logging
 import re
 from functools import lru_cache
 from pathlib import Path
-from typing import Callable, FrozenSet, Iterable, Optional
+from typing import Callable, FrozenSet, Iterable, List, Optional
 
 import yaml
 
@@ -52,43 +54,50 @@ def _tags_from_file(path_str: str) -> FrozenSet[str]:
     Returns ``frozenset()`` for any failure: missing file, malformed
     frontmatter, no `tags` key, tags value that isn't a list. The caller
     treats empty-set as "tags unknown" (conservative keep by default).
+    The parsed tags are also kept in the skill catalog, so a later process
+    only re-reads the file when it changed.
     """
+    from generator.skills.skill_catalog import get_skill_catalog
+
     path = Path(path_str)
     if not path.exists() or not path.is_file():
         return frozenset()
 
-    try:
-        content = path.read_text(encoding="utf-8", errors="replace")
-    except OSError as exc:
-        logger.debug("skill_tag_resolver: cannot read %s: %s", path, exc)
+    tags = get_skill_catalog().get(path, "tags", _tags_from_text, header_only=True)
+    if tags is None:
+        logger.debug("skill_tag_resolver: cannot read %s", path)
         return frozenset()
+    return frozenset(tags)
+
 
+def _tags_from_text(content: str) -> List[str]:
+    """Lower-cased frontmatter ``tags`` of one skill file, sorted for stable caching."""
     # Try YAML frontmatter first (markdown files)
     fm_match = _FRONTMATTER_RE.match(content)
     if fm_match:
         try:
             fm = yaml.safe_load(fm_match.group(1)) or {}
         except yaml.YAMLError as exc:
-            logger.debug("skill_tag_resolver: bad frontmatter in %s: %s", path, exc)
+            logger.debug("skill_tag_resolver: bad frontmatter: %s", exc)
             fm = {}
     else:
         # Maybe a pure YAML file? Try the whole content.
         try:
             fm = yaml.safe_load(content) or {}
-            if not isinstance(fm, dict):
-                fm = {}
         except yaml.YAMLError:
             fm = {}
+    if not isinstance(fm, dict):
+        fm = {}
 
     tags_raw = fm.get("tags", [])
     if not isinstance(tags_raw, Iterable) or isinstance(tags_raw, (str, bytes)):
-        return frozenset()
+        return []
 
     out = set()
     for t in tags_raw:
         if isinstance(t, str) and t.strip():
             out.add(t.strip().lower())
-    return frozenset(out)
+    return sorted(out)
 
 
 def clear_tag_cache() -> None:
@@ -4,7 +4,7 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from generator.base_generator import ArtifactGenerator
 from generator.tasks.subtask_model import SubTask
@@ -15,7 +15,13 @@ logger = logging.getLogger(__name__)
 class TaskDecomposer(ArtifactGenerator):
     """Break a high-level task into subtasks using an AI model."""
 
-    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None, provider: str = "gemini"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_name: Optional[str] = None,
+        provider: str = "gemini",
+        on_progress: Optional[Callable[[int], None]] = None,
+    ):
         # Normalise None → "gemini" so provider.upper() never crashes
         self.provider = provider or "gemini"
         self.api_key: Optional[str]
@@ -27,6 +33,8 @@ class TaskDecomposer(ArtifactGenerator):
         else:
             self.api_key = os.getenv(f"{self.provider.upper()}_API_KEY")
         self.model_name = model_name
+        # Receives the characters received so far while a response streams.
+        self.on_progress = on_progress
         # True after a decompose/from_design call when the LLM produced no usable
         # output (missing key, auth failure, empty/invalid response) and a
         # deterministic fallback plan was used instead. Callers inspect this to
@@ -389,10 +397,10 @@ Generate the subtasks now:
             self.llm_used_fallback = True
             return ""
         try:
-            from generator.ai.factory import create_ai_client
             from generator.ai.hardening import generate_with_validator, require_min_count
+            from generator.ai.sessions import ai_session
 
-            client = create_ai_client(self.provider, api_key=self.api_key)
+            client = ai_session(self.provider, api_key=self.api_key)
             validator = require_min_count(r"^###?\s*\d+\.", 3) if expect_multiple else None
             result = (
                 generate_with_validator(
@@ -401,6 +409,7 @@ Generate the subtasks now:
                     validator=validator,
                     max_tokens=8000,
                     max_retries=1,
+                    on_progress=self.on_progress,
                 )
                 or ""
             )
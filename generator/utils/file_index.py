@@ -0,0 +1,334 @@
+"""Single-pass project file index shared by every analyzer.
+
+Historically each analyzer walked the project tree on its own —
+``StructureAnalyzer`` rglob'd once per pattern file, ``IncrementalAnalyzer``
+once per extension, the tech detector once per suffix, the trigger detector
+and the code extractor once each. On large monorepos those repeated walks
+dominated ``prg analyze`` wall time.
+
+``ProjectFileIndex.build`` walks the tree exactly once with ``os.scandir``,
+pruning whatever the project's ``IgnoreMatcher`` rejects (dependency, cache
+and build trees, ``.gitignore`` / ``.prgignore`` entries) plus any virtualenv
+at descend time, and records each file's relative path, suffix, size and
+mtime. Analyzers then answer their questions — "any ``*.ts`` files?", "where
+is ``conftest.py``?", "which files match ``src/**/*.py``?" — from the
+in-memory index.
+
+Callers that run inside the analyze pipeline receive the index explicitly.
+Deeper call sites (strategies, the skill orchestrator) that have only a
+``project_path`` use ``get_file_index``, which returns the pipeline's active
+index for that root or builds a fresh one.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+
+from generator.utils.ignore import IgnoreMatcher
+
+# A directory holding this file is a virtualenv whatever it is called (``env``,
+# ``.direnv/python-3.11`` …); its contents are never project source.
+VENV_MARKER = "pyvenv.cfg"
+
+# A recorded (size, mtime_ns) only proves a file is unchanged when its mtime is
+# older than this window at the time it was recorded — coarse filesystem
+# timestamps can hide a same-tick rewrite. Stat-keyed caches check this first.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """One file recorded by the index."""
+
+    root: Path
+    rel: str  # POSIX-style path relative to ``root``
+    name: str
+    suffix: str
+    size: int
+    mtime_ns: int
+
+    @property
+    def path(self) -> Path:
+        return self.root / self.rel
+
+    @property
+    def parts(self) -> Tuple[str, ...]:
+        return tuple(self.rel.split("/"))
+
+    @property
+    def mtime(self) -> float:
+        return self.mtime_ns / 1e9
+
+
+class ProjectFileIndex:
+    """In-memory index of every file under a project root.
+
+    Files are ordered by a deterministic pre-order walk (each directory's
+    files sorted by name, then its sub-directories sorted by name) so
+    "first N files" limits behave the same on every platform.
+    """
+
+    def __init__(self, root: Path, entries: List[FileEntry], dirs: List[str], ignore: Optional[IgnoreMatcher] = None):
+        self.root = Path(root)
+        self.ignore = ignore if ignore is not None else IgnoreMatcher.for_project(self.root)
+        self._entries = entries
+        self._dirs = dirs
+        self._dir_set = frozenset(dirs)
+        self._by_name: Dict[str, List[FileEntry]] = {}
+        self._by_suffix: Dict[str, List[FileEntry]] = {}
+        for entry in entries:
+            self._by_name.setdefault(entry.name, []).append(entry)
+            self._by_suffix.setdefault(entry.suffix, []).append(entry)
+
+    @classmethod
+    def build(cls, root: Path, ignore: Optional[IgnoreMatcher] = None) -> "ProjectFileIndex":
+        """Walk ``root`` once and return the populated index.
+
+        ``ignore`` defaults to ``IgnoreMatcher.for_project(root)``. Ignored
+        directories and virtualenvs are never entered and ignored files are
+        not recorded. Symlinked directories are not followed (avoids cycles);
+        symlinked files are recorded with the target's size and mtime.
+        """
+        root = Path(root)
+        if ignore is None:
+            ignore = IgnoreMatcher.for_project(root)
+        entries: List[FileEntry] = []
+        dirs: List[str] = []
+        stack: List[str] = [""]
+
+        while stack:
+            rel_dir = stack.pop()
+            abs_dir = os.path.join(root, rel_dir) if rel_dir else str(root)
+            try:
+                with os.scandir(abs_dir) as it:
+                    children = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            subdirs: List[str] = []
+            for child in children:
+                rel = f"{rel_dir}/{child.name}" if rel_dir else child.name
+                try:
+                    if child.is_dir(follow_symlinks=False):
+                        if not ignore.ignores(rel, is_dir=True) and not _is_virtualenv(child.path):
+                            subdirs.append(rel)
+                        continue
+                    if not child.is_file() or ignore.ignores(rel):
+                        continue
+                    st = child.stat()
+                except OSError:
+                    continue
+                entries.append(
+                    FileEntry(
+                        root=root,
+                        rel=rel,
+                        name=child.name,
+                        suffix=os.path.splitext(child.name)[1],
+                        size=st.st_size,
+                        mtime_ns=st.st_mtime_ns,
+                    )
+                )
+
+            dirs.extend(subdirs)
+            # Reverse so the alphabetically-first sub-directory is walked next.
+            stack.extend(reversed(subdirs))
+
+        return cls(root, entries, dirs, ignore)
+
+    def with_changes(self, changed: Collection[str]) -> "ProjectFileIndex":
+        """Return a new index with the given relative paths re-stat'ed.
+
+        Used by ``prg watch`` to apply a batch of file events as a delta
+        instead of re-walking the tree. Paths that no longer exist are
+        dropped, new files are inserted in walk order, and directories that
+        have disappeared are removed along with everything beneath them.
+        Paths the index's ``ignore`` matcher rejects are skipped, as are new
+        files under a virtualenv.
+        """
+        by_rel = {e.rel: e for e in self._entries}
+        dirs = list(self._dirs)
+        dir_set = set(dirs)
+        removed_dirs: List[str] = []
+
+        for rel in sorted({c.strip("/") for c in changed if c.strip("/")}):
+            parts = rel.split("/")
+            if self.ignore.ignores_path(rel):
+                continue
+            path = self.root / rel
+            try:
+                st = path.stat()
+                is_file = path.is_file()
+            except OSError:
+                st, is_file = None, False
+
+            if st is None or not is_file:
+                by_rel.pop(rel, None)
+                if rel in dir_set and not path.is_dir():
+                    removed_dirs.append(rel)
+                # A deleted file may have taken its parent directories with it.
+                for i in range(len(parts) - 1, 0, -1):
+                    parent = "/".join(parts[:i])
+                    if parent not in dir_set or (self.root / parent).is_dir():
+                        break
+                    removed_dirs.append(parent)
+                continue
+
+            parent = "/".join(parts[:-1])
+            if parent and parent not in dir_set and _in_virtualenv(self.root, parts[:-1]):
+                continue
+            by_rel[rel] = FileEntry(
+                root=self.root,
+                rel=rel,
+                name=parts[-1],
+                suffix=os.path.splitext(parts[-1])[1],
+                size=st.st_size,
+                mtime_ns=st.st_mtime_ns,
+            )
+            for i in range(1, len(parts)):
+                parent = "/".join(parts[:i])
+                if parent not in dir_set:
+                    dir_set.add(parent)
+                    dirs.append(parent)
+
+        if removed_dirs:
+            prefixes = tuple(f"{d}/" for d in removed_dirs)
+            gone = set(removed_dirs)
+            by_rel = {rel: e for rel, e in by_rel.items() if not rel.startswith(prefixes)}
+            dirs = [d for d in dirs if d not in gone and not d.startswith(prefixes)]
+
+        return ProjectFileIndex(self.root, sorted(by_rel.values(), key=_walk_order), dirs, self.ignore)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        return iter(self._entries)
+
+    @property
+    def dirs(self) -> List[str]:
+        """Relative POSIX paths of every (non-pruned) directory."""
+        return list(self._dirs)
+
+    def has_dir(self, rel: str) -> bool:
+        return rel.strip("/") in self._dir_set
+
+    def files(self, exclude: Collection[str] = ()) -> List[FileEntry]:
+        """All files, optionally dropping any whose path has a part in ``exclude``."""
+        return _filter(self._entries, exclude)
+
+    def by_suffix(self, *suffixes: str, exclude: Collection[str] = ()) -> List[FileEntry]:
+        """Files whose suffix (``".py"``) is one of ``suffixes``, in walk order."""
+        if len(suffixes) == 1:
+            return _filter(self._by_suffix.get(suffixes[0], []), exclude)
+        wanted = set(suffixes)
+        return _filter([e for e in self._entries if e.suffix in wanted], exclude)
+
+    def has_suffix(self, *suffixes: str, exclude: Collection[str] = ()) -> bool:
+        for suffix in suffixes:
+            for entry in self._by_suffix.get(suffix, []):
+                if not exclude or not _excluded(entry, exclude):
+                    return True
+        return False
+
+    def by_name(self, name: str, exclude: Collection[str] = ()) -> List[FileEntry]:
+        """Files whose basename equals ``name`` (equivalent to ``rglob(name)``)."""
+        return _filter(self._by_name.get(name, []), exclude)
+
+    def glob(self, pattern: str, exclude: Collection[str] = ()) -> List[FileEntry]:
+        """Files matching a shell-style pattern.
+
+        Patterns without a ``/`` match the basename anywhere in the tree (like
+        ``Path.rglob``); patterns with a ``/`` match the relative POSIX path.
+        """
+        if "/" in pattern:
+            matches = [e for e in self._entries if fnmatch.fnmatch(e.rel, pattern)]
+        elif not any(ch in pattern for ch in "*?["):
+            matches = self._by_name.get(pattern, [])
+        else:
+            matches = [e for e in self._entries if fnmatch.fnmatch(e.name, pattern)]
+        return _filter(matches, exclude)
+
+    def get(self, rel: str) -> Optional[FileEntry]:
+        """Return the entry for an exact relative path, or None."""
+        name = rel.rsplit("/", 1)[-1]
+        for entry in self._by_name.get(name, []):
+            if entry.rel == rel:
+                return entry
+        return None
+
+
+def _is_virtualenv(abs_dir: str) -> bool:
+    return os.path.isfile(os.path.join(abs_dir, VENV_MARKER))
+
+
+def _in_virtualenv(root: Path, dir_parts: List[str]) -> bool:
+    return any(_is_virtualenv(os.path.join(root, *dir_parts[:i])) for i in range(1, len(dir_parts) + 1))
+
+
+def _walk_order(entry: FileEntry) -> Tuple[Tuple[int, str], ...]:
+    """Sort key reproducing ``build``'s pre-order: files before sub-directories."""
+    parts = entry.rel.split("/")
+    return tuple((1, d) for d in parts[:-1]) + ((0, parts[-1]),)
+
+
+def _excluded(entry: FileEntry, exclude: Collection[str]) -> bool:
+    return any(part in exclude for part in entry.rel.split("/"))
+
+
+def _filter(entries: List[FileEntry], exclude: Collection[str]) -> List[FileEntry]:
+    if not exclude:
+        return list(entries)
+    return [e for e in entries if not _excluded(e, exclude)]
+
+
+# ----------------------------------------------------------------------
+# Pipeline-scoped sharing
+# ----------------------------------------------------------------------
+
+_ACTIVE: Dict[Path, ProjectFileIndex] = {}
+
+
+def _key(root: Path) -> Path:
+    try:
+        return Path(root).resolve()
+    except OSError:
+        return Path(root)
+
+
+@contextmanager
+def use_file_index(index: ProjectFileIndex) -> Iterator[ProjectFileIndex]:
+    """Make ``index`` the active index for its root for the duration of the block.
+
+    Anything calling ``get_file_index(root)`` inside the block gets this index
+    instead of walking the tree again. Nested activation restores the previous
+    index on exit.
+    """
+    key = _key(index.root)
+    previous = _ACTIVE.get(key)
+    _ACTIVE[key] = index
+    try:
+        yield index
+    finally:
+        if previous is None:
+            _ACTIVE.pop(key, None)
+        else:
+            _ACTIVE[key] = previous
+
+
+def get_file_index(project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> ProjectFileIndex:
+    """Return ``file_index`` if given, else the active index for ``project_path``, else a fresh build."""
+    if file_index is not None:
+        return file_index
+    active = _ACTIVE.get(_key(project_path))
+    if active is not None:
+        return active
+    return ProjectFileIndex.build(project_path)
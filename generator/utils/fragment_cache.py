@@ -0,0 +1,183 @@
+"""Named fragments for generated artifacts, cached by input digest.
+
+``rules.md``, ``constitution.md`` and ``clinerules.yaml`` used to be rendered
+whole on every run, and ``prg analyze --incremental`` could only skip entire
+phases and then splice ``rules.md`` back together on heading markers. Each of
+those artifacts is now a sequence of ``Fragment`` objects. A fragment names the
+inputs its text depends on — ``readme``, ``deps``, ``structure``, ``tests``,
+``tools``, ``skills`` — and ``FragmentCache.assemble`` re-renders only the
+fragments whose input digests changed since the last run, reusing the stored
+text of the rest. Fragments are concatenated in order, so the result is
+byte-identical to a full render.
+
+The cache lives beside the analysis cache in
+``<output_dir>/.prg-cache/fragments.json``. Input values are digested from
+their canonical JSON form; a fragment must read nothing but its declared
+inputs. Records from another generator version are discarded on load.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from generator.analyzers.analysis_cache import CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+FRAGMENTS_FILENAME = "fragments.json"
+_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Fragment:
+    """One named piece of a generated file and the inputs its text depends on."""
+
+    name: str
+    inputs: Tuple[str, ...]
+    render: Callable[[], str]
+
+
+def assemble(
+    artifact: str,
+    fragments: Sequence[Fragment],
+    inputs: Mapping[str, Any],
+    cache: Optional["FragmentCache"] = None,
+) -> str:
+    """Concatenate ``fragments``, through ``cache`` when one is given."""
+    if cache is None:
+        return "".join(fragment.render() for fragment in fragments)
+    return cache.assemble(artifact, fragments, inputs)
+
+
+def input_digest(value: Any) -> str:
+    """Digest of ``value``'s canonical JSON form (sets sorted, other objects via ``str``)."""
+    data = json.dumps(value, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _generator_version() -> str:
+    try:
+        return importlib.metadata.version("project-rules-generator")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+class FragmentCache:
+    """Rendered fragment text per artifact, keyed by the digests of its inputs.
+
+    ``cache_dir=None`` gives an in-memory cache with the same semantics.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # artifact -> {fragment name: {"key": digest, "text": rendered text}}
+        self._artifacts: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.rendered = 0
+        self.reused = 0
+        # artifact -> names of the fragments rendered (not reused) by the last assemble()
+        self.last_rendered: Dict[str, List[str]] = {}
+
+    @classmethod
+    def load(cls, output_dir: Path) -> "FragmentCache":
+        """Open the cache stored under ``<output_dir>/.prg-cache/``."""
+        cache = cls(Path(output_dir) / CACHE_DIRNAME)
+        path = cache.cache_path
+        if path is None or not path.exists():
+            return cache
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Ignoring unreadable fragment cache %s: %s", path, exc)
+            return cache
+        if (
+            data.get("version") == _CACHE_VERSION
+            and data.get("generator") == _generator_version()
+            and isinstance(data.get("artifacts"), dict)
+        ):
+            cache._artifacts = data["artifacts"]
+        return cache
+
+    @property
+    def cache_path(self) -> Optional[Path]:
+        return self.cache_dir / FRAGMENTS_FILENAME if self.cache_dir is not None else None
+
+    # ------------------------------------------------------------------
+    # Assembly
+    # ------------------------------------------------------------------
+
+    def assemble(self, artifact: str, fragments: Sequence[Fragment], inputs: Mapping[str, Any]) -> str:
+        """Render ``artifact`` from ``fragments``, reusing those whose inputs are unchanged.
+
+        ``inputs`` maps every input name the fragments declare to its current
+        value. Fragments no longer produced for ``artifact`` are forgotten.
+        """
+        digests: Dict[str, str] = {}
+        with self._lock:
+            previous = self._artifacts.get(artifact, {})
+
+        records: Dict[str, Dict[str, str]] = {}
+        parts: List[str] = []
+        rendered: List[str] = []
+        for fragment in fragments:
+            if fragment.name in records:
+                raise ValueError(f"Duplicate fragment {fragment.name!r} in {artifact}")
+            for name in fragment.inputs:
+                if name not in digests:
+                    digests[name] = input_digest(inputs[name])
+            key = input_digest([fragment.name, [[name, digests[name]] for name in fragment.inputs]])
+            record = previous.get(fragment.name)
+            if record is not None and record.get("key") == key:
+                text = record["text"]
+            else:
+                text = fragment.render()
+                rendered.append(fragment.name)
+            records[fragment.name] = {"key": key, "text": text}
+            parts.append(text)
+
+        with self._lock:
+            self.rendered += len(rendered)
+            self.reused += len(records) - len(rendered)
+            self.last_rendered[artifact] = rendered
+            if records != previous:
+                self._artifacts[artifact] = records
+                self._dirty = True
+        return "".join(parts)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, int]:
+        return {"rendered": self.rendered, "reused": self.reused, "artifacts": len(self._artifacts)}
+
+    def save(self) -> None:
+        """Write the cache to disk (no-op for in-memory caches or when nothing changed)."""
+        path = self.cache_path
+        if path is None or not self._dirty:
+            return
+        from prg_utils.file_ops import atomic_write_text
+
+        with self._lock:
+            payload = {"version": _CACHE_VERSION, "generator": _generator_version(), "artifacts": self._artifacts}
+            data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+            self._dirty = False
+        try:
+            atomic_write_text(path, data)
+        except OSError as exc:
+            self._dirty = True
+            logger.warning("Failed to write fragment cache %s: %s", path, exc)
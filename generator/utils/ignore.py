@@ -0,0 +1,147 @@
+"""One ignore policy for every project walker.
+
+Each analyzer used to carry its own skip list — ``SKIP_DIRS`` in the
+structure analyzer and code extractor, ``_IGNORE_DIRS`` in ``prg watch``,
+``_TREE_EXCLUDE`` in the README bridge, the tech detector's and hardening's
+lists — and most of them filtered *after* walking, so a big ``data/`` or
+``node_modules`` tree was still listed in full. ``IgnoreMatcher`` combines
+
+* ``DEFAULT_IGNORE_DIRS`` (VCS, dependency, cache and build trees),
+* the project's root ``.gitignore`` and ``.prgignore``, and
+* extra entries from ``config.yaml`` (``analysis.ignore``),
+
+in that order, and walkers ask it about each directory *before* entering it.
+Patterns follow gitignore syntax. Plain name patterns (``data/``,
+``*.log``) — the bulk of a typical ``.gitignore`` — are compiled into a set
+and one regex over the basename; anchored or ``/``-containing patterns go
+through ``pathspec``. A ``!`` negation sends every pattern to ``pathspec`` so
+ordering semantics are preserved, and ``!name/`` also re-includes a default
+directory. Nested ``.gitignore`` files are not read.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from pathlib import Path
+from typing import Collection, Iterable, List, Optional, Set
+
+import pathspec
+
+# Directories no walker looks inside. Globs match the directory's name.
+DEFAULT_IGNORE_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "venv",
+        ".venv",
+        "__pycache__",
+        "site-packages",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".tox",
+        ".nox",
+        ".eggs",
+        "*.egg-info",
+        "htmlcov",
+        "dist",
+        "build",
+        ".web",  # Reflex framework generated Next.js output
+        ".idea",
+        ".vscode",
+    }
+)
+
+IGNORE_FILENAMES = (".gitignore", ".prgignore")
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def read_ignore_file(path: Path) -> List[str]:
+    """Return the lines of an ignore file, or ``[]`` when it is missing or unreadable."""
+    try:
+        return path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return []
+
+
+class IgnoreMatcher:
+    """Compiled gitignore-style matcher over project-relative POSIX paths."""
+
+    def __init__(self, patterns: Iterable[str] = (), dir_names: Collection[str] = DEFAULT_IGNORE_DIRS):
+        lines = [line.rstrip("\n") for line in patterns]
+        negated = {line[1:].strip().strip("/") for line in lines if line.startswith("!")}
+        self.patterns = [f"{name}/" for name in sorted(dir_names) if name not in negated]
+        self.patterns.extend(lines)
+
+        self._names: Set[str] = set()
+        self._dir_names: Set[str] = set()
+        name_globs: List[str] = []
+        dir_name_globs: List[str] = []
+        spec_lines: List[str] = []
+        # A negation can re-include anything matched earlier, so past the
+        # defaults every pattern keeps its gitignore ordering in pathspec.
+        in_order = bool(negated)
+        for index, raw in enumerate(self.patterns):
+            line = raw.rstrip(" ") if "\\" not in raw else raw
+            if not line or line.startswith("#"):
+                continue
+            body = line.rstrip("/")
+            dir_only = body != line
+            if (in_order and index >= len(self.patterns) - len(lines)) or not body or any(c in body for c in "/\\!"):
+                spec_lines.append(line)
+            elif _GLOB_CHARS & set(body):
+                (dir_name_globs if dir_only else name_globs).append(body)
+            else:
+                (self._dir_names if dir_only else self._names).add(body)
+
+        self._name_re = _compile_globs(name_globs)
+        self._dir_name_re = _compile_globs(name_globs + dir_name_globs)
+        self._spec: Optional[pathspec.PathSpec] = pathspec.GitIgnoreSpec.from_lines(spec_lines) if spec_lines else None
+
+    @classmethod
+    def for_project(
+        cls,
+        root: Path,
+        extra: Iterable[str] = (),
+        dir_names: Collection[str] = DEFAULT_IGNORE_DIRS,
+    ) -> "IgnoreMatcher":
+        """Build the matcher for ``root`` from the defaults, its ignore files and ``extra``."""
+        root = Path(root)
+        lines: List[str] = []
+        for filename in IGNORE_FILENAMES:
+            lines.extend(read_ignore_file(root / filename))
+        lines.extend(extra)
+        return cls(lines, dir_names=dir_names)
+
+    def ignores(self, rel: str, is_dir: bool = False) -> bool:
+        """Return True if ``rel`` itself is ignored.
+
+        Only the last component's name rules are checked — walkers call this
+        as they descend, so an ignored ancestor was never entered. Use
+        ``ignores_path`` for a path that did not come from a walk.
+        """
+        name = rel.rsplit("/", 1)[-1]
+        if name in self._names:
+            return True
+        if is_dir:
+            if name in self._dir_names or (self._dir_name_re is not None and self._dir_name_re.match(name)):
+                return True
+        elif self._name_re is not None and self._name_re.match(name):
+            return True
+        return self._spec is not None and self._spec.match_file(f"{rel}/" if is_dir else rel)
+
+    def ignores_path(self, rel: str, is_dir: bool = False) -> bool:
+        """Return True if ``rel`` or any of its parent directories is ignored."""
+        parts = rel.strip("/").split("/")
+        for i in range(1, len(parts)):
+            if self.ignores("/".join(parts[:i]), is_dir=True):
+                return True
+        return self.ignores("/".join(parts), is_dir=is_dir)
+
+
+def _compile_globs(globs: List[str]) -> "Optional[re.Pattern[str]]":
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(glob) for glob in globs))
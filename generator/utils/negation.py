@@ -32,11 +32,22 @@ single non-negated mention is enough to keep the tech.
 The helper expects ``content_lower`` to already be lowercased; the
 caller is responsible. The negation regex itself is also lowercase,
 so both sides match in lower-case space.
+
+Many keywords at once
+---------------------
+Scanners that test a whole keyword table against one README use
+``KeywordMatcher`` instead of calling the helper per keyword: it compiles
+every keyword into one overlapping-lookahead regex, finds all hits in a
+single pass over the text, and applies the same negation-window check to
+each hit. The result is identical to calling
+``keyword_has_non_negated_mention`` for every keyword.
 """
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Union
 
 # Negation tokens that, when they appear shortly BEFORE a tech keyword,
 # indicate the surrounding text is disclaiming rather than declaring it.
@@ -81,16 +92,96 @@ def keyword_has_non_negated_mention(
     bool — True if at least one non-negated match exists; False if the
     keyword is absent, or if every match falls inside a negation window.
     """
-    if word_boundary:
-        pattern = re.compile(rf"\b{re.escape(keyword)}\b")
-    else:
-        pattern = re.compile(re.escape(keyword))
-    matches = list(pattern.finditer(content_lower))
-    if not matches:
-        return False
-    for m in matches:
-        window_start = max(0, m.start() - NEGATION_PROXIMITY_CHARS)
-        window = content_lower[window_start : m.start()]
-        if not NEGATION_RE.search(window):
+    for m in _keyword_pattern(keyword, word_boundary).finditer(content_lower):
+        if not _negated_at(content_lower, m.start()):
             return True
     return False
+
+
+def _keyword_source(keyword: str, word_boundary: bool) -> str:
+    escaped = re.escape(keyword)
+    return rf"\b{escaped}\b" if word_boundary else escaped
+
+
+@lru_cache(maxsize=1024)
+def _keyword_pattern(keyword: str, word_boundary: bool) -> "re.Pattern[str]":
+    return re.compile(_keyword_source(keyword, word_boundary))
+
+
+def _negated_at(content_lower: str, start: int) -> bool:
+    """True when a negation token sits in the window just before ``start``."""
+    window_start = max(0, start - NEGATION_PROXIMITY_CHARS)
+    return NEGATION_RE.search(content_lower[window_start:start]) is not None
+
+
+class KeywordMatcher:
+    """Single-pass, negation-aware matcher for a fixed set of keywords.
+
+    ``matches(content_lower)`` returns the keywords that have at least one
+    non-negated mention — the same answer as calling
+    ``keyword_has_non_negated_mention`` per keyword, but with one regex
+    compiled up front and one scan of the text.
+
+    All keywords are folded into one alternation, longest first, which is
+    searched from each hit's start + 1 so every start position reports the
+    longest keyword matching there. Shorter keywords matching at the same
+    position are necessarily prefixes of that one and are checked
+    explicitly. (The alternation deliberately has no capture groups: the
+    keyword is recovered from the matched text, and per-keyword groups make
+    ``re`` an order of magnitude slower.)
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        *,
+        word_boundary: Union[bool, Callable[[str], bool]] = True,
+    ):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(kw for kw in keywords if kw))
+        boundary_of = word_boundary if callable(word_boundary) else (lambda _kw: word_boundary)
+        self._boundary: Dict[str, bool] = {kw: bool(boundary_of(kw)) for kw in self.keywords}
+
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = (
+            re.compile("|".join(_keyword_source(kw, self._boundary[kw]) for kw in ordered)) if ordered else None
+        )
+        # Keywords that are a strict prefix of another: they can match at the
+        # same position as the longer one, which the alternation would hide.
+        self._prefixes: Dict[str, List[str]] = {
+            kw: [other for other in ordered if other != kw and kw.startswith(other)] for kw in ordered
+        }
+
+    def matches(self, content_lower: str) -> Set[str]:
+        """Return the keywords with at least one non-negated mention."""
+        found: Set[str] = set()
+        if self._pattern is None:
+            return found
+        # End of the previous counted match per keyword, mirroring finditer's
+        # non-overlapping semantics for self-overlapping keywords.
+        last_end: Dict[str, int] = {}
+        remaining = len(self.keywords)
+
+        search = self._pattern.search
+        m = search(content_lower)
+        while m is not None:
+            start = m.start()
+            keyword = m.group()
+            candidates = [keyword]
+            for shorter in self._prefixes[keyword]:
+                if _keyword_pattern(shorter, self._boundary[shorter]).match(content_lower, start):
+                    candidates.append(shorter)
+
+            negated = None
+            for kw in candidates:
+                if kw in found or start < last_end.get(kw, 0):
+                    continue
+                last_end[kw] = start + len(kw)
+                if negated is None:
+                    negated = _negated_at(content_lower, start)
+                if not negated:
+                    found.add(kw)
+                    remaining -= 1
+            if not remaining:
+                break
+            m = search(content_lower, start + 1)
+        return found
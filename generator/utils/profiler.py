@@ -0,0 +1,281 @@
+"""Per-phase profiling for ``prg analyze --profile``.
+
+``PhaseProfiler.phase(name)`` wraps one pipeline phase and records:
+
+* wall time and process CPU time;
+* files opened for reading and their total size (via the ``open`` audit
+  event, so every ``open``/``Path.read_text``/``read_bytes`` is counted);
+* regex scans — calls to ``re.Pattern`` search/match/finditer/sub/… — taken
+  from a per-phase ``cProfile`` run;
+* subprocess launches (``subprocess.Popen`` / ``os.system`` audit events);
+* LLM calls and input/output tokens, reported by the provider clients
+  through ``record_llm_call``.
+
+The report is written to ``<output_dir>/.prg-profile.json``. Optionally the
+merged cProfile data is dumped for ``pstats``/snakeviz, and the phases are
+written as a Chrome trace-event file (open in ``chrome://tracing`` or
+Perfetto). Profiling runs the pipeline's stages serially so every counter is
+attributed to exactly one phase.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FILENAME = ".prg-profile.json"
+PSTATS_FILENAME = ".prg-profile.pstats"
+TRACE_FILENAME = ".prg-profile.trace.json"
+
+# Builtin function names cProfile records for regex scans.
+_REGEX_SCAN_RE = re.compile(r"^<method '(?:search|match|fullmatch|finditer|findall|sub|subn|split)' of 're\.Pattern'")
+
+
+@dataclass
+class PhaseStats:
+    """Measurements for one profiled phase."""
+
+    name: str
+    start_s: float = 0.0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    files_read: int = 0
+    bytes_read: int = 0
+    regex_scans: int = 0
+    subprocess_calls: int = 0
+    llm_calls: int = 0
+    llm_input_tokens: int = 0
+    llm_output_tokens: int = 0
+    parent: str = ""  # enclosing phase, for nested phases
+    thread_id: int = field(default=0, repr=False)
+    thread_name: str = field(default="", repr=False)
+
+
+class PhaseProfiler:
+    """Collects ``PhaseStats`` for the phases of one ``prg analyze`` run."""
+
+    def __init__(self, pstats_dump: bool = False, chrome_trace: bool = False):
+        self.pstats_dump = pstats_dump
+        self.chrome_trace = chrome_trace
+        self.phases: List[PhaseStats] = []
+        self._origin = time.perf_counter()
+        self._started_at = time.time()
+        self._stats: Optional[pstats.Stats] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, profile: bool = False) -> Optional["PhaseProfiler"]:
+        """Build a profiler when ``profile`` is set or ``PRG_PROFILE`` asks for one.
+
+        ``PRG_PROFILE=1`` writes the JSON report only; a comma-separated list
+        may add ``pstats`` and/or ``trace`` (``PRG_PROFILE=pstats,trace``).
+        """
+        raw = os.getenv("PRG_PROFILE", "").strip().lower()
+        extras = {part.strip() for part in raw.split(",")} if raw not in ("", "0", "false", "no") else set()
+        if not profile and not extras:
+            return None
+        return cls(pstats_dump="pstats" in extras, chrome_trace="trace" in extras)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseStats]:
+        """Measure the enclosed block as phase ``name``."""
+        _install_audit_hook()
+        outer = getattr(_active, "phase", None)
+        thread = threading.current_thread()
+        stats = PhaseStats(
+            name=name,
+            parent=outer.name if outer is not None else "",
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+        )
+        _active.phase = stats
+
+        # One cProfile per thread at a time; a nested phase is timed and
+        # counted but leaves call profiling to the outer phase.
+        profile = cProfile.Profile() if outer is None else None
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield stats
+        finally:
+            if profile is not None:
+                profile.disable()
+            stats.start_s = wall0 - self._origin
+            stats.wall_s = time.perf_counter() - wall0
+            stats.cpu_s = time.process_time() - cpu0
+            _active.phase = outer
+            if outer is not None:
+                _fold_counters(outer, stats)
+            if profile is not None:
+                self._absorb(stats, profile)
+            with self._lock:
+                self.phases.append(stats)
+
+    def _absorb(self, stats: PhaseStats, profile: cProfile.Profile) -> None:
+        phase_stats = pstats.Stats(profile)
+        for (_file, _line, func), (_cc, ncalls, *_rest) in phase_stats.stats.items():  # type: ignore[attr-defined]
+            if _REGEX_SCAN_RE.match(func):
+                stats.regex_scans += ncalls
+        with self._lock:
+            if self._stats is None:
+                self._stats = phase_stats
+            else:
+                self._stats.add(phase_stats)
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def report(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """The JSON report; ``metadata`` (version, project, …) is merged in at the top level."""
+        phases = sorted(self.phases, key=lambda p: p.start_s)
+        top_level = [p for p in phases if not p.parent]  # nested counters are folded into their parent
+        totals = {
+            key: sum(getattr(p, key) for p in top_level)
+            for key in (
+                "cpu_s",
+                "files_read",
+                "bytes_read",
+                "regex_scans",
+                "subprocess_calls",
+                "llm_calls",
+                "llm_input_tokens",
+                "llm_output_tokens",
+            )
+        }
+        totals["wall_s"] = time.perf_counter() - self._origin
+        return {
+            "version": 1,
+            **(metadata or {}),
+            "python": sys.version.split()[0],
+            "started_at": self._started_at,
+            "total": totals,
+            "phases": [_public(p) for p in phases],
+        }
+
+    def write(self, output_dir: Path, metadata: Optional[Dict[str, Any]] = None) -> List[Path]:
+        """Write the JSON report (plus pstats/trace when enabled); return the paths written."""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        written = [output_dir / PROFILE_FILENAME]
+        written[0].write_text(json.dumps(self.report(metadata), indent=2) + "\n", encoding="utf-8")
+
+        if self.pstats_dump and self._stats is not None:
+            path = output_dir / PSTATS_FILENAME
+            self._stats.dump_stats(str(path))
+            written.append(path)
+        if self.chrome_trace:
+            path = output_dir / TRACE_FILENAME
+            path.write_text(json.dumps(self.chrome_trace_events()), encoding="utf-8")
+            written.append(path)
+        return written
+
+    def chrome_trace_events(self) -> Dict[str, Any]:
+        """Phases as complete ("X") trace events, timestamps in microseconds."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        threads: Dict[int, str] = {}
+        for p in sorted(self.phases, key=lambda p: p.start_s):
+            threads.setdefault(p.thread_id, p.thread_name)
+            args = {k: v for k, v in _public(p).items() if k not in ("name", "start_s", "wall_s")}
+            events.append(
+                {
+                    "name": p.name,
+                    "cat": "phase",
+                    "ph": "X",
+                    "ts": round(p.start_s * 1e6),
+                    "dur": round(p.wall_s * 1e6),
+                    "pid": pid,
+                    "tid": p.thread_id,
+                    "args": args,
+                }
+            )
+        for tid, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _public(p: PhaseStats) -> Dict[str, Any]:
+    return {k: v for k, v in asdict(p).items() if k not in ("thread_id", "thread_name")}
+
+
+# ----------------------------------------------------------------------
+# Counters
+# ----------------------------------------------------------------------
+
+_active = threading.local()
+_hook_installed = False
+_hook_lock = threading.Lock()
+
+
+def _current_phase() -> Optional[PhaseStats]:
+    return getattr(_active, "phase", None)
+
+
+def _fold_counters(outer: PhaseStats, inner: PhaseStats) -> None:
+    for key in (
+        "files_read",
+        "bytes_read",
+        "subprocess_calls",
+        "llm_calls",
+        "llm_input_tokens",
+        "llm_output_tokens",
+    ):
+        setattr(outer, key, getattr(outer, key) + getattr(inner, key))
+
+
+def _audit(event: str, args: tuple) -> None:
+    # Runs on every audited operation in the process; bail out fast.
+    if event not in ("open", "subprocess.Popen", "os.system"):
+        return
+    stats = _current_phase()
+    if stats is None:
+        return
+    if event != "open":
+        stats.subprocess_calls += 1
+        return
+    path, mode, flags = args
+    if mode is not None:
+        reading = "r" in mode or "+" in mode
+    else:
+        reading = (flags & (os.O_WRONLY | os.O_RDWR)) != os.O_WRONLY
+    if not reading or not isinstance(path, (str, bytes, os.PathLike)):
+        return
+    stats.files_read += 1
+    try:
+        stats.bytes_read += os.stat(path).st_size
+    except (OSError, ValueError):
+        pass
+
+
+def _install_audit_hook() -> None:
+    # Audit hooks cannot be removed, so install once and gate on _active.
+    global _hook_installed
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit)
+            _hook_installed = True
+
+
+def record_llm_call(input_tokens: int = 0, output_tokens: int = 0) -> None:
+    """Attribute one provider round-trip to the phase running on this thread."""
+    stats = _current_phase()
+    if stats is None:
+        return
+    stats.llm_calls += 1
+    stats.llm_input_tokens += input_tokens
+    stats.llm_output_tokens += output_tokens
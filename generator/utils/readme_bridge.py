@@ -19,6 +19,8 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from generator.utils.ignore import IgnoreMatcher
+
 logger = logging.getLogger(__name__)
 
 README_MIN_WORDS = 80  # Below this → README is too sparse
@@ -40,25 +42,6 @@ def find_readme(project_path: Path) -> Optional[Path]:
     return None
 
 
-_TREE_EXCLUDE = {
-    ".git",
-    "__pycache__",
-    ".venv",
-    "venv",
-    "node_modules",
-    ".web",
-    ".pytest_cache",
-    "dist",
-    "build",
-    ".mypy_cache",
-    ".ruff_cache",
-    ".clinerules",
-    ".claude",
-    ".eggs",
-    "eggs",
-}
-
-
 def is_readme_sufficient(readme_content: str, min_words: int = README_MIN_WORDS) -> bool:
     """Return True if README has enough words for meaningful generation."""
     if not readme_content or not readme_content.strip():
@@ -73,11 +56,13 @@ def build_project_tree(
 ) -> str:
     """Walk the project directory and return a structured tree string.
 
-    Excludes noise (.git, __pycache__, venv, node_modules, etc.).
+    Excludes hidden entries and whatever the project's ``IgnoreMatcher``
+    rejects (.gitignore, .prgignore, venvs, node_modules, build output …).
     Capped at max_items entries to stay within token budget.
     """
     lines: List[str] = [f"{project_path.name}/"]
     count = 0
+    ignore = IgnoreMatcher.for_project(project_path)
 
     def _walk(path: Path, depth: int, prefix: str) -> None:
         nonlocal count
@@ -91,7 +76,12 @@ def build_project_tree(
         except PermissionError:
             return
 
-        visible = [e for e in entries if not e.name.startswith(".") and e.name not in _TREE_EXCLUDE]
+        visible = [
+            e
+            for e in entries
+            if not e.name.startswith(".")
+            and not ignore.ignores(e.relative_to(project_path).as_posix(), is_dir=e.is_dir())
+        ]
         for i, item in enumerate(visible):
             if count >= max_items:
                 lines.append(f"{prefix}... (truncated)")
@@ -0,0 +1,283 @@
+"""Small dependency-graph scheduler for pipeline stages.
+
+``prg analyze`` is a chain of phases, but many of them only depend on a
+shared input rather than on each other: README parsing, dependency parsing,
+structure analysis and test analysis all read the project independently, and
+constitution, rules and skill matching all consume the same enhanced
+context. ``StageGraph`` runs such stages on a thread pool while honouring
+explicit dependency edges.
+
+Two properties keep concurrent runs indistinguishable from serial ones:
+
+* **Results** are returned keyed by stage name in the order stages were
+  added, and each stage receives its dependencies' results as keyword
+  arguments.
+* **Output** written to ``sys.stdout``/``sys.stderr`` from inside a stage
+  (``click.echo``, ``print``) is replayed in stage order. The earliest
+  unfinished stage writes straight through — so interactive prompts stay
+  visible — and later stages buffer until every stage before them is done.
+
+Every run records a ``StageTiming`` per stage; ``critical_path()`` names the
+chain of stages that determined the wall time.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """When a stage ran, in seconds relative to the start of the run."""
+
+    name: str
+    deps: Tuple[str, ...]
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def critical_path(timings: Sequence[StageTiming]) -> List[str]:
+    """Walk back from the last stage to finish through its latest-finishing dependency."""
+    by_name = {t.name: t for t in timings}
+    if not by_name:
+        return []
+    current: Optional[StageTiming] = max(timings, key=lambda t: t.end)
+    path: List[str] = []
+    while current is not None:
+        path.append(current.name)
+        deps = [by_name[d] for d in current.deps if d in by_name]
+        current = max(deps, key=lambda t: t.end) if deps else None
+    return list(reversed(path))
+
+
+def format_timings(timings: Sequence[StageTiming]) -> str:
+    """One-line summary, e.g. ``readme 0.01s, deps 0.04s | critical path: deps → metadata``."""
+    parts = ", ".join(f"{t.name} {t.duration:.2f}s" for t in timings)
+    return f"{parts} | critical path: {' → '.join(critical_path(timings))}"
+
+
+@dataclass
+class _Stage:
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...]
+
+
+class StageGraph:
+    """A DAG of named stages, run concurrently where dependencies allow.
+
+    Stages must be added after their dependencies, which makes cycles
+    impossible by construction::
+
+        graph = StageGraph()
+        graph.add("readme", parse_readme)
+        graph.add("deps", parse_deps)
+        graph.add("metadata", build_metadata, deps=("readme", "deps"))  # metadata(readme=..., deps=...)
+        results = graph.run(max_workers=4)
+    """
+
+    def __init__(self) -> None:
+        self._stages: Dict[str, _Stage] = {}
+        self._lock = threading.Lock()
+        self.timings: List[StageTiming] = []
+
+    def add(self, name: str, fn: Callable[..., Any], deps: Sequence[str] = ()) -> None:
+        """Register ``fn`` as stage ``name``; it is called with each dep's result as a keyword."""
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name!r}")
+        missing = [d for d in deps if d not in self._stages]
+        if missing:
+            raise ValueError(f"Stage {name!r} depends on unknown stage(s): {', '.join(missing)}")
+        self._stages[name] = _Stage(name, fn, tuple(deps))
+
+    def run(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Run every stage and return ``{name: result}`` in insertion order.
+
+        ``max_workers=1`` runs the stages inline, in insertion order, on the
+        calling thread. If a stage raises, no further stages are started; the
+        exception of the earliest failing stage (in insertion order) is
+        re-raised once running stages have finished.
+        """
+        self.timings = []
+        stages = list(self._stages.values())
+        workers = max_workers if max_workers is not None else max(1, len(stages))
+        try:
+            if workers <= 1 or len(stages) <= 1:
+                return self._run_serial(stages)
+            return self._run_parallel(stages, workers)
+        finally:
+            order = {s.name: i for i, s in enumerate(stages)}
+            self.timings.sort(key=lambda t: order[t.name])
+
+    def critical_path(self) -> List[str]:
+        """Stage names on the longest dependency chain of the last run, first to last."""
+        return critical_path(self.timings)
+
+    def format_timings(self) -> str:
+        return format_timings(self.timings)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _call(self, stage: _Stage, results: Dict[str, Any], origin: float) -> Any:
+        kwargs = {d: results[d] for d in stage.deps}
+        started = time.perf_counter()
+        try:
+            return stage.fn(**kwargs)
+        finally:
+            ended = time.perf_counter()
+            with self._lock:
+                self.timings.append(StageTiming(stage.name, stage.deps, started - origin, ended - origin))
+
+    def _run_serial(self, stages: List[_Stage]) -> Dict[str, Any]:
+        origin = time.perf_counter()
+        results: Dict[str, Any] = {}
+        for stage in stages:
+            results[stage.name] = self._call(stage, results, origin)
+        return results
+
+    def _run_parallel(self, stages: List[_Stage], workers: int) -> Dict[str, Any]:
+        origin = time.perf_counter()
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+        order = {s.name: i for i, s in enumerate(stages)}
+        # A graph run from inside another graph's stage releases its output
+        # into that stage's, so it keeps the enclosing graph's ordering.
+        parent = getattr(_current, "output", None)
+        outputs = [_StageOutput(parent) for _ in stages]
+        pending = list(stages)
+        running: Dict[Future, _Stage] = {}
+        done: set = set()
+        head = 0  # index of the earliest stage whose output has not been released
+
+        def invoke(stage: _Stage, output: "_StageOutput") -> Any:
+            _current.output = output
+            try:
+                return self._call(stage, results, origin)
+            finally:
+                _current.output = None
+
+        outputs[0].go_live()
+        with _capture_streams(), ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prg-stage") as pool:
+            while pending or running:
+                if not errors:
+                    for stage in [s for s in pending if all(d in done for d in s.deps)]:
+                        pending.remove(stage)
+                        running[pool.submit(invoke, stage, outputs[order[stage.name]])] = stage
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    try:
+                        results[stage.name] = future.result()
+                    except BaseException as exc:  # noqa: BLE001 — re-raised below, after running stages drain
+                        errors[stage.name] = exc
+                    done.add(stage.name)
+                # Release output in stage order; the new head streams live.
+                while head < len(stages) and stages[head].name in done:
+                    head += 1
+                    if head < len(stages):
+                        outputs[head].go_live()
+
+        # After a failure the head may never reach later stages; flush
+        # whatever they buffered so no output is lost.
+        for output in outputs:
+            output.go_live()
+
+        if errors:
+            first = min(errors, key=order.__getitem__)
+            raise errors[first]
+        return {s.name: results[s.name] for s in stages}
+
+
+# ----------------------------------------------------------------------
+# Ordered output capture
+# ----------------------------------------------------------------------
+
+_current = threading.local()
+
+
+class _StageOutput:
+    """Output of one stage: buffered until the stage reaches the head of the line.
+
+    Released output goes to ``parent`` (the stage that started a nested graph)
+    when there is one, else straight to the target stream.
+    """
+
+    def __init__(self, parent: Optional["_StageOutput"] = None) -> None:
+        self._lock = threading.Lock()
+        self._chunks: List[Tuple[TextIO, str]] = []
+        self._parent = parent
+        self.live = False
+
+    def write(self, target: TextIO, text: str) -> None:
+        with self._lock:
+            if self.live:
+                self._emit(target, text)
+            else:
+                self._chunks.append((target, text))
+
+    def go_live(self) -> None:
+        with self._lock:
+            for target, text in self._chunks:
+                self._emit(target, text)
+                if self._parent is None:
+                    target.flush()  # keep stdout/stderr interleaving as written
+            self._chunks.clear()
+            self.live = True
+
+    def _emit(self, target: TextIO, text: str) -> None:
+        if self._parent is not None:
+            self._parent.write(target, text)
+        else:
+            target.write(text)
+
+
+class _RoutingStream:
+    """Stands in for ``sys.stdout``/``sys.stderr`` during a parallel run."""
+
+    def __init__(self, target: TextIO):
+        self._target = target
+
+    def write(self, text: str) -> int:
+        output = getattr(_current, "output", None)
+        if output is None or not isinstance(text, str):
+            return self._target.write(text)
+        output.write(self._target, text)
+        return len(text)
+
+    def flush(self) -> None:
+        output = getattr(_current, "output", None)
+        if output is None or output.live:
+            self._target.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+
+@contextmanager
+def _capture_streams() -> Iterator[None]:
+    # A nested graph reuses the enclosing graph's streams: routing already
+    # follows the thread's current stage output.
+    if isinstance(sys.stdout, _RoutingStream):
+        yield
+        return
+    saved = (sys.stdout, sys.stderr)
+    sys.stdout = _RoutingStream(sys.stdout)
+    sys.stderr = _RoutingStream(sys.stderr)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = saved
@@ -7,10 +7,12 @@ Consolidated tech detection logic from:
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set
 
 from generator.tech import NPM_PKG_ALIASES, PKG_MAP, TECH_README_KEYWORDS
+from generator.utils.file_index import ProjectFileIndex, get_file_index
 
 # Communication / notification channels. These are never promoted into a
 # project's build ``tech_stack`` from README prose alone — a dashboard that
@@ -70,32 +72,28 @@ def detect_from_readme(readme_content: str) -> Set[str]:
     Detect tech stack from README content (keyword-based).
     Less reliable than detect_from_dependencies - use as confirmation only.
 
-    Each keyword match is checked via the shared negation helper
-    (``generator.utils.negation.keyword_has_non_negated_mention``) so
-    prose like *"This is not a Python application"* does not cause
-    ``python`` to leak into the detected set. A tech is included only
-    when at least one of its keywords matches in a non-negated context.
+    Each keyword match is checked with the shared negation policy
+    (``generator.utils.negation``) so prose like *"This is not a Python
+    application"* does not cause ``python`` to leak into the detected set.
+    A tech is included only when at least one of its keywords matches in a
+    non-negated context. All keywords are matched in one pass by a
+    ``KeywordMatcher`` compiled once from ``TECH_README_KEYWORDS``.
     """
-    from generator.utils.negation import keyword_has_non_negated_mention
+    mentioned = _readme_keyword_matcher().matches(readme_content.lower())
+    return {tech for tech, keywords in TECH_README_KEYWORDS.items() if any(kw in mentioned for kw in keywords)}
 
-    detected = set()
-    content_lower = readme_content.lower()
-
-    for tech, keywords in TECH_README_KEYWORDS.items():
-        # Multi-word keywords like "fast api" need permissive (substring)
-        # matching; single-word keywords like "python" should be
-        # word-bounded to avoid 'jython' -> python false positives.
-        if any(
-            keyword_has_non_negated_mention(
-                kw,
-                content_lower,
-                word_boundary=(" " not in kw),
-            )
-            for kw in keywords
-        ):
-            detected.add(tech)
 
-    return detected
+@lru_cache(maxsize=1)
+def _readme_keyword_matcher():
+    from generator.utils.negation import KeywordMatcher
+
+    # Multi-word keywords like "fast api" need permissive (substring)
+    # matching; single-word keywords like "python" should be
+    # word-bounded to avoid 'jython' -> python false positives.
+    return KeywordMatcher(
+        (kw for keywords in TECH_README_KEYWORDS.values() for kw in keywords),
+        word_boundary=lambda kw: " " not in kw,
+    )
 
 
 def detect_from_dependencies(project_path: Path) -> Set[str]:
@@ -165,12 +163,19 @@ def detect_from_dependencies(project_path: Path) -> Set[str]:
     return detected
 
 
-def detect_tech_stack(project_path: Path, readme_content: str = "") -> List[str]:
+def detect_tech_stack(
+    project_path: Path,
+    readme_content: str = "",
+    file_index: Optional[ProjectFileIndex] = None,
+) -> List[str]:
     """
     Full tech stack detection: dependencies + files + README confirmation.
 
     This is the primary entry point for tech detection.
     Consolidated from CoworkSkillCreator._detect_tech_stack().
+
+    ``file_index`` lets pipeline callers share their single tree walk; when
+    omitted the active pipeline index (or a fresh walk) is used.
     """
     detected = set()
 
@@ -178,7 +183,7 @@ def detect_tech_stack(project_path: Path, readme_content: str = "") -> List[str]
     detected.update(detect_from_dependencies(project_path))
 
     # 2. Check for tech-specific files
-    detected.update(_detect_from_files(project_path))
+    detected.update(_detect_from_files(project_path, file_index))
 
     # 3. README - confirmation for common techs, primary source for canvas/DXF/specialized techs
     if readme_content:
@@ -260,20 +265,7 @@ def _reconcile_test_runner(project_path: Path, detected: Set[str]) -> List[str]:
     return list(detected)
 
 
-_FILE_SCAN_EXCLUDE: frozenset = frozenset(
-    {".web", "node_modules", ".venv", "venv", "__pycache__", ".git", "dist", "build"}
-)
-
-
-def _rglob_excluding(project_path: Path, pattern: str) -> bool:
-    """Return True if any file matching pattern exists outside excluded directories."""
-    for p in project_path.rglob(pattern):
-        if not any(part in _FILE_SCAN_EXCLUDE for part in p.parts):
-            return True
-    return False
-
-
-def _detect_from_files(project_path: Path) -> Set[str]:
+def _detect_from_files(project_path: Path, file_index: Optional[ProjectFileIndex] = None) -> Set[str]:
     """Detect tech from actual project files, skipping generated/vendor directories.
 
     Two complementary signals:
@@ -289,12 +281,13 @@ def _detect_from_files(project_path: Path) -> Set[str]:
     from generator.tech.lookups import DIR_DETECTION_MAP, FILE_DETECTION_MAP
 
     detected = set()
+    index = get_file_index(project_path, file_index)
 
-    if _rglob_excluding(project_path, "*.py"):
+    if index.has_suffix(".py"):
         detected.add("python")
-    if _rglob_excluding(project_path, "*.ts") or _rglob_excluding(project_path, "*.tsx"):
+    if index.has_suffix(".ts", ".tsx"):
         detected.add("typescript")
-    if _rglob_excluding(project_path, "*.jsx"):
+    if index.has_suffix(".jsx"):
         detected.add("react")
 
     # Config-file presence (root-level, exact filename) — vendor dirs are not
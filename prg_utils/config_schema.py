@@ -49,12 +49,18 @@ class SkillSourcesConfig(BaseModel):
     preference_order: List[str] = Field(default_factory=lambda: ["learned", "awesome", "builtin"])
 
 
+class AnalysisConfig(BaseModel):
+    # Extra gitignore-style patterns, applied after .gitignore and .prgignore.
+    ignore: List[str] = Field(default_factory=list)
+
+
 class RootConfig(BaseModel):
     llm: LLMConfig = Field(default_factory=LLMConfig)
     git: GitConfig = Field(default_factory=GitConfig)
     generation: GenerationConfig = Field(default_factory=GenerationConfig)
     packs: PacksConfig = Field(default_factory=PacksConfig)
     skill_sources: SkillSourcesConfig = Field(default_factory=SkillSourcesConfig)
+    analysis: AnalysisConfig = Field(default_factory=AnalysisConfig)
 
 
 def validate_config(config_dict: Dict) -> RootConfig:
@@ -205,3 +205,89 @@ def get_current_branch(repo_path: Union[str, Path] = ".") -> str:
         text=True,
     )
     return result.stdout.strip()
+
+
+def _git_output(args: Sequence[str], repo_path: Union[str, Path]) -> Optional[str]:
+    """Stdout of ``git -C repo_path <args>``, or None when git fails or is missing."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", _posix(repo_path), *args],
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def head_commit(repo_path: Union[str, Path] = ".") -> Optional[str]:
+    """Return the full SHA of HEAD, or None outside a repository or before the first commit."""
+    out = _git_output(["rev-parse", "--verify", "-q", "HEAD"], repo_path)
+    return out.strip() if out else None
+
+
+def changed_since(commit: str, repo_path: Union[str, Path] = ".") -> Optional[List[str]]:
+    """Paths under ``repo_path`` changed between ``commit`` and HEAD.
+
+    Paths are relative to ``repo_path``. A rename is reported as its old and
+    new path. Returns None when ``commit`` is unknown (e.g. after a history
+    rewrite or gc), so callers can fall back to a full scan.
+    """
+    out = _git_output(["diff", "--name-only", "--relative", "--no-renames", "-z", commit, "HEAD", "--"], repo_path)
+    if out is None:
+        return None
+    return [p for p in out.split("\0") if p]
+
+
+def dirty_paths(repo_path: Union[str, Path] = ".") -> Optional[List[str]]:
+    """Modified, staged, deleted and untracked (not ignored) paths under ``repo_path``.
+
+    Paths are relative to ``repo_path``; untracked directories are expanded
+    to their files. Returns None when the status cannot be read.
+    """
+    prefix = _git_output(["rev-parse", "--show-prefix"], repo_path)
+    out = _git_output(["status", "--porcelain", "-z", "--untracked-files=all", "--no-renames", "--", "."], repo_path)
+    if prefix is None or out is None:
+        return None
+    prefix = prefix.strip()
+    paths: List[str] = []
+    for record in out.split("\0"):
+        # "XY path" — status code, a space, then the repository-relative path.
+        path = record[3:]
+        if path.startswith(prefix):
+            paths.append(path[len(prefix) :])
+    return [p for p in paths if p]
+
+
+def branch_exists(name: str, repo_path: Union[str, Path] = ".") -> bool:
+    """Return True when the local branch ``name`` exists."""
+    return _git_output(["rev-parse", "--verify", "-q", f"refs/heads/{name}"], repo_path) is not None
+
+
+def common_git_dir(repo_path: Union[str, Path] = ".") -> Optional[Path]:
+    """The repository's shared .git directory (the same for every worktree), or None outside a repo."""
+    out = _git_output(["rev-parse", "--path-format=absolute", "--git-common-dir"], repo_path)
+    return Path(out.strip()) if out else None
+
+
+def add_worktree(path: Union[str, Path], branch: str, repo_path: Union[str, Path] = ".") -> None:
+    """Check out ``branch`` in a new worktree at ``path``, creating the branch from HEAD if needed."""
+    repo = _posix(repo_path)
+    subprocess.run(["git", "-C", repo, "worktree", "prune"], capture_output=True, text=True)
+    if branch_exists(branch, repo_path):
+        args = ["worktree", "add", _posix(path), branch]
+    else:
+        args = ["worktree", "add", "-b", branch, _posix(path)]
+    subprocess.run(["git", "-C", repo, *args], capture_output=True, check=True, text=True)
+
+
+def remove_worktree(path: Union[str, Path], repo_path: Union[str, Path] = ".") -> bool:
+    """Remove the worktree at ``path``; returns False (and keeps it) when it has uncommitted changes."""
+    result = subprocess.run(
+        ["git", "-C", _posix(repo_path), "worktree", "remove", _posix(path)],
+        capture_output=True,
+        text=True,
+    )
+    return result.returncode == 0
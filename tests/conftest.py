@@ -37,6 +37,36 @@ def _isolated_global_dir(tmp_path_factory):
     SkillPathManager.GLOBAL_LEARNED = original_learned
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _no_llm_response_cache():
+    """Keep mocked AI clients away from the persistent LLM response cache.
+
+    Tests stub ``generate`` with different answers for identical prompts; a
+    shared ~/.prg/llm-cache would replay one test's response into another.
+    Tests of the cache itself construct ``LLMResponseCache`` on a tmp dir.
+    """
+    import os
+
+    previous = os.environ.get("PRG_NO_LLM_CACHE")
+    os.environ["PRG_NO_LLM_CACHE"] = "1"
+    yield
+    if previous is None:
+        os.environ.pop("PRG_NO_LLM_CACHE", None)
+    else:
+        os.environ["PRG_NO_LLM_CACHE"] = previous
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client_pool():
+    """Drop pooled SDK clients and AI sessions so each test's patched constructor builds its own."""
+    from generator.ai.client_pool import clear_client_pool
+    from generator.ai.sessions import clear_sessions
+
+    yield
+    clear_client_pool()
+    clear_sessions()
+
+
 @pytest.fixture
 def sample_project_path():
     """Return path to sample project for testing."""
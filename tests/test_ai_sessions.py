@@ -0,0 +1,114 @@
+"""Tests for process-wide AI client sessions (generator.ai.sessions)."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from generator.ai.ai_client import AIClient
+from generator.ai.sessions import AISession, ai_session, sessions
+from generator.ralph import FeatureState, RalphEngine
+
+
+class _MeteredFake(AIClient):
+    """Reports usage the way provider clients do, via ``_record_usage``."""
+
+    def __init__(self, fail=False):
+        super().__init__("key")
+        self.fail = fail
+        self.models = []
+
+    def generate(self, prompt, max_tokens=2000, model=None, temperature=0.7, system_message=None):
+        self.models.append(model)
+        if self.fail:
+            raise RuntimeError("Fake generation failed")
+        self._record_usage(SimpleNamespace(prompt_tokens=10, completion_tokens=4), "prompt_tokens", "completion_tokens")
+        return "answer"
+
+    def stream(self, prompt, max_tokens=2000, model=None, temperature=0.7, system_message=None):
+        yield "ans"
+        yield "wer"
+        self._record_usage(SimpleNamespace(prompt_tokens=3, completion_tokens=2), "prompt_tokens", "completion_tokens")
+
+
+class TestRegistry:
+    def test_one_session_per_provider_key_and_model(self):
+        with patch("generator.ai.factory.create_ai_client", side_effect=lambda *a, **k: _MeteredFake()) as factory:
+            first = ai_session("groq", api_key="k")
+            assert ai_session("groq", api_key="k") is first
+            assert ai_session("groq", api_key="k", model="big") is not first
+            assert ai_session("groq", api_key="other") is not first
+        assert factory.call_count == 3
+        assert sessions()[0] is first
+
+    def test_failed_client_setup_is_not_registered(self):
+        with patch("generator.ai.factory.create_ai_client", side_effect=ImportError("no sdk")):
+            with pytest.raises(ImportError):
+                ai_session("groq")
+        assert sessions() == []
+
+
+class TestStats:
+    def test_generate_tracks_requests_tokens_latency_and_failures(self):
+        inner = _MeteredFake()
+        session = AISession(inner, "fake", model="small")
+
+        assert session.generate("p") == "answer"
+        assert session.generate("p", model="big") == "answer"
+        inner.fail = True
+        with pytest.raises(RuntimeError):
+            session.generate("p")
+
+        stats = session.stats
+        assert (stats.requests, stats.failures) == (3, 1)
+        assert (stats.input_tokens, stats.output_tokens) == (20, 8)
+        assert stats.latency_s > 0
+        assert inner.models == ["small", "big", "small"]
+
+    def test_stream_tokens_go_to_the_streaming_session_only(self):
+        streaming = AISession(_MeteredFake(), "a")
+        other = AISession(_MeteredFake(), "b")
+
+        pieces = []
+        for piece in streaming.stream("p"):
+            pieces.append(piece)
+            other.generate("meanwhile")
+
+        assert "".join(pieces) == "answer"
+        assert (streaming.stats.requests, streaming.stats.input_tokens) == (1, 3)
+        assert (other.stats.requests, other.stats.input_tokens) == (2, 20)
+
+    def test_agenerate_is_metered(self):
+        session = AISession(_MeteredFake(), "fake")
+
+        async def batch():
+            return await asyncio.gather(*(session.agenerate(f"p{i}") for i in range(3)))
+
+        assert asyncio.run(batch()) == ["answer"] * 3
+        assert (session.stats.requests, session.stats.input_tokens) == (3, 30)
+
+
+class TestInjection:
+    def test_ralph_iterations_share_one_client(self, tmp_path: Path):
+        feature_dir = tmp_path / "features" / "FEATURE-001"
+        FeatureState(feature_id="FEATURE-001", task="t", branch_name="b").save(feature_dir / "STATE.json")
+        (feature_dir / "PLAN.md").write_text("# Plan\n")
+        engine = RalphEngine(feature_id="FEATURE-001", project_path=tmp_path, verbose=False)
+
+        with (
+            patch("generator.ai.factory.create_ai_client", return_value=_MeteredFake()) as factory,
+            patch("generator.planning.task_agent.TaskImplementationAgent") as agent_cls,
+            patch("generator.planning.self_reviewer.SelfReviewer") as reviewer_cls,
+        ):
+            agent_cls.return_value.implement.return_value = {}
+            reviewer_cls.return_value.review.return_value = MagicMock(verdict="Pass", to_markdown=lambda: "ok")
+            for iteration in (1, 2):
+                engine.state.iteration = iteration
+                engine._agent_execute("ctx", None, "T1")
+                engine._run_self_review()
+
+        factory.assert_called_once()
+        clients = {id(call.kwargs["client"]) for call in agent_cls.call_args_list + reviewer_cls.call_args_list}
+        assert clients == {id(engine._ai_session())}
@@ -0,0 +1,195 @@
+"""Tests for pooled provider clients, streaming and the async client API."""
+
+import asyncio
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from generator.ai.ai_client import AIClient, normalized_stream
+from generator.ai.client_pool import pooled_async_client, pooled_client
+from generator.ai.hardening import generate_with_validator
+from generator.ai.providers.openai_client import OpenAIClient
+from generator.ai.response_cache import CachingAIClient, LLMResponseCache
+from generator.utils.encoding import normalize_mojibake
+
+MOJIBAKE = "ג€” Γ¥ל Γ£ו Γזע "
+COMPLETE = "## Design\n\n" + "The cache client wraps every read and write in one place. " * 4 + "\n"
+
+
+class _FakeClient(AIClient):
+    def __init__(self, responses):
+        super().__init__("key")
+        self.responses = list(responses)
+        self.calls = 0
+
+    def generate(self, prompt, max_tokens=2000, model=None, temperature=0.7, system_message=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def _chunk(content=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content is not None else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class TestPool:
+    def test_sync_clients_are_built_once_per_key(self):
+        build = MagicMock(side_effect=lambda: object())
+        first = pooled_client(("p", "k"), build)
+        assert pooled_client(("p", "k"), build) is first
+        assert pooled_client(("p", "other"), build) is not first
+        assert build.call_count == 2
+
+    def test_async_clients_are_per_event_loop(self):
+        async def get():
+            return pooled_async_client(("p", "k"), object), pooled_async_client(("p", "k"), object)
+
+        a1, a2 = asyncio.run(get())
+        b1, _ = asyncio.run(get())
+        assert a1 is a2 and a1 is not b1
+
+    def test_provider_clients_share_one_sdk_client(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        with patch("generator.ai.providers.openai_client._OpenAI") as sdk:
+            assert OpenAIClient().client is OpenAIClient().client
+            sdk.assert_called_once_with(api_key="sk-test", timeout=OpenAIClient.DEFAULT_TIMEOUT)
+
+
+class TestStreaming:
+    def test_normalized_stream_matches_whole_text_normalization(self):
+        rng = random.Random(5)
+        for _ in range(50):
+            text = "".join(rng.choice([MOJIBAKE, "plain text ", "Γ", "ג€", "→ ok "]) for _ in range(12))
+            cuts = sorted(rng.sample(range(1, len(text)), rng.randint(1, 10)))
+            pieces = [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+            assert "".join(normalized_stream(pieces)) == normalize_mojibake(text)
+
+    def test_base_class_defaults_fall_back_to_generate(self):
+        client = _FakeClient(["one", "two", "three"])
+        assert list(client.stream("p")) == ["one"]
+        assert asyncio.run(client.agenerate("p")) == "two"
+
+        async def collect():
+            return [piece async for piece in client.astream("p")]
+
+        assert asyncio.run(collect()) == ["three"]
+
+    def test_openai_stream_yields_deltas_and_records_usage(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        usage = SimpleNamespace(prompt_tokens=7, completion_tokens=3)
+        with (
+            patch("generator.ai.providers.openai_client._OpenAI") as sdk,
+            patch("generator.utils.profiler.record_llm_call") as record,
+        ):
+            sdk.return_value.chat.completions.create.return_value = iter(
+                [_chunk("Hel"), _chunk("lo Γ"), _chunk("¥ל"), _chunk(usage=usage)]
+            )
+            pieces = list(OpenAIClient().stream("hi", max_tokens=50))
+
+        assert "".join(pieces) == "Hello ❌"
+        kwargs = sdk.return_value.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True and kwargs["max_tokens"] == 50
+        record.assert_called_once_with(7, 3)
+
+    def test_openai_agenerate_uses_pooled_async_client(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="done"))], usage=None)
+        with (
+            patch("generator.ai.providers.openai_client._OpenAI"),
+            patch("generator.ai.providers.openai_client._AsyncOpenAI") as async_sdk,
+        ):
+            async_sdk.return_value.chat.completions.create = AsyncMock(return_value=reply)
+            client = OpenAIClient()
+
+            async def batch():
+                return await asyncio.gather(*(client.agenerate(f"p{i}") for i in range(4)))
+
+            assert asyncio.run(batch()) == ["done"] * 4
+        async_sdk.assert_called_once()
+
+    def test_caching_client_stores_streamed_response(self, tmp_path):
+        inner = _FakeClient(["streamed answer"])
+        client = CachingAIClient(inner, "fake", LLMResponseCache(root=tmp_path))
+        assert "".join(client.stream("p")) == "streamed answer"
+        assert list(client.stream("p")) == ["streamed answer"]
+        assert inner.calls == 1
+
+
+class TestProgress:
+    def test_progress_reports_running_count_and_retries_truncation(self):
+        truncated = "## Design\n\nThe cache client wraps every read and write, and"
+        client = _FakeClient([])
+        streams = iter([[truncated[:20], truncated[20:]], [COMPLETE[:50], COMPLETE[50:]]])
+        client.stream = MagicMock(side_effect=lambda *a, **k: iter(next(streams)))
+        progress = []
+
+        result = generate_with_validator(client, "design it", on_progress=progress.append)
+
+        assert result == COMPLETE
+        assert progress == [20, len(truncated), 50, len(COMPLETE)]
+        assert client.stream.call_count == 2 and client.calls == 0
+
+
+class _CompletionsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        base = {"id": "c1", "created": 0, "model": request["model"]}
+        if request.get("stream"):
+            events = [
+                {**base, "object": "chat.completion.chunk", "choices": [{"index": 0, "delta": {"content": part}}]}
+                for part in ("Hello", " world")
+            ]
+            body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+            content_type = "text/event-stream"
+        else:
+            message = {"role": "assistant", "content": "pong"}
+            body = json.dumps(
+                {
+                    **base,
+                    "object": "chat.completion",
+                    "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                }
+            )
+            content_type = "application/json"
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class TestLocalServer:
+    def test_openai_calls_reuse_one_connection(self, monkeypatch):
+        pytest.importorskip("openai")
+        connections = []
+
+        class Server(ThreadingHTTPServer):
+            def get_request(self):
+                conn, addr = super().get_request()
+                connections.append(addr)
+                return conn, addr
+
+        server = Server(("127.0.0.1", 0), _CompletionsHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+            monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+            assert [OpenAIClient().generate(f"ping {i}") for i in range(3)] == ["pong"] * 3
+            assert "".join(OpenAIClient().stream("stream")) == "Hello world"
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(connections) == 1
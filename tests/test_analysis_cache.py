@@ -0,0 +1,154 @@
+"""Tests for the persistent per-file AnalysisCache."""
+
+import os
+
+from generator.analyzers.analysis_cache import CACHE_DIRNAME, AnalysisCache
+from generator.analyzers.structure_analyzer import StructureAnalyzer
+from generator.extractors.code_extractor import CodeExampleExtractor
+from generator.utils.file_index import ProjectFileIndex
+
+
+def _age(path, seconds=60):
+    """Push a file's mtime into the past so it is outside the racy window."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _make_project(root):
+    (root / "app").mkdir()
+    (root / "app" / "main.py").write_text("import click\n\n@click.command()\ndef cli():\n    pass\n")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_main.py").write_text(
+        "import pytest\n\ndef test_a():\n    pass\n\ndef test_b():\n    pass\n"
+    )
+    for p in (root / "app" / "main.py", root / "tests" / "test_main.py"):
+        _age(p)
+
+
+def _analyze(analyzer):
+    return analyzer.detect_project_type(), analyzer.analyze_tests()
+
+
+def _entry(root, rel):
+    return ProjectFileIndex.build(root).get(rel)
+
+
+class TestLookup:
+    def test_second_lookup_is_a_hit_without_recompute(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        _age(tmp_path / "a.py")
+        cache = AnalysisCache()
+        calls = []
+
+        def compute(text):
+            calls.append(text)
+            return len(text)
+
+        entry = _entry(tmp_path, "a.py")
+        assert cache.get(entry, "len", compute) == 6
+        assert cache.get(entry, "len", compute) == 6
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_touch_with_same_content_is_a_digest_hit(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+        _age(path, 120)
+        cache = AnalysisCache()
+        cache.get(_entry(tmp_path, "a.py"), "len", len)
+
+        _age(path, 60)  # new mtime, same bytes
+        calls = []
+        cache.get(_entry(tmp_path, "a.py"), "len", lambda t: calls.append(t) or len(t))
+        assert calls == []
+        assert cache.hits == 1
+
+    def test_edit_with_same_size_is_recomputed(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+        _age(path, 120)
+        cache = AnalysisCache()
+        assert cache.get(_entry(tmp_path, "a.py"), "text", str) == "x = 1\n"
+
+        path.write_text("y = 2\n")
+        _age(path, 60)
+        assert cache.get(_entry(tmp_path, "a.py"), "text", str) == "y = 2\n"
+
+    def test_recent_mtime_is_verified_by_digest(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+        cache = AnalysisCache()
+        entry = _entry(tmp_path, "a.py")
+        cache.get(entry, "text", str)
+
+        # Same-second rewrite: stat key unchanged but content differs.
+        path.write_bytes(b"y = 2\n")
+        os.utime(path, ns=(entry.mtime_ns, entry.mtime_ns))
+        assert cache.get(_entry(tmp_path, "a.py"), "text", str) == "y = 2\n"
+
+
+class TestPersistence:
+    def test_save_and_load_round_trip(self, tmp_path):
+        _make_project(tmp_path)
+        out = tmp_path / ".clinerules"
+        index = ProjectFileIndex.build(tmp_path)
+
+        cold = AnalysisCache.load(out)
+        _analyze(StructureAnalyzer(tmp_path, file_index=index, analysis_cache=cold))
+        assert cold.misses > 0
+        cold.save(index)
+        assert (out / CACHE_DIRNAME / "analysis.json").exists()
+
+        warm = AnalysisCache.load(out)
+        _analyze(StructureAnalyzer(tmp_path, file_index=index, analysis_cache=warm))
+        assert warm.misses == 0
+        assert warm.hits == cold.misses
+
+    def test_save_prunes_deleted_files(self, tmp_path):
+        _make_project(tmp_path)
+        out = tmp_path / ".clinerules"
+        cache = AnalysisCache.load(out)
+        _analyze(StructureAnalyzer(tmp_path, analysis_cache=cache))
+        cache.save(ProjectFileIndex.build(tmp_path))
+
+        (tmp_path / "tests" / "test_main.py").unlink()
+        reloaded = AnalysisCache.load(out)
+        reloaded.save(ProjectFileIndex.build(tmp_path))
+        assert AnalysisCache.load(out).stats()["entries"] == 1
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        out = tmp_path / ".clinerules"
+        (out / CACHE_DIRNAME).mkdir(parents=True)
+        (out / CACHE_DIRNAME / "analysis.json").write_text("{not json")
+        assert AnalysisCache.load(out).stats()["entries"] == 0
+
+
+class TestConsumers:
+    def test_structure_results_match_uncached_analysis(self, tmp_path):
+        _make_project(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+        cache = AnalysisCache()
+        first = _analyze(StructureAnalyzer(tmp_path, file_index=index, analysis_cache=cache))
+        second = _analyze(StructureAnalyzer(tmp_path, file_index=index, analysis_cache=cache))
+
+        assert first == second
+        assert first[1]["framework"] == "pytest"
+        assert first[1]["test_files"] == 1
+
+    def test_code_extractor_reuses_cached_symbols(self, tmp_path):
+        _make_project(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+        cache = AnalysisCache()
+
+        first = CodeExampleExtractor(file_index=index, analysis_cache=cache).extract_examples_for_skill(
+            tmp_path, "cli", []
+        )
+        misses = cache.misses
+        second = CodeExampleExtractor(file_index=index, analysis_cache=cache).extract_examples_for_skill(
+            tmp_path, "cli", []
+        )
+
+        assert first == second
+        assert cache.misses == misses
+        decorated = [e for e in first if e["type"] == "decorated_function"]
+        assert decorated and decorated[0]["code"].startswith("def cli()")
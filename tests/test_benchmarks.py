@@ -0,0 +1,50 @@
+"""Smoke tests for the offline benchmark suite (benchmarks/)."""
+
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.suite import available_benchmarks, compare, run_suite
+from benchmarks.synthetic import SIZES, SPEC_FILENAME, generate_project
+
+
+def test_synthetic_project_is_deterministic_and_reused(tmp_path):
+    spec = SIZES["tiny"]
+    first = generate_project(tmp_path / "a", spec)
+    second = generate_project(tmp_path / "b", spec)
+
+    files_a = sorted(p.relative_to(first).as_posix() for p in first.rglob("*") if p.is_file())
+    files_b = sorted(p.relative_to(second).as_posix() for p in second.rglob("*") if p.is_file())
+    assert files_a == files_b
+    assert (first / "README.md").read_text(encoding="utf-8") == (second / "README.md").read_text(encoding="utf-8")
+    assert len([f for f in files_a if not f.startswith(("node_modules/", ".venv/"))]) >= spec.files
+
+    marker_mtime = (first / SPEC_FILENAME).stat().st_mtime_ns
+    generate_project(first, spec)
+    assert (first / SPEC_FILENAME).stat().st_mtime_ns == marker_mtime
+
+
+def test_tiny_suite_runs_every_benchmark(tmp_path):
+    document = run_suite("tiny", tmp_path, repeat=1)
+
+    assert list(document["results"]) == available_benchmarks()
+    for result in document["results"].values():
+        assert len(result["runs"]) == 1
+        assert result["min_s"] <= result["median_s"] <= result["max_s"]
+    # The suite used its own global skill dir, not the session one.
+    assert (tmp_path / "tiny" / "prg-global" / "learned").is_dir()
+
+
+def test_cli_writes_results_and_flags_regressions(tmp_path):
+    output = tmp_path / "current.json"
+    args = ["--size", "tiny", "--repeat", "1", "--only", "extract_tech_stack", "--workdir", str(tmp_path)]
+    assert main(args + ["--output", str(output)]) == 0
+    document = json.loads(output.read_text(encoding="utf-8"))
+    assert document["size"] == "tiny"
+
+    baseline = {
+        "results": {"extract_tech_stack": {"median_s": document["results"]["extract_tech_stack"]["median_s"] / 10}}
+    }
+    (rows,) = compare(document, baseline)
+    assert rows["regressed"]
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline), encoding="utf-8")
+    assert main(args + ["--output", str(output), "--compare", str(tmp_path / "baseline.json")]) == 1
@@ -82,5 +82,63 @@ class TestDependencyParser(unittest.TestCase):
             # Version/constraint might need adjusting based on how packaging parses it.
 
 
+class TestSystemDependencyScan(unittest.TestCase):
+    def setUp(self):
+        import shutil
+        import tempfile
+
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def _write(self, rel, text):
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def test_virtualenvs_and_vendored_trees_are_pruned(self):
+        self._write(".venv/lib/python3.11/site-packages/gv/__init__.py", "import graphviz\n")
+        self._write("node_modules/x/setup.py", "import pytesseract\n")
+        self._write("vendor/site-packages/db.py", "import pymysql\n")
+        self._write("app/main.py", "r = redis.Redis()\n")
+        self.assertEqual(DependencyParser.detect_system_dependencies(self.root), ["redis-server"])
+
+    def test_first_party_source_is_scanned_before_tests(self):
+        for i in range(60):
+            self._write(f"tests/test_{i:02d}.py", "def test(): pass\n")
+        self._write("pkg/deep/er/media.py", 'subprocess.run(["ffmpeg", "-i", src])\n')
+        self.assertEqual(DependencyParser.detect_system_dependencies(self.root), ["ffmpeg"])
+
+    def test_stops_once_every_marker_is_found(self):
+        from unittest.mock import patch
+
+        self._write(
+            "all.py",
+            "ffmpeg imagemagick graphviz pytesseract redis:// postgresql:// mysql://\n",
+        )
+        for i in range(10):
+            self._write(f"pkg/m{i}.py", "x = 1\n")
+        with patch("builtins.open", wraps=open) as opened:
+            found = DependencyParser.detect_system_dependencies(self.root)
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual(
+            sorted(found), ["ffmpeg", "graphviz", "imagemagick", "mysql", "postgresql", "redis-server", "tesseract"]
+        )
+
+    def test_greedy_marker_does_not_hide_others_on_its_line(self):
+        self._write("img.py", "convert the image; import graphviz; more image\n")
+        self.assertEqual(sorted(DependencyParser.detect_system_dependencies(self.root)), ["graphviz", "imagemagick"])
+
+    def test_file_index_gives_the_same_result(self):
+        from generator.utils.file_index import ProjectFileIndex
+
+        self._write("README.md", "Needs a postgresql:// database\n")
+        self._write("svc/cache.py", "URL = 'redis://localhost'\n")
+        self._write("build/lib/old.py", "import graphviz\n")
+        walked = DependencyParser.detect_system_dependencies(self.root)
+        indexed = DependencyParser.detect_system_dependencies(self.root, ProjectFileIndex.build(self.root))
+        self.assertEqual(walked, indexed)
+        self.assertEqual(walked, ["postgresql", "redis-server"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -180,7 +180,7 @@ class TestDesignGenerator:
         sentinel = object()
         with patch("generator.ai.factory.create_ai_client", return_value=sentinel) as factory:
             gen = DesignGenerator(api_key="fake-key", provider="gemini")
-        assert gen.client is sentinel, "AI client not wired — design_generator import path regressed"
+        assert gen.client.inner is sentinel, "AI client not wired — design_generator import path regressed"
         factory.assert_called_once()
 
 
@@ -207,8 +207,9 @@ class TestDesignCLI:
         listed = {line.split()[0] for line in commands_section.splitlines() if line.startswith("  ") and line.strip()}
         assert "design" not in listed
         # But still registered and marked hidden, so dispatch keeps working.
-        assert "design" in cli.commands
-        assert cli.commands["design"].hidden is True
+        design = cli.get_command(None, "design")
+        assert design is not None
+        assert design.hidden is True
 
     def test_design_requires_api_key(self, tmp_path):
         """prg design must exit 1 with a clear error when no API key is set."""
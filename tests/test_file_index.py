@@ -0,0 +1,153 @@
+"""Tests for the shared single-pass ProjectFileIndex."""
+
+import os
+
+from generator.analyzers.incremental_analyzer import IncrementalAnalyzer
+from generator.analyzers.structure_analyzer import StructureAnalyzer
+from generator.utils.file_index import ProjectFileIndex, get_file_index, use_file_index
+
+
+def _make_tree(root):
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / "pkg" / "core.py").write_text("import click\n")
+    (root / "src" / "app.ts").write_text("export {}\n")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_core.py").write_text("def test_a():\n    pass\n")
+    (root / "main.py").write_text("print('hi')\n")
+    (root / "node_modules" / "left-pad").mkdir(parents=True)
+    (root / "node_modules" / "left-pad" / "index.js").write_text("module.exports = 1\n")
+    (root / ".venv" / "lib").mkdir(parents=True)
+    (root / ".venv" / "lib" / "site.py").write_text("")
+    (root / "generated").mkdir()
+    (root / "generated" / "gen.py").write_text("")
+    (root / "build").mkdir()
+    (root / "build" / "out.py").write_text("")
+
+
+class TestBuild:
+    def test_records_path_suffix_size_and_mtime(self, tmp_path):
+        (tmp_path / "a.py").write_text("abc")
+        index = ProjectFileIndex.build(tmp_path)
+
+        entry = index.get("a.py")
+        assert entry is not None
+        assert entry.suffix == ".py"
+        assert entry.size == 3
+        assert entry.mtime_ns == os.stat(tmp_path / "a.py").st_mtime_ns
+        assert entry.path == tmp_path / "a.py"
+
+    def test_prunes_vendor_dirs_at_walk_time(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+
+        rels = {e.rel for e in index}
+        assert "node_modules/left-pad/index.js" not in rels
+        assert ".venv/lib/site.py" not in rels
+        assert "node_modules" not in index.dirs
+        assert "build/out.py" not in rels
+        # Consumer-specific dirs are kept and filtered at query time instead.
+        assert "generated/gen.py" in rels
+
+    def test_walk_order_is_deterministic_preorder(self, tmp_path):
+        _make_tree(tmp_path)
+        rels = [e.rel for e in ProjectFileIndex.build(tmp_path)]
+        assert rels == ["main.py", "generated/gen.py", "src/app.ts", "src/pkg/core.py", "tests/test_core.py"]
+
+    def test_missing_root_yields_empty_index(self, tmp_path):
+        assert len(ProjectFileIndex.build(tmp_path / "nope")) == 0
+
+
+class TestQueries:
+    def test_by_suffix_and_exclude(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+
+        assert {e.rel for e in index.by_suffix(".py", exclude={"generated"})} == {
+            "main.py",
+            "src/pkg/core.py",
+            "tests/test_core.py",
+        }
+        assert index.has_suffix(".ts")
+        assert not index.has_suffix(".py", exclude={"generated", "src", "tests", "main.py"})
+
+    def test_by_name_matches_anywhere(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+        assert [e.rel for e in index.by_name("core.py")] == ["src/pkg/core.py"]
+
+    def test_glob_basename_and_path_patterns(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+
+        assert [e.rel for e in index.glob("test_*.py")] == ["tests/test_core.py"]
+        assert [e.rel for e in index.glob("src/*.ts")] == ["src/app.ts"]
+
+    def test_dirs_lists_non_pruned_directories(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+        assert index.has_dir("src/pkg")
+        assert not index.has_dir(".venv")
+
+
+class TestSharing:
+    def test_active_index_is_reused(self, tmp_path):
+        index = ProjectFileIndex.build(tmp_path)
+        with use_file_index(index):
+            assert get_file_index(tmp_path) is index
+        assert get_file_index(tmp_path) is not index
+
+    def test_explicit_index_wins(self, tmp_path):
+        index = ProjectFileIndex.build(tmp_path)
+        assert get_file_index(tmp_path / "elsewhere", index) is index
+
+
+class TestAnalyzersUseIndex:
+    def test_structure_analyzer_reads_injected_index(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+        analyzer = StructureAnalyzer(tmp_path, file_index=index)
+
+        sources = {p.relative_to(tmp_path).as_posix() for p in analyzer._get_source_files()}
+        assert sources == {"generated/gen.py", "main.py", "src/app.ts", "src/pkg/core.py", "tests/test_core.py"}
+        assert [p.name for p in analyzer._get_test_files()] == ["test_core.py"]
+
+    def test_incremental_analyzer_uses_injected_snapshot(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+        analyzer = IncrementalAnalyzer(tmp_path, tmp_path / ".clinerules", file_index=index)
+        before = analyzer.compute_project_hash()["source"]
+
+        # The injected index is a snapshot — new files are not seen through it.
+        (tmp_path / "extra.py").write_text("x = 1\n")
+        assert analyzer.compute_project_hash()["source"] == before
+        fresh = IncrementalAnalyzer(tmp_path, tmp_path / ".clinerules")
+        assert fresh.compute_project_hash()["source"] != before
+
+
+class TestWithChanges:
+    def test_delta_matches_fresh_walk(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+
+        (tmp_path / "main.py").write_text("print('changed')\n")
+        (tmp_path / "src" / "app.ts").unlink()
+        (tmp_path / "src" / "new").mkdir()
+        (tmp_path / "src" / "new" / "mod.py").write_text("")
+        (tmp_path / "aaa.py").write_text("")
+        updated = index.with_changes(["main.py", "src/app.ts", "src/new/mod.py", "aaa.py", "node_modules/x.js"])
+
+        fresh = ProjectFileIndex.build(tmp_path)
+        assert [(e.rel, e.size) for e in updated] == [(e.rel, e.size) for e in fresh]
+        assert updated.has_dir("src/new")
+        assert index.get("src/app.ts") is not None  # original is untouched
+
+    def test_removed_directory_drops_its_files(self, tmp_path):
+        _make_tree(tmp_path)
+        index = ProjectFileIndex.build(tmp_path)
+
+        import shutil
+
+        shutil.rmtree(tmp_path / "src")
+        updated = index.with_changes(["src/pkg/core.py"])
+        assert not any(e.rel.startswith("src/") for e in updated)
+        assert not updated.has_dir("src/pkg")
@@ -0,0 +1,94 @@
+"""Tests for fragment-cached artifact assembly (generator.utils.fragment_cache)."""
+
+import copy
+import json
+
+from generator.outputs.clinerules_generator import generate_clinerules
+from generator.rules.constitution_generator import generate_constitution
+from generator.rules_generator import generate_rules
+from generator.utils import fragment_cache as fragment_cache_mod
+from generator.utils.fragment_cache import Fragment, FragmentCache
+
+
+def _context():
+    return {
+        "metadata": {"project_type": "python-cli", "tech_stack": ["python", "click", "pytest"], "languages": ["py"]},
+        "dependencies": {"python": [{"name": "click"}, {"name": "pytest-cov"}], "node": []},
+        "structure": {"entry_points": ["cli/main.py"], "patterns": ["python-cli", "pytest-tests"]},
+        "test_patterns": {"framework": "pytest", "test_files": 4, "test_cases": 20, "has_conftest": True},
+        "readme": {"installation": "pip install demo", "usage": "demo run", "raw_readme": "# demo\n"},
+    }
+
+
+def _project_data():
+    return {"name": "demo", "description": "A demo CLI.", "tech_stack": ["python", "click", "pytest"], "features": []}
+
+
+class TestAssemble:
+    def test_rerenders_only_fragments_with_changed_inputs(self):
+        calls = []
+
+        def fragment(name, inputs, text):
+            return Fragment(name, inputs, lambda: calls.append(name) or text(name))
+
+        def fragments(values):
+            return [
+                fragment("head", ("a",), lambda n: f"{n}:{values['a']}|"),
+                fragment("body", ("a", "b"), lambda n: f"{n}:{values['a']}{values['b']}|"),
+                fragment("tail", (), lambda n: f"{n}|"),
+            ]
+
+        cache = FragmentCache()
+        values = {"a": 1, "b": {"x": [1, 2]}}
+        assert cache.assemble("out", fragments(values), values) == "head:1|body:1{'x': [1, 2]}|tail|"
+        calls.clear()
+
+        values = {"a": 1, "b": {"x": [1, 3]}}
+        assert cache.assemble("out", fragments(values), values) == "head:1|body:1{'x': [1, 3]}|tail|"
+        assert calls == ["body"]
+        assert cache.last_rendered["out"] == ["body"]
+
+    def test_persists_and_drops_other_generator_versions(self, tmp_path, monkeypatch):
+        values = {"a": 1}
+        fragments = [Fragment("only", ("a",), lambda: "text")]
+        cache = FragmentCache.load(tmp_path)
+        cache.assemble("out", fragments, values)
+        cache.save()
+
+        warm = FragmentCache.load(tmp_path)
+        warm.assemble("out", [Fragment("only", ("a",), lambda: "changed")], values)
+        assert warm.stats()["reused"] == 1
+
+        monkeypatch.setattr(fragment_cache_mod, "_generator_version", lambda: "9.9.9")
+        assert FragmentCache.load(tmp_path).stats()["artifacts"] == 0
+        data = json.loads(warm.cache_path.read_text(encoding="utf-8"))
+        assert set(data["artifacts"]) == {"out"}
+
+
+class TestArtifacts:
+    def test_test_only_change_rerenders_test_sections(self):
+        cache = FragmentCache()
+        ctx = _context()
+        generate_rules(_project_data(), {}, enhanced_context=ctx, fragment_cache=cache)
+        generate_constitution("demo", ctx, fragment_cache=cache)
+
+        changed = copy.deepcopy(ctx)
+        changed["test_patterns"]["test_files"] = 9
+        rules = generate_rules(_project_data(), {}, enhanced_context=changed, fragment_cache=cache)
+        constitution = generate_constitution("demo", changed, fragment_cache=cache)
+
+        assert rules == generate_rules(_project_data(), {}, enhanced_context=changed)
+        assert constitution == generate_constitution("demo", changed)
+        assert "**Test files**: 9" in rules and "9 test files" in constitution
+        assert cache.last_rendered["rules.md"] == ["DO (must follow)", "TESTING", "CONTEXT STRATEGY", "WORKFLOWS"]
+        assert cache.last_rendered["constitution.md"] == ["Testing Standards"]
+
+    def test_clinerules_skill_change_rerenders_skills_block(self):
+        cache = FragmentCache()
+        ctx = _context()
+        generate_clinerules("demo", {"builtin/code-review"}, ctx, output_dir=".clinerules", fragment_cache=cache)
+
+        selected = {"builtin/code-review", "project/deploy"}
+        yaml_text = generate_clinerules("demo", selected, ctx, output_dir=".clinerules", fragment_cache=cache)
+        assert yaml_text == generate_clinerules("demo", selected, ctx, output_dir=".clinerules")
+        assert cache.last_rendered["clinerules.yaml"] == ["skills"]
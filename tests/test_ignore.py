@@ -0,0 +1,98 @@
+"""Tests for the shared ignore policy (generator.utils.ignore)."""
+
+import os
+import random
+
+import pathspec
+
+from generator.ai.hardening import discover_source_dirs
+from generator.utils import file_index as file_index_mod
+from generator.utils.file_index import ProjectFileIndex
+from generator.utils.ignore import IgnoreMatcher
+from generator.utils.readme_bridge import build_project_tree
+
+
+def _write(path, text=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _git_ignored(spec, rel):
+    """Git semantics on top of pathspec: nothing under an ignored directory is re-included."""
+    parts = rel.split("/")
+    return any(spec.match_file("/".join(parts[:i]) + "/") for i in range(1, len(parts))) or spec.match_file(rel)
+
+
+class TestMatcher:
+    def test_matches_pathspec_on_random_patterns(self):
+        rng = random.Random(11)
+        pool = ["data/", "*.log", "/out", "docs/*.md", "build", "cache*/", "a/b/", "x?.py", "!keep.log", "**/tmp"]
+        names = ["data", "out", "docs", "build", "cache1", "a", "b", "tmp", "src"]
+        leaves = ["x1.py", "keep.log", "err.log", "readme.md", "main.py"]
+        for _ in range(40):
+            patterns = rng.sample(pool, rng.randint(1, 5))
+            spec = pathspec.GitIgnoreSpec.from_lines(patterns)
+            matcher = IgnoreMatcher(patterns, dir_names=())
+            for _ in range(30):
+                parts = [rng.choice(names) for _ in range(rng.randint(0, 3))] + [rng.choice(leaves)]
+                rel = "/".join(parts)
+                assert matcher.ignores_path(rel) == _git_ignored(spec, rel), (patterns, rel)
+
+    def test_defaults_and_negated_default(self):
+        assert IgnoreMatcher().ignores("pkg/foo.egg-info", is_dir=True)
+        assert IgnoreMatcher().ignores_path("src/node_modules/x/index.js")
+        assert not IgnoreMatcher(["!build/"]).ignores("build", is_dir=True)
+
+    def test_for_project_combines_sources_in_order(self, tmp_path):
+        _write(tmp_path / ".gitignore", "*.csv\n")
+        _write(tmp_path / ".prgignore", "fixtures/\n")
+        matcher = IgnoreMatcher.for_project(tmp_path, extra=["!keep.csv"])
+        assert matcher.ignores("a.csv")
+        assert not matcher.ignores("keep.csv")
+        assert matcher.ignores("tests/fixtures", is_dir=True)
+
+
+class TestWalkers:
+    def test_index_never_enters_ignored_trees(self, tmp_path, monkeypatch):
+        _write(tmp_path / ".gitignore", "data/\n*.log\n")
+        _write(tmp_path / "src" / "app.py")
+        _write(tmp_path / "src" / "debug.log")
+        _write(tmp_path / "data" / "raw" / "dump.py")
+        _write(tmp_path / "env" / "pyvenv.cfg")
+        _write(tmp_path / "env" / "lib" / "site.py")
+
+        listed = []
+        real_scandir = os.scandir
+
+        def scandir(path):
+            listed.append(os.path.relpath(path, tmp_path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(file_index_mod.os, "scandir", scandir)
+        index = ProjectFileIndex.build(tmp_path)
+
+        assert {e.rel for e in index} == {".gitignore", "src/app.py"}
+        assert sorted(listed) == [".", "src"]
+
+    def test_delta_respects_ignore(self, tmp_path):
+        _write(tmp_path / ".gitignore", "data/\n")
+        _write(tmp_path / "app.py")
+        index = ProjectFileIndex.build(tmp_path)
+        _write(tmp_path / "data" / "new.py")
+        _write(tmp_path / "env" / "pyvenv.cfg")
+        _write(tmp_path / "env" / "lib" / "site.py")
+        _write(tmp_path / "src" / "new.py")
+
+        updated = index.with_changes(["data/new.py", "env/lib/site.py", "src/new.py"])
+        assert {e.rel for e in updated} == {".gitignore", "app.py", "src/new.py"}
+
+    def test_source_dirs_and_tree_skip_ignored_dirs(self, tmp_path):
+        _write(tmp_path / ".prgignore", "scratch/\n")
+        _write(tmp_path / "scratch" / "try.py")
+        _write(tmp_path / "service" / "main.py")
+        _write(tmp_path / "build" / "lib" / "main.py")
+
+        assert discover_source_dirs(tmp_path) == ["service"]
+        tree = build_project_tree(tmp_path)
+        assert "service/" in tree
+        assert "scratch" not in tree and "build" not in tree
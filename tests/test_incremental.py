@@ -1,7 +1,12 @@
 """Tests for incremental analysis (Feature 3)."""
 
 import json
+import os
+import shutil
+import subprocess
+import time
 
+import pytest
 from click.testing import CliRunner
 
 from cli.cli import cli as main
@@ -204,3 +209,166 @@ class TestIncrementalCLI:
         result2 = runner.invoke(main, [str(tmp_path), "--no-commit", "--verbose", "--incremental"])
         assert result2.exit_code == 0
         assert "No changes detected" in result2.output
+
+
+class TestFileManifest:
+    """Per-file digest manifest behind the section hashes."""
+
+    @staticmethod
+    def _age(path, seconds=60):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+    def test_same_size_edit_is_detected(self, tmp_path):
+        (tmp_path / "app.py").write_text("x = 1\n")
+        analyzer = IncrementalAnalyzer(tmp_path, tmp_path / ".clinerules")
+        h1 = analyzer.compute_project_hash()
+
+        (tmp_path / "app.py").write_text("y = 2\n")
+        h2 = analyzer.compute_project_hash()
+
+        assert h1["source"] != h2["source"]
+
+    def test_changed_files_reported_per_section(self, tmp_path):
+        (tmp_path / "README.md").write_text("# Stable")
+        (tmp_path / "app.py").write_text("x = 1\n")
+        (tmp_path / "lib.py").write_text("y = 1\n")
+        output_dir = tmp_path / ".clinerules"
+        first = IncrementalAnalyzer(tmp_path, output_dir)
+        first.save_hash(first.compute_project_hash())
+
+        (tmp_path / "lib.py").write_text("y = 22\n")
+        (tmp_path / "new.py").write_text("z = 3\n")
+        second = IncrementalAnalyzer(tmp_path, output_dir)
+
+        assert second.detect_changes() == {"source", "structure"}
+        assert second.changed_files["source"] == ["lib.py", "new.py"]
+        assert second.changed_files["structure"] == ["new.py"]
+
+    def test_unchanged_files_reuse_stored_digests(self, tmp_path):
+        for name in ("a.py", "b.py", "README.md"):
+            (tmp_path / name).write_text(f"# {name}\n")
+            self._age(tmp_path / name)
+        output_dir = tmp_path / ".clinerules"
+        first = IncrementalAnalyzer(tmp_path, output_dir)
+        first.save_hash(first.compute_project_hash())
+        assert first.rehashed_files == 3
+
+        second = IncrementalAnalyzer(tmp_path, output_dir)
+        assert second.detect_changes() == set()
+        assert second.rehashed_files == 0
+
+        data = json.loads((output_dir / ".prg-cache.json").read_text(encoding="utf-8"))
+        assert set(data["files"]) == {"a.py", "b.py", "README.md"}
+        assert data["files"]["a.py"]["sections"] == ["source"]
+
+    def test_touch_without_edit_is_not_a_change(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        self._age(tmp_path / "a.py", 120)
+        output_dir = tmp_path / ".clinerules"
+        first = IncrementalAnalyzer(tmp_path, output_dir)
+        first.save_hash(first.compute_project_hash())
+
+        self._age(tmp_path / "a.py", -60)
+        second = IncrementalAnalyzer(tmp_path, output_dir)
+        assert second.detect_changes() == set()
+        assert second.rehashed_files == 1
+
+
+def _git(cwd, *args):
+    env = {**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t", "GIT_COMMITTER_NAME": "t"}
+    env["GIT_COMMITTER_EMAIL"] = "t@t"
+    subprocess.run(["git", *args], cwd=cwd, env=env, check=True, capture_output=True)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitChanges:
+    """--git-changes: source/tests sections rebuilt from git's change list."""
+
+    @staticmethod
+    def _repo(tmp_path):
+        tmp_path = tmp_path / "repo"
+        tmp_path.mkdir()
+        (tmp_path / ".gitignore").write_text(".clinerules/\n")
+        (tmp_path / "README.md").write_text("# Demo\n")
+        (tmp_path / "pkg").mkdir()
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / "pkg" / name).write_text(f"# {name}\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_a.py").write_text("def test_a():\n    pass\n")
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-qm", "init")
+        stamp = time.time() - 60
+        for path in tmp_path.rglob("*"):
+            os.utime(path, (stamp, stamp))
+        return tmp_path, tmp_path / ".clinerules"
+
+    @staticmethod
+    def _run(tmp_path, output_dir, git_changes=True):
+        analyzer = IncrementalAnalyzer(tmp_path, output_dir, git_changes=git_changes)
+        changed = analyzer.detect_changes()
+        analyzer.save_hash(analyzer._current_hash)
+        return analyzer, changed
+
+    def test_matches_full_hash_across_commits_and_dirty_files(self, tmp_path):
+        tmp_path, output_dir = self._repo(tmp_path)
+        first, _ = self._run(tmp_path, output_dir)
+        assert first.change_source == "hash"  # no previous git record yet
+
+        (tmp_path / "pkg" / "a.py").write_text("# committed edit\n")
+        (tmp_path / "pkg" / "b.py").unlink()
+        _git(tmp_path, "commit", "-qam", "edit")
+        (tmp_path / "pkg" / "c.py").write_text("# dirty edit\n")
+        (tmp_path / "tests" / "test_new.py").write_text("def test_new():\n    pass\n")
+
+        second, changed = self._run(tmp_path, output_dir)
+        assert second.change_source == "git"
+        assert second.walked_index is None
+        assert changed == {"source", "tests"}
+        assert second.changed_files["source"] == ["pkg/a.py", "pkg/b.py", "pkg/c.py", "tests/test_new.py"]
+        assert second._current_hash == IncrementalAnalyzer(tmp_path, output_dir).compute_project_hash()
+
+        # Reverting a file that was dirty at the last run is still noticed.
+        _git(tmp_path, "checkout", "--", "pkg/c.py")
+        third, changed = self._run(tmp_path, output_dir)
+        assert third.change_source == "git"
+        assert third.changed_files["source"] == ["pkg/c.py"]
+
+    def test_clean_tree_reads_nothing(self, tmp_path):
+        tmp_path, output_dir = self._repo(tmp_path)
+        self._run(tmp_path, output_dir)
+        analyzer, changed = self._run(tmp_path, output_dir)
+        assert changed == set()
+        assert analyzer.change_source == "git"
+        assert analyzer.rehashed_files == 0
+
+    def test_clean_run_records_git_state(self, tmp_path):
+        tmp_path, output_dir = self._repo(tmp_path)
+        self._run(tmp_path, output_dir, git_changes=False)
+        analyzer = IncrementalAnalyzer(tmp_path, output_dir, git_changes=True)
+        assert analyzer.detect_changes() == set()
+        analyzer.save_git_state()
+
+        data = json.loads((output_dir / ".prg-cache.json").read_text(encoding="utf-8"))
+        assert data["git"]["dirty"] == []
+        assert IncrementalAnalyzer(tmp_path, output_dir, git_changes=True).detect_changes() == set()
+
+    def test_falls_back_to_hashing(self, tmp_path):
+        tmp_path, output_dir = self._repo(tmp_path)
+        self._run(tmp_path, output_dir, git_changes=False)
+        analyzer, _ = self._run(tmp_path, output_dir)
+        assert analyzer.change_source == "hash"  # previous run left no git record
+
+        data = json.loads((output_dir / ".prg-cache.json").read_text(encoding="utf-8"))
+        data["git"]["head"] = "0" * 40  # e.g. history rewritten since
+        (output_dir / ".prg-cache.json").write_text(json.dumps(data), encoding="utf-8")
+        analyzer, changed = self._run(tmp_path, output_dir)
+        assert analyzer.change_source == "hash" and changed == set()
+
+        plain = tmp_path.parent / "plain"
+        plain.mkdir()
+        (plain / "x.py").write_text("x = 1\n")
+        self._run(plain, plain / ".clinerules")
+        analyzer, _ = self._run(plain, plain / ".clinerules")
+        assert analyzer.change_source == "hash"
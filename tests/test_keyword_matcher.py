@@ -0,0 +1,59 @@
+"""Tests for the single-pass negation-aware KeywordMatcher."""
+
+import random
+
+import pytest
+
+from generator.analyzers.readme_parser import TECH_KEYWORDS
+from generator.tech import TECH_README_KEYWORDS
+from generator.utils.negation import KeywordMatcher, keyword_has_non_negated_mention
+from generator.utils.tech_detector import detect_from_readme
+
+README_KEYWORDS = [kw for keywords in TECH_README_KEYWORDS.values() for kw in keywords]
+
+
+def _multi_word_substring(kw):
+    return " " not in kw
+
+
+def _expected(keywords, text, word_boundary):
+    return {kw for kw in keywords if keyword_has_non_negated_mention(kw, text, word_boundary=word_boundary(kw))}
+
+
+class TestKeywordMatcher:
+    def test_negated_and_plain_mentions(self):
+        matcher = KeywordMatcher(["python", "flask", "react"])
+        text = (
+            "this is not a python app. we don't use flask.\n\n"
+            "the frontend of this project is built with react, and the backend with python."
+        )
+        assert matcher.matches(text) == {"python", "react"}
+
+    def test_word_boundary_rejects_partial_words(self):
+        assert KeywordMatcher(["python"]).matches("we use jython exclusively.") == set()
+        assert KeywordMatcher(["python"], word_boundary=False).matches("we use cpython internals.") == {"python"}
+
+    def test_keywords_sharing_a_start_position_are_all_reported(self):
+        matcher = KeywordMatcher(["react", "react native", "native"])
+        assert matcher.matches("built on react native") == {"react", "react native", "native"}
+
+    def test_empty_keyword_set_matches_nothing(self):
+        assert KeywordMatcher([]).matches("python") == set()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_agrees_with_per_keyword_helper(self, seed):
+        keywords = list(TECH_KEYWORDS) + README_KEYWORDS + ["aa", "node.js", "c++", "react native"]
+        vocabulary = keywords + ["not", "don't use", "instead of", "we", "jython", "breakfast", "aaa", ".", "\n"]
+        rng = random.Random(seed)
+        matcher = KeywordMatcher(keywords, word_boundary=_multi_word_substring)
+        for _ in range(200):
+            text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 40))).lower()
+            if rng.random() < 0.3:
+                text = text.replace(" ", "")
+            assert matcher.matches(text) == _expected(set(keywords), text, _multi_word_substring), text
+
+
+def test_detect_from_readme_uses_negation_policy():
+    detected = detect_from_readme("Built with FastAPI and Redis. This is not a Django project.")
+    assert {"fastapi", "redis"} <= detected
+    assert "django" not in detected
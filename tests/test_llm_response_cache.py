@@ -0,0 +1,219 @@
+"""Tests for the persistent LLM response cache."""
+
+import asyncio
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from click.testing import CliRunner
+
+from generator.ai import response_cache
+from generator.ai.ai_client import AIClient
+from generator.ai.hardening import generate_with_validator
+from generator.ai.response_cache import CachingAIClient, LLMResponseCache, cache_only_valid
+
+
+class _CountingClient(AIClient):
+    DEFAULT_MODEL = "base-model"
+
+    def __init__(self, answers=None):
+        super().__init__("key")
+        self.answers = list(answers or [])
+        self.calls = []
+
+    def generate(self, prompt, max_tokens=2000, model=None, temperature=0.7, system_message=None):
+        self.calls.append((prompt, max_tokens, self.resolve_model(model), temperature, system_message))
+        return self.answers.pop(0) if self.answers else f"answer {len(self.calls)}"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(root=tmp_path / "llm-cache")
+
+
+class TestCachingClient:
+    def test_identical_request_is_served_from_disk(self, cache):
+        inner = _CountingClient()
+        first = CachingAIClient(inner, "groq", cache).generate("hello", max_tokens=100)
+        # A fresh wrapper (next run) still hits the on-disk entry.
+        second = CachingAIClient(inner, "groq", cache).generate("hello", max_tokens=100)
+
+        assert first == second == "answer 1"
+        assert len(inner.calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_tokens": 200},
+            {"temperature": 0.2},
+            {"system_message": "be terse"},
+            {"model": "other-model"},
+        ],
+    )
+    def test_each_key_component_separates_entries(self, cache, kwargs):
+        inner = _CountingClient()
+        client = CachingAIClient(inner, "groq", cache)
+        client.generate("hello", max_tokens=100)
+        client.generate("hello", **{"max_tokens": 100, **kwargs})
+        assert len(inner.calls) == 2
+
+    def test_provider_is_part_of_the_key(self, cache):
+        inner = _CountingClient()
+        CachingAIClient(inner, "groq", cache).generate("hello")
+        CachingAIClient(inner, "openai", cache).generate("hello")
+        assert len(inner.calls) == 2
+
+    def test_empty_response_is_not_stored(self, cache):
+        inner = _CountingClient(answers=["", "real"])
+        client = CachingAIClient(inner, "groq", cache)
+        assert client.generate("hello") == ""
+        assert client.generate("hello") == "real"
+
+    def test_attributes_fall_through_to_wrapped_client(self, cache):
+        inner = _CountingClient()
+        inner.client = object()
+        assert CachingAIClient(inner, "groq", cache).client is inner.client
+
+
+class TestBounds:
+    def test_expired_entry_is_a_miss_and_deleted(self, cache):
+        key = cache.make_key("groq", "m", 0.7, None, "p", 10)
+        cache.put(key, "fresh")
+        assert cache.get(key) == "fresh"
+
+        cache.ttl_seconds = 1e-9
+        time.sleep(0.01)
+        assert cache.get(key) is None
+        assert not cache._path(key).exists()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = LLMResponseCache(root=tmp_path, max_entries=2)
+        keys = [cache.make_key("groq", "m", 0.7, None, f"p{i}", 10) for i in range(3)]
+        cache.put(keys[0], "a")
+        cache.put(keys[1], "b")
+        past = time.time() - 100
+        os.utime(cache._path(keys[0]), (past, past))
+        os.utime(cache._path(keys[1]), (past - 50, past - 50))
+        cache.get(keys[1])  # refreshes keys[1]; keys[0] is now the LRU entry
+
+        cache.put(keys[2], "c")
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) == "b"
+        assert cache.get(keys[2]) == "c"
+
+    def test_byte_budget_is_enforced(self, tmp_path):
+        cache = LLMResponseCache(root=tmp_path, max_bytes=400)
+        for i in range(10):
+            cache.put(cache.make_key("groq", "m", 0.7, None, f"p{i}", 10), "x" * 100)
+        assert cache.stats()["bytes"] <= 400
+
+    def test_writes_under_budget_do_not_scan_the_directory(self, cache, monkeypatch):
+        cache.put(cache.make_key("groq", "m", 0.7, None, "p0", 10), "x")
+        scans = []
+        entries = cache._entries
+        monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+        for i in range(1, 20):
+            cache.put(cache.make_key("groq", "m", 0.7, None, f"p{i}", 10), "x")
+        cache.discard(cache.make_key("groq", "m", 0.7, None, "p0", 10))
+        assert scans == []
+        assert cache._totals == (cache.stats()["bytes"], 19)
+
+    def test_clear_removes_everything(self, cache):
+        for i in range(3):
+            cache.put(cache.make_key("groq", "m", 0.7, None, f"p{i}", 10), "x")
+        assert cache.clear() == 3
+        assert cache.stats()["entries"] == 0
+
+
+class TestRejectedResponses:
+    def test_validator_failure_is_not_replayed(self, cache):
+        inner = _CountingClient(answers=["bad", "good"])
+        client = CachingAIClient(inner, "groq", cache)
+
+        result = generate_with_validator(
+            client, "prompt", validator=lambda r: r == "good", detect_truncation=False, max_retries=0
+        )
+        assert result == "bad"
+        # Next run: the rejected answer must not come back from the cache.
+        result = generate_with_validator(
+            client, "prompt", validator=lambda r: r == "good", detect_truncation=False, max_retries=0
+        )
+        assert result == "good"
+        assert len(inner.calls) == 2
+
+    def test_accepted_response_is_kept(self, cache):
+        inner = _CountingClient(answers=["good"])
+        client = CachingAIClient(inner, "groq", cache)
+        generate_with_validator(client, "prompt", validator=lambda r: True, detect_truncation=False)
+        generate_with_validator(client, "prompt", validator=lambda r: True, detect_truncation=False)
+        assert len(inner.calls) == 1
+
+    def test_rejected_response_is_never_written(self, cache):
+        client = CachingAIClient(_CountingClient(answers=["stub"]), "groq", cache)
+        with cache_only_valid(lambda r: r != "stub"):
+            assert client.generate("prompt") == "stub"
+        assert cache.stats()["entries"] == 0
+
+    def test_stored_entry_the_validator_rejects_is_a_miss(self, cache):
+        CachingAIClient(_CountingClient(answers=["stub"]), "groq", cache).generate("prompt")
+        inner = _CountingClient(answers=["full"])
+        client = CachingAIClient(inner, "groq", cache)
+        with cache_only_valid(lambda r: r != "stub"):
+            assert client.generate("prompt") == "full"
+        assert client.generate("prompt") == "full"
+        assert len(inner.calls) == 1
+
+    def test_concurrent_async_calls_use_their_own_validator(self, cache):
+        client = CachingAIClient(_CountingClient(answers=["a", "b"]), "groq", cache)
+
+        async def call(prompt, validator):
+            with cache_only_valid(validator):
+                await asyncio.sleep(0)
+                return await client.agenerate(prompt)
+
+        async def batch():
+            return await asyncio.gather(call("one", lambda r: False), call("two", lambda r: True))
+
+        assert asyncio.run(batch()) == ["a", "b"]
+        assert CachingAIClient(_CountingClient(), "groq", cache).generate("two") == "b"
+        assert cache.stats()["entries"] == 1
+
+
+class TestConfiguration:
+    def test_factory_wraps_unless_disabled(self, monkeypatch, tmp_path):
+        from generator.ai.factory import create_ai_client
+
+        monkeypatch.setenv("GROQ_API_KEY", "k")
+        monkeypatch.setenv("PRG_LLM_CACHE_DIR", str(tmp_path))
+        monkeypatch.delenv("PRG_NO_LLM_CACHE")
+        monkeypatch.setattr(response_cache, "_enabled", None)
+        monkeypatch.setattr("generator.ai.providers.groq_client.GROQ_AVAILABLE", True)
+        monkeypatch.setattr("generator.ai.providers.groq_client.Groq", MagicMock(), raising=False)
+
+        client = create_ai_client("groq")
+        assert isinstance(client, CachingAIClient)
+        assert client.cache.root == tmp_path
+        assert not isinstance(create_ai_client("groq", cache=False), CachingAIClient)
+
+        response_cache.set_llm_cache_enabled(False)
+        assert not isinstance(create_ai_client("groq"), CachingAIClient)
+
+    def test_no_llm_cache_flag_and_cache_commands(self, monkeypatch, tmp_path):
+        from cli.cli import cli
+
+        monkeypatch.setenv("PRG_LLM_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(response_cache, "_enabled", None)
+        cache = response_cache.get_response_cache()
+        cache.put(cache.make_key("groq", "m", 0.7, None, "p", 10), "x")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--no-llm-cache", "cache", "stats"])
+        assert result.exit_code == 0, result.output
+        assert "Entries: 1" in result.output
+        assert response_cache.llm_cache_enabled() is False
+
+        result = runner.invoke(cli, ["cache", "clear"])
+        assert "Removed 1" in result.output
+        assert cache.stats()["entries"] == 0
@@ -0,0 +1,154 @@
+"""Tests for concurrent LLM skill generation in cli.skill_pipeline."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cli.skill_pipeline import _llm_generate_skills
+from generator.ai.rate_limit import ProviderBackoff
+
+REFS = {"learned/alpha", "learned/bravo", "learned/charlie", "learned/delta", "builtin/ignored"}
+
+
+class _FakeGenerator:
+    """Stands in for LLMSkillGenerator; ``behaviour(topic, call_no)`` decides each call."""
+
+    def __init__(self, behaviour):
+        self.behaviour = behaviour
+        self.calls = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def generate_content(self, prompt, max_tokens=2000):
+        topic = prompt.split("TOPIC=")[1].split()[0]
+        with self.lock:
+            self.calls.append(topic)
+            call_no = self.calls.count(topic)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            return self.behaviour(topic, call_no)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _run(tmp_path, fake, concurrency):
+    manager = MagicMock()
+    with (
+        patch("generator.skills.llm_skill_generator.LLMSkillGenerator", return_value=fake),
+        patch("cli.skill_pipeline.build_skill_prompt", side_effect=lambda **kw: f"TOPIC={kw['skill_topic']} ..."),
+        patch("cli.skill_pipeline.CodeExampleExtractor") as extractor_cls,
+        patch("cli.skill_pipeline.SkillPathManager.get_skill_path", return_value=None),
+    ):
+        extractor_cls.return_value.extract_examples_for_skill.return_value = []
+        _llm_generate_skills(
+            project_path=tmp_path,
+            project_name="demo",
+            enhanced_context={},
+            detected_tech=[],
+            enhanced_selected_skills=REFS,
+            provider="groq",
+            verbose=False,
+            skills_manager=manager,
+            output_dir=tmp_path / ".clinerules",
+            ai_concurrency=concurrency,
+        )
+    return manager
+
+
+def _written(tmp_path):
+    root = tmp_path / ".clinerules" / "skills" / "learned"
+    return sorted(p.parent.name for p in root.glob("*/SKILL.md")) if root.exists() else []
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_generates_every_learned_skill_and_invalidates_once(tmp_path, concurrency):
+    def slow(topic, _):
+        time.sleep(0.05)
+        return f"# {topic}\n"
+
+    fake = _FakeGenerator(slow)
+    manager = _run(tmp_path, fake, concurrency)
+
+    assert _written(tmp_path) == ["alpha", "bravo", "charlie", "delta"]
+    assert (tmp_path / ".clinerules" / "skills" / "learned" / "bravo" / "SKILL.md").read_text() == "# bravo\n"
+    assert manager.discovery.invalidate_cache.call_count == 1
+    assert fake.peak == (1 if concurrency == 1 else 4)
+
+
+def test_output_is_reported_in_name_order(tmp_path, capsys):
+    # Later skills finish first; reporting must still follow sorted order.
+    delays = {"alpha": 0.15, "bravo": 0.1, "charlie": 0.05, "delta": 0.0}
+    fake = _FakeGenerator(lambda topic, _: time.sleep(delays[topic]) or topic)
+    _run(tmp_path, fake, 4)
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if "Generated:" in line]
+    assert [line.split("learned/")[1].split()[0] for line in lines] == ["alpha", "bravo", "charlie", "delta"]
+
+
+def test_auth_failure_stops_remaining_generations(tmp_path, capsys):
+    def unauthorized(topic, _):
+        raise RuntimeError("LLM generation failed: 401 invalid_api_key")
+
+    fake = _FakeGenerator(unauthorized)
+    manager = _run(tmp_path, fake, 1)
+
+    assert fake.calls == ["alpha"]
+    assert _written(tmp_path) == []
+    assert "API key invalid" in capsys.readouterr().out
+    manager.discovery.invalidate_cache.assert_not_called()
+
+
+def test_rate_limited_call_is_retried(tmp_path):
+    def flaky(topic, call_no):
+        if topic == "bravo" and call_no == 1:
+            raise RuntimeError("LLM generation failed: 429 Too Many Requests")
+        return topic
+
+    fake = _FakeGenerator(flaky)
+    with patch("generator.ai.rate_limit.ProviderBackoff", lambda: ProviderBackoff(base_delay=0.01)):
+        _run(tmp_path, fake, 2)
+
+    assert fake.calls.count("bravo") == 2
+    assert _written(tmp_path) == ["alpha", "bravo", "charlie", "delta"]
+
+
+class TestProviderBackoff:
+    def test_rate_limit_pauses_then_resets(self):
+        backoff = ProviderBackoff(base_delay=0.05, max_delay=1.0)
+        backoff.rate_limited()
+        backoff.rate_limited()
+        started = time.monotonic()
+        backoff.acquire()
+        assert time.monotonic() - started >= 0.04
+        assert backoff._delay == pytest.approx(0.2)
+        backoff.succeeded()
+        assert backoff._delay == pytest.approx(0.05)
+
+    def test_non_rate_limit_errors_propagate_immediately(self):
+        backoff = ProviderBackoff(base_delay=0.01)
+        calls = []
+
+        def boom():
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            backoff.call(boom)
+        assert calls == [1]
+
+    def test_gives_up_after_max_retries(self):
+        backoff = ProviderBackoff(base_delay=0.001, max_retries=2)
+        calls = []
+
+        def limited():
+            calls.append(1)
+            raise RuntimeError("rate limit exceeded")
+
+        with pytest.raises(RuntimeError):
+            backoff.call(limited)
+        assert len(calls) == 3
@@ -205,9 +205,9 @@ def test_auto_generate_skills_skipped_when_run_skills_gen_false(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_incremental_merge_called_when_rules_md_exists(tmp_path):
-    """When inc_analyzer is set and rules.md already exists, IncrementalAnalyzer.merge_rules
-    is called to merge rather than replace."""
+def test_incremental_rules_md_is_reassembled_not_spliced(tmp_path):
+    """When inc_analyzer is set and rules.md already exists, the new content
+    (assembled from cached fragments) replaces it; merge_rules is not used."""
     output_dir = tmp_path / ".clinerules"
     output_dir.mkdir(parents=True, exist_ok=True)
     (output_dir / "rules.md").write_text("# Old rules\n", encoding="utf-8")
@@ -216,10 +216,12 @@ def test_incremental_merge_called_when_rules_md_exists(tmp_path):
     inc.phases_to_run.return_value = (True, True, False, False)
     inc.detect_changes.return_value = {"deps"}
 
-    with patch("cli.analyze_pipeline.IncrementalAnalyzer.merge_rules", return_value="# Merged rules\n") as mock_merge:
+    with patch("generator.analyzers.incremental_analyzer.IncrementalAnalyzer.merge_rules") as mock_merge:
         _call_pipeline(tmp_path, output_dir=output_dir, inc_analyzer=inc)
 
-    mock_merge.assert_called_once()
+    mock_merge.assert_not_called()
+    written = (output_dir / "rules.md").read_text(encoding="utf-8")
+    assert written.startswith("# Rules\n") and "Old rules" not in written
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,164 @@
+"""Tests for per-phase profiling (prg analyze --profile)."""
+
+import json
+import re
+import subprocess
+import sys
+from types import SimpleNamespace
+
+from click.testing import CliRunner
+
+from generator.ai.ai_client import AIClient
+from generator.utils.profiler import PROFILE_FILENAME, PSTATS_FILENAME, TRACE_FILENAME, PhaseProfiler, record_llm_call
+
+
+def _phase(profiler, name):
+    return next(p for p in profiler.phases if p.name == name)
+
+
+class TestPhaseCounters:
+    def test_file_reads_are_counted_with_sizes(self, tmp_path):
+        target = tmp_path / "data.txt"
+        target.write_text("x" * 100, encoding="utf-8")
+        profiler = PhaseProfiler()
+        with profiler.phase("read"):
+            target.read_text(encoding="utf-8")
+            with open(target, "rb") as fh:
+                fh.read()
+            (tmp_path / "out.txt").write_text("not a read", encoding="utf-8")
+
+        stats = _phase(profiler, "read")
+        assert stats.files_read == 2
+        assert stats.bytes_read == 200
+
+    def test_regex_scans_and_subprocesses(self):
+        profiler = PhaseProfiler()
+        pattern = re.compile(r"\d+")
+        with profiler.phase("scan"):
+            for text in ("a1", "b2", "c"):
+                pattern.search(text)
+            list(pattern.finditer("1 2 3"))
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+        stats = _phase(profiler, "scan")
+        assert stats.regex_scans == 4
+        assert stats.subprocess_calls == 1
+
+    def test_llm_calls_outside_a_phase_are_ignored(self):
+        profiler = PhaseProfiler()
+        record_llm_call(5, 5)
+        with profiler.phase("llm"):
+            record_llm_call(100, 20)
+            record_llm_call(50, 10)
+        assert profiler.report()["total"]["llm_calls"] == 2
+        stats = _phase(profiler, "llm")
+        assert (stats.llm_input_tokens, stats.llm_output_tokens) == (150, 30)
+
+    def test_nested_phase_counts_fold_into_parent_once(self):
+        profiler = PhaseProfiler()
+        with profiler.phase("outer"):
+            record_llm_call(1, 1)
+            with profiler.phase("inner"):
+                record_llm_call(2, 2)
+
+        assert _phase(profiler, "inner").parent == "outer"
+        assert _phase(profiler, "outer").llm_calls == 2
+        assert profiler.report()["total"]["llm_calls"] == 2
+
+    def test_provider_usage_is_reported(self):
+        profiler = PhaseProfiler()
+        with profiler.phase("llm"):
+            AIClient._record_usage(
+                SimpleNamespace(prompt_tokens=12, completion_tokens=3), "prompt_tokens", "completion_tokens"
+            )
+            AIClient._record_usage(None, "prompt_tokens", "completion_tokens")
+        stats = _phase(profiler, "llm")
+        assert (stats.llm_calls, stats.llm_input_tokens, stats.llm_output_tokens) == (2, 12, 3)
+
+
+class TestOutput:
+    def test_write_report_pstats_and_trace(self, tmp_path):
+        profiler = PhaseProfiler(pstats_dump=True, chrome_trace=True)
+        with profiler.phase("first"):
+            re.compile("a").match("a")
+        with profiler.phase("second"):
+            pass
+
+        written = profiler.write(tmp_path, metadata={"prg_version": "test"})
+        assert [p.name for p in written] == [PROFILE_FILENAME, PSTATS_FILENAME, TRACE_FILENAME]
+
+        report = json.loads((tmp_path / PROFILE_FILENAME).read_text(encoding="utf-8"))
+        assert report["prg_version"] == "test"
+        assert [p["name"] for p in report["phases"]] == ["first", "second"]
+        assert report["total"]["regex_scans"] == 1
+
+        trace = json.loads((tmp_path / TRACE_FILENAME).read_text(encoding="utf-8"))
+        spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert [e["name"] for e in spans] == ["first", "second"]
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.delenv("PRG_PROFILE", raising=False)
+        assert PhaseProfiler.from_env() is None
+        assert PhaseProfiler.from_env(profile=True) is not None
+
+        monkeypatch.setenv("PRG_PROFILE", "0")
+        assert PhaseProfiler.from_env() is None
+
+        monkeypatch.setenv("PRG_PROFILE", "pstats,trace")
+        profiler = PhaseProfiler.from_env()
+        assert profiler.pstats_dump and profiler.chrome_trace
+
+
+def test_analyze_profile_writes_report(tmp_path):
+    from cli.cli import cli
+
+    (tmp_path / "README.md").write_text("# Demo\n\nA Python project tested with pytest.\n", encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("pytest\n", encoding="utf-8")
+
+    result = CliRunner().invoke(cli, ["analyze", str(tmp_path), "--no-commit", "--profile"])
+    assert result.exit_code == 0, result.output
+
+    report = json.loads((tmp_path / ".clinerules" / PROFILE_FILENAME).read_text(encoding="utf-8"))
+    names = [p["name"] for p in report["phases"]]
+    for phase in ("enhanced_parse", "rules", "unified_content", "write_rules", "skill_orchestration"):
+        assert phase in names
+    assert _by_name(report, "enhanced_parse")["files_read"] > 0
+
+
+def _by_name(report, name):
+    return next(p for p in report["phases"] if p["name"] == name)
+
+
+def test_analyze_profile_counts_llm_calls_made_with_ai_concurrency(tmp_path, monkeypatch):
+    from cli import skill_pipeline
+    from cli.cli import cli
+
+    class _Generator:
+        def __init__(self, **kwargs):
+            pass
+
+        def generate_content(self, prompt, max_tokens=2000):
+            record_llm_call(input_tokens=10, output_tokens=5)
+            return "# Skill\n\n## Process\n\n1. Do it.\n"
+
+    real_generate = skill_pipeline._llm_generate_skills
+    concurrency = []
+
+    def generate(**kwargs):
+        concurrency.append(kwargs["ai_concurrency"])
+        real_generate(**{**kwargs, "enhanced_selected_skills": {"learned/alpha", "learned/bravo", "learned/charlie"}})
+
+    monkeypatch.setattr(skill_pipeline, "_llm_generate_skills", generate)
+    monkeypatch.setattr("generator.skills.llm_skill_generator.LLMSkillGenerator", _Generator)
+    monkeypatch.setattr(skill_pipeline.SkillPathManager, "get_skill_path", staticmethod(lambda ref: None))
+    (tmp_path / "README.md").write_text("# Demo\n\nA Python project tested with pytest.\n", encoding="utf-8")
+
+    args = ["analyze", str(tmp_path), "--no-commit", "--profile", "--ai", "--ai-concurrency", "4"]
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0, result.output
+
+    report = json.loads((tmp_path / ".clinerules" / PROFILE_FILENAME).read_text(encoding="utf-8"))
+    assert concurrency == [1]
+    assert report["total"]["llm_calls"] == 3
+    assert report["total"]["llm_input_tokens"] == 30
+    assert _by_name(report, "skills")["llm_calls"] == 3
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -372,6 +376,47 @@ def test_next_task_title_none_when_all_done(tmp_path):
     assert engine._next_task_title() is None
 
 
+def _age(path: Path, seconds: int = 60) -> None:
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_task_store_parses_once_across_checks(tmp_path):
+    engine = _make_engine(tmp_path)
+    _make_tasks(engine.tasks_yaml, [{"title": f"T{i}", "status": "pending"} for i in range(200)])
+    _age(engine.tasks_yaml)
+
+    for _ in range(5):
+        assert not engine.should_exit()
+        assert engine._next_task_title() == "T0"
+        assert not engine.verify_success()
+    engine._mark_task_complete("T0")
+
+    assert engine._next_task_title() == "T1"
+    assert engine.task_store.parses == 1
+    assert _load_tasks(engine.tasks_yaml)[0]["status"] == "done"
+
+
+def test_task_store_sees_external_edits(tmp_path):
+    engine = _make_engine(tmp_path)
+    _make_tasks(engine.tasks_yaml, [{"title": "T1", "status": "pending"}])
+    _age(engine.tasks_yaml, 120)
+    assert engine._next_task_title() == "T1"
+
+    _make_tasks(engine.tasks_yaml, [{"title": "T1", "status": "done"}, {"title": "T2", "status": "pending"}])
+    _age(engine.tasks_yaml)
+    assert engine._next_task_title() == "T2"
+
+    # Same size, inode and mtime as before: only the racy-window re-read can notice.
+    stat = engine.tasks_yaml.stat()
+    with open(engine.tasks_yaml, "r+", encoding="utf-8") as fh:
+        fh.write(fh.read().replace("T2", "T3"))
+    os.utime(engine.tasks_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    engine.task_store._checked_ns = stat.st_mtime_ns  # as if last read in the same tick
+    assert engine._next_task_title() == "T3"
+    assert engine.task_store.parses == 3
+
+
 # ---------------------------------------------------------------------------
 # build_context smoke test
 # ---------------------------------------------------------------------------
@@ -570,3 +615,62 @@ def test_step6_task_marked_complete_when_tests_pass_and_score_ok(tmp_path):
     statuses = {t["title"]: t["status"] for t in tasks}
     assert statuses["T1"] == "done"
     assert statuses["T2"] == "pending"
+
+
+# ---------------------------------------------------------------------------
+# Overlapped review + tests (steps 5 and 6)
+# ---------------------------------------------------------------------------
+
+
+def test_review_and_tests_run_concurrently(tmp_path):
+    """Both branches must be in flight at once: each waits for the other to start."""
+    engine = _make_engine(tmp_path, tasks_total=1)
+    _make_tasks(engine.tasks_yaml, [{"title": "T1", "status": "pending"}])
+    both_started = threading.Barrier(2, timeout=5)
+
+    def review():
+        both_started.wait()
+        return 80
+
+    def tests(changed=None):
+        both_started.wait()
+        return True, ""
+
+    engine._run_self_review = review
+    engine._run_tests = tests
+
+    assert engine._step_review_and_tests("T1", {"f.py": "x"}) == (80, True)
+    assert _load_tasks(engine.tasks_yaml)[0]["status"] == "done"
+
+
+def test_review_emergency_stop_kills_running_tests(tmp_path):
+    engine = _make_engine(tmp_path)
+    engine._detect_test_runner = MagicMock(return_value=(sys.executable, ["-c", "import time; time.sleep(60)"]))
+
+    def review():
+        deadline = time.monotonic() + 10
+        while engine._test_proc is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return 40
+
+    engine._run_self_review = review
+    started = time.monotonic()
+
+    assert engine._step_review_and_tests("T1", None) is None
+    assert time.monotonic() - started < 10
+    assert engine.state.exit_condition == "review_score_too_low:40"
+    assert engine.state.consecutive_test_failures == 0
+
+
+def test_test_failure_limit_stops_without_waiting_for_review(tmp_path):
+    engine = _make_engine(tmp_path, consecutive_test_failures=2)
+    release = threading.Event()
+    engine._run_self_review = lambda: release.wait(10) and 80
+    engine._run_tests = MagicMock(return_value=(False, "FAIL"))
+
+    try:
+        assert engine._step_review_and_tests("T1", None) is None
+        assert not release.is_set()
+    finally:
+        release.set()
+    assert engine.state.exit_condition == "test_fail_3x"
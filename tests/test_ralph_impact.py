@@ -0,0 +1,119 @@
+"""Tests for Ralph's test-impact selection (generator.ralph.impact)."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from generator.ralph import FeatureState, RalphEngine
+from generator.ralph.impact import ImpactMap, jest_related_args
+
+
+def _write(path: Path, text: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _project(root: Path) -> Path:
+    _write(root / "pkg" / "__init__.py")
+    _write(root / "pkg" / "util.py", "def helper():\n    return 1\n")
+    _write(root / "pkg" / "core.py", "from . import util\n")
+    _write(root / "pkg" / "other.py", "import os\n")
+    _write(root / "tests" / "test_core.py", "from pkg.core import util\n")
+    _write(root / "tests" / "test_other.py", "import pkg.other\n")
+    _write(root / "tests" / "api" / "conftest.py", "from pkg.util import helper\n")
+    _write(root / "tests" / "api" / "test_routes.py", "def test_ok():\n    pass\n")
+    _write(root / "tests" / "fixtures" / "app" / "test_app.py", "import pkg.other\n")
+    _write(root / "scripts" / "test_manual.py", "import pkg.other\n")
+    _write(root / "setup.cfg", "[tool:pytest]\ntestpaths = tests\nnorecursedirs = tests/fixtures\n")
+    return root
+
+
+def _age(root: Path) -> None:
+    old = 1_000_000_000
+    for path in root.rglob("*.py"):
+        os.utime(path, (old, old))
+
+
+class TestImpactMap:
+    def test_selects_importers_transitively_and_conftest_scopes(self, tmp_path):
+        impact = ImpactMap(_project(tmp_path))
+
+        assert impact.affected_tests(["pkg/util.py"]) == ["tests/api/test_routes.py", "tests/test_core.py"]
+        assert impact.affected_tests(["pkg/other.py"]) == ["tests/test_other.py"]
+        assert impact.affected_tests(["tests/test_other.py", "README.md"]) == ["tests/test_other.py"]
+        assert impact.affected_tests(["docs/notes.md"]) == []
+        assert impact.affected_tests(["setup.cfg"]) is None
+
+    def test_namespace_packages_are_descended_into(self, tmp_path):
+        _write(tmp_path / "pkg" / "mod.py", "def f():\n    return 1\n")
+        _write(tmp_path / "pkg" / "sub" / "leaf.py", "X = 1\n")
+        _write(tmp_path / "tests" / "test_mod.py", "from pkg.mod import f\n")
+        _write(tmp_path / "tests" / "test_leaf.py", "from pkg.sub import leaf\n")
+        impact = ImpactMap(tmp_path)
+
+        assert impact.affected_tests(["pkg/mod.py"]) == ["tests/test_mod.py"]
+        assert impact.affected_tests(["pkg/sub/leaf.py"]) == ["tests/test_leaf.py"]
+
+    def test_module_nothing_imports_runs_the_full_suite(self, tmp_path):
+        root = _project(tmp_path)
+        _write(root / "pkg" / "loaded_by_name.py", "X = 1\n")
+        impact = ImpactMap(root)
+
+        assert impact.affected_tests(["pkg/loaded_by_name.py"]) is None
+        assert impact.affected_tests(["tests/api/test_routes.py"]) == ["tests/api/test_routes.py"]
+        assert impact.affected_tests(["tests/api/conftest.py"]) == ["tests/api/test_routes.py"]
+
+    def test_failing_tests_carry_over_and_persist(self, tmp_path):
+        root = _project(tmp_path)
+        _age(root)
+        path = tmp_path / "features" / "F-1" / "TEST_IMPACT.json"
+        impact = ImpactMap.load(root, path)
+        impact.affected_tests(["pkg/core.py"])
+        impact.record_result(["tests/test_core.py"], passed=False)
+        impact.save()
+
+        warm = ImpactMap.load(root, path)
+        assert warm.affected_tests(["pkg/other.py"]) == ["tests/test_core.py", "tests/test_other.py"]
+        assert warm.parsed == 0
+
+        warm.record_result(["tests/test_core.py", "tests/test_other.py"], passed=True)
+        assert warm.affected_tests(["pkg/other.py"]) == ["tests/test_other.py"]
+
+    def test_jest_uses_find_related_tests(self):
+        assert jest_related_args(["src/a.ts", "README.md"]) == ["--findRelatedTests", "src/a.ts"]
+        assert jest_related_args(["package.json"]) is None
+
+
+class TestEngineSelection:
+    def _engine(self, root: Path) -> RalphEngine:
+        feature_dir = root / "features" / "FEATURE-001"
+        FeatureState(feature_id="FEATURE-001", task="t", branch_name="b").save(feature_dir / "STATE.json")
+        return RalphEngine(feature_id="FEATURE-001", project_path=root, verbose=False)
+
+    def test_iteration_runs_affected_tests_and_verify_runs_full_suite(self, tmp_path):
+        engine = self._engine(_project(tmp_path))
+        commands = []
+
+        def run(cmd):
+            commands.append(cmd)
+            return 0, "ok"
+
+        with patch.object(RalphEngine, "_run_test_command", side_effect=run):
+            assert engine._step_tests("T1", 90, {"pkg/other.py": "import os\n"}) is True
+            engine.state.last_review_score = 90
+            assert engine.verify_success() is True
+
+        assert commands == [["pytest", "-x", "-q", "tests/test_other.py"], ["pytest", "-x", "-q"]]
+        assert (engine.feature_dir / "TEST_IMPACT.json").exists()
+
+    def test_unaffected_change_skips_the_run(self, tmp_path):
+        root = _project(tmp_path)
+        _write(root / "pkg" / "unused.py", "X = 1\n")
+        _write(root / "pkg" / "cli.py", "from . import unused\n")
+        engine = self._engine(root)
+
+        with patch.object(RalphEngine, "_run_test_command") as run:
+            passed, output = engine._run_tests(changed=["pkg/unused.py"])
+
+        run.assert_not_called()
+        assert passed and "No tests affected" in output
@@ -0,0 +1,174 @@
+"""Tests for the parallel Ralph runner and the shared provider rate limiter."""
+
+import asyncio
+import json
+import multiprocessing
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from cli.ralph_cmd import ralph_group
+from generator.ai.ai_client import AIClient
+from generator.ai.rate_limit import RateLimitedAIClient, SharedRateLimiter, install_rate_limiter, with_rate_limit
+from generator.ralph import FeatureState
+from generator.ralph.parallel import ParallelRunner, pending_features
+
+
+class _FakeClient(AIClient):
+    def __init__(self, responses):
+        super().__init__("key")
+        self.responses = list(responses)
+
+    def generate(self, prompt, max_tokens=2000, model=None, temperature=0.7, system_message=None):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _reserve_slots(limiter, count, results):
+    results.put([limiter.reserve() + time.time() for _ in range(count)])
+
+
+def _fake_worker(feature_id, worktree, feature_dir, provider, api_key, max_iterations, limiter, verbose):
+    """Stands in for run_feature_worker: one commit in the worktree, then a final STATE.json."""
+    feature_dir, worktree = Path(feature_dir), Path(worktree)
+    started = time.time()
+    (worktree / f"{feature_id}.txt").write_text(feature_id, encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=worktree, check=True)
+    subprocess.run(["git", "commit", "-qm", feature_id], cwd=worktree, check=True)
+    time.sleep(1.5)
+    state = FeatureState.load(feature_dir / "STATE.json")
+    state.status = "stopped" if feature_id.endswith("3") else "success"
+    state.exit_condition = json.dumps([started, time.time()])
+    state.save(feature_dir / "STATE.json")
+    sys.exit(0 if state.status == "success" else 1)
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_identity(monkeypatch):
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "t")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "t@t")
+
+
+def _repo_with_features(root: Path, count: int) -> Path:
+    root.mkdir()
+    (root / "README.md").write_text("# Demo\n")
+    (root / ".gitignore").write_text("features/\n")
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "add", ".")
+    _git(root, "commit", "-qm", "init")
+    for i in range(1, count + 1):
+        feature_id = f"FEATURE-00{i}"
+        branch = f"ralph/{feature_id}-demo"
+        FeatureState(feature_id=feature_id, task=f"task {i}", branch_name=branch).save(
+            root / "features" / feature_id / "STATE.json"
+        )
+        _git(root, "branch", branch)
+    return root
+
+
+class TestSharedRateLimiter:
+    def test_slots_are_spaced_by_the_request_budget(self):
+        limiter = SharedRateLimiter(requests_per_minute=600)
+        waits = [limiter.reserve() for _ in range(3)]
+        assert waits[0] == pytest.approx(0, abs=0.05)
+        assert waits[1] == pytest.approx(0.1, abs=0.05)
+        assert waits[2] == pytest.approx(0.2, abs=0.05)
+
+    def test_rate_limited_calls_back_off_and_retry(self):
+        limiter = SharedRateLimiter(base_delay=0.5)
+        client = RateLimitedAIClient(_FakeClient([RuntimeError("429 Too Many Requests"), "ok"]), limiter)
+        with patch("generator.ai.rate_limit.time.sleep") as sleep:
+            assert client.generate("p") == "ok"
+        assert sleep.call_args.args[0] == pytest.approx(0.5, abs=0.05)
+        assert limiter._delay.value == limiter.base_delay
+
+    def test_async_calls_back_off_without_blocking_the_loop(self):
+        limiter = SharedRateLimiter(base_delay=0.5)
+        client = RateLimitedAIClient(_FakeClient([RuntimeError("429 Too Many Requests"), "ok"]), limiter)
+        with (
+            patch("generator.ai.rate_limit.asyncio.sleep") as asleep,
+            patch("generator.ai.rate_limit.time.sleep") as sleep,
+        ):
+            assert asyncio.run(client.agenerate("p")) == "ok"
+        sleep.assert_not_called()
+        assert asleep.call_args.args[0] == pytest.approx(0.5, abs=0.05)
+        assert limiter._delay.value == limiter.base_delay
+
+    def test_processes_share_one_schedule(self):
+        ctx = multiprocessing.get_context("spawn")
+        limiter = SharedRateLimiter(requests_per_minute=600, context=ctx)
+        results = ctx.Queue()
+        procs = [ctx.Process(target=_reserve_slots, args=(limiter, 2, results)) for _ in range(2)]
+        for proc in procs:
+            proc.start()
+        slots = sorted(results.get(timeout=30) + results.get(timeout=30))
+        for proc in procs:
+            proc.join(timeout=30)
+        gaps = [b - a for a, b in zip(slots, slots[1:])]
+        assert all(gap == pytest.approx(0.1, abs=0.05) for gap in gaps)
+
+    def test_factory_wraps_only_when_installed(self):
+        client = _FakeClient([])
+        assert with_rate_limit(client) is client
+        install_rate_limiter(SharedRateLimiter())
+        try:
+            assert isinstance(with_rate_limit(client), RateLimitedAIClient)
+        finally:
+            install_rate_limiter(None)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestParallelRunner:
+    def test_features_run_concurrently_in_their_own_worktrees(self, tmp_path, git_identity):
+        root = _repo_with_features(tmp_path / "repo", 3)
+        runner = ParallelRunner(root, pending_features(root / "features"), provider="groq", worker=_fake_worker)
+
+        runs = runner.run(poll_interval=0.2)
+
+        assert [run.phase for run in runs] == ["done", "done", "failed"]
+        spans = [json.loads(row["exit_condition"]) for row in runner.rows()]
+        assert spans[0][0] < spans[1][1] and spans[1][0] < spans[0][1]  # the first two overlapped
+        assert spans[2][0] >= min(spans[0][1], spans[1][1])  # the third waited for a free slot
+        for run in runs:
+            assert not run.worktree.exists()
+            log = subprocess.run(["git", "log", "-1", "--format=%s", run.branch], cwd=root, capture_output=True)
+            assert log.stdout.decode().strip() == run.feature_id
+        assert not (root / "FEATURE-001.txt").exists()
+        assert pending_features(root / "features") == []
+
+    def test_cli_refuses_a_branch_checked_out_in_the_main_tree(self, tmp_path, git_identity):
+        root = _repo_with_features(tmp_path / "repo", 1)
+        _git(root, "checkout", "-q", "ralph/FEATURE-001-demo")
+
+        result = CliRunner().invoke(ralph_group, ["run-all", "-p", str(root), "--provider", "groq", "--api-key", "k"])
+
+        assert result.exit_code != 0
+        assert "is checked out here" in result.output
+
+    def test_real_worker_keeps_state_in_the_main_tree_and_logs_there(self, tmp_path, git_identity):
+        root = _repo_with_features(tmp_path / "repo", 1)
+        feature_dir = root / "features" / "FEATURE-001"
+        (feature_dir / "TASKS.yaml").write_text("tasks:\n- title: Add a greeting\n  status: pending\n")
+        # No provider SDK/key is usable here, so every agent call fails and the loop stops itself.
+        runner = ParallelRunner(root, ["FEATURE-001"], provider="groq", api_key="k", max_iterations=5, verbose=True)
+
+        (run,) = runner.run(poll_interval=0.2)
+
+        assert run.phase == "failed" and run.exitcode == 1
+        state = json.loads((feature_dir / "STATE.json").read_text())
+        assert state["status"] in ("stopped", "max_iterations") and state["iteration"] >= 1
+        assert "Ralph Loop starting" in (feature_dir / "RALPH.log").read_text()
@@ -0,0 +1,223 @@
+"""Tests for the persistent skill catalog (generator.skills.skill_catalog)."""
+
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from generator.skills import skill_catalog
+from generator.skills.manager import SkillsManager
+from generator.skills.skill_catalog import CATALOG_FILENAME, SkillCatalog
+from generator.skills.skill_parser import SkillParser
+from generator.skills.skill_record import read_skill_header
+from generator.skills.tag_resolver import _tags_from_text
+from generator.storage.skill_paths import SkillPathManager
+
+_opened = None
+
+
+def _audit(event, args):
+    if _opened is not None and event == "open" and isinstance(args[0], (str, os.PathLike)):
+        _opened.append(os.fspath(args[0]))
+
+
+sys.addaudithook(_audit)
+
+
+@contextmanager
+def _record_opens():
+    global _opened
+    _opened = []
+    try:
+        yield _opened
+    finally:
+        _opened = None
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _backdate(root, seconds=60):
+    """Age every file and directory under ``root`` past the racy window."""
+    stamp = time.time() - seconds
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (stamp, stamp))
+    for dirpath, _, _ in sorted(os.walk(root), reverse=True):
+        os.utime(dirpath, (stamp, stamp))
+
+
+def _skill(name, triggers, tags=("python",)):
+    tag_lines = "".join(f"  - {t}\n" for t in tags)
+    bullets = "".join(f"- {t}\n" for t in triggers)
+    return f"---\nname: {name}\ntags:\n{tag_lines}---\n\n# {name}\n\nDoes {name}.\n\n## Auto-Trigger\n{bullets}\n## Process\n1. Go\n"
+
+
+class TestScan:
+    def test_matches_rglob_and_skips_unchanged_directories(self, tmp_path):
+        rng = random.Random(3)
+        root = tmp_path / "learned"
+        for _ in range(60):
+            parts = [rng.choice(["a", "b", "c"]) for _ in range(rng.randint(0, 3))]
+            leaf = f"{rng.choice(['x', 'y', 'SKILL'])}{rng.choice(['.md', '.yaml', '.yml', '.txt'])}"
+            _write(root.joinpath(*parts, leaf), "body")
+        _backdate(root)
+
+        expected = [
+            p.relative_to(root).as_posix()
+            for p in root.rglob("*")
+            if p.is_file() and p.suffix in (".md", ".yaml", ".yml")
+        ]
+        catalog = SkillCatalog(tmp_path / CATALOG_FILENAME)
+        assert catalog.scan(root) == expected
+        catalog.save()
+
+        warm = SkillCatalog.load(tmp_path / CATALOG_FILENAME)
+        assert warm.scan(root) == expected
+        assert warm.dirs_listed == 0
+
+    def test_added_file_relists_only_its_directory(self, tmp_path):
+        root = tmp_path / "learned"
+        _write(root / "a" / "one.md", "1")
+        _write(root / "b" / "two.md", "2")
+        _backdate(root)
+        catalog = SkillCatalog()
+        catalog.scan(root)
+        listed = catalog.dirs_listed
+
+        _write(root / "b" / "three.md", "3")
+        assert sorted(catalog.scan(root)) == ["a/one.md", "b/three.md", "b/two.md"]
+        assert catalog.dirs_listed == listed + 1
+
+    def test_missing_root_is_empty(self, tmp_path):
+        assert SkillCatalog().scan(tmp_path / "nope") == []
+
+
+class TestFacts:
+    def test_warm_lookup_does_not_open_the_file(self, tmp_path):
+        skill = tmp_path / "deploy.md"
+        _write(skill, _skill("deploy", ['"ship it"']))
+        _backdate(tmp_path)
+        catalog = SkillCatalog(tmp_path / CATALOG_FILENAME)
+        assert catalog.get(skill, "triggers", SkillParser.extract_triggers) == ["ship it"]
+        catalog.save()
+
+        warm = SkillCatalog.load(tmp_path / CATALOG_FILENAME)
+        with _record_opens() as opened:
+            assert warm.get(skill, "triggers", SkillParser.extract_triggers) == ["ship it"]
+        assert str(skill) not in opened
+        assert warm.stats()["hits"] == 1
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        skill = tmp_path / "deploy.md"
+        _write(skill, _skill("deploy", ['"ship it"']))
+        _backdate(tmp_path)
+        catalog = SkillCatalog()
+        catalog.get(skill, "triggers", SkillParser.extract_triggers)
+
+        _write(skill, _skill("deploy", ['"roll back"']))
+        assert catalog.get(skill, "triggers", SkillParser.extract_triggers) == ["roll back"]
+
+    def test_unreadable_file_returns_none(self, tmp_path):
+        assert SkillCatalog().get(tmp_path / "gone.md", "triggers", SkillParser.extract_triggers) is None
+
+
+@pytest.fixture
+def skill_layers(tmp_path, monkeypatch):
+    """A project with learned and project skills, backed by a fresh on-disk catalog."""
+    global_dir = tmp_path / "global"
+    monkeypatch.setattr(SkillPathManager, "GLOBAL_DIR", global_dir)
+    monkeypatch.setattr(SkillPathManager, "GLOBAL_BUILTIN", global_dir / "builtin")
+    monkeypatch.setattr(SkillPathManager, "GLOBAL_LEARNED", global_dir / "learned")
+    monkeypatch.setattr(SkillPathManager, "sync_builtin_skills", classmethod(lambda cls: None))
+
+    learned = global_dir / "learned"
+    _write(learned / "python" / "fastapi-routes.md", _skill("fastapi-routes", ['User says: "add endpoint"']))
+    _write(learned / "python" / "celery-tasks" / "SKILL.md", _skill("celery-tasks", ["When queueing work"]))
+    _write(learned / "python" / "celery-tasks" / "references" / "notes.md", "# notes\n")
+    _write(learned / "js" / "jest-tests.md", _skill("jest-tests", ['"jest"']) + "\n**Triggers**: jest, ui change\n")
+    project = tmp_path / "project"
+    _write(
+        project / ".clinerules" / "skills" / "project" / "fastapi-routes.md",
+        _skill("fastapi-routes", ['"project route"']),
+    )
+    (global_dir / "builtin").mkdir(parents=True)
+    _backdate(tmp_path)
+
+    def fresh_catalog():
+        catalog = SkillCatalog.load(global_dir / CATALOG_FILENAME)
+        monkeypatch.setitem(skill_catalog._catalogs, str(global_dir), catalog)
+        return catalog
+
+    fresh_catalog()
+    return project, fresh_catalog
+
+
+class TestManagerIntegration:
+    def test_triggers_match_parsing_full_content(self, skill_layers):
+        project, _ = skill_layers
+        manager = SkillsManager(project_path=project)
+        expected = SkillParser.extract_all_triggers(manager.get_all_skills_content())
+
+        assert manager.extract_all_triggers() == expected
+        assert manager.extract_project_triggers() == expected
+        assert manager.extract_project_triggers(include_only={"learned/celery-tasks"}) == {
+            "celery-tasks": ["queueing work"],
+            "fastapi-routes": ["project route"],
+        }
+
+    def test_warm_run_opens_no_skill_file(self, skill_layers, tmp_path):
+        project, fresh_catalog = skill_layers
+        cold = SkillsManager(project_path=project)
+        triggers = cold.extract_project_triggers()
+        index = cold.generate_perfect_index(project_type="python-cli").read_text(encoding="utf-8")
+        assert "jest-tests" not in index
+
+        catalog = fresh_catalog()
+        warm = SkillsManager(project_path=project)
+        with _record_opens() as opened:
+            skills = warm.list_skills()
+            assert warm.extract_project_triggers() == triggers
+            assert warm.generate_perfect_index(project_type="python-cli").read_text(encoding="utf-8") == index
+
+        skill_files = {str(data["path"]) for data in skills.values()}
+        assert not skill_files & set(opened)
+        assert catalog.stats()["misses"] == 0
+        assert catalog.dirs_listed == 0
+
+
+class TestSkillRecords:
+    def test_header_read_stops_after_trigger_section(self, tmp_path):
+        skill = tmp_path / "deploy.md"
+        _write(skill, _skill("deploy", ['"ship it"'], tags=("Docker",)) + "\n## Examples\n" + "x" * 10_000)
+        header = read_skill_header(skill)
+        full = skill.read_text(encoding="utf-8")
+
+        assert "## Process" not in header and len(header) < 200
+        assert SkillParser.extract_triggers(header) == SkillParser.extract_triggers(full) == ["ship it"]
+        assert _tags_from_text(header) == ["docker"]
+
+    def test_crlf_files_parse_like_read_text(self, tmp_path):
+        skill = tmp_path / "deploy.md"
+        skill.write_bytes(_skill("deploy", ['"ship it"']).replace("\n", "\r\n").encode("utf-8"))
+        assert SkillCatalog().get(skill, "triggers", SkillParser.extract_triggers, header_only=True) == ["ship it"]
+        assert SkillCatalog().get(skill, "triggers", SkillParser.extract_triggers) == ["ship it"]
+
+    def test_iter_skills_is_lazy_and_filters_before_reading(self, skill_layers):
+        project, _ = skill_layers
+        manager = SkillsManager(project_path=project)
+        manager.list_skills()
+
+        with _record_opens() as opened:
+            refs = [r.ref for r in manager.iter_skills(include_only={"learned/celery-tasks"})]
+            assert refs == ["learned/celery-tasks", "project/fastapi-routes"]
+            assert not [p for p in opened if p.endswith((".md", ".yaml", ".yml"))]
+
+            manager.extract_project_triggers(include_only={"learned/celery-tasks"})
+        read = {"/".join(p.split(os.sep)[-2:]) for p in opened if p.endswith(".md")}
+        assert read == {"celery-tasks/SKILL.md", "project/fastapi-routes.md"}
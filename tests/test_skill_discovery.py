@@ -0,0 +1,79 @@
+"""Tests for SkillDiscovery layer resolution (_get_layer_skills)."""
+
+import random
+
+from generator.skills.skill_discovery import SkillDiscovery
+
+
+def _make(root, rels):
+    for rel in rels:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {rel}\n", encoding="utf-8")
+
+
+def _project_skills(project):
+    return SkillDiscovery(project_path=project)._get_layer_skills("project")
+
+
+def _reference_layer(rel_paths):
+    """The previous O(files x skill_dirs) algorithm, kept as an oracle."""
+    priority = {".md": 4, ".yaml": 3, ".yml": 2}
+    rel_paths = sorted(rel_paths)
+    skill_dirs = {"" if rel == "SKILL.md" else rel[:-9] for rel in rel_paths if rel.endswith("SKILL.md")}
+    skills, prios = {}, {}
+    for rel in rel_paths:
+        if any(sd and rel.startswith(f"{sd}/") and rel != f"{sd}/SKILL.md" for sd in skill_dirs):
+            continue
+        if rel == "SKILL.md" or rel.endswith("/SKILL.md"):
+            name = rel[:-9].split("/")[-1] if "/" in rel else rel.rsplit(".", 1)[0]
+            prio = 1
+        else:
+            name = rel.rsplit(".", 1)[0].split("/")[-1]
+            prio = priority.get("." + rel.rsplit(".", 1)[1], 0)
+        if name not in skills or prio > prios[name]:
+            skills[name], prios[name] = rel, prio
+    return skills
+
+
+class TestLayerResolution:
+    def test_priority_md_over_yaml_over_yml_over_skill_dir(self, tmp_path):
+        project = tmp_path
+        layer = project / ".clinerules" / "skills" / "project"
+        _make(layer, ["a/deploy/SKILL.md", "b/deploy.yml", "c/deploy.yaml", "d/deploy.md"])
+        assert _project_skills(project)["deploy"] == layer / "d" / "deploy.md"
+
+    def test_files_inside_a_skill_dir_are_not_skills(self, tmp_path):
+        project = tmp_path
+        layer = project / ".clinerules" / "skills" / "project"
+        _make(
+            layer,
+            [
+                "tdd/SKILL.md",
+                "tdd/references/checklist.md",
+                "tdd/nested/SKILL.md",
+                "tdd-extra.md",  # sibling sharing a name prefix stays visible
+                "SKILL.md",  # a root SKILL.md hides nothing
+                "standalone.md",
+            ],
+        )
+        skills = _project_skills(project)
+        assert skills["tdd"] == layer / "tdd" / "SKILL.md"
+        assert {"tdd", "tdd-extra", "standalone", "SKILL"} == set(skills)
+
+    def test_matches_reference_algorithm_on_random_trees(self, tmp_path):
+        rng = random.Random(7)
+        dirs = ["a", "a/b", "a-b", "a/b/c", "x", "x/refs", "y.z", "y"]
+        names = ["skill", "deploy", "notes", "tdd", "a"]
+        for trial in range(5):
+            project = tmp_path / f"p{trial}"
+            rels = set()
+            for _ in range(40):
+                d = rng.choice(dirs)
+                leaf = rng.choice(["SKILL.md"] + [f"{rng.choice(names)}{rng.choice(['.md', '.yaml', '.yml'])}"])
+                rels.add(f"{d}/{leaf}")
+            layer = project / ".clinerules" / "skills" / "project"
+            _make(layer, rels)
+
+            expected = {name: layer / rel for name, rel in _reference_layer(rels).items()}
+            assert _project_skills(project) == expected
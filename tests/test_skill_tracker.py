@@ -1,4 +1,4 @@
-"""Tests for SkillTracker — score math, JSON persistence, low-scoring detection."""
+"""Tests for SkillTracker — score math, event-log persistence, low-scoring detection."""
 
 from __future__ import annotations
 
@@ -134,6 +134,7 @@ class TestPersistence:
         path = tmp_path / "nested" / "dir" / "usage.json"
         t = SkillTracker(data_path=path)
         t.record_match("x")
+        t.compact()
         assert path.exists()
 
     def test_corrupt_json_does_not_crash(self, tmp_path):
@@ -146,6 +147,7 @@ class TestPersistence:
         path = tmp_path / "skill-usage.json"
         t = SkillTracker(data_path=path)
         t.record_match("skill-y")
+        t.compact()
         data = json.loads(path.read_text())
         assert "skill-y" in data
 
@@ -201,6 +203,102 @@ class TestConcurrencySafety:
         assert leftovers == []
 
 
+class TestEventLog:
+    def test_matches_are_buffered_until_flush(self, tmp_path):
+        path = tmp_path / "usage.json"
+        tracker = SkillTracker(data_path=path, flush_every=10)
+        for _ in range(3):
+            tracker.record_match("buffered")
+        assert tracker.get_stats("buffered")["match_count"] == 3
+        assert SkillTracker(data_path=path).get_stats("buffered") == {}
+
+        tracker.flush()
+        assert SkillTracker(data_path=path).get_stats("buffered")["match_count"] == 3
+
+    def test_flush_every_n_events_appends_without_rewriting_snapshot(self, tmp_path):
+        path = tmp_path / "usage.json"
+        tracker = SkillTracker(data_path=path, flush_every=2)
+        tracker.record_match("a")
+        tracker.record_match("b")
+        log = tmp_path / "usage.events.jsonl"
+        assert [json.loads(line)["skill"] for line in log.read_text().splitlines()] == ["a", "b"]
+        assert not path.exists()
+
+    def test_compaction_keeps_stats_and_empties_log(self, tmp_path):
+        path = tmp_path / "usage.json"
+        tracker = SkillTracker(data_path=path)
+        tracker.record_match("s")
+        tracker.record_feedback("s", useful=False)
+        other = SkillTracker(data_path=path)  # loaded before compaction
+
+        tracker.compact()
+        assert (tmp_path / "usage.events.jsonl").read_text() == ""
+        other.record_feedback("s", useful=True)
+
+        fresh = SkillTracker(data_path=path)
+        assert fresh.get_stats("s")["match_count"] == 1
+        assert (fresh.get_stats("s")["useful_count"], fresh.get_stats("s")["not_useful_count"]) == (1, 1)
+        assert fresh.get_score("s") == 0.5
+
+    def test_interrupted_compaction_does_not_double_count(self, tmp_path, monkeypatch):
+        import os
+
+        path = tmp_path / "usage.json"
+        log = tmp_path / "usage.events.jsonl"
+        tracker = SkillTracker(data_path=path)
+        tracker.record_match("s")
+        tracker.record_feedback("s", useful=True)
+
+        # Die after the snapshot is written but before the log is swapped out.
+        real_replace = os.replace
+
+        def crash_on_log(src, dst):
+            if os.fspath(dst) == os.fspath(log):
+                raise OSError("killed")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", crash_on_log)
+        tracker.compact()
+        monkeypatch.undo()
+        assert json.loads(path.read_text())["s"]["match_count"] == 1
+        assert log.read_text() != ""
+
+        SkillTracker(data_path=path).record_match("s")
+        fresh = SkillTracker(data_path=path)
+        assert fresh.get_stats("s")["match_count"] == 2
+        assert fresh.get_stats("s")["useful_count"] == 1
+        assert "__folded_log__" not in fresh.all_stats()
+
+        fresh.compact()
+        assert SkillTracker(data_path=path).get_stats("s")["match_count"] == 2
+
+    def test_feedback_score_includes_other_writers(self, tmp_path):
+        path = tmp_path / "usage.json"
+        a = SkillTracker(data_path=path)
+        b = SkillTracker(data_path=path)
+        a.record_feedback("s", useful=True)
+        assert b.record_feedback("s", useful=False) == 0.5
+
+    def test_partial_trailing_line_is_ignored(self, tmp_path):
+        path = tmp_path / "usage.json"
+        SkillTracker(data_path=path).record_match("s")
+        with open(tmp_path / "usage.events.jsonl", "ab") as fh:
+            fh.write(b'{"skill": "s", "ev')
+        assert SkillTracker(data_path=path).get_stats("s")["match_count"] == 1
+
+    def test_process_tracker_is_a_buffered_singleton(self, tmp_path, monkeypatch):
+        from generator.skills import skill_tracker
+
+        monkeypatch.setattr(skill_tracker, "_DEFAULT_PATH", tmp_path / "usage.json")
+        monkeypatch.setattr(skill_tracker, "_trackers", {})
+        tracker = skill_tracker.get_skill_tracker()
+        assert skill_tracker.get_skill_tracker() is tracker
+        tracker.record_match("s")
+        assert not (tmp_path / "usage.events.jsonl").exists()
+        tracker.flush()
+        assert SkillTracker(data_path=tmp_path / "usage.json").get_stats("s")["match_count"] == 1
+
+
 # ---------------------------------------------------------------------------
 # CLI — prg skills feedback and prg skills stale
 # ---------------------------------------------------------------------------
@@ -0,0 +1,161 @@
+"""Tests for the StageGraph pipeline scheduler."""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from generator.parsers.enhanced_parser import EnhancedProjectParser
+from generator.utils.stage_graph import StageGraph
+
+
+def _sleeper(name, delay, log=None):
+    def stage(**deps):
+        time.sleep(delay)
+        if log is not None:
+            log.append(name)
+        return (name, sorted(deps))
+
+    return stage
+
+
+class TestScheduling:
+    def test_results_are_in_insertion_order_and_receive_deps(self):
+        graph = StageGraph()
+        graph.add("slow", _sleeper("slow", 0.05))
+        graph.add("fast", _sleeper("fast", 0.0))
+        graph.add("join", lambda slow, fast: slow[0] + "+" + fast[0], deps=("slow", "fast"))
+
+        results = graph.run()
+        assert list(results) == ["slow", "fast", "join"]
+        assert results["join"] == "slow+fast"
+
+    def test_independent_stages_overlap(self):
+        barrier = threading.Barrier(3, timeout=2)
+        graph = StageGraph()
+        for name in ("a", "b", "c"):
+            graph.add(name, barrier.wait)  # deadlocks (times out) unless all three run at once
+        graph.run()
+
+    def test_dependents_wait_for_their_deps(self):
+        log = []
+        graph = StageGraph()
+        graph.add("first", _sleeper("first", 0.05, log))
+        graph.add("second", _sleeper("second", 0.0, log), deps=("first",))
+        graph.run()
+        assert log == ["first", "second"]
+
+    def test_serial_mode_runs_inline(self):
+        threads = []
+        graph = StageGraph()
+        graph.add("a", lambda: threads.append(threading.current_thread()))
+        graph.add("b", lambda: threads.append(threading.current_thread()))
+        graph.run(max_workers=1)
+        assert threads == [threading.current_thread()] * 2
+
+    def test_unknown_or_duplicate_stage_is_rejected(self):
+        graph = StageGraph()
+        graph.add("a", lambda: 1)
+        with pytest.raises(ValueError):
+            graph.add("a", lambda: 2)
+        with pytest.raises(ValueError):
+            graph.add("b", lambda missing: 2, deps=("missing",))
+
+    def test_failure_stops_dependents_and_reraises_earliest(self):
+        ran = []
+        graph = StageGraph()
+        graph.add("ok", _sleeper("ok", 0.02, ran))
+        graph.add("late_boom", lambda: (time.sleep(0.03), 1 / 0))
+        graph.add("early_boom", lambda: (_ for _ in ()).throw(KeyError("x")))
+        graph.add("after", _sleeper("after", 0.0, ran), deps=("late_boom",))
+        with pytest.raises(ZeroDivisionError):
+            graph.run()
+        assert "after" not in ran
+
+
+class TestTimingAndOutput:
+    def test_timings_and_critical_path(self):
+        graph = StageGraph()
+        graph.add("short", _sleeper("short", 0.0))
+        graph.add("long", _sleeper("long", 0.05))
+        graph.add("tail", _sleeper("tail", 0.0), deps=("short", "long"))
+        graph.run()
+
+        assert [t.name for t in graph.timings] == ["short", "long", "tail"]
+        assert graph.timings[1].duration >= 0.04
+        assert graph.critical_path() == ["long", "tail"]
+        assert "critical path: long → tail" in graph.format_timings()
+
+    def test_output_is_replayed_in_stage_order(self):
+        def stage(name, delay):
+            def run():
+                click.echo(f"{name} start")
+                time.sleep(delay)
+                click.echo(f"{name} end", err=True)
+
+            return run
+
+        @click.command()
+        def cmd():
+            graph = StageGraph()
+            graph.add("a", stage("a", 0.05))
+            graph.add("b", stage("b", 0.0))
+            graph.add("c", stage("c", 0.0))
+            graph.run()
+
+        result = CliRunner().invoke(cmd)
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines() == ["a start", "a end", "b start", "b end", "c start", "c end"]
+
+    def test_nested_graph_output_stays_inside_its_stage(self):
+        # Run in a child process: a deadlocked pool would also hang this
+        # interpreter's exit, which joins executor threads.
+        result = subprocess.run(
+            [sys.executable, "-c", _NESTED_GRAPH_SCRIPT],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines() == ["outer a start", "inner x", "inner y", "outer a end", "outer b"]
+
+
+_NESTED_GRAPH_SCRIPT = """
+import time
+import click
+from generator.utils.stage_graph import StageGraph
+
+def inner_stage(name, delay):
+    def run():
+        time.sleep(delay)
+        click.echo(f"inner {name}")
+    return run
+
+def outer_nested():
+    click.echo("outer a start")
+    inner = StageGraph()
+    inner.add("x", inner_stage("x", 0.05))
+    inner.add("y", inner_stage("y", 0.0))
+    inner.run(max_workers=2)
+    click.echo("outer a end")
+
+graph = StageGraph()
+graph.add("a", outer_nested)
+graph.add("b", lambda: click.echo("outer b"))
+graph.run(max_workers=2)
+"""
+
+
+def test_enhanced_parser_records_stage_timings(sample_project_path):
+    parser = EnhancedProjectParser(sample_project_path)
+    parallel = parser.extract_full_context()
+    assert [t.name for t in parser.timings] == ["readme", "dependencies", "structure", "test_patterns"]
+
+    serial = EnhancedProjectParser(sample_project_path).extract_full_context(max_workers=1)
+    assert parallel == serial
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from cli.watch_cmd import _PRGHandler, _should_trigger
+from generator.utils.ignore import IgnoreMatcher
 
 # ---------------------------------------------------------------------------
 # _should_trigger — pattern matching
@@ -70,15 +71,18 @@ class TestShouldTrigger:
         assert not _should_trigger(str(tmp_path / "node_modules" / "package.json"), tmp_path)
 
     def test_gitignore_pattern_suppresses_trigger(self, tmp_path):
-        try:
-            import pathspec
-        except ImportError:
-            pytest.skip("pathspec not available")
         (tmp_path / ".gitignore").write_text("*.log\nbuild/\n", encoding="utf-8")
-        from cli.watch_cmd import _load_gitignore_spec
+        ignore = IgnoreMatcher.for_project(tmp_path)
+        assert not _should_trigger(str(tmp_path / "debug.log"), tmp_path, ignore)
 
-        spec = _load_gitignore_spec(tmp_path)
-        assert not _should_trigger(str(tmp_path / "debug.log"), tmp_path, spec)
+    def test_prgignore_directory_suppresses_trigger(self, tmp_path):
+        (tmp_path / ".prgignore").write_text("data/\n", encoding="utf-8")
+        ignore = IgnoreMatcher.for_project(tmp_path)
+        assert not _should_trigger(str(tmp_path / "data" / "tests" / "test_x.py"), tmp_path, ignore)
+        assert _should_trigger(str(tmp_path / "tests" / "test_x.py"), tmp_path, ignore)
+
+    def test_output_dir_does_not_trigger(self, tmp_path):
+        assert not _should_trigger(str(tmp_path / ".clinerules" / "tests" / "test_x.py"), tmp_path)
 
     # Issue #3 fix: lock files
     def test_poetry_lock_triggers(self, tmp_path):
@@ -106,42 +110,37 @@ class TestShouldTrigger:
 
 
 class TestPRGHandlerDebounce:
-    def _make_handler(self, tmp_path, delay=0.05):
-        return _PRGHandler(project_path=tmp_path, delay=delay, extra_args=[], verbose=False, gitignore_spec=None)
+    def _make_handler(self, tmp_path, delay=0.05, engine=None):
+        engine = engine or MagicMock(**{"run.return_value": 0})
+        return _PRGHandler(project_path=tmp_path, delay=delay, extra_args=[], verbose=False, ignore=None, engine=engine)
 
     def test_single_change_triggers_analyze(self, tmp_path):
         handler = self._make_handler(tmp_path)
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            handler.on_change(str(tmp_path / "README.md"))
-            time.sleep(0.2)  # wait for debounce + subprocess mock
-        assert mock_run.called
+        handler.on_change(str(tmp_path / "README.md"))
+        time.sleep(0.2)  # wait for debounce
+        assert handler._engine.run.called
 
     def test_rapid_changes_coalesce_to_one_run(self, tmp_path):
         handler = self._make_handler(tmp_path, delay=0.1)
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            # Fire 5 rapid changes
-            for _ in range(5):
-                handler.on_change(str(tmp_path / "README.md"))
-                time.sleep(0.01)
-            time.sleep(0.3)  # wait for final debounce
-        assert mock_run.call_count == 1, f"Expected 1 call, got {mock_run.call_count}"
+        # Fire 5 rapid changes
+        for _ in range(5):
+            handler.on_change(str(tmp_path / "README.md"))
+            time.sleep(0.01)
+        time.sleep(0.3)  # wait for final debounce
+        assert handler._engine.run.call_count == 1, f"Expected 1 call, got {handler._engine.run.call_count}"
 
     def test_non_triggering_file_does_not_call_analyze(self, tmp_path):
         handler = self._make_handler(tmp_path)
-        with patch("subprocess.run") as mock_run:
-            handler.on_change(str(tmp_path / "notes.txt"))
-            time.sleep(0.2)
-        assert not mock_run.called
+        handler.on_change(str(tmp_path / "notes.txt"))
+        time.sleep(0.2)
+        assert not handler._engine.run.called
 
     def test_cancel_prevents_pending_trigger(self, tmp_path):
         handler = self._make_handler(tmp_path, delay=0.5)
-        with patch("subprocess.run") as mock_run:
-            handler.on_change(str(tmp_path / "README.md"))
-            handler.cancel()
-            time.sleep(0.7)
-        assert not mock_run.called
+        handler.on_change(str(tmp_path / "README.md"))
+        handler.cancel()
+        time.sleep(0.7)
+        assert not handler._engine.run.called
 
     def test_dirty_bit_queues_rerun_when_change_arrives_during_run(self, tmp_path):
         """Issue #1 fix: change during active run sets dirty bit, triggers one final run."""
@@ -152,27 +151,104 @@ class TestPRGHandlerDebounce:
             # First run: simulate a second change arriving while we are busy
             if call_count["n"] == 1:
                 handler._needs_rerun = True
-            return MagicMock(returncode=0)
+            return 0
 
-        handler = self._make_handler(tmp_path)
-        with patch("subprocess.run", side_effect=mock_run):
-            # Kick off first trigger
-            handler._trigger()
+        handler = self._make_handler(tmp_path, engine=MagicMock(**{"run.side_effect": mock_run}))
+        # Kick off first trigger
+        handler._trigger()
 
         # Expect 2 calls: one for the initial trigger, and one for the dirty bit
         assert call_count["n"] == 2, f"Expected 2 runs, got {call_count['n']}"
 
-    def test_extra_args_passed_to_subprocess(self, tmp_path):
-        handler = _PRGHandler(tmp_path, delay=0.05, extra_args=["--ide", "cursor"], verbose=False, gitignore_spec=None)
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            handler.on_change(str(tmp_path / "README.md"))
-            time.sleep(0.2)
-        assert mock_run.called
-        cmd_args = mock_run.call_args[0][0]
-        assert "--ide" in cmd_args
-        assert "cursor" in cmd_args
-        assert "--incremental" in cmd_args
+    def test_batch_includes_non_triggering_changes(self, tmp_path):
+        """Every changed path is handed to the engine so its file index stays current."""
+        handler = self._make_handler(tmp_path)
+        handler.on_change(str(tmp_path / "src" / "utils.py"))
+        handler.on_change(str(tmp_path / "node_modules" / "x" / "index.js"))
+        handler.on_change(str(tmp_path / "README.md"))
+        time.sleep(0.2)
+        batch = handler._engine.run.call_args[0][0]
+        assert batch == [str(tmp_path / "README.md"), str(tmp_path / "src" / "utils.py")]
+
+    def test_ignore_follows_the_daemons_rebuilt_index(self, tmp_path):
+        """After an ignore-file edit the daemon swaps its index; events use the new matcher."""
+        engine = MagicMock(**{"run.return_value": 0})
+        engine.file_index.ignore = IgnoreMatcher()
+        handler = self._make_handler(tmp_path, engine=engine)
+        handler.on_change(str(tmp_path / "vendor" / "a.py"))
+
+        engine.file_index = MagicMock(ignore=IgnoreMatcher(["vendor/"]))
+        handler.on_change(str(tmp_path / "vendor" / "b.py"))
+        handler.on_change(str(tmp_path / "README.md"))
+        time.sleep(0.2)
+
+        batch = engine.run.call_args[0][0]
+        assert batch == [str(tmp_path / "README.md"), str(tmp_path / "vendor" / "a.py")]
+
+    def test_default_engine_is_in_process_daemon(self, tmp_path):
+        from cli.watch_engine import AnalysisDaemon
+
+        handler = _PRGHandler(tmp_path, delay=0.05, extra_args=["--ide", "cursor"], verbose=False)
+        engine = handler._get_engine()
+        assert isinstance(engine, AnalysisDaemon)
+        assert engine.extra_args == ["--ide", "cursor"]
+
+
+class TestAnalysisDaemon:
+    def test_config_ignore_edit_rebuilds_the_matcher(self, tmp_path, monkeypatch):
+        from cli.watch_engine import AnalysisDaemon
+
+        config = tmp_path / "config.yaml"
+        monkeypatch.setattr("cli.analyze_cmd.CONFIG_PATH", config)
+        project = tmp_path / "project"
+        (project / "data").mkdir(parents=True)
+        (project / "data" / "rows.py").write_text("x = 1\n")
+        daemon = AnalysisDaemon(project)
+        assert not daemon.file_index.ignore.ignores_path("data/rows.py")
+
+        config.write_text("analysis:\n  ignore:\n    - data/\n")
+        daemon.apply_delta([])
+
+        assert daemon.file_index.ignore.ignores_path("data/rows.py")
+        assert [e.rel for e in daemon.file_index] == []
+
+    def test_apply_delta_updates_resident_index(self, tmp_path):
+        from cli.watch_engine import AnalysisDaemon
+
+        (tmp_path / "old.py").write_text("x = 1\n")
+        daemon = AnalysisDaemon(tmp_path)
+        (tmp_path / "old.py").unlink()
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "new.py").write_text("y = 2\n")
+
+        applied = daemon.apply_delta([str(tmp_path / "old.py"), str(tmp_path / "pkg" / "new.py")])
+
+        assert applied == ["old.py", "pkg/new.py"]
+        assert [e.rel for e in daemon.file_index] == ["pkg/new.py"]
+        assert daemon.file_index.has_dir("pkg")
+
+    def test_run_invokes_analyze_in_process_with_resident_state(self, tmp_path):
+        from cli.watch_engine import AnalysisDaemon
+
+        (tmp_path / "README.md").write_text("# Demo\n\nA small demo project for watch mode.\n")
+        daemon = AnalysisDaemon(tmp_path)
+        seen = {}
+
+        def fake_pipeline(**kwargs):
+            seen.update(kwargs)
+            return []
+
+        with patch("cli.analyze_cmd.run_generation_pipeline", side_effect=fake_pipeline):
+            assert daemon.run() == 0
+            first_manager = seen["skills_manager"]
+            assert seen["file_index"] is daemon.file_index
+            assert seen["analysis_cache"] is daemon.analysis_cache(tmp_path / ".clinerules")
+
+            (tmp_path / "README.md").write_text("# Demo\n\nA small demo project, now edited for watch mode.\n")
+            seen.clear()
+            assert daemon.run([str(tmp_path / "README.md")]) == 0
+            assert seen["skills_manager"] is first_manager
+        assert daemon.runs == 2
 
 
 # ---------------------------------------------------------------------------